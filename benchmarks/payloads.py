@@ -0,0 +1,183 @@
+"""Synthetic API answers shaped like those of real Radarr, Sonarr and Dispatcharr instances.
+
+The records are generated from their index, so every run, and every commit, decodes the same bytes.
+Field names, nesting and string lengths follow what the servers send, which is what the JSON
+decoder and the typed records spend their time on.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+#: Library sizes at scale 1.0, those of a large home library.
+MOVIES = 20_000
+EPISODES = 100_000
+HISTORY = 100_000
+STREAMS = 300_000
+
+_QUALITIES = ["HDTV-720p", "WEBDL-1080p", "Bluray-1080p", "WEBDL-2160p", "Bluray-2160p"]
+_GENRES = ["Action", "Adventure", "Comedy", "Drama", "Fantasy", "Horror", "Science Fiction", "Thriller"]
+
+
+def _date(i: int) -> str:
+    """Returns an ISO timestamp that varies with ``i``.
+
+    Args:
+        i (int): The record index.
+
+    Returns:
+        str: The timestamp.
+    """
+    return f"20{10 + i % 15:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:00:00Z"
+
+
+def movie(i: int) -> dict[str, Any]:
+    """Builds one Radarr movie.
+
+    Args:
+        i (int): The record index.
+
+    Returns:
+        dict[str, Any]: The movie.
+    """
+    title = f"Synthetic Movie Number {i}"
+    return {
+        "id": i + 1,
+        "title": title,
+        "originalTitle": title,
+        "sortTitle": title.lower(),
+        "sizeOnDisk": 4_000_000_000 + i * 1_000,
+        "status": "released",
+        "overview": "A benchmark movie whose overview is about as long as a real one. " * 3,
+        "inCinemas": _date(i),
+        "images": [
+            {"coverType": "poster", "remoteUrl": f"https://image.tmdb.org/t/p/original/{i:08x}.jpg"},
+            {"coverType": "fanart", "remoteUrl": f"https://image.tmdb.org/t/p/original/{i:08x}f.jpg"},
+        ],
+        "year": 1970 + i % 55,
+        "hasFile": i % 5 != 0,
+        "path": f"/movies/{title} ({1970 + i % 55})",
+        "qualityProfileId": 1 + i % 4,
+        "monitored": True,
+        "minimumAvailability": "released",
+        "runtime": 90 + i % 60,
+        "tmdbId": 100_000 + i,
+        "imdbId": f"tt{1_000_000 + i}",
+        "genres": [_GENRES[i % len(_GENRES)], _GENRES[(i + 3) % len(_GENRES)]],
+        "tags": [i % 7] if i % 3 == 0 else [],
+        "added": _date(i + 7),
+        "ratings": {"imdb": {"votes": 1000 + i, "value": 5 + i % 50 / 10, "type": "user"}},
+        "movieFile": {"id": i + 1, "relativePath": f"{title}.mkv", "quality": {"quality": {"name": _QUALITIES[i % 5]}}},
+        "statistics": {"movieFileCount": 1, "sizeOnDisk": 4_000_000_000 + i * 1_000, "releaseGroups": ["GRP"]},
+    }
+
+
+def episode(i: int) -> dict[str, Any]:
+    """Builds one Sonarr episode.
+
+    Args:
+        i (int): The record index.
+
+    Returns:
+        dict[str, Any]: The episode.
+    """
+    return {
+        "id": i + 1,
+        "seriesId": 1 + i // 200,
+        "tvdbId": 5_000_000 + i,
+        "episodeFileId": i + 1 if i % 4 else 0,
+        "seasonNumber": 1 + i % 200 // 20,
+        "episodeNumber": 1 + i % 20,
+        "title": f"Synthetic Episode {i}",
+        "airDate": _date(i)[:10],
+        "airDateUtc": _date(i),
+        "runtime": 45,
+        "overview": "An episode overview of a typical length for a television episode.",
+        "hasFile": i % 4 != 0,
+        "monitored": True,
+        "absoluteEpisodeNumber": 1 + i % 200,
+        "unverifiedSceneNumbering": False,
+    }
+
+
+def history(i: int) -> dict[str, Any]:
+    """Builds one Sonarr history record.
+
+    Args:
+        i (int): The record index.
+
+    Returns:
+        dict[str, Any]: The record.
+    """
+    return {
+        "id": i + 1,
+        "episodeId": 1 + i % EPISODES,
+        "seriesId": 1 + i // 200,
+        "sourceTitle": f"Synthetic.Show.S{1 + i % 10:02d}E{1 + i % 20:02d}.1080p.WEB.h264-GRP",
+        "quality": {"quality": {"id": 3, "name": _QUALITIES[i % 5]}, "revision": {"version": 1, "real": 0}},
+        "qualityCutoffNotMet": False,
+        "date": _date(i),
+        "downloadId": f"{i:040x}",
+        "eventType": "grabbed" if i % 2 else "downloadFolderImported",
+        "data": {"indexer": "Synthetic Indexer", "releaseGroup": "GRP", "size": str(1_500_000_000 + i)},
+    }
+
+
+def stream(i: int) -> dict[str, Any]:
+    """Builds one Dispatcharr stream.
+
+    Args:
+        i (int): The record index.
+
+    Returns:
+        dict[str, Any]: The stream.
+    """
+    return {
+        "id": i + 1,
+        "name": f"Synthetic Channel {i} HD",
+        "url": f"http://provider.example:8080/live/user/pass/{100_000 + i}.ts",
+        "m3u_account": 1 + i % 3,
+        "logo_url": f"http://provider.example/logos/{i}.png",
+        "tvg_id": f"synthetic{i}.example",
+        "local_file": None,
+        "current_viewers": 0,
+        "updated_at": _date(i),
+        "last_seen": _date(i + 1),
+        "stream_profile_id": None,
+        "is_custom": False,
+        "channel_group": 1 + i % 40,
+        "stream_hash": f"{i:032x}",
+    }
+
+
+def encode(value: Any) -> bytes:
+    """Encodes an answer compactly, the way the servers send it.
+
+    Args:
+        value (Any): The answer.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def build(scale: float = 1.0) -> dict[str, Any]:
+    """Builds every record set.
+
+    Args:
+        scale (float, optional): Multiplies the library sizes, below 1 for quick runs. Defaults to 1.0.
+
+    Returns:
+        dict[str, Any]: The record lists by name, plus the pre-encoded ``movie``, ``episode`` and ``streams``
+            answers under ``<name>_body``.
+    """
+    sizes = {"movie": MOVIES, "episode": EPISODES, "history": HISTORY, "streams": STREAMS}
+    builders = {"movie": movie, "episode": episode, "history": history, "streams": stream}
+    data: dict[str, Any] = {}
+    for name, size in sizes.items():
+        data[name] = [builders[name](i) for i in range(max(int(size * scale), 1))]
+    for name in ("movie", "episode", "streams"):
+        data[f"{name}_body"] = encode(data[name])
+    return data
@@ -0,0 +1,497 @@
+"""Measure PyArr's own overhead against a local stand-in server.
+
+Every case runs the sync and the async client against :class:`server.FakeArr`, in process by
+default or over localhost sockets with ``--localhost``, and reports the median time, throughput,
+latency percentiles and peak memory. Results are saved as JSON named after the commit, so two
+commits can be compared:
+
+    uv run python3 benchmarks/run.py --scale 0.1
+    git checkout main && uv run python3 benchmarks/run.py --scale 0.1
+    uv run python3 benchmarks/run.py --compare benchmarks/results/<main>.json benchmarks/results/<branch>.json
+
+Nothing here needs a network connection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import httpx
+from server import FakeArr, serve
+
+from pyarr import AsyncDispatcharr, AsyncRadarr, AsyncSonarr, Dispatcharr, Radarr, Sonarr
+from pyarr.codec import CODECS
+from pyarr.instrumentation import LatencyHistogram
+from pyarr.models import EpisodeRecord, MovieRecord, Record
+
+RESULTS = Path(__file__).parent / "results"
+#: Requests timed one by one in the small request cases.
+SMALL_REQUESTS = 500
+#: Requests in flight at once in the concurrent small request case.
+CONCURRENCY = 20
+
+SyncCase = Callable[[dict[str, Any]], int]
+AsyncCase = Callable[[dict[str, Any]], Awaitable[int]]
+
+
+def sync_movies(clients: dict[str, Any]) -> int:
+    """Fetches every movie at once."""
+    return len(clients["radarr"].movie.get())
+
+
+def sync_movies_stream(clients: dict[str, Any]) -> int:
+    """Streams every movie."""
+    return sum(1 for _ in clients["radarr"].movie.iter_records())
+
+
+def sync_episodes(clients: dict[str, Any]) -> int:
+    """Fetches every episode at once."""
+    return len(clients["sonarr"].episode.get(series_id=1))
+
+
+def sync_episodes_models(clients: dict[str, Any]) -> int:
+    """Fetches every episode as typed records."""
+    return len(clients["sonarr"].episode.get(series_id=1, models=True))
+
+
+def sync_history_pages(clients: dict[str, Any]) -> int:
+    """Pages through the whole history, four pages at a time."""
+    return sum(1 for _ in clients["sonarr"].history.iter_records(page_size=1000))
+
+
+def sync_streams(clients: dict[str, Any]) -> int:
+    """Fetches every Dispatcharr stream at once."""
+    return len(clients["dispatcharr"].streams.get())
+
+
+async def async_movies(clients: dict[str, Any]) -> int:
+    """Fetches every movie at once."""
+    return len(await clients["radarr"].movie.get())
+
+
+async def async_movies_stream(clients: dict[str, Any]) -> int:
+    """Streams every movie."""
+    return len([movie async for movie in clients["radarr"].movie.iter_records()])
+
+
+async def async_episodes(clients: dict[str, Any]) -> int:
+    """Fetches every episode at once."""
+    return len(await clients["sonarr"].episode.get(series_id=1))
+
+
+async def async_episodes_models(clients: dict[str, Any]) -> int:
+    """Fetches every episode as typed records."""
+    return len(await clients["sonarr"].episode.get(series_id=1, models=True))
+
+
+async def async_history_pages(clients: dict[str, Any]) -> int:
+    """Pages through the whole history, four pages at a time."""
+    return len([record async for record in clients["sonarr"].history.iter_records(page_size=1000)])
+
+
+async def async_streams(clients: dict[str, Any]) -> int:
+    """Fetches every Dispatcharr stream at once."""
+    return len(await clients["dispatcharr"].streams.get())
+
+
+#: The bulk cases, by name: the sync and the async version.
+CASES: dict[str, tuple[SyncCase, AsyncCase]] = {
+    "movie.get": (sync_movies, async_movies),
+    "movie.iter_records": (sync_movies_stream, async_movies_stream),
+    "episode.get": (sync_episodes, async_episodes),
+    "episode.get(models)": (sync_episodes_models, async_episodes_models),
+    "history.iter_records": (sync_history_pages, async_history_pages),
+    "streams.get": (sync_streams, async_streams),
+}
+
+
+def summarise(durations: list[float], items: int, peak: int | None = None) -> dict[str, Any]:
+    """Summarises the timed runs of one case.
+
+    Args:
+        durations (list[float]): Seconds per run, or per request for the small request cases.
+        items (int): Items handled by one run.
+        peak (int | None, optional): Peak traced memory of one run, in bytes. Defaults to None.
+
+    Returns:
+        dict[str, Any]: The median, percentiles, throughput and memory.
+    """
+    histogram = LatencyHistogram()
+    for duration in durations:
+        histogram.record(duration)
+    median = statistics.median(durations)
+    result = {
+        "runs": len(durations),
+        "median": median,
+        "min": min(durations),
+        "p90": histogram.percentile(90),
+        "p99": histogram.percentile(99),
+        "items": items,
+        "items_per_second": items / median if median else 0.0,
+    }
+    if peak is not None:
+        result["peak_mib"] = peak / 2**20
+    return result
+
+
+def _traced(run: Callable[[], int]) -> int:
+    """Runs a case once under ``tracemalloc``.
+
+    Args:
+        run (Callable[[], int]): The case.
+
+    Returns:
+        int: The peak traced memory in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def sync_clients(app: FakeArr, url: str | None, stack: ExitStack) -> dict[str, Any]:
+    """Builds the sync clients, in process unless a server URL is given.
+
+    Args:
+        app (FakeArr): The application.
+        url (str | None): The localhost server, or None to call the application in process.
+        stack (ExitStack): Closes the clients.
+
+    Returns:
+        dict[str, Any]: The clients by name.
+    """
+    clients = {}
+    for name, client_class in (("radarr", Radarr), ("sonarr", Sonarr), ("dispatcharr", Dispatcharr)):
+        session = None if url else httpx.Client(transport=httpx.WSGITransport(app=app))
+        client = client_class(url or "http://fake.local", "key", session=session)
+        clients[name] = stack.enter_context(client)
+        if session is not None:
+            stack.callback(session.close)
+    return clients
+
+
+def async_clients(app: FakeArr, url: str | None) -> dict[str, Any]:
+    """Builds the async clients, in process unless a server URL is given.
+
+    Args:
+        app (FakeArr): The application.
+        url (str | None): The localhost server, or None to call the application in process.
+
+    Returns:
+        dict[str, Any]: The clients by name, close them with :func:`close_async`.
+    """
+    clients = {}
+    for name, client_class in (("radarr", AsyncRadarr), ("sonarr", AsyncSonarr), ("dispatcharr", AsyncDispatcharr)):
+        session = None if url else httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+        clients[name] = client_class(url or "http://fake.local", "key", session=session)
+    return clients
+
+
+async def close_async(clients: dict[str, Any]) -> None:
+    """Closes the async clients and their sessions.
+
+    Args:
+        clients (dict[str, Any]): The clients by name.
+    """
+    for client in clients.values():
+        await client.__aexit__(None, None, None)
+        if client.http_utils.session is not None:
+            await client.http_utils.session.aclose()
+
+
+def bench_sync(app: FakeArr, url: str | None, repeats: int, memory: bool) -> dict[str, Any]:
+    """Runs every case with the sync clients.
+
+    Args:
+        app (FakeArr): The application.
+        url (str | None): The localhost server, or None for in process.
+        repeats (int): Timed runs per case.
+        memory (bool): Also measure the peak memory of each case.
+
+    Returns:
+        dict[str, Any]: The results by case name.
+    """
+    results: dict[str, Any] = {}
+    with ExitStack() as stack:
+        clients = sync_clients(app, url, stack)
+        clients["sonarr"].system.get_status()  # Discovers the API version and opens the connection.
+        for name, (case, _) in CASES.items():
+            items = case(clients)
+            durations = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                case(clients)
+                durations.append(time.perf_counter() - started)
+            peak = _traced(partial(case, clients)) if memory else None
+            results[name] = summarise(durations, items, peak)
+            print(f"  sync  {name:<22} {results[name]['median'] * 1000:9.1f} ms", file=sys.stderr)
+
+        status = clients["sonarr"].system.get_status
+        durations = []
+        for _ in range(SMALL_REQUESTS):
+            started = time.perf_counter()
+            status()
+            durations.append(time.perf_counter() - started)
+        results["system.get_status"] = summarise(durations, 1)
+    return results
+
+
+async def bench_async(app: FakeArr, url: str | None, repeats: int, memory: bool) -> dict[str, Any]:
+    """Runs every case with the async clients.
+
+    Args:
+        app (FakeArr): The application.
+        url (str | None): The localhost server, or None for in process.
+        repeats (int): Timed runs per case.
+        memory (bool): Also measure the peak memory of each case.
+
+    Returns:
+        dict[str, Any]: The results by case name.
+    """
+    results: dict[str, Any] = {}
+    clients = async_clients(app, url)
+    try:
+        await clients["sonarr"].system.get_status()
+        for name, (_, case) in CASES.items():
+            items = await case(clients)
+            durations = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                await case(clients)
+                durations.append(time.perf_counter() - started)
+            peak = None
+            if memory:
+                gc.collect()
+                tracemalloc.start()
+                await case(clients)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            results[name] = summarise(durations, items, peak)
+            print(f"  async {name:<22} {results[name]['median'] * 1000:9.1f} ms", file=sys.stderr)
+
+        status = clients["sonarr"].system.get_status
+        durations = []
+        for _ in range(SMALL_REQUESTS):
+            started = time.perf_counter()
+            await status()
+            durations.append(time.perf_counter() - started)
+        results["system.get_status"] = summarise(durations, 1)
+
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def limited() -> None:
+            """Sends one status request once a slot is free."""
+            async with semaphore:
+                await status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(limited() for _ in range(SMALL_REQUESTS)))
+        results["system.get_status(concurrent)"] = summarise([time.perf_counter() - started], SMALL_REQUESTS)
+    finally:
+        await close_async(clients)
+    return results
+
+
+def bench_decode(app: FakeArr, repeats: int, memory: bool) -> dict[str, Any]:
+    """Times each installed JSON codec decoding the movie, episode and stream answers.
+
+    Args:
+        app (FakeArr): The application, holding the encoded answers.
+        repeats (int): Timed runs per codec and answer.
+        memory (bool): Also measure the peak memory of one more run.
+
+    Returns:
+        dict[str, Any]: The results by ``codec/answer``.
+    """
+    results = {}
+    for codec_name, codec_class in CODECS.items():
+        try:
+            codec = codec_class()
+        except ImportError:
+            continue
+        for name in ("movie", "episode", "streams"):
+            body = app.data[f"{name}_body"]
+            durations = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                codec.loads(body)
+                durations.append(time.perf_counter() - started)
+            peak = _traced(partial(codec.loads, body)) if memory else None
+            results[f"{codec_name}/{name}"] = summarise(durations, len(app.data[name]), peak)
+            results[f"{codec_name}/{name}"]["mib_per_second"] = (
+                len(body) / 2**20 / results[f"{codec_name}/{name}"]["median"]
+            )
+    return results
+
+
+def _retained(build: Callable[[], Any]) -> int:
+    """Builds a value under ``tracemalloc`` and measures what it keeps.
+
+    Args:
+        build (Callable[[], Any]): Builds the value.
+
+    Returns:
+        int: The traced memory in bytes still held once the value is built.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        retained = tracemalloc.get_traced_memory()[0]
+        del value
+        return retained
+    finally:
+        tracemalloc.stop()
+
+
+def _records(model: type[Record], body: bytes) -> list[Record]:
+    """Decodes an answer into typed records.
+
+    Args:
+        model (type[Record]): The record type.
+        body (bytes): The answer.
+
+    Returns:
+        list[Record]: The records.
+    """
+    return [model.from_dict(item) for item in json.loads(body)]
+
+
+def bench_records(app: FakeArr, repeats: int, memory: bool) -> dict[str, Any]:
+    """Times decoding the movie and episode answers into dictionaries and into typed records.
+
+    The memory reported is what the decoded answer keeps once built, not the peak while building it.
+
+    Args:
+        app (FakeArr): The application, holding the encoded answers.
+        repeats (int): Timed runs per answer and form.
+        memory (bool): Also measure the memory kept by one more run.
+
+    Returns:
+        dict[str, Any]: The results by ``answer/form``.
+    """
+    results = {}
+    for name, model in (("movie", MovieRecord), ("episode", EpisodeRecord)):
+        body = app.data[f"{name}_body"]
+        builds: dict[str, Callable[[], Any]] = {
+            "dicts": partial(json.loads, body),
+            "records": partial(_records, model, body),
+        }
+        for form, build in builds.items():
+            durations = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                build()
+                durations.append(time.perf_counter() - started)
+            results[f"{name}/{form}"] = summarise(durations, len(app.data[name]), _retained(build) if memory else None)
+    return results
+
+
+def commit() -> str:
+    """Names the checked out commit.
+
+    Returns:
+        str: The short hash, with ``-dirty`` if there are uncommitted changes, or ``unknown`` outside git.
+    """
+    try:
+        sha = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD", "--", "src"]).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{sha}-dirty" if dirty else sha
+
+
+def compare(old_path: Path, new_path: Path) -> None:
+    """Prints the change in median time of every case the two result files share.
+
+    Args:
+        old_path (Path): The baseline results.
+        new_path (Path): The results to compare with it.
+    """
+    old, new = json.loads(old_path.read_text()), json.loads(new_path.read_text())
+    print(f"{'case':<44} {old['meta']['commit']:>12} {new['meta']['commit']:>12} {'change':>8}")
+    for group, cases in new["results"].items():
+        for name, result in cases.items():
+            before = old["results"].get(group, {}).get(name)
+            if before is None:
+                continue
+            change = (result["median"] - before["median"]) / before["median"] * 100
+            label = f"{group}/{name}"
+            print(f"{label:<44} {before['median'] * 1000:10.2f}ms {result['median'] * 1000:10.2f}ms {change:+7.1f}%")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Runs the benchmarks, or compares two result files.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to None, ``sys.argv``.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the library sizes, e.g. 0.1 for a quick run")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--localhost", action="store_true", help="serve over localhost sockets instead of in process")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory runs")
+    parser.add_argument("--output", type=Path, help="where to save the results, defaults to results/<commit>.json")
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    print(f"building payloads at scale {args.scale}", file=sys.stderr)
+    app = FakeArr(args.scale)
+    memory = not args.no_memory
+    with ExitStack() as stack:
+        url = stack.enter_context(serve(app)) if args.localhost else None
+        results = {
+            "sync": bench_sync(app, url, args.repeats, memory),
+            "async": asyncio.run(bench_async(app, url, args.repeats, memory)),
+            "decode": bench_decode(app, args.repeats, memory),
+            "models": bench_records(app, args.repeats, memory),
+        }
+
+    report = {
+        "meta": {
+            "commit": commit(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "httpx": httpx.__version__,
+            "scale": args.scale,
+            "repeats": args.repeats,
+            "transport": "localhost" if args.localhost else "in-process",
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS / f"{report['meta']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    for group, cases in results.items():
+        for name, result in cases.items():
+            rate = f"{result['items_per_second']:12,.0f} items/s" if result["items"] > 1 else ""
+            memory_text = f"{result['peak_mib']:8.1f} MiB" if "peak_mib" in result else ""
+            timing = f"{result['median'] * 1000:9.2f} ms  p99 {result['p99'] * 1000:9.2f} ms"
+            print(f"{group:<6} {name:<30} {timing} {rate} {memory_text}")
+    print(f"saved {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""A stand-in Servarr/Dispatcharr server for the benchmarks.
+
+:class:`FakeArr` answers the few endpoints the benchmarks call from pre-built payloads, so the
+time measured is PyArr's own and not a real server's. It is both a WSGI and an ASGI application:
+the sync clients reach it in process through ``httpx.WSGITransport``, the async ones through
+``httpx.ASGITransport``, and :func:`serve` puts it on a localhost port to include real sockets.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from socketserver import ThreadingMixIn
+from typing import Any
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from payloads import build, encode
+
+_JSON = [("Content-Type", "application/json; charset=utf-8")]
+_STATUS = encode({"appName": "Sonarr", "version": "4.0.0.0", "isProduction": True, "authentication": "none"})
+
+
+class FakeArr:
+    """Answers the benchmarked endpoints of Radarr, Sonarr and Dispatcharr."""
+
+    def __init__(self, scale: float = 1.0):
+        """Builds the payloads.
+
+        Args:
+            scale (float, optional): Multiplies the library sizes. Defaults to 1.0.
+        """
+        self.data = build(scale)
+        self._pages: dict[tuple[int, int], bytes] = {}
+        self._lock = threading.Lock()
+
+    def answer(self, path: str, query: str) -> tuple[int, bytes]:
+        """Routes one request.
+
+        Args:
+            path (str): The URL path, such as ``/api/v3/movie``.
+            query (str): The query string.
+
+        Returns:
+            tuple[int, bytes]: The status and the JSON body.
+        """
+        path = path.rstrip("/")
+        if path == "/api":
+            return 200, encode({"current": "v3"})
+        endpoint = path.rsplit("/", 1)[-1]
+        if path.endswith("/system/status"):
+            return 200, _STATUS
+        if endpoint in ("movie", "episode", "streams"):
+            return 200, self.data[f"{endpoint}_body"]
+        if endpoint == "history":
+            params = parse_qs(query)
+            return 200, self._page(int(params.get("page", ["1"])[0]), int(params.get("pageSize", ["10"])[0]))
+        return 404, encode({"message": "NotFound"})
+
+    def _page(self, page: int, page_size: int) -> bytes:
+        """Returns one page of history, encoding it once.
+
+        Args:
+            page (int): The page number, starting at 1.
+            page_size (int): The records per page.
+
+        Returns:
+            bytes: The paged answer.
+        """
+        key = (page, page_size)
+        with self._lock:
+            body = self._pages.get(key)
+            if body is None:
+                records = self.data["history"]
+                start = (page - 1) * page_size
+                body = self._pages[key] = encode(
+                    {
+                        "page": page,
+                        "pageSize": page_size,
+                        "totalRecords": len(records),
+                        "records": records[start : start + page_size],
+                    }
+                )
+        return body
+
+    def __call__(self, environ_or_scope: dict[str, Any], *args: Any) -> Any:
+        """Serves a WSGI request, or returns the coroutine serving an ASGI one.
+
+        Args:
+            environ_or_scope (dict[str, Any]): The WSGI environ or the ASGI scope.
+            *args (Any): ``start_response`` for WSGI, ``receive`` and ``send`` for ASGI.
+
+        Returns:
+            Any: The WSGI body iterable, or the ASGI coroutine.
+        """
+        if "type" in environ_or_scope:
+            return self._asgi(environ_or_scope, *args)
+        start_response: Callable[..., Any] = args[0]
+        status, body = self.answer(environ_or_scope.get("PATH_INFO", ""), environ_or_scope.get("QUERY_STRING", ""))
+        start_response(
+            f"{status} {'OK' if status == 200 else 'Not Found'}", [*_JSON, ("Content-Length", str(len(body)))]
+        )
+        return [body]
+
+    async def _asgi(self, scope: dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        """Serves an ASGI request.
+
+        Args:
+            scope (dict[str, Any]): The connection scope.
+            receive (Callable[..., Any]): Receives ASGI messages.
+            send (Callable[..., Any]): Sends ASGI messages.
+        """
+        status, body = self.answer(scope["path"], scope.get("query_string", b"").decode())
+        headers = [(name.lower().encode(), value.encode()) for name, value in _JSON]
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+class _ThreadingServer(ThreadingMixIn, WSGIServer):
+    """A WSGI server with a thread per connection, so concurrent clients are not serialised."""
+
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    """Does not log every request."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Drops the access log line.
+
+        Args:
+            format (str): The message format.
+            *args (Any): The message arguments.
+        """
+
+
+@contextmanager
+def serve(app: FakeArr) -> Iterator[str]:
+    """Serves the application on a free localhost port while the context is open.
+
+    Args:
+        app (FakeArr): The application.
+
+    Yields:
+        str: The base URL of the server.
+    """
+    httpd = make_server("127.0.0.1", 0, app, server_class=_ThreadingServer, handler_class=_QuietHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_port}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
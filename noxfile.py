@@ -166,6 +166,13 @@ def test_style(session: Session) -> None:
     session.run("uv", "run", "interrogate", "src/pyarr", external=True)
 
 
+@nox.session(reuse_venv=True)
+def benchmarks(session: Session) -> None:
+    """Measure the client overhead against a local stand-in server"""
+    session.run("uv", "sync", external=True)
+    session.run("uv", "run", "python3", "benchmarks/run.py", *session.posargs, external=True)
+
+
 @nox.session(reuse_venv=True)
 def serve_docs(session: Session) -> None:
     """Create local copy of docs for testing"""
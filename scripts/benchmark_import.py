@@ -0,0 +1,39 @@
+"""Measure how long ``import pyarr`` takes for a script that only needs one client.
+
+Each statement runs in a fresh interpreter, so nothing is already cached in ``sys.modules``.
+``eager`` imports every client the way ``pyarr/__init__.py`` used to, ``lazy`` is what a script
+using only Sonarr now pays.
+
+    uv run python3 scripts/benchmark_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "eager": ("import pyarr\nfor name in pyarr.__all__:\n    getattr(pyarr, name)"),
+    "lazy": "import pyarr\npyarr.Sonarr",
+}
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    """Times ``statement`` in ``runs`` fresh interpreters."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(runs: int = 20) -> None:
+    baseline = statistics.median(measure("pass", runs))
+    for name, statement in STATEMENTS.items():
+        median = statistics.median(measure(statement, runs)) - baseline
+        print(f"{name:>6}: {median * 1000:7.1f} ms (interpreter start up excluded)")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,18 @@ def fix_sync_code(filepath):
 
     # unasync sometimes misses things or we need custom replacements
 
+    # Also moves shared helpers over, e.g. pyarr._async_synchronization becomes pyarr._sync_synchronization
     new_content = content.replace("pyarr._async", "pyarr._sync")
     new_content = new_content.replace("httpx.AsyncClient", "httpx.Client")
     new_content = new_content.replace("httpx.SyncClient", "httpx.Client")
+    new_content = new_content.replace("httpx.SyncBaseTransport", "httpx.BaseTransport")
+    new_content = new_content.replace("httpx.AsyncBaseTransport", "httpx.BaseTransport")
     new_content = new_content.replace("self.session.aclose()", "self.session.close()")
     new_content = new_content.replace("await self.session.aclose()", "self.session.close()")
+    # AsyncIterator sorted before Callable, Iterator does not
+    new_content = new_content.replace(
+        "from collections.abc import Iterator, Callable", "from collections.abc import Callable, Iterator"
+    )
 
     if new_content != content:
         with open(filepath, "w") as f:
@@ -38,6 +45,12 @@ def main():
                 "httpx.AsyncClient": "httpx.Client",
                 "pyarr._async": "pyarr._sync",
                 "aclose": "close",
+                "async_sleep": "sync_sleep",
+                "async_to_thread": "sync_to_thread",
+                "aiter_bytes": "iter_bytes",
+                "aiter_lines": "iter_lines",
+                "aread": "read",
+                "AsyncBaseTransport": "BaseTransport",
             },
         )
     ]
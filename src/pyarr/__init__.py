@@ -1,21 +1,6 @@
-from ._async.bazarr import Bazarr as AsyncBazarr
-from ._async.dispatcharr import Dispatcharr as AsyncDispatcharr
-from ._async.lidarr import Lidarr as AsyncLidarr
-from ._async.prowlarr import Prowlarr as AsyncProwlarr
-from ._async.radarr import Radarr as AsyncRadarr
-from ._async.readarr import Readarr as AsyncReadarr
-from ._async.sonarr import Sonarr as AsyncSonarr
-from ._async.utils.http import RequestHandler as AsyncRequestHandler
-from ._async.whisparr import Whisparr as AsyncWhisparr
-from ._sync.bazarr import Bazarr
-from ._sync.dispatcharr import Dispatcharr
-from ._sync.lidarr import Lidarr
-from ._sync.prowlarr import Prowlarr
-from ._sync.radarr import Radarr
-from ._sync.readarr import Readarr
-from ._sync.sonarr import Sonarr
-from ._sync.utils.http import RequestHandler
-from ._sync.whisparr import Whisparr
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     PyarrAccessRestricted,
     PyarrBadGateway,
@@ -30,6 +15,121 @@ from .exceptions import (
     PyarrUnauthorizedError,
 )
 
+if TYPE_CHECKING:
+    from ._async.bazarr import Bazarr as AsyncBazarr
+    from ._async.dispatcharr import Dispatcharr as AsyncDispatcharr
+    from ._async.dispatcher import CommandDispatcher as AsyncCommandDispatcher
+    from ._async.fleet import ArrFleet as AsyncArrFleet
+    from ._async.lidarr import Lidarr as AsyncLidarr
+    from ._async.mirror import LibraryMirror as AsyncLibraryMirror
+    from ._async.prowlarr import Prowlarr as AsyncProwlarr
+    from ._async.radarr import Radarr as AsyncRadarr
+    from ._async.readarr import Readarr as AsyncReadarr
+    from ._async.sonarr import Sonarr as AsyncSonarr
+    from ._async.utils.http import RequestHandler as AsyncRequestHandler
+    from ._async.whisparr import Whisparr as AsyncWhisparr
+    from ._sync.bazarr import Bazarr
+    from ._sync.dispatcharr import Dispatcharr
+    from ._sync.dispatcher import CommandDispatcher
+    from ._sync.fleet import ArrFleet
+    from ._sync.lidarr import Lidarr
+    from ._sync.mirror import LibraryMirror
+    from ._sync.prowlarr import Prowlarr
+    from ._sync.radarr import Radarr
+    from ._sync.readarr import Readarr
+    from ._sync.sonarr import Sonarr
+    from ._sync.utils.http import RequestHandler
+    from ._sync.whisparr import Whisparr
+    from .cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+    from .cassette import Cassette, RecordingTransport, ReplayTransport
+    from .codec import JsonCodec
+    from .events import ChangeEvent
+    from .fleet import FleetResult, FleetResults
+    from .instrumentation import LatencyHistograms, OpenTelemetryInstrument, RequestEvent
+    from .ratelimit import RateLimit
+    from .retry import RetryEvent, RetryPolicy
+    from .search import SearchCheckpoint, SearchProgress
+
+# The clients are imported on first access rather than here. Importing them all pulls in every
+# component module of both the sync and async packages, which short lived scripts that only
+# need one client should not pay for.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "Sonarr": ("._sync.sonarr", "Sonarr"),
+    "Radarr": ("._sync.radarr", "Radarr"),
+    "Readarr": ("._sync.readarr", "Readarr"),
+    "Lidarr": ("._sync.lidarr", "Lidarr"),
+    "Prowlarr": ("._sync.prowlarr", "Prowlarr"),
+    "Bazarr": ("._sync.bazarr", "Bazarr"),
+    "Whisparr": ("._sync.whisparr", "Whisparr"),
+    "Dispatcharr": ("._sync.dispatcharr", "Dispatcharr"),
+    "RequestHandler": ("._sync.utils.http", "RequestHandler"),
+    "AsyncSonarr": ("._async.sonarr", "Sonarr"),
+    "AsyncRadarr": ("._async.radarr", "Radarr"),
+    "AsyncReadarr": ("._async.readarr", "Readarr"),
+    "AsyncLidarr": ("._async.lidarr", "Lidarr"),
+    "AsyncProwlarr": ("._async.prowlarr", "Prowlarr"),
+    "AsyncBazarr": ("._async.bazarr", "Bazarr"),
+    "AsyncWhisparr": ("._async.whisparr", "Whisparr"),
+    "AsyncDispatcharr": ("._async.dispatcharr", "Dispatcharr"),
+    "AsyncRequestHandler": ("._async.utils.http", "RequestHandler"),
+    "ArrFleet": ("._sync.fleet", "ArrFleet"),
+    "AsyncArrFleet": ("._async.fleet", "ArrFleet"),
+    "LibraryMirror": ("._sync.mirror", "LibraryMirror"),
+    "AsyncLibraryMirror": ("._async.mirror", "LibraryMirror"),
+    "CommandDispatcher": ("._sync.dispatcher", "CommandDispatcher"),
+    "AsyncCommandDispatcher": ("._async.dispatcher", "CommandDispatcher"),
+    "FleetResult": (".fleet", "FleetResult"),
+    "FleetResults": (".fleet", "FleetResults"),
+    "ApiVersionCache": (".cache", "ApiVersionCache"),
+    "ResponseCache": (".cache", "ResponseCache"),
+    "ConditionalCache": (".cache", "ConditionalCache"),
+    "LookupCache": (".cache", "LookupCache"),
+    "JsonCodec": (".codec", "JsonCodec"),
+    "RetryPolicy": (".retry", "RetryPolicy"),
+    "RetryEvent": (".retry", "RetryEvent"),
+    "RateLimit": (".ratelimit", "RateLimit"),
+    "RequestEvent": (".instrumentation", "RequestEvent"),
+    "LatencyHistograms": (".instrumentation", "LatencyHistograms"),
+    "OpenTelemetryInstrument": (".instrumentation", "OpenTelemetryInstrument"),
+    "Cassette": (".cassette", "Cassette"),
+    "RecordingTransport": (".cassette", "RecordingTransport"),
+    "ReplayTransport": (".cassette", "ReplayTransport"),
+    "ChangeEvent": (".events", "ChangeEvent"),
+    "SearchCheckpoint": (".search", "SearchCheckpoint"),
+    "SearchProgress": (".search", "SearchProgress"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a public name on first access.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Raises:
+        AttributeError: If ``name`` is not part of the public API.
+
+    Returns:
+        Any: The class the name refers to.
+    """
+    try:
+        module, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Lists the module attributes, including names not imported yet.
+
+    Returns:
+        list[str]: The attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     "Sonarr",
     "Radarr",
@@ -49,6 +149,31 @@ __all__ = [
     "AsyncWhisparr",
     "AsyncDispatcharr",
     "AsyncRequestHandler",
+    "ArrFleet",
+    "AsyncArrFleet",
+    "LibraryMirror",
+    "AsyncLibraryMirror",
+    "CommandDispatcher",
+    "AsyncCommandDispatcher",
+    "FleetResult",
+    "FleetResults",
+    "ApiVersionCache",
+    "ResponseCache",
+    "ConditionalCache",
+    "LookupCache",
+    "JsonCodec",
+    "RetryPolicy",
+    "RetryEvent",
+    "RateLimit",
+    "RequestEvent",
+    "LatencyHistograms",
+    "OpenTelemetryInstrument",
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+    "ChangeEvent",
+    "SearchCheckpoint",
+    "SearchProgress",
     "PyarrAccessRestricted",
     "PyarrBadGateway",
     "PyarrBadRequest",
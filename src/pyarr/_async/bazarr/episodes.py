@@ -8,6 +8,8 @@ from pyarr.types import JsonObject
 class Episodes(CommonActions):
     """Episode actions for Bazarr."""
 
+    __slots__ = ()
+
     async def get(
         self,
         series_id: int | list[int] | None = None,
@@ -17,6 +19,7 @@ class Episodes(CommonActions):
         """Returns the episodes Bazarr knows about for the given series or episodes.
 
         Bazarr requires at least one series or episode ID, it answers an unfiltered request with a 404.
+        Long ID lists are split over several concurrent requests and the answers merged.
 
         Args:
             series_id (int | list[int] | None, optional): One or more Sonarr series IDs to list episodes for.
@@ -40,7 +43,14 @@ class Episodes(CommonActions):
         if episode_id is not None:
             params["episodeid[]"] = episode_id
 
-        response = await self.handler.request("episodes", params=params)
+        if isinstance(episode_id, list):
+            del params["episodeid[]"]
+            response = await self._request_chunked("episodes", "episodeid[]", episode_id, params)
+        elif isinstance(series_id, list):
+            del params["seriesid[]"]
+            response = await self._request_chunked("episodes", "seriesid[]", series_id, params)
+        else:
+            response = await self.handler.request("episodes", params=params)
         if isinstance(response, dict):
             return response
         raise ValueError("Expected a dictionary response from the 'episodes' endpoint")
@@ -9,6 +9,8 @@ from pyarr.types import JsonObject
 class Series(CommonActions):
     """Series actions for Bazarr."""
 
+    __slots__ = ()
+
     async def get(self, series_id: int | list[int] | None = None, **kwargs) -> JsonObject:
         """Returns the series Bazarr knows about.
 
@@ -21,10 +23,12 @@ class Series(CommonActions):
             JsonObject: Dictionary with a ``data`` list of series and a ``total`` count.
         """
         params: dict[str, Any] = dict(kwargs)
-        if series_id is not None:
-            params["seriesid[]"] = series_id
-
-        response = await self.handler.request("series", params=params)
+        if isinstance(series_id, list):
+            response = await self._request_chunked("series", "seriesid[]", series_id, params)
+        else:
+            if series_id is not None:
+                params["seriesid[]"] = series_id
+            response = await self.handler.request("series", params=params)
         if isinstance(response, dict):
             return response
         raise ValueError("Expected a dictionary response from the 'series' endpoint")
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Subtitles(CommonActions):
     """Subtitle actions for Bazarr."""
 
+    __slots__ = ()
+
     async def get(self, **kwargs) -> JsonArray:
         """Returns the list of subtitles.
 
@@ -1,34 +1,98 @@
-from typing import Any, TypeVar
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import httpx
 
-from pyarr._async.common.backup import Backup
-from pyarr._async.common.blocklist import Blocklist
-from pyarr._async.common.calendar import Calendar
-from pyarr._async.common.command import Command
-from pyarr._async.common.download_client import DownloadClient
-from pyarr._async.common.history import History
-from pyarr._async.common.import_list import ImportList
-from pyarr._async.common.indexer import Indexer
-from pyarr._async.common.log import Log
-from pyarr._async.common.metadata import Metadata
-from pyarr._async.common.notification import Notification
-from pyarr._async.common.quality_definition import QualityDefinition
-from pyarr._async.common.quality_profile import QualityProfile
-from pyarr._async.common.queue import Queue
-from pyarr._async.common.remote_path_mapping import RemotePathMapping
-from pyarr._async.common.root_folder import RootFolder
-from pyarr._async.common.system import System
-from pyarr._async.common.tag import Tag
-from pyarr._async.common.update import Update
 from pyarr._async.utils.http import RequestHandler
+from pyarr.cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+from pyarr.codec import JsonCodec
+from pyarr.instrumentation import Instrument
+from pyarr.ratelimit import RateLimit
+from pyarr.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyarr._async.common.backup import Backup
+    from pyarr._async.common.blocklist import Blocklist
+    from pyarr._async.common.calendar import Calendar
+    from pyarr._async.common.command import Command
+    from pyarr._async.common.download_client import DownloadClient
+    from pyarr._async.common.events import Events
+    from pyarr._async.common.history import History
+    from pyarr._async.common.import_list import ImportList
+    from pyarr._async.common.indexer import Indexer
+    from pyarr._async.common.log import Log
+    from pyarr._async.common.metadata import Metadata
+    from pyarr._async.common.notification import Notification
+    from pyarr._async.common.quality_definition import QualityDefinition
+    from pyarr._async.common.quality_profile import QualityProfile
+    from pyarr._async.common.queue import Queue
+    from pyarr._async.common.remote_path_mapping import RemotePathMapping
+    from pyarr._async.common.root_folder import RootFolder
+    from pyarr._async.common.system import System
+    from pyarr._async.common.tag import Tag
+    from pyarr._async.common.update import Update
 
 T = TypeVar("T", bound="BaseArrClient")
+C = TypeVar("C")
+
+
+class LazyComponent(Generic[C]):  # noqa: UP046 - mypy checks against Python 3.10
+    """A client component that is imported and built on first access.
+
+    Building every component up front imports each component module and constructs objects
+    most callers never touch. Declaring them with this descriptor defers both to the first
+    attribute access, after which the component is stored on the instance and later lookups
+    are plain attribute reads.
+    """
+
+    def __init__(self, module: str, name: str, **kwargs: Any):
+        """Initializes the descriptor.
+
+        Args:
+            module (str): Module defining the component class, relative to the client package,
+                for example ``".common.history"``.
+            name (str): Name of the component class in that module.
+            **kwargs (Any): Extra keyword arguments for the component constructor.
+        """
+        self.module = module
+        self.name = name
+        self.kwargs = kwargs
+        self.attr = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        """Records the attribute name the component is stored under.
+
+        Args:
+            owner (type): The client class.
+            attr (str): The attribute name.
+        """
+        self.attr = attr
+
+    def __get__(self, instance: Any, owner: type | None = None) -> C:
+        """Builds the component for the client on first access.
+
+        Args:
+            instance (Any): The client, or None when accessed on the class.
+            owner (type | None, optional): The client class. Defaults to None.
+
+        Returns:
+            C: The component, or the descriptor itself when accessed on the class.
+        """
+        if instance is None:
+            return self  # type: ignore[return-value]
+        component_class = getattr(importlib.import_module(self.module, __package__), self.name)
+        component = component_class(instance.http_utils, **self.kwargs)
+        instance.__dict__[self.attr] = component
+        return component
 
 
 class BaseArrClient:
     """Base class for all Arr clients."""
 
+    system: LazyComponent[System] = LazyComponent(".common.system", "System")
+
     def __init__(
         self,
         host: str,
@@ -41,6 +105,22 @@ class BaseArrClient:
         session: httpx.AsyncClient | None = None,
         verify_ssl: bool = True,
         headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        version_cache: ApiVersionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: JsonCodec | str | None = None,
+        models: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        warm_up: bool = False,
+        coalesce: bool = False,
+        batch_window: float | None = None,
+        batch_size: int = 100,
+        rate_limit: RateLimit | None = None,
+        instrumentation: Instrument | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        lookup_cache: LookupCache | None = None,
     ):
         """Initializes the client with the provided host, API key, and optional parameters.
 
@@ -55,6 +135,36 @@ class BaseArrClient:
             session (httpx.AsyncClient | None, optional): An existing httpx.AsyncClient session. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             headers (dict[str, str] | None, optional): Default headers to include in requests. Defaults to None.
+            retry (RetryPolicy | None, optional): How failed requests are retried. Defaults to None, the default policy.
+            version_cache (ApiVersionCache | None, optional): Where discovered API versions are cached between runs.
+                Defaults to None, always probe.
+            response_cache (ResponseCache | None, optional): Caches answers from rarely changing endpoints. Defaults to
+                None, no caching.
+            conditional_cache (ConditionalCache | None, optional): Revalidates repeated GETs instead of downloading and
+                decoding them again. Defaults to None, always fetch.
+            json_codec (JsonCodec | str | None, optional): The JSON backend, a codec or one of "orjson", "msgspec" and
+                "json". Defaults to None, the standard library.
+            models (bool, optional): Return typed records from pyarr.models instead of dictionaries where a model
+                exists. Defaults to False.
+            limits (httpx.Limits | None, optional): Connection pool limits and keep-alive expiry for the session PyArr
+                creates. Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session PyArr creates, needs the httpx[http2] extra.
+                Defaults to False.
+            warm_up (bool, optional): Open a connection, and discover the API version if needed, when entering the
+                context. Defaults to False.
+            coalesce (bool, optional): Share one in-flight answer among identical concurrent GETs. Defaults to False.
+            batch_window (float | None, optional): Gather single-ID lookups made within this many seconds into one list
+                request, where the endpoint supports it. Defaults to None, no batching.
+            batch_size (int, optional): The most IDs sent in one batched request, keeping URLs short. Defaults to 100.
+            rate_limit (RateLimit | None, optional): Paces and caps the requests sent to the host, pass one instance to
+                several clients to share it. Defaults to None, no limit.
+            instrumentation (Instrument | None, optional): Receives a RequestEvent with the timings, sizes and status of
+                every request. Defaults to None, nothing is measured.
+            transport (httpx.AsyncBaseTransport | None, optional): Sends requests through this transport instead of the
+                network, such as a :class:`~pyarr.cassette.ReplayTransport`. Ignored when ``session`` is given. Defaults
+                to None.
+            lookup_cache (LookupCache | None, optional): Caches metadata lookups on disk, shared between processes.
+                Defaults to None.
         """
         self.http_utils = RequestHandler(
             host,
@@ -67,8 +177,23 @@ class BaseArrClient:
             session=session,
             verify_ssl=verify_ssl,
             headers=headers,
+            retry=retry,
+            version_cache=version_cache,
+            response_cache=response_cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            models=models,
+            limits=limits,
+            http2=http2,
+            warm_up=warm_up,
+            coalesce=coalesce,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            rate_limit=rate_limit,
+            instrumentation=instrumentation,
+            transport=transport,
+            lookup_cache=lookup_cache,
         )
-        self.system = System(self.http_utils)
 
     async def __aenter__(self: T) -> T:
         """Enter the runtime context related to this object.
@@ -100,29 +225,26 @@ class MediaArrClient(BaseArrClient):
     which is why these live on this tier rather than on :class:`BaseArrClient`.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initializes the client and attaches the shared media management components.
-
-        Args:
-            *args (Any): Positional arguments for BaseArrClient.
-            **kwargs (Any): Keyword arguments for BaseArrClient.
-        """
-        super().__init__(*args, **kwargs)
-        self.history = History(self.http_utils)
-        self.backup = Backup(self.http_utils)
-        self.tag = Tag(self.http_utils)
-        self.blocklist = Blocklist(self.http_utils)
-        self.calendar = Calendar(self.http_utils)
-        self.root_folder = RootFolder(self.http_utils)
-        self.update = Update(self.http_utils)
-        self.metadata = Metadata(self.http_utils)
-        self.log = Log(self.http_utils)
-        self.indexer = Indexer(self.http_utils)
-        self.download_client = DownloadClient(self.http_utils)
-        self.import_list = ImportList(self.http_utils)
-        self.notification = Notification(self.http_utils)
-        self.quality_profile = QualityProfile(self.http_utils)
-        self.quality_definition = QualityDefinition(self.http_utils)
-        self.queue = Queue(self.http_utils)
-        self.remote_path_mapping = RemotePathMapping(self.http_utils)
-        self.command = Command(self.http_utils)
+    backup: LazyComponent[Backup] = LazyComponent(".common.backup", "Backup")
+    blocklist: LazyComponent[Blocklist] = LazyComponent(".common.blocklist", "Blocklist")
+    calendar: LazyComponent[Calendar] = LazyComponent(".common.calendar", "Calendar")
+    command: LazyComponent[Command] = LazyComponent(".common.command", "Command")
+    download_client: LazyComponent[DownloadClient] = LazyComponent(".common.download_client", "DownloadClient")
+    events: LazyComponent[Events] = LazyComponent(".common.events", "Events")
+    history: LazyComponent[History] = LazyComponent(".common.history", "History")
+    import_list: LazyComponent[ImportList] = LazyComponent(".common.import_list", "ImportList")
+    indexer: LazyComponent[Indexer] = LazyComponent(".common.indexer", "Indexer")
+    log: LazyComponent[Log] = LazyComponent(".common.log", "Log")
+    metadata: LazyComponent[Metadata] = LazyComponent(".common.metadata", "Metadata")
+    notification: LazyComponent[Notification] = LazyComponent(".common.notification", "Notification")
+    quality_definition: LazyComponent[QualityDefinition] = LazyComponent(
+        ".common.quality_definition", "QualityDefinition"
+    )
+    quality_profile: LazyComponent[QualityProfile] = LazyComponent(".common.quality_profile", "QualityProfile")
+    queue: LazyComponent[Queue] = LazyComponent(".common.queue", "Queue")
+    remote_path_mapping: LazyComponent[RemotePathMapping] = LazyComponent(
+        ".common.remote_path_mapping", "RemotePathMapping"
+    )
+    root_folder: LazyComponent[RootFolder] = LazyComponent(".common.root_folder", "RootFolder")
+    tag: LazyComponent[Tag] = LazyComponent(".common.tag", "Tag")
+    update: LazyComponent[Update] = LazyComponent(".common.update", "Update")
@@ -7,6 +7,8 @@ from pyarr.types import JsonArray
 class Calendar(CommonActions):
     """Calendar actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(
         self,
         start_date: datetime | None = None,
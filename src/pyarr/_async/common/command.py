@@ -1,10 +1,38 @@
+from typing import Any
+
 from pyarr._async.common.base import CommonActions
+from pyarr._async_synchronization import AsyncPoller
+from pyarr.exceptions import PyarrResourceNotFound
 from pyarr.types import JsonArray, JsonObject
 
+#: Statuses a command does not leave.
+FINISHED_STATUSES = frozenset({"completed", "failed", "aborted", "cancelled", "orphaned"})
+#: Searches that take a list of IDs, and the field holding the IDs.
+SEARCH_COMMANDS = {
+    "EpisodeSearch": "episodeIds",
+    "MoviesSearch": "movieIds",
+    "AlbumSearch": "albumIds",
+    "BookSearch": "bookIds",
+}
+
+
+def _finished(command: JsonObject) -> bool:
+    """Whether a command has ended.
+
+    Args:
+        command (JsonObject): The command.
+
+    Returns:
+        bool: True once its status is final.
+    """
+    return command.get("status") in FINISHED_STATUSES
+
 
 class Command(CommonActions):
     """Command actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Queries the status of a previously started command, or all currently started commands.
 
@@ -16,21 +44,82 @@ class Command(CommonActions):
         """
         return await self._get("command", item_id=item_id)
 
-    async def execute(self, name: str, **kwargs) -> JsonObject:
+    async def execute(self, name: str, wait: bool = False, timeout: float | None = None, **kwargs) -> JsonObject:
         """Performs any of the predetermined command routines.
 
         Args:
             name (str): Command name that should be executed.
+            wait (bool, optional): Return once the command has ended rather than once it is queued, see
+                :meth:`wait`. Defaults to False.
+            timeout (float | None, optional): With ``wait``, seconds to wait at most. Defaults to None, as long
+                as it takes.
             **kwargs: Additional parameters for specific commands.
 
+        Raises:
+            TimeoutError: If ``wait`` is set and the command did not end in time. It keeps running.
+
         Returns:
-            JsonObject: Dictionary of command run.
+            JsonObject: Dictionary of command run, in its final state with ``wait``.
         """
         json_data = {"name": name}
         if kwargs:
             json_data |= kwargs
 
         response = await self.handler.request("command", method="POST", json_data=json_data)
-        if isinstance(response, dict):
-            return response
-        raise ValueError("Expected a dictionary response from the 'command' endpoint")
+        if not isinstance(response, dict):
+            raise ValueError("Expected a dictionary response from the 'command' endpoint")
+        if wait and not _finished(response):
+            return await self.wait(response["id"], timeout)
+        return response
+
+    async def wait(self, item_id: int, timeout: float | None = None) -> JsonObject:
+        """Waits until a command has ended, whatever its outcome.
+
+        Every command waited on through the same client is tracked by one poll of the command list,
+        rather than a request per command. Polls start every half second and slow down to one every
+        ten seconds while nothing changes. A poll that fails is tried again at the next interval, and
+        the wait fails with its error only after five polls in a row have failed. A command no longer
+        listed is fetched on its own, and is reported ``orphaned`` if the server no longer knows it.
+
+        Args:
+            item_id (int): Database ID of the command.
+            timeout (float | None, optional): Seconds to wait at most. Defaults to None, as long as it takes.
+
+        Raises:
+            TimeoutError: If the command did not end in time. It keeps running, see :meth:`cancel`.
+
+        Returns:
+            JsonObject: The command, with a ``status`` of ``completed``, ``failed``, ``aborted``, ``cancelled``
+                or ``orphaned``.
+        """
+        poller = self.handler.pollers.get("command")
+        if poller is None:
+            poller = self.handler.pollers["command"] = AsyncPoller(self._statuses, _finished)
+        return await poller.wait(item_id, timeout)
+
+    async def _statuses(self, ids: list[int]) -> dict[int, Any]:
+        """Fetches the current state of commands.
+
+        Args:
+            ids (list[int]): The command IDs.
+
+        Returns:
+            dict[int, Any]: The commands, by ID.
+        """
+        response = await self.handler.request("command")
+        wanted = set(ids)
+        found = {command["id"]: command for command in response or [] if command.get("id") in wanted}
+        for item_id in wanted.difference(found):
+            try:
+                found[item_id] = await self._get("command", item_id=item_id)
+            except PyarrResourceNotFound:
+                found[item_id] = {"id": item_id, "status": "orphaned"}
+        return found
+
+    async def cancel(self, item_id: int) -> None:
+        """Cancels a command that has not started yet.
+
+        Args:
+            item_id (int): Database ID of the command.
+        """
+        await self._delete("command", item_id=item_id)
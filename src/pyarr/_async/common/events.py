@@ -0,0 +1,100 @@
+from collections.abc import AsyncGenerator, Iterable
+
+from pyarr._async.common.base import CommonActions
+from pyarr._async_synchronization import async_sleep
+from pyarr.events import CLOSE, HANDSHAKE, HUB_PATH, ChangeEvent, change_event, parse_messages
+from pyarr.exceptions import PyarrBadGateway, PyarrConnectionError, PyarrServerError
+from pyarr.models import EpisodeRecord, MovieRecord, QueueRecord, Record, SeriesRecord
+
+#: The records the resources of typed events become.
+_MODELS: dict[str, type[Record]] = {
+    "episode": EpisodeRecord,
+    "movie": MovieRecord,
+    "series": SeriesRecord,
+    "queue": QueueRecord,
+}
+
+
+class Events(CommonActions):
+    """Change events pushed by the server, for Arr clients."""
+
+    __slots__ = ()
+
+    async def subscribe(
+        self,
+        names: Iterable[str] | None = None,
+        idle_timeout: float = 60.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+        models: bool | None = None,
+    ) -> AsyncGenerator[ChangeEvent, None]:
+        """Yields the changes the server announces, as they happen, for as long as it is iterated.
+
+        Connects to the SignalR hub, the same feed the web UI uses, in place of polling the queue, history
+        or health. A dropped or silent connection is reopened, waiting longer after each failed attempt.
+        Changes made while disconnected are not replayed, so once reconnected a ``sync`` event is yielded
+        for each name subscribed to, or one named ``*`` when subscribed to everything: fetch those
+        resources again. Closing the iterator closes the connection.
+
+        Args:
+            names (Iterable[str] | None, optional): Only these resources, such as ``queue``, ``episode``,
+                ``movie``, ``health`` or ``command``. Defaults to None, every resource.
+            idle_timeout (float, optional): Seconds without any message, the server pings every 15, before the
+                connection is considered dead. Defaults to 60.0.
+            reconnect_delay (float, optional): Seconds before the first reconnect attempt, doubled for each
+                attempt that fails. Defaults to 1.0.
+            max_reconnect_delay (float, optional): Longest wait between attempts. Defaults to 60.0.
+            models (bool | None, optional): Return episodes, movies, series and queue items as records from
+                :mod:`pyarr.models` rather than dictionaries. Defaults to None, the client setting.
+
+        Yields:
+            ChangeEvent: Each change.
+        """
+        wanted = set(names) if names is not None else None
+        delay = reconnect_delay
+        connected = False
+        while True:
+            try:
+                negotiation = await self.handler.request(
+                    f"{HUB_PATH}/negotiate", method="POST", params={"negotiateVersion": 1}
+                )
+                params = {"id": negotiation.get("connectionToken") or negotiation["connectionId"]}
+                async with self.handler.server_events(HUB_PATH, params, read_timeout=idle_timeout) as events:
+                    await self.handler.request(HUB_PATH, method="POST", params=params, data=HANDSHAKE)
+                    if connected:
+                        for name in sorted(wanted) if wanted is not None else ["*"]:
+                            yield ChangeEvent(name, "sync", None)
+                    connected = True
+                    delay = reconnect_delay
+                    closed = False
+                    async for data in events:
+                        for message in parse_messages(data):
+                            if "error" in message:
+                                raise PyarrConnectionError(f"The hub refused the connection: {message['error']}")
+                            if message.get("type") == CLOSE:
+                                closed = True
+                                break
+                            event = change_event(message)
+                            if event is not None and (wanted is None or event.name in wanted):
+                                yield self._typed(event, models)
+                        if closed:
+                            break
+            except (PyarrConnectionError, PyarrServerError, PyarrBadGateway):
+                pass
+            await async_sleep(delay)
+            delay = min(delay * 2, max_reconnect_delay)
+
+    def _typed(self, event: ChangeEvent, models: bool | None) -> ChangeEvent:
+        """Converts the resource of an event to a record, when records are wanted.
+
+        Args:
+            event (ChangeEvent): The event.
+            models (bool | None): The choice made for the call, None to use the client setting.
+
+        Returns:
+            ChangeEvent: The event, with a record in place of the dictionary if wanted.
+        """
+        model = _MODELS.get(event.name)
+        if model is None or not isinstance(event.resource, dict) or not self._wants_models(models):
+            return event
+        return event._replace(resource=model.from_dict(event.resource))
@@ -10,6 +10,8 @@ class ImportListExclusion(CommonActions):
     ``exclusions``, while Sonarr, Lidarr, Readarr and Whisparr use ``importlistexclusion``.
     """
 
+    __slots__ = ("path",)
+
     def __init__(self, handler: RequestHandler, path: str = "importlistexclusion"):
         """Initializes the import list exclusion actions with the provided request handler.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Indexer(CommonActions):
     """Indexer actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of indexers or a specific indexer by ID.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Metadata(CommonActions):
     """Metadata actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of metadata consumer settings or a specific record by ID.
 
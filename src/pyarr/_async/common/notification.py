@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Notification(CommonActions):
     """Notification actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of notification services or a specific service by ID.
 
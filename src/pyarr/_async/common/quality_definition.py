@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class QualityDefinition(CommonActions):
     """Quality definition actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of quality definitions or a specific definition by ID.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class QualityProfile(CommonActions):
     """Quality profile actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of quality profiles or a specific profile by ID.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class RemotePathMapping(CommonActions):
     """Remote path mapping actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of remote path mappings or a specific mapping by ID.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class System(CommonActions):
     """System actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get_status(self) -> JsonObject:
         """Gets system status.
 
@@ -7,6 +7,8 @@ from pyarr.types import JsonObject
 class Tag(CommonActions):
     """Tag actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> Any:
         """Returns the list of added tags or a specific tag by ID.
 
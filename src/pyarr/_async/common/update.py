@@ -5,6 +5,8 @@ from pyarr.types import JsonArray
 class Update(CommonActions):
     """Update actions for Arr clients."""
 
+    __slots__ = ()
+
     async def get(self) -> JsonArray:
         """Returns the list of available updates.
 
@@ -1,21 +1,40 @@
+import os
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
 from pyarr._async.common.base import CommonActions
+from pyarr._async.common.command import SEARCH_COMMANDS, Command
 from pyarr._async.utils.http import RequestHandler
+from pyarr._async_synchronization import async_sleep, async_to_thread
 from pyarr.exceptions import PyarrMissingArgument
+from pyarr.ratelimit import RateLimit
+from pyarr.search import SearchCheckpoint, SearchProgress
 from pyarr.types import JsonObject
 
 
 class Wanted(CommonActions):
     """Wanted actions for Arr clients."""
 
-    def __init__(self, handler: RequestHandler, path: str = "wanted/missing"):
+    __slots__ = ("path", "search_command")
+
+    def __init__(
+        self,
+        handler: RequestHandler,
+        path: str = "wanted/missing",
+        search_command: str | None = None,
+    ):
         """Initializes the wanted actions with the provided request handler.
 
         Args:
             handler (RequestHandler): The request handler to use for API requests.
             path (str, optional): The API endpoint path. Defaults to "wanted/missing".
+            search_command (str | None, optional): The command that searches wanted items by ID, such as
+                ``EpisodeSearch``. Defaults to None, for clients that cannot search them.
         """
         super().__init__(handler)
         self.path = path
+        self.search_command = search_command
 
     async def get(
         self,
@@ -59,3 +78,198 @@ class Wanted(CommonActions):
         if isinstance(response, dict):
             return response
         raise TypeError("Expected response to be a dictionary")
+
+    def iter_pages(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        max_concurrency: int = 4,
+        **kwargs,
+    ) -> AsyncIterator[JsonObject]:
+        """Iterates over every page of wanted items, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            **kwargs: Additional parameters for specific clients.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each page in order, with its ``records``.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        if kwargs:
+            params |= kwargs
+
+        return self._iter_pages(self.path, params, page_size, max_concurrency)
+
+    def iter_records(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        max_concurrency: int = 4,
+        **kwargs,
+    ) -> AsyncIterator[JsonObject]:
+        """Iterates over every wanted item, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            **kwargs: Additional parameters for specific clients.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each record in order.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        if kwargs:
+            params |= kwargs
+
+        return self._iter_records(self.path, params, page_size, max_concurrency)
+
+    def search(
+        self,
+        cutoff: bool = False,
+        chunk_size: int = 100,
+        commands_per_minute: float | None = None,
+        wait: bool = False,
+        checkpoint: SearchCheckpoint | str | os.PathLike[str] | None = None,
+        page_size: int = 250,
+        max_concurrency: int = 4,
+        **kwargs,
+    ) -> AsyncIterator[SearchProgress]:
+        """Searches every wanted item, in batched search commands.
+
+        Pages of wanted items are fetched concurrently while the IDs already seen are sent, ``chunk_size`` at
+        a time, as one search command per batch. Items that move between pages while paging are only
+        searched once.
+
+        Args:
+            cutoff (bool, optional): Search the items that have not met their quality cutoff rather than the
+                missing ones. Defaults to False.
+            chunk_size (int, optional): The most IDs sent in one search command. Defaults to 100.
+            commands_per_minute (float | None, optional): The most search commands sent per minute. Defaults to
+                None, no limit.
+            wait (bool, optional): Wait for each search to end before sending the next, so at most one runs at a
+                time. Defaults to False.
+            checkpoint (SearchCheckpoint | str | os.PathLike[str] | None, optional): A checkpoint, or its file,
+                recording each batch once sent. Items it holds are skipped, so an interrupted search resumes
+                where it stopped. The file is removed once the search completes. Defaults to None.
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            **kwargs: Additional parameters for specific clients.
+
+        Raises:
+            ValueError: If the client cannot search wanted items, ``chunk_size`` or ``commands_per_minute`` is
+                not positive, or the checkpoint belongs to a search of the other endpoint.
+
+        Returns:
+            AsyncIterator[SearchProgress]: The progress after each search command, then once all pages are done.
+        """
+        if self.search_command is None:
+            raise ValueError("This client cannot search wanted items")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if commands_per_minute is not None and commands_per_minute <= 0:
+            raise ValueError("commands_per_minute must be positive")
+        path = "wanted/cutoff" if cutoff else self.path
+        if checkpoint is not None and not isinstance(checkpoint, SearchCheckpoint):
+            checkpoint = SearchCheckpoint(checkpoint)
+        if checkpoint is not None:
+            checkpoint.check(path)
+        limit = RateLimit(rate=commands_per_minute / 60, burst=1) if commands_per_minute else None
+        params = dict(kwargs)
+
+        return self._search(path, params, chunk_size, limit, wait, checkpoint, page_size, max_concurrency)
+
+    async def _search(
+        self,
+        path: str,
+        params: dict[str, Any],
+        chunk_size: int,
+        limit: RateLimit | None,
+        wait: bool,
+        checkpoint: SearchCheckpoint | None,
+        page_size: int,
+        max_concurrency: int,
+    ) -> AsyncIterator[SearchProgress]:
+        """Pages through wanted items and searches them in batches.
+
+        Args:
+            path (str): The wanted endpoint.
+            params (dict[str, Any]): The query parameters, without paging.
+            chunk_size (int): The most IDs sent in one search command.
+            limit (RateLimit | None): Paces the search commands.
+            wait (bool): Wait for each search to end before sending the next.
+            checkpoint (SearchCheckpoint | None): Records the batches sent.
+            page_size (int): Number of items per page.
+            max_concurrency (int): Maximum number of page requests in flight.
+
+        Yields:
+            SearchProgress: The progress after each search command, then once all pages are done.
+        """
+        started = time.monotonic()
+        pages = total = skipped = searched = commands = 0
+        seen: set[int] = set()
+        batch: list[int] = []
+
+        async for page in self._iter_pages(path, params, page_size, max_concurrency):
+            pages += 1
+            total = page.get("totalRecords", total)
+            for record in page.get("records", []):
+                item_id = record.get("id")
+                if item_id is None or item_id in seen:
+                    continue
+                seen.add(item_id)
+                if checkpoint is not None and item_id in checkpoint.searched:
+                    skipped += 1
+                    continue
+                batch.append(item_id)
+                if len(batch) == chunk_size:
+                    await self._search_batch(path, batch, limit, wait, checkpoint)
+                    searched += len(batch)
+                    commands += 1
+                    batch = []
+                    yield SearchProgress(
+                        pages, total, len(seen), skipped, searched, commands, time.monotonic() - started, False
+                    )
+        if batch:
+            await self._search_batch(path, batch, limit, wait, checkpoint)
+            searched += len(batch)
+            commands += 1
+        if checkpoint is not None:
+            await async_to_thread(checkpoint.clear)
+        yield SearchProgress(pages, total, len(seen), skipped, searched, commands, time.monotonic() - started, True)
+
+    async def _search_batch(
+        self,
+        path: str,
+        ids: list[int],
+        limit: RateLimit | None,
+        wait: bool,
+        checkpoint: SearchCheckpoint | None,
+    ) -> None:
+        """Sends one search command.
+
+        Args:
+            path (str): The wanted endpoint the IDs came from.
+            ids (list[int]): The IDs to search.
+            limit (RateLimit | None): Paces the search commands.
+            wait (bool): Wait for the search to end.
+            checkpoint (SearchCheckpoint | None): Records the batch once sent.
+        """
+        delay = limit.reserve() if limit is not None else 0.0
+        if delay:
+            await async_sleep(delay)
+        name = self.search_command or ""
+        command = Command(self.handler)
+        body: dict[str, Any] = {SEARCH_COMMANDS[name]: ids}
+        response = await command.execute(name, **body)
+        if checkpoint is not None:
+            await async_to_thread(checkpoint.record, path, ids)
+        if wait:
+            await command.wait(response["id"])
@@ -1,27 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import httpx
 
-from pyarr._async.client import BaseArrClient
-from pyarr._async.dispatcharr.accounts import Accounts
-from pyarr._async.dispatcharr.backups import Backups
-from pyarr._async.dispatcharr.channel_groups import ChannelGroups
-from pyarr._async.dispatcharr.channel_logos import ChannelLogos
-from pyarr._async.dispatcharr.channel_profiles import ChannelProfiles
-from pyarr._async.dispatcharr.channels import Channels
-from pyarr._async.dispatcharr.connect import Connect
-from pyarr._async.dispatcharr.epg import Epg
-from pyarr._async.dispatcharr.hdhr import Hdhr
-from pyarr._async.dispatcharr.live import Live
-from pyarr._async.dispatcharr.m3u import M3u
-from pyarr._async.dispatcharr.plugins import Plugins
-from pyarr._async.dispatcharr.proxy import Proxy
-from pyarr._async.dispatcharr.streams import Streams
-from pyarr._async.dispatcharr.system import DispatcharrSystem
-from pyarr._async.dispatcharr.vod import Vod
+from pyarr._async.client import BaseArrClient, LazyComponent
+from pyarr.cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+from pyarr.codec import JsonCodec
+from pyarr.instrumentation import Instrument
+from pyarr.ratelimit import RateLimit
+from pyarr.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyarr._async.dispatcharr.accounts import Accounts
+    from pyarr._async.dispatcharr.backups import Backups
+    from pyarr._async.dispatcharr.channel_groups import ChannelGroups
+    from pyarr._async.dispatcharr.channel_logos import ChannelLogos
+    from pyarr._async.dispatcharr.channel_profiles import ChannelProfiles
+    from pyarr._async.dispatcharr.channels import Channels
+    from pyarr._async.dispatcharr.connect import Connect
+    from pyarr._async.dispatcharr.epg import Epg
+    from pyarr._async.dispatcharr.hdhr import Hdhr
+    from pyarr._async.dispatcharr.live import Live
+    from pyarr._async.dispatcharr.m3u import M3u
+    from pyarr._async.dispatcharr.plugins import Plugins
+    from pyarr._async.dispatcharr.proxy import Proxy
+    from pyarr._async.dispatcharr.streams import Streams
+    from pyarr._async.dispatcharr.system import DispatcharrSystem
+    from pyarr._async.dispatcharr.vod import Vod
 
 
 class Dispatcharr(BaseArrClient):
     """Dispatcharr API client."""
 
+    accounts: LazyComponent[Accounts] = LazyComponent(".dispatcharr.accounts", "Accounts")
+    backups: LazyComponent[Backups] = LazyComponent(".dispatcharr.backups", "Backups")
+    channels: LazyComponent[Channels] = LazyComponent(".dispatcharr.channels", "Channels")
+    channel_groups: LazyComponent[ChannelGroups] = LazyComponent(".dispatcharr.channel_groups", "ChannelGroups")
+    channel_logos: LazyComponent[ChannelLogos] = LazyComponent(".dispatcharr.channel_logos", "ChannelLogos")
+    channel_profiles: LazyComponent[ChannelProfiles] = LazyComponent(".dispatcharr.channel_profiles", "ChannelProfiles")
+    connect: LazyComponent[Connect] = LazyComponent(".dispatcharr.connect", "Connect")
+    epg: LazyComponent[Epg] = LazyComponent(".dispatcharr.epg", "Epg")
+    hdhr: LazyComponent[Hdhr] = LazyComponent(".dispatcharr.hdhr", "Hdhr")
+    live: LazyComponent[Live] = LazyComponent(".dispatcharr.live", "Live")
+    m3u: LazyComponent[M3u] = LazyComponent(".dispatcharr.m3u", "M3u")
+    plugins: LazyComponent[Plugins] = LazyComponent(".dispatcharr.plugins", "Plugins")
+    proxy: LazyComponent[Proxy] = LazyComponent(".dispatcharr.proxy", "Proxy")
+    streams: LazyComponent[Streams] = LazyComponent(".dispatcharr.streams", "Streams")
+    system: LazyComponent[DispatcharrSystem] = LazyComponent(".dispatcharr.system", "DispatcharrSystem")  # type: ignore[assignment]
+    vod: LazyComponent[Vod] = LazyComponent(".dispatcharr.vod", "Vod")
+
     def __init__(
         self,
         host: str,
@@ -34,6 +62,22 @@ class Dispatcharr(BaseArrClient):
         session: httpx.AsyncClient | None = None,
         verify_ssl: bool = True,
         headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        version_cache: ApiVersionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: JsonCodec | str | None = None,
+        models: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        warm_up: bool = False,
+        coalesce: bool = False,
+        batch_window: float | None = None,
+        batch_size: int = 100,
+        rate_limit: RateLimit | None = None,
+        instrumentation: Instrument | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        lookup_cache: LookupCache | None = None,
     ):
         """Initializes the Dispatcharr client.
 
@@ -48,6 +92,36 @@ class Dispatcharr(BaseArrClient):
             session (httpx.AsyncClient | None, optional): An existing httpx.AsyncClient session. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             headers (dict[str, str] | None, optional): Default headers to include in requests. Defaults to None.
+            retry (RetryPolicy | None, optional): How failed requests are retried. Defaults to None, the default policy.
+            version_cache (ApiVersionCache | None, optional): Where discovered API versions are cached between runs.
+                Defaults to None, always probe.
+            response_cache (ResponseCache | None, optional): Caches answers from rarely changing endpoints. Defaults to
+                None, no caching.
+            conditional_cache (ConditionalCache | None, optional): Revalidates repeated GETs instead of downloading and
+                decoding them again. Defaults to None, always fetch.
+            json_codec (JsonCodec | str | None, optional): The JSON backend, a codec or one of "orjson", "msgspec" and
+                "json". Defaults to None, the standard library.
+            models (bool, optional): Return typed records from pyarr.models instead of dictionaries where a model
+                exists. Defaults to False.
+            limits (httpx.Limits | None, optional): Connection pool limits and keep-alive expiry for the session PyArr
+                creates. Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session PyArr creates, needs the httpx[http2] extra.
+                Defaults to False.
+            warm_up (bool, optional): Open a connection, and discover the API version if needed, when entering the
+                context. Defaults to False.
+            coalesce (bool, optional): Share one in-flight answer among identical concurrent GETs. Defaults to False.
+            batch_window (float | None, optional): Gather single-ID lookups made within this many seconds into one list
+                request, where the endpoint supports it. Defaults to None, no batching.
+            batch_size (int, optional): The most IDs sent in one batched request, keeping URLs short. Defaults to 100.
+            rate_limit (RateLimit | None, optional): Paces and caps the requests sent to the host, pass one instance to
+                several clients to share it. Defaults to None, no limit.
+            instrumentation (Instrument | None, optional): Receives a RequestEvent with the timings, sizes and status of
+                every request. Defaults to None, nothing is measured.
+            transport (httpx.AsyncBaseTransport | None, optional): Sends requests through this transport instead of the
+                network, such as a :class:`~pyarr.cassette.ReplayTransport`. Ignored when ``session`` is given. Defaults
+                to None.
+            lookup_cache (LookupCache | None, optional): Caches metadata lookups on disk, shared between processes.
+                Defaults to None.
         """
         super().__init__(
             host,
@@ -60,20 +134,20 @@ class Dispatcharr(BaseArrClient):
             session=session,
             verify_ssl=verify_ssl,
             headers=headers,
+            retry=retry,
+            version_cache=version_cache,
+            response_cache=response_cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            models=models,
+            limits=limits,
+            http2=http2,
+            warm_up=warm_up,
+            coalesce=coalesce,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            rate_limit=rate_limit,
+            instrumentation=instrumentation,
+            transport=transport,
+            lookup_cache=lookup_cache,
         )
-        self.accounts = Accounts(self.http_utils)
-        self.backups = Backups(self.http_utils)
-        self.channels = Channels(self.http_utils)
-        self.channel_groups = ChannelGroups(self.http_utils)
-        self.channel_logos = ChannelLogos(self.http_utils)
-        self.channel_profiles = ChannelProfiles(self.http_utils)
-        self.connect = Connect(self.http_utils)
-        self.epg = Epg(self.http_utils)
-        self.hdhr = Hdhr(self.http_utils)
-        self.live = Live(self.http_utils)
-        self.m3u = M3u(self.http_utils)
-        self.plugins = Plugins(self.http_utils)
-        self.proxy = Proxy(self.http_utils)
-        self.streams = Streams(self.http_utils)
-        self.system = DispatcharrSystem(self.http_utils)  # type: ignore
-        self.vod = Vod(self.http_utils)
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Backups(CommonActions):
     """Backup actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get(self) -> JsonArray:
         """List all available backup files.
 
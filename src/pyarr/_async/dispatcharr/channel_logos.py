@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class ChannelLogos(CommonActions):
     """Channel logo actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve channel logos.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class ChannelProfiles(CommonActions):
     """Channel profile actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve channel profiles.
 
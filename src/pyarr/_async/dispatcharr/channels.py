@@ -1,12 +1,15 @@
 from typing import Any
 
 from pyarr._async.common.base import CommonActions
+from pyarr.models import ChannelRecord
 from pyarr.types import JsonArray, JsonObject
 
 
 class Channels(CommonActions):
     """Channel actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get(
         self,
         item_id: int | None = None,
@@ -17,7 +20,8 @@ class Channels(CommonActions):
         page: int | None = None,
         page_size: int | None = None,
         search: str | None = None,
-    ) -> JsonArray | JsonObject:
+        models: bool | None = None,
+    ) -> JsonArray | JsonObject | list[ChannelRecord] | ChannelRecord:
         """Returns the list of channels or a specific channel by ID.
 
         Args:
@@ -29,9 +33,11 @@ class Channels(CommonActions):
             page (int | None, optional): A page number within the paginated result set. Defaults to None.
             page_size (int | None, optional): Number of results to return per page. Defaults to None.
             search (str | None, optional): A search term. Defaults to None.
+            models (bool | None, optional): Return ChannelRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
-            JsonArray | JsonObject: The response data.
+            JsonArray | JsonObject | list[ChannelRecord] | ChannelRecord: The response data.
         """
         params: dict[str, Any] = {}
         if channel_group:
@@ -49,7 +55,8 @@ class Channels(CommonActions):
         if search:
             params["search"] = search
 
-        return await self._get("channels/channels/", item_id=item_id, params=params)
+        response = await self._get("channels/channels/", item_id=item_id, params=params)
+        return self._to_models(response, ChannelRecord, models)
 
     async def add(self, data: JsonObject) -> JsonObject:
         """Add a new channel.
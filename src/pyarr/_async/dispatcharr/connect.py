@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Connect(CommonActions):
     """Connect actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get_integrations(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve integrations.
 
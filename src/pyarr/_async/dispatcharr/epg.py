@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Epg(CommonActions):
     """EPG actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get_current_programs(self, data: JsonObject) -> JsonArray | JsonObject:
         """Retrieve current programs.
 
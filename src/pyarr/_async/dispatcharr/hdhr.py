@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Hdhr(CommonActions):
     """HDHR actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get_device_xml(self) -> JsonObject:
         """Retrieve HDHR device XML.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonObject
 class Live(CommonActions):
     """Live actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get_stream(self, username: str, password: str, channel_id: str) -> JsonObject:
         """Retrieve live stream.
 
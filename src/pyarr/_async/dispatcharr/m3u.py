@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class M3u(CommonActions):
     """M3U actions for Dispatcharr."""
 
+    __slots__ = ()
+
     async def get_accounts(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve M3U accounts.
 
@@ -1,20 +1,93 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
 from pyarr._async.common.base import CommonActions
+from pyarr.models import StreamRecord
 from pyarr.types import JsonArray, JsonObject
 
 
 class Streams(CommonActions):
     """Stream actions for Dispatcharr."""
 
-    async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
+    __slots__ = ()
+
+    async def get(
+        self, item_id: int | None = None, models: bool | None = None
+    ) -> JsonArray | JsonObject | list[StreamRecord] | StreamRecord:
         """Returns the list of streams or a specific stream by ID.
 
+        When the client has a ``batch_window``, concurrent lookups of a single stream by ID are sent as one
+        :meth:`get_by_ids` request.
+
         Args:
             item_id (int | None, optional): ID of the stream to return. Defaults to None.
+            models (bool | None, optional): Return StreamRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
-            JsonArray | JsonObject: The response data.
+            JsonArray | JsonObject | list[StreamRecord] | StreamRecord: The response data.
+        """
+        if item_id and self._batching():
+            response = await self._get_batched("channels/streams/", item_id, self._get_list_by_ids)
+        else:
+            response = await self._get("channels/streams/", item_id=item_id)
+        return self._to_models(response, StreamRecord, models)
+
+    def iter_records(
+        self,
+        models: bool | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[JsonObject | StreamRecord]:
+        """Iterates over every stream, one page at a time.
+
+        The stream list is paginated, so only one page of ``page_size`` streams is held in memory
+        however many streams the server has. Pages are requested until the server reports no
+        ``next`` page.
+
+        Args:
+            models (bool | None, optional): Return StreamRecord records rather than dictionaries. Defaults to None, the
+                client setting.
+            page_size (int, optional): Number of streams per page. Defaults to 500.
+
+        Raises:
+            ValueError: If ``page_size`` is less than 1.
+
+        Returns:
+            AsyncIterator[JsonObject | StreamRecord]: Each stream.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        return self._iter_streams(models, page_size)
+
+    async def _iter_streams(self, models: bool | None, page_size: int) -> AsyncIterator[Any]:
+        """Yields the streams of each page in turn, see :meth:`iter_records`.
+
+        Args:
+            models (bool | None): Return StreamRecord records rather than dictionaries.
+            page_size (int): Number of streams per page.
+
+        Raises:
+            TypeError: If a page holds no list of streams.
+
+        Yields:
+            Any: Each stream, as a dictionary or a record.
         """
-        return await self._get("channels/streams/", item_id=item_id)
+        convert = self._wants_models(models)
+        page = 1
+        while True:
+            response = await self.handler.request("channels/streams/", params={"page": page, "page_size": page_size})
+            if isinstance(response, dict):
+                results, more = response.get("results"), bool(response.get("next"))
+            else:
+                # A server without pagination answers with every stream at once.
+                results, more = response, False
+            if not isinstance(results, list):
+                raise TypeError("Expected a paginated list response from the 'channels/streams/' endpoint")
+            for item in results:
+                yield StreamRecord.from_dict(item) if convert else item
+            if not more or not results:
+                return
+            page += 1
 
     async def add(self, data: JsonObject) -> JsonObject:
         """Add a new stream.
@@ -88,6 +161,25 @@ class Streams(CommonActions):
         response = await self.handler.request("channels/streams/by-ids/", method="POST", json_data={"ids": ids})
         return response
 
+    async def _get_list_by_ids(self, ids: list[int]) -> list[Any]:
+        """Retrieve streams by a list of IDs, for the bulk fetch of a batch.
+
+        Args:
+            ids (list[int]): List of stream IDs.
+
+        Raises:
+            TypeError: If the answer holds no list of streams.
+
+        Returns:
+            list[Any]: The streams.
+        """
+        response: Any = await self.get_by_ids(ids)
+        if isinstance(response, dict):
+            response = response.get("results")
+        if isinstance(response, list):
+            return response
+        raise TypeError("Expected a list response from the 'channels/streams/by-ids/' endpoint")
+
     async def get_filter_options(self) -> JsonObject:
         """Retrieve filter options for streams.
 
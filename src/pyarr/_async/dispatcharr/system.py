@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class DispatcharrSystem(CommonActions):
     """System actions for Dispatcharr (Core API)."""
 
+    __slots__ = ()
+
     async def get_notifications(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve notifications.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Album(CommonActions):
     """Album actions for Lidarr."""
 
+    __slots__ = ()
+
     async def get(
         self,
         item_id: int | None = None,
@@ -18,7 +20,8 @@ class Album(CommonActions):
         Args:
             item_id (int | None, optional): Lidarr ID of album. Defaults to None.
             artist_id (int | None, optional): Lidarr ID of artist. Defaults to None.
-            album_ids (list[int] | None, optional): List of album IDs. Defaults to None.
+            album_ids (list[int] | None, optional): List of album IDs, long lists are split over several concurrent
+                requests. Defaults to None.
             foreign_album_id (str | None, optional): Foreign album ID. Defaults to None.
             all_artist_albums (bool, optional): Include all artist albums. Defaults to False.
 
@@ -28,11 +31,11 @@ class Album(CommonActions):
         params: dict[str, str | int | bool | list[int]] = {"includeAllArtistAlbums": all_artist_albums}
         if artist_id:
             params["artistId"] = artist_id
-        if album_ids:
-            params["albumIds"] = album_ids
         if foreign_album_id:
             params["foreignAlbumId"] = foreign_album_id
 
+        if album_ids and not item_id:
+            return await self._request_chunked("album", "albumIds", album_ids, params)
         return await self._get("album", item_id=item_id, params=params)
 
     async def add(
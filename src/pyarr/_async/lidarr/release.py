@@ -5,6 +5,8 @@ from pyarr.types import JsonArray
 class Release(CommonActions):
     """Release actions for Lidarr."""
 
+    __slots__ = ()
+
     async def get(self, artist_id: int | None = None, album_id: int | None = None) -> JsonArray:
         """Search indexers for specified fields.
 
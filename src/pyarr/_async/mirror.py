@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from pyarr._async.radarr import Radarr
+from pyarr._async.sonarr import Sonarr
+from pyarr._async_synchronization import AsyncLock, AsyncPool, async_to_thread
+from pyarr.exceptions import PyarrResourceNotFound
+from pyarr.mirror import MirrorStore, newest_date
+from pyarr.types import JsonArray, JsonObject
+
+#: Kinds refetched whole on every sync, they are small and not reported in history.
+_SHARED_KINDS = ("tag", "qualityprofile")
+
+
+class LibraryMirror:
+    """Keeps a Sonarr or Radarr library in a local SQLite database.
+
+    The first sync copies every series with its episodes and episode files, or every movie with its
+    file, plus the tags and quality profiles. Later syncs read the history recorded since the last
+    one and refetch only the series or movies it mentions. Changes that leave no history, such as a
+    series added or edited by hand, are picked up by the full sync repeated every
+    ``full_sync_interval``. Reads are served from the database and trigger a sync first once the data
+    is older than ``max_staleness``.
+    """
+
+    def __init__(
+        self,
+        client: Sonarr | Radarr,
+        path: str | os.PathLike[str] = ":memory:",
+        max_staleness: float | None = 60.0,
+        full_sync_interval: float | None = 86400.0,
+        max_concurrency: int = 4,
+    ):
+        """Initializes the mirror, resuming from the state saved in ``path``.
+
+        Args:
+            client (Sonarr | Radarr): The client to mirror.
+            path (str | os.PathLike[str], optional): The database file. Defaults to ":memory:", a mirror that
+                starts empty.
+            max_staleness (float | None, optional): Seconds after a sync before reads sync again. Defaults to
+                60.0, None to only sync when :meth:`sync` is called.
+            full_sync_interval (float | None, optional): Seconds between full syncs. Defaults to 86400.0, None
+                to only sync fully the first time or when asked.
+            max_concurrency (int, optional): Maximum number of series fetched at once. Defaults to 4.
+
+        Raises:
+            TypeError: If the client is neither a Sonarr nor a Radarr client.
+        """
+        if isinstance(client, Sonarr):
+            self.parent_kind, self.parent_key = "series", "seriesId"
+            self.child_kinds: tuple[str, ...] = ("episode", "episodefile")
+        elif isinstance(client, Radarr):
+            self.parent_kind, self.parent_key = "movie", "movieId"
+            self.child_kinds = ("moviefile",)
+        else:
+            raise TypeError("LibraryMirror only mirrors Sonarr and Radarr libraries")
+        self.client = client
+        self.store = MirrorStore(path)
+        self.max_staleness = max_staleness
+        self.full_sync_interval = full_sync_interval
+        self.max_concurrency = max_concurrency
+        self.kinds = (self.parent_kind, *self.child_kinds, *_SHARED_KINDS)
+        synced_at = self.store.state("synced_at")
+        self.synced_at = float(synced_at) if synced_at is not None else None
+        self._lock = AsyncLock()
+
+    async def __aenter__(self) -> LibraryMirror:
+        """Enter the runtime context related to this object.
+
+        Returns:
+            LibraryMirror: The mirror.
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Closes the database.
+
+        Args:
+            exc_type (Any): The exception type.
+            exc_value (Any): The exception value.
+            traceback (Any): The traceback.
+        """
+        await async_to_thread(self.store.close)
+
+    @property
+    def stale(self) -> bool:
+        """Whether the next read syncs first.
+
+        Returns:
+            bool: True if the mirror was never synced, or was synced longer than ``max_staleness`` ago.
+        """
+        if self.synced_at is None:
+            return True
+        return self.max_staleness is not None and time.time() - self.synced_at > self.max_staleness
+
+    async def get(
+        self,
+        kind: str,
+        item_id: int | None = None,
+        parent_id: int | None = None,
+    ) -> JsonArray | JsonObject | None:
+        """Reads mirrored records, syncing first if the mirror is stale.
+
+        Args:
+            kind (str): One of :attr:`kinds`, such as ``series``, ``episode`` or ``movie``.
+            item_id (int | None, optional): Return this record only. Defaults to None.
+            parent_id (int | None, optional): Return the records of this series or movie only, for episodes and
+                files. Defaults to None.
+
+        Raises:
+            ValueError: If the kind is not mirrored from this client.
+
+        Returns:
+            JsonArray | JsonObject | None: The records by ID, or the record asked for, None if there is no such
+                record.
+        """
+        if kind not in self.kinds:
+            raise ValueError(f"{kind!r} is not mirrored, expected one of {', '.join(self.kinds)}")
+        await self.refresh()
+        if item_id is not None:
+            return await async_to_thread(self.store.get, kind, item_id)
+        return await async_to_thread(self.store.all, kind, parent_id)
+
+    async def refresh(self) -> bool:
+        """Syncs if the mirror is stale, once however many callers ask at the same time.
+
+        Returns:
+            bool: True if a sync ran.
+        """
+        if not self.stale:
+            return False
+        async with self._lock:
+            if not self.stale:
+                return False
+            await self._sync(False)
+        return True
+
+    async def sync(self, full: bool = False) -> int:
+        """Brings the mirror up to date.
+
+        Args:
+            full (bool, optional): Copy the whole library again rather than only what changed. Defaults to False.
+
+        Returns:
+            int: The number of series or movies fetched.
+        """
+        async with self._lock:
+            return await self._sync(full)
+
+    async def _sync(self, full: bool) -> int:
+        """Runs a full or an incremental sync, whichever is due.
+
+        Args:
+            full (bool): Run a full sync whether it is due or not.
+
+        Returns:
+            int: The number of series or movies fetched.
+        """
+        watermark = await async_to_thread(self.store.state, "watermark")
+        full_synced_at = await async_to_thread(self.store.state, "full_synced_at")
+        due = (
+            self.full_sync_interval is not None
+            and full_synced_at is not None
+            and time.time() - float(full_synced_at) > self.full_sync_interval
+        )
+        if full or due or watermark is None or full_synced_at is None:
+            return await self._full_sync()
+        return await self._incremental_sync(watermark)
+
+    async def _full_sync(self) -> int:
+        """Copies the whole library.
+
+        Returns:
+            int: The number of series or movies fetched.
+        """
+        watermark = await self._latest_event()
+        parents = await self._fetch_parents()
+        children = await self._fetch_children(parents)
+        await async_to_thread(self.store.replace, self.parent_kind, parents)
+        for kind in self.child_kinds:
+            owned = [child for found in children for child in found[kind]]
+            await async_to_thread(self.store.replace, kind, owned, self.parent_key)
+        await self._sync_shared()
+        now = time.time()
+        await async_to_thread(self.store.set_state, watermark=watermark, synced_at=str(now), full_synced_at=str(now))
+        self.synced_at = now
+        return len(parents)
+
+    async def _incremental_sync(self, watermark: str) -> int:
+        """Refetches the series or movies with history since the watermark.
+
+        Args:
+            watermark (str): The date of the newest history record seen so far.
+
+        Returns:
+            int: The number of series or movies fetched.
+        """
+        events = await self.client.history.since(watermark)
+        changed = sorted({event[self.parent_key] for event in events if event.get(self.parent_key)})
+        async with AsyncPool(self.max_concurrency) as pool:
+            futures = [pool.submit(self._fetch_parent, item_id) for item_id in changed]
+            parents = [await pool.result(future) for future in futures]
+        found = [parent for parent in parents if parent is not None]
+        children = await self._fetch_children(found)
+        for item_id, parent in zip(changed, parents, strict=True):
+            if parent is None:
+                await async_to_thread(self.store.delete, self.parent_kind, item_id, self.child_kinds)
+        await async_to_thread(self.store.upsert, self.parent_kind, found)
+        for parent, owned in zip(found, children, strict=True):
+            for kind in self.child_kinds:
+                await async_to_thread(self.store.replace, kind, owned[kind], self.parent_key, parent["id"])
+        await self._sync_shared()
+        now = time.time()
+        latest = newest_date(watermark, *(str(event["date"]) for event in events))
+        await async_to_thread(self.store.set_state, watermark=latest, synced_at=str(now))
+        self.synced_at = now
+        return len(changed)
+
+    async def _latest_event(self) -> str:
+        """Returns the date of the newest history record, the watermark a full sync starts from.
+
+        Returns:
+            str: The date, or the current time if there is no history.
+        """
+        page = await self.client.history.get(page=1, page_size=1, sort_key="date", sort_dir="descending", models=False)
+        records = page.get("records") or []
+        if records:
+            return str(records[0]["date"])
+        return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    async def _fetch_parents(self) -> JsonArray:
+        """Fetches every series or movie.
+
+        Returns:
+            JsonArray: The series or movies.
+        """
+        if isinstance(self.client, Sonarr):
+            return await self.client.series.get(models=False)  # type: ignore[return-value]
+        return await self.client.movie.get(models=False)  # type: ignore[return-value]
+
+    async def _fetch_parent(self, item_id: int) -> JsonObject | None:
+        """Fetches one series or movie.
+
+        Args:
+            item_id (int): Its ID.
+
+        Returns:
+            JsonObject | None: The series or movie, None if it was deleted.
+        """
+        try:
+            if isinstance(self.client, Sonarr):
+                return await self.client.series.get(item_id, models=False)  # type: ignore[return-value]
+            return await self.client.movie.get(item_id, models=False)  # type: ignore[return-value]
+        except PyarrResourceNotFound:
+            return None
+
+    async def _fetch_children(self, parents: JsonArray) -> list[dict[str, JsonArray]]:
+        """Fetches the episodes and files of series, or takes the file of movies from the movie itself.
+
+        Args:
+            parents (JsonArray): The series or movies.
+
+        Returns:
+            list[dict[str, JsonArray]]: The records of each child kind, for each parent in order.
+        """
+        client = self.client
+        if isinstance(client, Radarr):
+            return [{"moviefile": [parent["movieFile"]] if parent.get("movieFile") else []} for parent in parents]
+        async with AsyncPool(self.max_concurrency) as pool:
+            futures = [pool.submit(self._fetch_episodes, client, parent["id"]) for parent in parents]
+            return [await pool.result(future) for future in futures]
+
+    async def _fetch_episodes(self, client: Sonarr, series_id: int) -> dict[str, JsonArray]:
+        """Fetches the episodes and episode files of a series.
+
+        Args:
+            client (Sonarr): The client.
+            series_id (int): The series ID.
+
+        Returns:
+            dict[str, JsonArray]: The episodes and the files.
+        """
+        episodes = await client.episode.get(series_id=series_id, models=False)
+        files = await client.episode_file.get(series_id=series_id)
+        return {"episode": episodes, "episodefile": files}  # type: ignore[dict-item]
+
+    async def _sync_shared(self) -> None:
+        """Refetches the tags and quality profiles."""
+        tags = await self.client.tag.get()
+        profiles = await self.client.quality_profile.get()
+        await async_to_thread(self.store.replace, "tag", tags)
+        await async_to_thread(self.store.replace, "qualityprofile", profiles)
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Indexer(CommonIndexer):
     """Indexer actions for Prowlarr."""
 
+    __slots__ = ()
+
     async def get_stats(self) -> JsonObject:
         """Gets indexer stats.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class IndexerProxy(CommonActions):
     """Indexer proxy actions for Prowlarr."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of indexer proxies or a specific proxy by ID.
 
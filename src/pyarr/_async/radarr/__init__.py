@@ -1,19 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import httpx
 
-from pyarr._async.client import MediaArrClient
-from pyarr._async.common.import_list_exclusion import ImportListExclusion
-from pyarr._async.common.wanted import Wanted
-from pyarr._async.radarr.config import Config
-from pyarr._async.radarr.custom_filter import CustomFilter
-from pyarr._async.radarr.manual_import import ManualImport
-from pyarr._async.radarr.movie import Movie
-from pyarr._async.radarr.movie_file import MovieFile
-from pyarr._async.radarr.release import Release
+from pyarr._async.client import LazyComponent, MediaArrClient
+from pyarr.cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+from pyarr.codec import JsonCodec
+from pyarr.instrumentation import Instrument
+from pyarr.ratelimit import RateLimit
+from pyarr.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyarr._async.common.import_list_exclusion import ImportListExclusion
+    from pyarr._async.common.wanted import Wanted
+    from pyarr._async.radarr.config import Config
+    from pyarr._async.radarr.custom_filter import CustomFilter
+    from pyarr._async.radarr.manual_import import ManualImport
+    from pyarr._async.radarr.movie import Movie
+    from pyarr._async.radarr.movie_file import MovieFile
+    from pyarr._async.radarr.release import Release
 
 
 class Radarr(MediaArrClient):
     """Radarr API client."""
 
+    config: LazyComponent[Config] = LazyComponent(".radarr.config", "Config")
+    movie: LazyComponent[Movie] = LazyComponent(".radarr.movie", "Movie")
+    movie_file: LazyComponent[MovieFile] = LazyComponent(".radarr.movie_file", "MovieFile")
+    release: LazyComponent[Release] = LazyComponent(".radarr.release", "Release")
+    manual_import: LazyComponent[ManualImport] = LazyComponent(".radarr.manual_import", "ManualImport")
+    custom_filter: LazyComponent[CustomFilter] = LazyComponent(".radarr.custom_filter", "CustomFilter")
+    wanted: LazyComponent[Wanted] = LazyComponent(".common.wanted", "Wanted", search_command="MoviesSearch")
+    import_list_exclusion: LazyComponent[ImportListExclusion] = LazyComponent(
+        ".common.import_list_exclusion", "ImportListExclusion", path="exclusions"
+    )
+
     def __init__(
         self,
         host: str,
@@ -26,6 +48,22 @@ class Radarr(MediaArrClient):
         session: httpx.AsyncClient | None = None,
         verify_ssl: bool = True,
         headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        version_cache: ApiVersionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: JsonCodec | str | None = None,
+        models: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        warm_up: bool = False,
+        coalesce: bool = False,
+        batch_window: float | None = None,
+        batch_size: int = 100,
+        rate_limit: RateLimit | None = None,
+        instrumentation: Instrument | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        lookup_cache: LookupCache | None = None,
     ):
         """Initializes the Radarr client with the provided host, API key, and optional parameters.
 
@@ -40,6 +78,36 @@ class Radarr(MediaArrClient):
             session (httpx.AsyncClient | None, optional): An existing httpx.AsyncClient session. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             headers (dict[str, str] | None, optional): Default headers to include in requests. Defaults to None.
+            retry (RetryPolicy | None, optional): How failed requests are retried. Defaults to None, the default policy.
+            version_cache (ApiVersionCache | None, optional): Where discovered API versions are cached between runs.
+                Defaults to None, always probe.
+            response_cache (ResponseCache | None, optional): Caches answers from rarely changing endpoints. Defaults to
+                None, no caching.
+            conditional_cache (ConditionalCache | None, optional): Revalidates repeated GETs instead of downloading and
+                decoding them again. Defaults to None, always fetch.
+            json_codec (JsonCodec | str | None, optional): The JSON backend, a codec or one of "orjson", "msgspec" and
+                "json". Defaults to None, the standard library.
+            models (bool, optional): Return typed records from pyarr.models instead of dictionaries where a model
+                exists. Defaults to False.
+            limits (httpx.Limits | None, optional): Connection pool limits and keep-alive expiry for the session PyArr
+                creates. Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session PyArr creates, needs the httpx[http2] extra.
+                Defaults to False.
+            warm_up (bool, optional): Open a connection, and discover the API version if needed, when entering the
+                context. Defaults to False.
+            coalesce (bool, optional): Share one in-flight answer among identical concurrent GETs. Defaults to False.
+            batch_window (float | None, optional): Gather single-ID lookups made within this many seconds into one list
+                request, where the endpoint supports it. Defaults to None, no batching.
+            batch_size (int, optional): The most IDs sent in one batched request, keeping URLs short. Defaults to 100.
+            rate_limit (RateLimit | None, optional): Paces and caps the requests sent to the host, pass one instance to
+                several clients to share it. Defaults to None, no limit.
+            instrumentation (Instrument | None, optional): Receives a RequestEvent with the timings, sizes and status of
+                every request. Defaults to None, nothing is measured.
+            transport (httpx.AsyncBaseTransport | None, optional): Sends requests through this transport instead of the
+                network, such as a :class:`~pyarr.cassette.ReplayTransport`. Ignored when ``session`` is given. Defaults
+                to None.
+            lookup_cache (LookupCache | None, optional): Caches metadata lookups on disk, shared between processes.
+                Defaults to None.
         """
         super().__init__(
             host,
@@ -52,12 +120,20 @@ class Radarr(MediaArrClient):
             session=session,
             verify_ssl=verify_ssl,
             headers=headers,
+            retry=retry,
+            version_cache=version_cache,
+            response_cache=response_cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            models=models,
+            limits=limits,
+            http2=http2,
+            warm_up=warm_up,
+            coalesce=coalesce,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            rate_limit=rate_limit,
+            instrumentation=instrumentation,
+            transport=transport,
+            lookup_cache=lookup_cache,
         )
-        self.config = Config(self.http_utils)
-        self.movie = Movie(self.http_utils)
-        self.movie_file = MovieFile(self.http_utils)
-        self.release = Release(self.http_utils)
-        self.manual_import = ManualImport(self.http_utils)
-        self.custom_filter = CustomFilter(self.http_utils)
-        self.wanted = Wanted(self.http_utils)
-        self.import_list_exclusion = ImportListExclusion(self.http_utils, path="exclusions")
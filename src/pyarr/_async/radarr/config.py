@@ -4,6 +4,8 @@ from pyarr._async.utils.http import RequestHandler
 class Config:
     """Config actions for Radarr."""
 
+    __slots__ = ("handler",)
+
     def __init__(self, handler: RequestHandler):
         """Initializes the config actions with the provided request handler.
 
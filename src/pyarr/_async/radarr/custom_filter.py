@@ -5,6 +5,8 @@ from pyarr.types import JsonArray
 class CustomFilter(CommonActions):
     """Custom filter actions for Radarr."""
 
+    __slots__ = ()
+
     async def get(self) -> JsonArray:
         """Query Radarr for custom filters.
 
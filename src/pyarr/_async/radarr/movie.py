@@ -1,25 +1,51 @@
+from collections.abc import AsyncIterator
+
 from pyarr._async.common.base import CommonActions
+from pyarr.models import MovieRecord
 from pyarr.types import JsonArray, JsonObject
 
 
 class Movie(CommonActions):
     """Movie actions for Radarr."""
 
-    async def get(self, item_id: int | None = None, tmdb_id: int | None = None) -> JsonArray | JsonObject:
+    __slots__ = ()
+
+    async def get(
+        self, item_id: int | None = None, tmdb_id: int | None = None, models: bool | None = None
+    ) -> JsonArray | JsonObject | list[MovieRecord] | MovieRecord:
         """Returns movies by ID or TMDB ID.
 
         Args:
             item_id (int | None, optional): Radarr ID of movie. Defaults to None.
             tmdb_id (int | None, optional): TMDB ID of movie. Defaults to None.
+            models (bool | None, optional): Return MovieRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
-            JsonArray | JsonObject: List of dictionaries with items or a single dictionary.
+            JsonArray | JsonObject | list[MovieRecord] | MovieRecord: List of items or a single item.
         """
         params = {}
         if tmdb_id:
             params["tmdbid"] = tmdb_id
 
-        return await self._get("movie", item_id=item_id, params=params)
+        response = await self._get("movie", item_id=item_id, params=params)
+        return self._to_models(response, MovieRecord, models)
+
+    def iter_records(
+        self, tmdb_id: int | None = None, models: bool | None = None
+    ) -> AsyncIterator[JsonObject | MovieRecord]:
+        """Streams the movie library, decoding one movie at a time as the answer downloads.
+
+        Args:
+            tmdb_id (int | None, optional): TMDB ID of movie. Defaults to None.
+            models (bool | None, optional): Return MovieRecord records rather than dictionaries. Defaults to None, the
+                client setting.
+
+        Returns:
+            AsyncIterator[JsonObject | MovieRecord]: Each movie.
+        """
+        params = {"tmdbid": tmdb_id} if tmdb_id else None
+        return self._stream("movie", params, MovieRecord, models)
 
     async def add(
         self,
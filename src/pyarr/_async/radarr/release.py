@@ -7,6 +7,8 @@ from pyarr.types import JsonArray, JsonObject
 class Release(CommonActions):
     """Release actions for Radarr."""
 
+    __slots__ = ()
+
     async def get(self, movie_id: int | None = None) -> JsonArray:
         """Query indexers for latest releases.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray, JsonObject
 class Author(CommonActions):
     """Author actions for Readarr."""
 
+    __slots__ = ()
+
     async def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns authors by ID or all authors.
 
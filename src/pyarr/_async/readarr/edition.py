@@ -5,6 +5,8 @@ from pyarr.types import JsonArray
 class Edition(CommonActions):
     """Edition actions for Readarr."""
 
+    __slots__ = ()
+
     async def get(self, book_id: int) -> JsonArray:
         """Get editions for a specific book.
 
@@ -5,6 +5,8 @@ from pyarr.types import JsonArray
 class ManualImport(CommonActions):
     """Manual import actions for Readarr."""
 
+    __slots__ = ()
+
     async def get(
         self,
         folder: str,
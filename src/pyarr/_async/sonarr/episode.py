@@ -1,25 +1,57 @@
+from collections.abc import AsyncIterator
+
 from pyarr._async.common.base import CommonActions
+from pyarr.models import EpisodeRecord
 from pyarr.types import JsonArray, JsonObject
 
 
 class Episode(CommonActions):
     """Episode actions for Sonarr."""
 
-    async def get(self, item_id: int | None = None, series_id: int | None = None) -> JsonArray | JsonObject:
+    __slots__ = ()
+
+    async def get(
+        self, item_id: int | None = None, series_id: int | None = None, models: bool | None = None
+    ) -> JsonArray | JsonObject | list[EpisodeRecord] | EpisodeRecord:
         """Returns episodes by ID or series ID.
 
+        When the client has a ``batch_window``, concurrent lookups of a single episode by ID are sent as one
+        request.
+
         Args:
             item_id (int | None, optional): ID for Episode. Defaults to None.
             series_id (int | None, optional): ID for Series. Defaults to None.
+            models (bool | None, optional): Return EpisodeRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
-            JsonArray | JsonObject: List of dictionaries with items or a single dictionary.
+            JsonArray | JsonObject | list[EpisodeRecord] | EpisodeRecord: List of items or a single item.
         """
         params = {}
         if series_id:
             params["seriesId"] = series_id
 
-        return await self._get("episode", item_id=item_id, params=params)
+        if item_id and not params and self._batching():
+            response = await self._get_batched("episode", item_id, self._get_by_ids, "episode", "episodeIds")
+        else:
+            response = await self._get("episode", item_id=item_id, params=params)
+        return self._to_models(response, EpisodeRecord, models)
+
+    def iter_records(
+        self, series_id: int | None = None, models: bool | None = None
+    ) -> AsyncIterator[JsonObject | EpisodeRecord]:
+        """Streams episodes, decoding one episode at a time as the answer downloads.
+
+        Args:
+            series_id (int | None, optional): ID for Series. Defaults to None.
+            models (bool | None, optional): Return EpisodeRecord records rather than dictionaries. Defaults to None, the
+                client setting.
+
+        Returns:
+            AsyncIterator[JsonObject | EpisodeRecord]: Each episode.
+        """
+        params = {"seriesId": series_id} if series_id else None
+        return self._stream("episode", params, EpisodeRecord, models)
 
     async def update(self, item_id: int, data: JsonObject) -> JsonObject:
         """Update the given episode.
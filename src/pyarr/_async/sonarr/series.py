@@ -1,37 +1,59 @@
+from collections.abc import AsyncIterator
+
 from pyarr._async.common.base import CommonActions
 from pyarr.exceptions import PyarrMissingArgument
+from pyarr.models import SeriesRecord
 from pyarr.types import JsonArray, JsonObject
 
 
 class Series(CommonActions):
     """Series actions for Sonarr."""
 
-    async def get(self, item_id: int | None = None, tvdb: bool = False, tmdb: bool = False) -> JsonArray | JsonObject:
+    __slots__ = ()
+
+    async def get(
+        self, item_id: int | None = None, tvdb: bool = False, tmdb: bool = False, models: bool | None = None
+    ) -> JsonArray | JsonObject | list[SeriesRecord] | SeriesRecord:
         """Returns the list of added series or a specific series by ID, TVDB ID, or TMDB ID.
 
         Args:
             item_id (int | None, optional): ID of the series to return. Defaults to None.
             tvdb (bool, optional): Set to true if item_id is the TVDB ID. Defaults to False.
             tmdb (bool, optional): Set to true if item_id is the TMDB ID. Defaults to False.
+            models (bool | None, optional): Return SeriesRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
-            JsonArray | JsonObject: List of dictionaries with items or a single dictionary.
+            JsonArray | JsonObject | list[SeriesRecord] | SeriesRecord: List of items or a single item.
         """
         if item_id and tvdb:
             params = {"tvdbid": item_id}
             response = await self.handler.request("series", params=params)
             if isinstance(response, list):
-                return response
+                return self._to_models(response, SeriesRecord, models)
             raise ValueError(f"Expected a list response from the 'series?tvdbid={item_id}' endpoint")
 
         if item_id and tmdb:
             params = {"tmdbid": item_id}
             response = await self.handler.request("series", params=params)
             if isinstance(response, list):
-                return response
+                return self._to_models(response, SeriesRecord, models)
             raise ValueError(f"Expected a list response from the 'series?tmdbid={item_id}' endpoint")
 
-        return await self._get("series", item_id=item_id)
+        response = await self._get("series", item_id=item_id)
+        return self._to_models(response, SeriesRecord, models)
+
+    def iter_records(self, models: bool | None = None) -> AsyncIterator[JsonObject | SeriesRecord]:
+        """Streams the added series, decoding one series at a time as the answer downloads.
+
+        Args:
+            models (bool | None, optional): Return SeriesRecord records rather than dictionaries. Defaults to None, the
+                client setting.
+
+        Returns:
+            AsyncIterator[JsonObject | SeriesRecord]: Each series.
+        """
+        return self._stream("series", None, SeriesRecord, models)
 
     async def add(
         self,
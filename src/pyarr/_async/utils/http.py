@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import importlib.util
 import inspect
-from collections.abc import Mapping
+import threading
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
-import backoff
 import httpx
 from yarl import URL
 
+from pyarr._async_synchronization import (
+    AsyncBatcher,
+    AsyncGate,
+    AsyncLock,
+    AsyncPoller,
+    AsyncSingleFlight,
+    async_sleep,
+    async_to_thread,
+)
+from pyarr.cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+from pyarr.codec import JsonArrayDecoder, JsonCodec, get_codec
 from pyarr.exceptions import (
     PyarrAccessRestricted,
     PyarrBadGateway,
@@ -18,6 +32,10 @@ from pyarr.exceptions import (
     PyarrServerError,
     PyarrUnauthorizedError,
 )
+from pyarr.instrumentation import Instrument, RequestTimer
+from pyarr.pool import PoolStats, TraceCallback, is_connection_event
+from pyarr.ratelimit import RateLimit, RateLimitTicket
+from pyarr.retry import RetryBudget, RetryEvent, RetryPolicy, RetryStats
 
 
 class RequestHandler:
@@ -35,6 +53,22 @@ class RequestHandler:
         session: httpx.AsyncClient | None = None,
         verify_ssl: bool = True,
         headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        version_cache: ApiVersionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: JsonCodec | str | None = None,
+        models: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        warm_up: bool = False,
+        coalesce: bool = False,
+        batch_window: float | None = None,
+        batch_size: int = 100,
+        rate_limit: RateLimit | None = None,
+        instrumentation: Instrument | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        lookup_cache: LookupCache | None = None,
     ) -> None:
         """
         Initializes the HTTP client with the provided host, API key, and optional parameters.
@@ -50,10 +84,43 @@ class RequestHandler:
             session (httpx.AsyncClient | None, optional): An existing httpx.AsyncClient session. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             headers (dict[str, str] | None, optional): Default headers to include in requests. Defaults to None.
+            retry (RetryPolicy | None, optional): How failed requests are retried. Defaults to None, the default policy.
+            version_cache (ApiVersionCache | None, optional): Where discovered API versions are cached between runs.
+                Defaults to None, always probe.
+            response_cache (ResponseCache | None, optional): Caches answers from rarely changing endpoints. Defaults to
+                None, no caching.
+            conditional_cache (ConditionalCache | None, optional): Revalidates repeated GETs instead of downloading and
+                decoding them again. Defaults to None, always fetch.
+            json_codec (JsonCodec | str | None, optional): The JSON backend, a codec or one of "orjson", "msgspec" and
+                "json". Defaults to None, the standard library.
+            models (bool, optional): Return typed records from pyarr.models instead of dictionaries where a model
+                exists. Defaults to False.
+            limits (httpx.Limits | None, optional): Connection pool limits and keep-alive expiry for the session PyArr
+                creates. Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session PyArr creates, needs the http2 extra.
+                Defaults to False.
+            warm_up (bool, optional): Open a connection, and discover the API version if needed, when entering the
+                context. Defaults to False.
+            coalesce (bool, optional): Share one in-flight answer among identical concurrent GETs. Defaults to False.
+            batch_window (float | None, optional): Gather single-ID lookups made within this many seconds into one list
+                request, where the endpoint supports it. Defaults to None, no batching.
+            batch_size (int, optional): The most IDs sent in one batched request, keeping URLs short. Defaults to 100.
+            rate_limit (RateLimit | None, optional): Paces and caps the requests sent to the host, pass one instance to
+                several clients to share it. Defaults to None, no limit.
+            instrumentation (Instrument | None, optional): Receives a RequestEvent with the timings, sizes and status of
+                every request. Defaults to None, nothing is measured.
+            transport (httpx.AsyncBaseTransport | None, optional): Sends requests through this transport instead of the
+                network, such as a :class:`~pyarr.cassette.ReplayTransport`. Ignored when ``session`` is given. Defaults
+                to None.
+            lookup_cache (LookupCache | None, optional): Caches the answers of ``series/lookup``, ``movie/lookup`` and
+                the other metadata lookups on disk, shared between processes. Defaults to None.
 
         Raises:
             ValueError: If no API Key is provided or if unable to retrieve API version automatically.
+            ImportError: If ``http2`` is set for our own session and ``h2`` is not installed.
         """
+        if http2 and session is None and importlib.util.find_spec("h2") is None:
+            raise ImportError('http2=True needs the h2 package, install it with: pip install "pyarr[http2]"')
         if "://" in host:
             url = URL(host)
             scheme = url.scheme
@@ -78,18 +145,36 @@ class RequestHandler:
         self.request_timeout = request_timeout
         self.verify_ssl = verify_ssl
         self.headers = headers or {}
-        # Set default timeout to None to match requests behavior if not specified
-        # Enable follow_redirects to match requests behavior
-        if session:
-            self.session: httpx.AsyncClient | None = session
-            self._owns_session = False
-        else:
-            self.session = httpx.AsyncClient(
-                timeout=request_timeout,
-                follow_redirects=True,
-                verify=verify_ssl,
-            )
-            self._owns_session = True
+        # Our own session is only created by the first request, building an httpx client (and its
+        # SSL context) is most of the cost of constructing a client that may never be used.
+        self.session: httpx.AsyncClient | None = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+        self.retry = retry or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self._retry_budget = RetryBudget(self.retry.budget_ratio, self.retry.budget_reserve)
+        self.version_cache = version_cache
+        self.response_cache = response_cache
+        self.conditional_cache = conditional_cache
+        self.json_codec = get_codec(json_codec)
+        self.models = models
+        self.limits = limits
+        self.http2 = http2
+        self.warm_up = warm_up
+        self.pool_stats = PoolStats()
+        self.coalesce = coalesce
+        self.singleflight = AsyncSingleFlight()
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        #: The batcher of each batched endpoint and fetch, created on first use.
+        self.batchers: dict[tuple[Any, ...], AsyncBatcher] = {}
+        #: The poller of each endpoint waited on, created on first use.
+        self.pollers: dict[str, AsyncPoller] = {}
+        self.rate_limit = rate_limit
+        self.instrumentation = instrumentation
+        self.transport = transport
+        self.lookup_cache = lookup_cache
+        self._api_lock = AsyncLock()
         self._api_ver = api_ver
         self.api_url: URL | None = None
         if api_ver:
@@ -101,6 +186,8 @@ class RequestHandler:
         Returns:
             RequestHandler: The request handler instance.
         """
+        if self.warm_up:
+            await self._warm_up()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
@@ -115,6 +202,54 @@ class RequestHandler:
             await self.session.aclose()
             self.session = None
 
+    async def _warm_up(self) -> None:
+        """Opens a pooled connection ahead of the first real request.
+
+        When the API version is not known yet its discovery is the warm-up, otherwise a ``HEAD``
+        of the base URL is sent. Failures are left for the first real request to report.
+        """
+        try:
+            if self.api_url is None:
+                await self._resolve_api_url()
+            else:
+                await self._get_session().head(str(self.base_url))
+        except (PyarrConnectionError, httpx.HTTPError):
+            pass
+
+    async def _resolve_api_url(self) -> URL:
+        """Returns the versioned API URL, discovering the version on first use.
+
+        Discovery runs under a lock, so when many requests start together on a fresh client
+        exactly one of them probes ``/api`` and the rest wait for its answer.
+
+        Returns:
+            URL: The base URL joined with ``api`` and the API version.
+        """
+        if self.api_url is None:
+            async with self._api_lock:
+                if self.api_url is None:
+                    if self._api_ver is None:
+                        self._api_ver = await self._discover_api_version()
+                    self.api_url = self.base_url.joinpath("api").joinpath(self._api_ver)
+        return self.api_url
+
+    async def _discover_api_version(self) -> str:
+        """Finds the API version, from the version cache when possible.
+
+        Returns:
+            str: The API version.
+        """
+        base_url = str(self.base_url)
+        if self.version_cache is not None:
+            cached = self.version_cache.get(base_url)
+            if cached is not None:
+                return cached
+
+        version = await self._get_api_version()
+        if self.version_cache is not None:
+            self.version_cache.set(base_url, version)
+        return version
+
     async def _get_api_version(self) -> str:
         """Retrieves the API version from the server.
 
@@ -137,7 +272,138 @@ class RequestHandler:
                 f"Unable to retrieve API Version automatically, please specify it in the initialization: {e}"
             ) from e
 
-    @backoff.on_exception(backoff.expo, (httpx.RequestError, httpx.TimeoutException), max_tries=5, logger=None)
+    async def _prepare(
+        self, endpoint: str, params: Mapping[str, Any] | None, headers: dict | None
+    ) -> tuple[URL, dict[str, Any] | None, dict[str, str]]:
+        """Builds the URL, query parameters and headers for a request.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            params (Mapping[str, Any] | None): The parameters to include in the request URL.
+            headers (dict | None): The headers to include in the request.
+
+        Returns:
+            tuple[URL, dict[str, Any] | None, dict[str, str]]: The URL, the parameters and the headers.
+        """
+        if endpoint == "api" or endpoint.startswith("/"):
+            # Paths starting with a slash are outside the API, such as the SignalR hub.
+            url = self.base_url.joinpath(endpoint.lstrip("/"))
+        else:
+            url = (await self._resolve_api_url()).joinpath(endpoint)
+
+        params_copy = None
+        if params:
+            # Create a mutable copy of params if it's not already one
+            params_copy = dict(params)
+            for key, value in params_copy.items():
+                if isinstance(value, bool):
+                    params_copy[key] = str(value).lower()
+
+        # Merge default headers with request-specific headers
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+        request_headers["X-Api-Key"] = self.api_key
+
+        return url, params_copy, request_headers
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """Returns the HTTP session, creating our own on first use.
+
+        Returns:
+            httpx.AsyncClient: The session.
+        """
+        if self.session is not None:
+            return self.session
+        # A plain lock, threads sharing a sync client would otherwise each build a session.
+        with self._session_lock:
+            if self.session is None:
+                self.session = self._new_session()
+        return self.session
+
+    def _new_session(self) -> httpx.AsyncClient:
+        """Builds our own HTTP session from the connection options.
+
+        Returns:
+            httpx.AsyncClient: The session.
+        """
+        # Set default timeout to None to match requests behavior if not specified
+        # Enable follow_redirects to match requests behavior
+        options: dict[str, Any] = {"limits": self.limits} if self.limits is not None else {}
+        if self.transport is not None:
+            options["transport"] = self.transport
+        self._owns_session = True
+        return httpx.AsyncClient(
+            timeout=self.request_timeout,
+            follow_redirects=True,
+            verify=self.verify_ssl,
+            http2=self.http2,
+            **options,
+        )
+
+    def _trace(self, timer: RequestTimer | None = None) -> TraceCallback:
+        """Returns an httpcore trace callback that records how long a request waits for a connection.
+
+        Args:
+            timer (RequestTimer | None, optional): Also takes the request's connection and first byte times.
+                Defaults to None.
+
+        Returns:
+            TraceCallback: The callback, for the ``trace`` request extension.
+        """
+        started = time.perf_counter()
+        done = False
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            """Records the wait once the request holds a connection.
+
+            Args:
+                name (str): The trace event name.
+                info (dict[str, Any]): The event details.
+            """
+            nonlocal done
+            if timer is not None:
+                timer.trace(name)
+            if not done:
+                connected, opened = is_connection_event(name)
+                if connected:
+                    done = True
+                    self.pool_stats.record(time.perf_counter() - started, opened)
+
+        return trace
+
+    @asynccontextmanager
+    async def _throttled(self, endpoint: str) -> AsyncIterator[RateLimitTicket]:
+        """Holds back one attempt until the rate limit admits it, and records how it went.
+
+        Args:
+            endpoint (str): The endpoint the attempt is sent to, which sets its cost.
+
+        Yields:
+            RateLimitTicket: The attempt's ticket, pass the response status to its ``respond``.
+        """
+        limit = self.rate_limit
+        if limit is None:
+            yield RateLimitTicket()
+            return
+        delay = limit.reserve(limit.cost(endpoint))
+        if delay:
+            await async_sleep(delay)
+        gate = limit.gate(AsyncGate)
+        if gate is not None:
+            await gate.acquire()
+        ticket = RateLimitTicket()
+        try:
+            yield ticket
+        except Exception:
+            if ticket.elapsed is None:
+                ticket.failed = True
+            raise
+        finally:
+            limit.record(ticket)
+            if gate is not None:
+                await gate.release()
+
     async def request(
         self,
         endpoint: str,
@@ -172,69 +438,214 @@ class RequestHandler:
         Returns:
             Any: The response data as a dictionary or list, or None when the response is a 204 No Content.
         """
-        if endpoint == "api":
-            url = self.base_url.joinpath(endpoint)
-        else:
-            if self.api_url is None:
-                if self._api_ver is None:
-                    self._api_ver = await self._get_api_version()
-                self.api_url = self.base_url.joinpath("api").joinpath(self._api_ver)
-            url = self.api_url.joinpath(endpoint)
+        send = self._request if self.instrumentation is None else self._instrumented
+        if self.lookup_cache is not None and method == "GET" and not headers and self.lookup_cache.covers(endpoint):
+            return await self._lookup(self.lookup_cache, endpoint, params)
+        if self.coalesce and method == "GET" and not headers:
+            # Identical GETs in flight at the same time share one request, and its decoded answer.
+            key = (endpoint, str(httpx.QueryParams(params or {})))
+            return await self.singleflight.do(key, send, endpoint, method, data, json_data, params, headers)
+        return await send(endpoint, method, data, json_data, params, headers)
+
+    async def _lookup(
+        self,
+        cache: LookupCache,
+        endpoint: str,
+        params: Mapping[str, Any] | None,
+    ) -> Any:
+        """Answers a metadata lookup from the lookup cache, asking the server on a miss.
 
-        if params:
-            # Create a mutable copy of params if it's not already one
-            params_copy = dict(params)
-            for key, value in params_copy.items():
-                if isinstance(value, bool):
-                    params_copy[key] = str(value).lower()
-            params = params_copy
+        While another caller sharing the cache, in this process or another, is asking the server
+        for the same lookup, this one waits for its answer instead. The database is used from a
+        worker thread, so waiting for a lock held by another process does not block the event loop.
 
-        # Merge default headers with request-specific headers
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-        request_headers["X-Api-Key"] = self.api_key
+        Args:
+            cache (LookupCache): The lookup cache.
+            endpoint (str): The lookup endpoint.
+            params (Mapping[str, Any] | None): The parameters to include in the request URL.
 
-        if self.session is None:
-            self.session = httpx.AsyncClient(
-                timeout=self.request_timeout,
-                follow_redirects=True,
-                verify=self.verify_ssl,
-            )
-            self._owns_session = True
+        Returns:
+            Any: The response data.
+        """
+        key = cache.key(str(self.base_url), endpoint, params)
+        while True:
+            body = await async_to_thread(cache.get, key)
+            if body is not None:
+                return self.json_codec.loads(body)
+            if await async_to_thread(cache.claim, key):
+                break
+            await async_sleep(cache.poll_interval)
+        send = self._request if self.instrumentation is None else self._instrumented
+        try:
+            response = await send(endpoint, "GET", None, None, params, None)
+        except BaseException:
+            await async_to_thread(cache.release, key)
+            raise
+        if isinstance(response, list):
+            await async_to_thread(cache.set, key, self.json_codec.dumps(response), not response)
+        else:
+            await async_to_thread(cache.release, key)
+        return response
+
+    async def _instrumented(
+        self,
+        endpoint: str,
+        method: str,
+        data: Any,
+        json_data: dict[str, Any] | list[Any] | None,
+        params: Mapping[str, Any] | None,
+        headers: dict | None,
+    ) -> Any:
+        """Sends a request, see :meth:`request`, and reports it to the instrumentation.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            method (str): The HTTP method to use.
+            data (Any): The data to send in the request body.
+            json_data (dict[str, Any] | list[Any] | None): The JSON data to send in the request body.
+            params (Mapping[str, Any] | None): The parameters to include in the request URL.
+            headers (dict | None): The headers to include in the request.
 
+        Returns:
+            Any: The response data.
+        """
+        timer = RequestTimer()
+        error: Exception | None = None
         try:
-            response = await self.session.request(
-                method,
-                str(url),
-                data=data,
-                json=json_data,
-                params=params,
-                headers=request_headers,
-            )
-        except httpx.TimeoutException as exception:
-            msg = "Timeout occurred while connecting to your instance."
-            raise PyarrConnectionError(msg) from exception
-        except httpx.RequestError as exception:
-            msg = "Error occurred while communicating with your instance."
-            raise PyarrConnectionError(msg) from exception
+            return await self._request(endpoint, method, data, json_data, params, headers, timer)
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            if self.instrumentation is not None:
+                self.instrumentation.record(timer.event(method, endpoint, error))
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        data: Any,
+        json_data: dict[str, Any] | list[Any] | None,
+        params: Mapping[str, Any] | None,
+        headers: dict | None,
+        timer: RequestTimer | None = None,
+    ) -> Any:
+        """Sends a request, see :meth:`request`.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            method (str): The HTTP method to use.
+            data (Any): The data to send in the request body.
+            json_data (dict[str, Any] | list[Any] | None): The JSON data to send in the request body.
+            params (Mapping[str, Any] | None): The parameters to include in the request URL.
+            headers (dict | None): The headers to include in the request.
+            timer (RequestTimer | None, optional): Collects the measurements for the instrumentation. Defaults to
+                None.
+
+        Returns:
+            Any: The response data.
+        """
+        url, params, request_headers = await self._prepare(endpoint, params, headers)
+
+        cache_key = None
+        if endpoint != "api" and method == "GET":
+            if self.response_cache is not None or self.conditional_cache is not None:
+                cache_key = str(httpx.URL(str(url), params=params))
+            if self.response_cache is not None and self.response_cache.ttl(endpoint) is not None:
+                body = self.response_cache.get(cache_key or "")
+                if body is not None:
+                    if timer is not None:
+                        timer.cached = True
+                    return self.json_codec.loads(body)
+            if self.conditional_cache is not None:
+                for name, value in self.conditional_cache.headers(cache_key or "").items():
+                    request_headers.setdefault(name, value)
+        elif endpoint != "api" and self.response_cache is not None:
+            self.response_cache.invalidate(endpoint)
+
+        session = self._get_session()
+
+        content: bytes | str | None = None
+        if json_data is not None:
+            content = self.json_codec.dumps(json_data)
+            request_headers["Content-Type"] = "application/json"
+            if timer is not None:
+                timer.request_bytes = len(content)
+        elif isinstance(data, (bytes, str)):
+            # A raw body, httpx only takes form fields as data.
+            content, data = data, None
+
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            if timer is not None:
+                timer.attempt()
+            try:
+                async with self._throttled(endpoint) as ticket:
+                    response = await session.request(
+                        method,
+                        str(url),
+                        data=data,
+                        content=content,
+                        params=params,
+                        headers=request_headers,
+                        extensions={"trace": self._trace(timer)},
+                    )
+                    ticket.respond(response.status_code)
+            except httpx.TimeoutException as exception:
+                if await self._retry_wait(method, str(url), attempt, exception=exception):
+                    continue
+                msg = "Timeout occurred while connecting to your instance."
+                raise PyarrConnectionError(msg) from exception
+            except httpx.RequestError as exception:
+                if await self._retry_wait(method, str(url), attempt, exception=exception):
+                    continue
+                msg = "Error occurred while communicating with your instance."
+                raise PyarrConnectionError(msg) from exception
+
+            if response.status_code // 100 in [4, 5]:
+                if await self._retry_wait(method, str(url), attempt, response=response):
+                    continue
+            break
+
+        if self.response_cache is not None and method != "GET" and endpoint != "api":
+            # Again once the change is done, a GET that ran alongside may have cached the old state.
+            self.response_cache.invalidate(endpoint)
 
         # Handle both httpx (.status_code) and aiohttp (.status)
         status_code = int(getattr(response, "status", getattr(response, "status_code", 0)))
+        loads = self.json_codec.loads if timer is None else timer.timed(self.json_codec.loads)
+        if timer is not None:
+            timer.status = status_code
+            timer.response_bytes = len(response.content)
 
         if status_code // 100 in [4, 5]:
             await self._handle_error(response)
 
+        if status_code == 304 and cache_key is not None and self.conditional_cache is not None:
+            known, value = self.conditional_cache.not_modified(cache_key)
+            if known:
+                return value
+            # The answer was evicted after its validators were sent, ask again for the full body.
+            headers = {
+                name: value
+                for name, value in (headers or {}).items()
+                if name.lower() not in ("if-none-match", "if-modified-since")
+            }
+            return await self._request(endpoint, method, data, json_data, params, headers, timer)
+
         if status_code == 204:
             # No Content, there is no body to decode even when the server advertises a JSON content type.
             return None
 
         content_type = response.headers.get("Content-Type", "")
         if "application/json" in content_type:
-            res_json = response.json()
-            if inspect.isawaitable(res_json):
-                return await res_json
-            return res_json
+            if cache_key is not None and self.response_cache is not None and status_code == 200:
+                self.response_cache.set(cache_key, endpoint, response.content)
+            if cache_key is not None and self.conditional_cache is not None and status_code == 200:
+                return self.conditional_cache.store(cache_key, response, loads)
+            return loads(response.content)
 
         res_text = getattr(response, "text", "")
         if callable(res_text):
@@ -244,6 +655,221 @@ class RequestHandler:
 
         return {"message": res_text}
 
+    def stream(self, endpoint: str, params: Mapping[str, Any] | None = None) -> AsyncIterator[Any]:
+        """Sends a GET request and yields the elements of the JSON array it answers with, one at a time.
+
+        The body is decoded while it downloads, so only the element being received is held in
+        memory. Failures before the first element are retried like any other request, later ones
+        are raised since the caller has already seen part of the answer. Close the iterator (or
+        run it to the end) to release the connection.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            params (Mapping[str, Any] | None, optional): The parameters to include in the request URL. Defaults to None.
+
+        Raises:
+            PyarrConnectionError: If a timeout or error occurs during the request.
+            ValueError: If the answer is not a JSON array.
+
+        Returns:
+            AsyncIterator[Any]: Each element of the array.
+        """
+        if self.instrumentation is None:
+            return self._stream(endpoint, params)
+        return self._instrumented_stream(endpoint, params)
+
+    async def _instrumented_stream(self, endpoint: str, params: Mapping[str, Any] | None) -> AsyncGenerator[Any, None]:
+        """Streams a GET request, see :meth:`stream`, and reports it to the instrumentation once it ends.
+
+        Decoding overlaps the download and the caller's work, so its time is not measured.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            params (Mapping[str, Any] | None): The parameters to include in the request URL.
+
+        Yields:
+            Any: Each element of the array.
+        """
+        timer = RequestTimer()
+        items = self._stream(endpoint, params, timer)
+        error: Exception | None = None
+        try:
+            async for item in items:  # noqa: UP028 - async generators have no yield from
+                yield item
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            await items.aclose()
+            if self.instrumentation is not None:
+                self.instrumentation.record(timer.event("GET", endpoint, error))
+
+    async def _stream(
+        self, endpoint: str, params: Mapping[str, Any] | None, timer: RequestTimer | None = None
+    ) -> AsyncGenerator[Any, None]:
+        """Streams a GET request, see :meth:`stream`.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            params (Mapping[str, Any] | None): The parameters to include in the request URL.
+            timer (RequestTimer | None, optional): Collects the measurements for the instrumentation. Defaults to
+                None.
+
+        Yields:
+            Any: Each element of the array.
+        """
+        url, params, request_headers = await self._prepare(endpoint, params, None)
+        session = self._get_session()
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            received = False
+            if timer is not None:
+                timer.attempt()
+            trace = {"trace": self._trace(timer)}
+            options: dict[str, Any] = {"params": params, "headers": request_headers, "extensions": trace}
+            try:
+                async with self._throttled(endpoint) as ticket, session.stream("GET", str(url), **options) as response:
+                    ticket.respond(response.status_code)
+                    if timer is not None:
+                        timer.status = response.status_code
+                    if response.status_code // 100 in [4, 5]:
+                        await response.aread()
+                    else:
+                        decoder = JsonArrayDecoder()
+                        async for chunk in response.aiter_bytes():
+                            if timer is not None:
+                                timer.response_bytes += len(chunk)
+                            for item in decoder.feed(chunk):
+                                received = True
+                                yield item
+                        for item in decoder.feed(b"", final=True):
+                            yield item
+                        return
+                # The rate limit slot is given back before waiting to retry.
+                if await self._retry_wait("GET", str(url), attempt, response=response):
+                    continue
+                await self._handle_error(response)
+            except httpx.TimeoutException as exception:
+                if not received and await self._retry_wait("GET", str(url), attempt, exception=exception):
+                    continue
+                msg = "Timeout occurred while connecting to your instance."
+                raise PyarrConnectionError(msg) from exception
+            except httpx.RequestError as exception:
+                if not received and await self._retry_wait("GET", str(url), attempt, exception=exception):
+                    continue
+                msg = "Error occurred while communicating with your instance."
+                raise PyarrConnectionError(msg) from exception
+
+    @asynccontextmanager
+    async def server_events(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+        read_timeout: float | None = None,
+    ) -> AsyncIterator[AsyncIterator[str]]:
+        """Opens a server-sent events stream.
+
+        The connection is open, and its status checked, when the context is entered, so requests that
+        must follow it can be sent before reading. The stream is not retried, a dropped connection
+        raises when the events are read.
+
+        Args:
+            endpoint (str): The endpoint to connect to.
+            params (Mapping[str, Any] | None, optional): The parameters to include in the request URL.
+                Defaults to None.
+            read_timeout (float | None, optional): Seconds to wait for the next line before giving up on the
+                connection. Defaults to None, wait for as long as the server keeps it open.
+
+        Raises:
+            PyarrConnectionError: If the connection fails or goes quiet for longer than ``read_timeout``.
+
+        Yields:
+            AsyncIterator[str]: The data of each event, as the events arrive.
+        """
+        url, params, request_headers = await self._prepare(endpoint, params, {"Accept": "text/event-stream"})
+        session = self._get_session()
+        timeout = httpx.Timeout(self.request_timeout, read=read_timeout)
+        options: dict[str, Any] = {"params": params, "headers": request_headers, "timeout": timeout}
+        try:
+            async with session.stream("GET", str(url), **options) as response:
+                if response.status_code // 100 in [4, 5]:
+                    await response.aread()
+                    await self._handle_error(response)
+                yield self._event_data(response)
+        except httpx.TimeoutException as exception:
+            msg = "Timeout occurred while waiting for events from your instance."
+            raise PyarrConnectionError(msg) from exception
+        except httpx.RequestError as exception:
+            msg = "Error occurred while communicating with your instance."
+            raise PyarrConnectionError(msg) from exception
+
+    @staticmethod
+    async def _event_data(response: httpx.Response) -> AsyncGenerator[str, None]:
+        """Parses a server-sent events body.
+
+        Args:
+            response (httpx.Response): The open response.
+
+        Yields:
+            str: The data of each event, its data lines joined by newlines.
+        """
+        data: list[str] = []
+        async for line in response.aiter_lines():
+            if line.startswith("data:"):
+                data.append(line[5:].removeprefix(" "))
+            elif not line and data:
+                yield "\n".join(data)
+                data = []
+
+    async def _retry_wait(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        exception: Exception | None = None,
+        response: httpx.Response | None = None,
+    ) -> bool:
+        """Decides whether a failed attempt is retried, and if so waits before the next one.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            attempt (int): The attempt that just failed, starting at 1.
+            exception (Exception | None, optional): The transport error, if the attempt raised. Defaults to None.
+            response (httpx.Response | None, optional): The error response, if one came back. Defaults to None.
+
+        Returns:
+            bool: True once the wait is over and the request should be sent again.
+        """
+        policy = self.retry
+        if attempt >= policy.max_attempts:
+            return False
+
+        if response is not None:
+            if not policy.should_retry_response(method, response):
+                return False
+            retry_after = policy.retry_after(response)
+            delay = policy.backoff(attempt) if retry_after is None else retry_after
+            reason = str(response.status_code)
+        else:
+            if exception is None or not policy.should_retry_exception(method, exception):
+                return False
+            delay = policy.backoff(attempt)
+            reason = type(exception).__name__
+
+        if not self._retry_budget.withdraw():
+            self.retry_stats.budget_exhausted += 1
+            return False
+
+        self.retry_stats.retries += 1
+        self.retry_stats.retry_delay += delay
+        if policy.on_retry is not None:
+            policy.on_retry(RetryEvent(method, url, attempt, delay, reason))
+        await async_sleep(delay)
+        return True
+
     async def _handle_error(self, response: Any) -> None:
         """Handles error responses by raising appropriate exceptions.
 
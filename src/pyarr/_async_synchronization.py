@@ -0,0 +1,487 @@
+"""Concurrency primitives for the async clients.
+
+The sync package is generated from the async one by ``unasync``, which renames any ``AsyncFoo`` to
+``SyncFoo`` and rewrites ``pyarr._async`` to ``pyarr._sync``, import paths included. Every primitive
+here therefore has a counterpart with matching methods in :mod:`pyarr._sync_synchronization`, so
+async code can use ``AsyncPool`` and the generated sync code ends up using the threaded ``SyncPool``.
+Plain functions cannot follow the class naming, so ``scripts/generate_sync.py`` maps ``async_sleep``
+to ``sync_sleep`` and ``async_to_thread`` to ``sync_to_thread`` explicitly. Keeping the two halves
+apart means the sync clients never import :mod:`asyncio`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+#: Mutual exclusion for coroutines.
+AsyncLock = asyncio.Lock
+
+#: A flag coroutines wait on.
+AsyncEvent = asyncio.Event
+
+#: Fetches the items for a list of keys, for :class:`AsyncBatcher`.
+AsyncBatchFetch = Callable[[list[Any]], Awaitable[list[Any]]]
+
+#: Fetches the current state of a list of keys, by key, for :class:`AsyncPoller`.
+AsyncPollFetch = Callable[[list[Any]], Awaitable[dict[Any, Any]]]
+
+
+async def async_sleep(seconds: float) -> None:
+    """Sleeps without blocking the event loop.
+
+    Args:
+        seconds (float): How long to sleep.
+    """
+    await asyncio.sleep(seconds)
+
+
+async def async_to_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Runs a blocking function, such as an SQLite query, in a worker thread.
+
+    Args:
+        func (Callable[..., Any]): The function.
+        *args (Any): Its arguments.
+        **kwargs (Any): Its keyword arguments.
+
+    Returns:
+        Any: What the function returned.
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+class AsyncPool:
+    """Runs coroutine functions as tasks, at most ``max_workers`` at a time.
+
+    Tasks start as soon as they are submitted. Any that are still outstanding when the
+    context exits are cancelled, so breaking out of a consumer loop does not leak requests.
+    """
+
+    def __init__(self, max_workers: int, wait: bool = True):
+        """Initializes the pool.
+
+        Args:
+            max_workers (int): The maximum number of calls in flight at once.
+            wait (bool, optional): Whether exiting waits for calls that are still running. Outstanding
+                tasks are cancelled either way, so this only matters to ``SyncPool``. Defaults to True.
+
+        Raises:
+            ValueError: If ``max_workers`` is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._tasks: set[asyncio.Future[Any]] = set()
+        self._wait = wait
+
+    async def __aenter__(self) -> AsyncPool:
+        """Enter the pool context.
+
+        Returns:
+            AsyncPool: The pool.
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Cancel any calls that have not completed.
+
+        Args:
+            exc_type (Any): The exception type.
+            exc_value (Any): The exception value.
+            traceback (Any): The traceback.
+        """
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Runs one call once a worker slot is free.
+
+        Args:
+            fn (Callable[..., Awaitable[T]]): The coroutine function to call.
+            *args (Any): Positional arguments for ``fn``.
+            **kwargs (Any): Keyword arguments for ``fn``.
+
+        Returns:
+            T: The result of the call.
+        """
+        async with self._semaphore:
+            return await fn(*args, **kwargs)
+
+    def submit(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> asyncio.Future[T]:
+        """Schedules a call on the pool.
+
+        Args:
+            fn (Callable[..., Awaitable[T]]): The coroutine function to call.
+            *args (Any): Positional arguments for ``fn``.
+            **kwargs (Any): Keyword arguments for ``fn``.
+
+        Returns:
+            asyncio.Future[T]: A handle to pass to :meth:`result`.
+        """
+        task = asyncio.ensure_future(self._run(fn, *args, **kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def result(self, future: asyncio.Future[T], timeout: float | None = None) -> T:
+        """Waits for a submitted call and returns its result.
+
+        Args:
+            future (asyncio.Future[T]): The handle returned by :meth:`submit`.
+            timeout (float | None, optional): Seconds to wait at most, the call is cancelled when they
+                run out. Defaults to None, wait for as long as it takes.
+
+        Raises:
+            TimeoutError: If the call did not complete in time.
+
+        Returns:
+            T: The result of the call, re-raising any exception it raised.
+        """
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
+
+
+class AsyncSingleFlight:
+    """Shares one in-flight call among every caller asking for the same key.
+
+    The call runs as its own task, so a caller that is cancelled does not cancel it for the
+    others. Nothing is kept once it completes, the next caller starts a new call.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        #: Calls that went ahead.
+        self.calls = 0
+        #: Callers that joined a call already in flight.
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls currently running.
+
+        Returns:
+            int: The number of keys in flight.
+        """
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Runs ``fn`` unless a call for ``key`` is already in flight, then waits for that one.
+
+        Args:
+            key (Hashable): Identifies calls that are interchangeable.
+            fn (Callable[..., Awaitable[T]]): The coroutine function to call.
+            *args (Any): Positional arguments for ``fn``.
+            **kwargs (Any): Keyword arguments for ``fn``.
+
+        Returns:
+            T: The result of the shared call, re-raising any exception it raised.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            future = self._calls[key] = asyncio.ensure_future(fn(*args, **kwargs))
+            future.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(future)
+
+    def _done(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Forgets a completed call.
+
+        Args:
+            key (Hashable): The call's key.
+            future (asyncio.Future[Any]): The completed call.
+        """
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Every caller may have been cancelled, an unobserved exception must not be logged.
+            future.exception()
+
+
+class AsyncBatcher:
+    """Gathers single-key lookups made at about the same time into one bulk fetch.
+
+    The first lookup opens a batch and schedules it ``window`` seconds later, any lookups made
+    meanwhile join it, and a batch that reaches ``max_size`` keys is sent straight away. The bulk
+    fetch runs as its own task, so a cancelled caller does not cancel it for the others. A batcher
+    must only be shared within one event loop.
+    """
+
+    def __init__(
+        self,
+        fetch: AsyncBatchFetch,
+        window: float = 0.005,
+        max_size: int = 100,
+        key: Callable[[Any], Hashable] = lambda item: item.get("id"),
+    ):
+        """Initializes the batcher.
+
+        Args:
+            fetch (AsyncBatchFetch): Fetches the items for a list of keys.
+            window (float, optional): Seconds a batch stays open for more lookups. Defaults to 0.005.
+            max_size (int, optional): The most keys sent in one fetch. Defaults to 100.
+            key (Callable[[Any], Hashable], optional): Returns the key of a fetched item. Defaults to its
+                ``id``.
+
+        Raises:
+            ValueError: If ``max_size`` is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._fetch = fetch
+        self._window = window
+        self._max_size = max_size
+        self._key = key
+        self._batch: dict[Hashable, asyncio.Future[Any]] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Future[Any]] = set()
+        #: Bulk fetches sent.
+        self.batches = 0
+        #: Lookups answered by them.
+        self.lookups = 0
+
+    async def load(self, key: Hashable) -> Any:
+        """Looks one key up as part of the next batch.
+
+        Args:
+            key (Hashable): The key to look up.
+
+        Returns:
+            Any: The item, or None if the fetch did not return one for the key.
+        """
+        loop = asyncio.get_running_loop()
+        self.lookups += 1
+        if self._batch is None:
+            self._batch = {}
+            self._timer = loop.call_later(self._window, self._dispatch)
+        future = self._batch.get(key)
+        if future is None:
+            future = self._batch[key] = loop.create_future()
+        if len(self._batch) >= self._max_size:
+            self._dispatch()
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Closes the open batch and starts fetching it."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, None
+        if batch:
+            self.batches += 1
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[Hashable, asyncio.Future[Any]]) -> None:
+        """Fetches a batch and hands each caller its item.
+
+        Args:
+            batch (dict[Hashable, asyncio.Future[Any]]): The waiting callers, by key.
+        """
+        try:
+            items = await self._fetch(list(batch))
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+                    # Marks the exception retrieved in case every caller of this key was cancelled.
+                    future.exception()
+            return
+        found = {self._key(item): item for item in items}
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class AsyncGate:
+    """Admits at most ``limit()`` holders at a time, a limit that may change while callers wait."""
+
+    def __init__(self, limit: Callable[[], int]):
+        """Initializes an empty gate.
+
+        Args:
+            limit (Callable[[], int]): Returns the current number of holders allowed.
+        """
+        self._limit = limit
+        self._condition = asyncio.Condition()
+        #: Callers currently admitted.
+        self.holders = 0
+
+    async def acquire(self, unless: Callable[[], bool] | None = None) -> bool:
+        """Waits until the gate has room, then holds a place in it.
+
+        Args:
+            unless (Callable[[], bool] | None, optional): Stop waiting, without a place, once this returns
+                True. It is checked when the gate has room and after every :meth:`wake`. Defaults to None.
+
+        Returns:
+            bool: True if a place is held, False if ``unless`` ended the wait.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.holders < self._limit() or (unless is not None and unless()))
+            if unless is not None and unless():
+                return False
+            self.holders += 1
+            return True
+
+    async def wake(self) -> None:
+        """Makes the waiters check their ``unless`` again."""
+        async with self._condition:
+            self._condition.notify_all()
+
+    async def release(self) -> None:
+        """Gives a place back and wakes the waiters, the limit may have grown meanwhile."""
+        async with self._condition:
+            self.holders -= 1
+            self._condition.notify_all()
+
+
+class AsyncPoller:
+    """Waits for many keys to be done with one polling loop shared by every waiter.
+
+    The loop runs as its own task while anyone waits. Each poll fetches the state of every key
+    waited for at once. The interval starts at ``min_interval``, grows by ``backoff`` after every
+    poll that finds nothing changed up to ``max_interval``, and drops back after one that does. A
+    new waiter brings the next poll forward to ``min_interval`` from now. A poll that fails is tried
+    again after the next interval, which grows as if nothing changed. Waiters get the error only
+    once ``max_failures`` polls in a row have failed, unless their own timeout runs out first.
+    """
+
+    def __init__(
+        self,
+        fetch: AsyncPollFetch,
+        done: Callable[[Any], bool],
+        min_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        max_failures: int = 5,
+    ):
+        """Initializes the poller.
+
+        Args:
+            fetch (AsyncPollFetch): Fetches the current state of a list of keys, by key.
+            done (Callable[[Any], bool]): Whether a state is final.
+            min_interval (float, optional): Shortest time between polls, in seconds. Defaults to 0.5.
+            max_interval (float, optional): Longest time between polls, in seconds. Defaults to 10.0.
+            backoff (float, optional): Multiplies the interval after a poll that found no change. Defaults to 1.5.
+            max_failures (int, optional): Polls in a row that may fail before the waiters get the error.
+                Defaults to 5.
+
+        Raises:
+            ValueError: If ``max_failures`` is less than 1.
+        """
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        self._fetch = fetch
+        self._done = done
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._max_failures = max_failures
+        self._failures = 0
+        self._interval = min_interval
+        self._next_poll = 0.0
+        self._waiters: dict[Hashable, list[asyncio.Future[Any]]] = {}
+        self._states: dict[Hashable, Any] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Future[None] | None = None
+        #: Polls sent.
+        self.polls = 0
+        #: Polls that failed.
+        self.errors = 0
+
+    async def wait(self, key: Hashable, timeout: float | None = None) -> Any:
+        """Waits until the state of a key is final.
+
+        Args:
+            key (Hashable): The key.
+            timeout (float | None, optional): Seconds to wait at most. Defaults to None, as long as it takes.
+
+        Raises:
+            TimeoutError: If the key was not done in time.
+
+        Returns:
+            Any: The final state.
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(future)
+        first_poll = time.monotonic() + self._min_interval
+        if first_poll < self._next_poll or self._task is None:
+            self._interval = self._min_interval
+            self._next_poll = first_poll
+            self._wake.set()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[key]
+                    self._states.pop(key, None)
+
+    async def _run(self) -> None:
+        """Polls until nobody waits any more."""
+        try:
+            while self._waiters:
+                delay = self._next_poll - time.monotonic()
+                if delay > 0:
+                    self._wake.clear()
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), delay)
+                    except TimeoutError:
+                        pass
+                    continue
+                await self._poll()
+                self._next_poll = time.monotonic() + self._interval
+        finally:
+            self._task = None
+
+    async def _poll(self) -> None:
+        """Fetches the state of every key waited for and resolves the waiters of those that are done."""
+        keys = list(self._waiters)
+        self.polls += 1
+        try:
+            states = await self._fetch(keys)
+        except Exception as error:
+            self.errors += 1
+            self._failures += 1
+            self._interval = min(self._interval * self._backoff, self._max_interval)
+            if self._failures < self._max_failures:
+                return
+            self._failures = 0
+            for key in keys:
+                self._states.pop(key, None)
+                for future in self._waiters.pop(key, []):
+                    if not future.done():
+                        future.set_exception(error)
+            return
+        self._failures = 0
+        changed = False
+        for key in keys:
+            state = states.get(key)
+            if state != self._states.get(key):
+                changed = True
+                self._states[key] = state
+            if state is not None and self._done(state):
+                self._states.pop(key, None)
+                for future in self._waiters.pop(key, []):
+                    if not future.done():
+                        future.set_result(state)
+        if changed:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._interval * self._backoff, self._max_interval)
@@ -14,6 +14,8 @@ from pyarr.types import JsonObject
 class Movies(CommonActions):
     """Movie actions for Bazarr."""
 
+    __slots__ = ()
+
     def get(self, movie_id: int | list[int] | None = None, **kwargs) -> JsonObject:
         """Returns the movies Bazarr knows about.
 
@@ -26,10 +28,12 @@ class Movies(CommonActions):
             JsonObject: Dictionary with a ``data`` list of movies and a ``total`` count.
         """
         params: dict[str, Any] = dict(kwargs)
-        if movie_id is not None:
-            params["radarrid[]"] = movie_id
-
-        response = self.handler.request("movies", params=params)
+        if isinstance(movie_id, list):
+            response = self._request_chunked("movies", "radarrid[]", movie_id, params)
+        else:
+            if movie_id is not None:
+                params["radarrid[]"] = movie_id
+            response = self.handler.request("movies", params=params)
         if isinstance(response, dict):
             return response
         raise ValueError("Expected a dictionary response from the 'movies' endpoint")
@@ -10,6 +10,8 @@ from pyarr.types import JsonObject
 class Providers(CommonActions):
     """Subtitle provider actions for Bazarr."""
 
+    __slots__ = ()
+
     def get(self) -> JsonObject:
         """Returns the subtitle providers Bazarr knows about.
 
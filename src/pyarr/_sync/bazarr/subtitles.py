@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Subtitles(CommonActions):
     """Subtitle actions for Bazarr."""
 
+    __slots__ = ()
+
     def get(self, **kwargs) -> JsonArray:
         """Returns the list of subtitles.
 
@@ -3,14 +3,83 @@
 # Do not edit this file directly.
 # """
 
+import math
+from collections import deque
+from collections.abc import Callable, Iterator
+from functools import partial
 from typing import Any
+from urllib.parse import quote
 
 from pyarr._sync.utils.http import RequestHandler
+from pyarr._sync_synchronization import SyncBatcher, SyncBatchFetch, SyncPool
+from pyarr.exceptions import PyarrMissingArgument, PyarrResourceNotFound
+from pyarr.models import Record
+from pyarr.types import JsonObject
+
+#: Longest encoded ID list sent in one request. Servers and proxies commonly reject URLs over 8 KiB,
+#: this leaves room for the rest of the URL.
+MAX_IDS_LENGTH = 4096
+#: Chunks of one ID list fetched at the same time.
+CHUNK_CONCURRENCY = 4
+
+
+def _chunk_ids(key: str, ids: list[Any], max_length: int = MAX_IDS_LENGTH) -> list[list[Any]]:
+    """Splits an ID list so that each part, encoded as repeated ``key=id`` pairs, fits ``max_length``.
+
+    Args:
+        key (str): The parameter name the IDs are sent as.
+        ids (list[Any]): The IDs.
+        max_length (int, optional): The longest encoded part. Defaults to MAX_IDS_LENGTH.
+
+    Returns:
+        list[list[Any]]: The parts, in order, at least one.
+    """
+    overhead = len(quote(key, safe="")) + 2  # "=" and "&"
+    chunks: list[list[Any]] = [[]]
+    length = 0
+    for item_id in ids:
+        size = overhead + len(quote(str(item_id), safe=""))
+        if chunks[-1] and length + size > max_length:
+            chunks.append([])
+            length = 0
+        chunks[-1].append(item_id)
+        length += size
+    return chunks
+
+
+def _merge_chunks(responses: list[Any]) -> Any:
+    """Merges the answers to the chunks of one ID list, keeping their order.
+
+    Lists are concatenated. Objects that wrap their items in ``data`` (Bazarr) or ``results``
+    (Dispatcharr) keep the first answer's other fields with the items of all of them.
+
+    Args:
+        responses (list[Any]): The answers, in chunk order.
+
+    Returns:
+        Any: The merged answer.
+    """
+    first = responses[0]
+    if isinstance(first, list):
+        return [item for response in responses for item in response or []]
+    if isinstance(first, dict):
+        for key in ("data", "results"):
+            if isinstance(first.get(key), list):
+                items = [item for response in responses for item in response.get(key) or []]
+                merged = {**first, key: items}
+                if "total" in first:
+                    merged["total"] = len(items)
+                if "count" in first:
+                    merged["count"] = len(items)
+                return merged
+    return first
 
 
 class CommonActions:
     """Base class for common API actions."""
 
+    __slots__ = ("handler",)
+
     def __init__(self, handler: RequestHandler):
         """Initializes the common actions with the provided request handler.
 
@@ -33,6 +102,88 @@ class CommonActions:
         endpoint = f"{path}{f'/{item_id}' if item_id else ''}"
         return self.handler.request(endpoint, params=params)
 
+    def _batching(self) -> bool:
+        """Whether single-ID lookups are gathered into list requests.
+
+        Returns:
+            bool: True if the client was given a ``batch_window``.
+        """
+        return self.handler.batch_window is not None
+
+    def _get_batched(self, path: str, item_id: int, fetch: Callable[..., Any], *args: Any) -> JsonObject:
+        """Looks one item up by ID as part of a batch, see the client's ``batch_window``.
+
+        Batches are kept by ``path``, ``fetch`` and ``args`` together, so a lookup only joins the batch
+        of lookups that would fetch it the same way, whichever component made them.
+
+        Args:
+            path (str): The API endpoint path.
+            item_id (int): The ID of the item.
+            fetch (Callable[..., Any]): Fetches the items for a list of IDs, passed after ``args``.
+            *args (Any): Passed to ``fetch`` before the IDs.
+
+        Raises:
+            PyarrResourceNotFound: If the batch did not return the item.
+
+        Returns:
+            JsonObject: The item.
+        """
+        key = (path, fetch, *args)
+        batcher = self.handler.batchers.get(key)
+        if batcher is None:
+            window = self.handler.batch_window or 0.0
+            bulk: SyncBatchFetch = partial(fetch, *args)
+            batcher = self.handler.batchers[key] = SyncBatcher(bulk, window, self.handler.batch_size)
+        item = batcher.load(item_id)
+        if item is None:
+            raise PyarrResourceNotFound(f"No item with id {item_id} at {path}")
+        return item
+
+    def _get_by_ids(self, path: str, ids_param: str, ids: list[Any]) -> list[Any]:
+        """Fetches the items of a list endpoint by their IDs, for the bulk fetch of a batch.
+
+        Args:
+            path (str): The API endpoint path.
+            ids_param (str): The query parameter that takes the IDs, such as ``episodeIds``.
+            ids (list[Any]): The IDs.
+
+        Raises:
+            TypeError: If the endpoint does not answer with a list.
+
+        Returns:
+            list[Any]: The items.
+        """
+        response = self._request_chunked(path, ids_param, ids)
+        if isinstance(response, list):
+            return response
+        raise TypeError(f"Expected a list response from the '{path}' endpoint")
+
+    def _request_chunked(self, path: str, key: str, ids: list[Any], params: dict[str, Any] | None = None) -> Any:
+        """GETs a list endpoint for a list of IDs, split into several concurrent requests if it is long.
+
+        Each chunk's IDs fit :data:`MAX_IDS_LENGTH` once encoded, so the URL stays within what
+        servers accept, and :data:`CHUNK_CONCURRENCY` chunks are fetched at a time. The answers are
+        merged in ID order, see :func:`_merge_chunks`. Only query strings are chunked: an ID list
+        sent in a body has no length limit, and splitting a bulk change would make it partial.
+
+        Args:
+            path (str): The API endpoint path.
+            key (str): The query parameter that takes the IDs.
+            ids (list[Any]): The IDs.
+            params (dict[str, Any] | None, optional): The other query parameters. Defaults to None.
+
+        Returns:
+            Any: The merged response data.
+        """
+        params = params or {}
+        chunks = _chunk_ids(key, ids)
+        if len(chunks) == 1:
+            return self.handler.request(path, params={**params, key: ids})
+        with SyncPool(CHUNK_CONCURRENCY) as pool:
+            futures = [pool.submit(self.handler.request, path, params={**params, key: chunk}) for chunk in chunks]
+            responses = [pool.result(future) for future in futures]
+        return _merge_chunks(responses)
+
     def _delete(self, path: str, item_id: Any) -> Any:
         """Helper method for standard DELETE requests.
 
@@ -45,3 +196,180 @@ class CommonActions:
         """
         endpoint = f"{path}/{item_id}"
         return self.handler.request(endpoint, method="DELETE")
+
+    def _sort_params(self, sort_key: str | None, sort_dir: str | None) -> dict[str, Any]:
+        """Builds the sort parameters for a paged endpoint.
+
+        Args:
+            sort_key (str | None): Field to sort by.
+            sort_dir (str | None): Direction to sort the items.
+
+        Raises:
+            PyarrMissingArgument: If only one of sort_key and sort_dir is given.
+
+        Returns:
+            dict[str, Any]: The sort parameters, empty when neither is given.
+        """
+        if sort_key and sort_dir:
+            return {"sortKey": sort_key, "sortDirection": sort_dir}
+        if sort_key or sort_dir:
+            raise PyarrMissingArgument("sort_key and sort_dir must be used together")
+        return {}
+
+    def _wants_models(self, models: bool | None) -> bool:
+        """Resolves whether a call returns typed records.
+
+        Args:
+            models (bool | None): The choice made for the call, None to use the client setting.
+
+        Returns:
+            bool: True to return records from :mod:`pyarr.models`.
+        """
+        return self.handler.models if models is None else models
+
+    def _to_models(self, response: Any, model: type[Record], models: bool | None) -> Any:
+        """Converts the records in a response to a model, when records are wanted.
+
+        Lists, single objects and pages, whose items are under ``records`` (Servarr) or
+        ``results`` (Dispatcharr), are converted. Anything else is returned unchanged.
+
+        Args:
+            response (Any): The decoded response.
+            model (type[Record]): The record class for the endpoint.
+            models (bool | None): The choice made for the call, None to use the client setting.
+
+        Returns:
+            Any: The response, with records in place of dictionaries if wanted.
+        """
+        if not self._wants_models(models):
+            return response
+        if isinstance(response, list):
+            return [model.from_dict(item) for item in response]
+        if isinstance(response, dict):
+            for key in ("records", "results"):
+                if isinstance(response.get(key), list):
+                    return {**response, key: [model.from_dict(item) for item in response[key]]}
+            return model.from_dict(response)
+        return response
+
+    def _stream(
+        self, path: str, params: dict[str, Any] | None, model: type[Record], models: bool | None
+    ) -> Iterator[Any]:
+        """Streams the elements of a JSON array endpoint, converting them to a model if wanted.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any] | None): The query parameters.
+            model (type[Record]): The record class for the endpoint.
+            models (bool | None): The choice made for the call, None to use the client setting.
+
+        Yields:
+            Any: Each element, as a dictionary or a record.
+        """
+        convert = self._wants_models(models)
+        for item in self.handler.stream(path, params=params):
+            yield model.from_dict(item) if convert else item
+
+    def _get_page(self, path: str, params: dict[str, Any], page: int, page_size: int) -> JsonObject:
+        """Fetches a single page from a paged endpoint.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The query parameters, without paging.
+            page (int): The page number to fetch, starting at 1.
+            page_size (int): The number of records per page.
+
+        Raises:
+            TypeError: If the endpoint does not answer with a paged object.
+
+        Returns:
+            JsonObject: The page, with its ``records`` and ``totalRecords``.
+        """
+        response = self.handler.request(path, params={**params, "page": page, "pageSize": page_size})
+        if isinstance(response, dict):
+            return response
+        raise TypeError("Expected response to be a dictionary")
+
+    def _iter_pages(
+        self,
+        path: str,
+        params: dict[str, Any],
+        page_size: int,
+        max_concurrency: int,
+    ) -> Iterator[JsonObject]:
+        """Yields every page of a paged endpoint, in order.
+
+        The first page is fetched on its own to learn ``totalRecords``. The remaining pages are
+        then fetched ``max_concurrency`` at a time and yielded in page order, so no more than
+        ``max_concurrency`` pages are ever held in memory.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The query parameters, without paging.
+            page_size (int): The number of records per page.
+            max_concurrency (int): The maximum number of page requests in flight.
+
+        Raises:
+            ValueError: If ``page_size`` or ``max_concurrency`` is less than 1.
+
+        Yields:
+            JsonObject: Each page, with its ``records``.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        first = self._get_page(path, params, 1, page_size)
+        yield first
+
+        # The server may clamp the page size, so page maths must use the size it actually used.
+        page_size = first.get("pageSize") or page_size
+        total_pages = math.ceil(first.get("totalRecords", 0) / page_size)
+        if total_pages <= 1:
+            return
+
+        with SyncPool(max_concurrency) as pool:
+            pending: deque = deque()
+            next_page = 2
+            while next_page <= total_pages and len(pending) < max_concurrency:
+                pending.append(pool.submit(self._get_page, path, params, next_page, page_size))
+                next_page += 1
+
+            while pending:
+                page = pool.result(pending.popleft())
+                if next_page <= total_pages:
+                    pending.append(pool.submit(self._get_page, path, params, next_page, page_size))
+                    next_page += 1
+                if not page.get("records"):
+                    # Records were removed while paging, everything after this is empty too.
+                    return
+                yield page
+
+    def _iter_records(
+        self,
+        path: str,
+        params: dict[str, Any],
+        page_size: int,
+        max_concurrency: int,
+        model: type[Record] | None = None,
+        models: bool | None = None,
+    ) -> Iterator[Any]:
+        """Yields every record of a paged endpoint, in order.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The query parameters, without paging.
+            page_size (int): The number of records per page.
+            max_concurrency (int): The maximum number of page requests in flight.
+            model (type[Record] | None, optional): The record class for the endpoint. Defaults to None.
+            models (bool | None, optional): Whether to yield records, None to use the client setting.
+                Defaults to None.
+
+        Yields:
+            Any: Each record from each page, as a dictionary or a record.
+        """
+        convert = model if model is not None and self._wants_models(models) else None
+        for page in self._iter_pages(path, params, page_size, max_concurrency):
+            for record in page.get("records", []):
+                yield record if convert is None else convert.from_dict(record)
@@ -3,6 +3,8 @@
 # Do not edit this file directly.
 # """
 
+from collections.abc import Iterator
+
 from pyarr._sync.common.base import CommonActions
 from pyarr.types import JsonArray, JsonObject
 
@@ -10,6 +12,8 @@ from pyarr.types import JsonArray, JsonObject
 class Blocklist(CommonActions):
     """Blocklist actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of blocklists or a specific blocklist by ID.
 
@@ -37,3 +41,47 @@ class Blocklist(CommonActions):
         """
         json_data = {"ids": item_ids}
         self.handler.request("blocklist/bulk", method="DELETE", json_data=json_data)
+
+    def iter_pages(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        max_concurrency: int = 4,
+    ) -> Iterator[JsonObject]:
+        """Iterates over every page of the blocklist, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each page in order, with its ``records``.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+
+        return self._iter_pages("blocklist", params, page_size, max_concurrency)
+
+    def iter_records(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        max_concurrency: int = 4,
+    ) -> Iterator[JsonObject]:
+        """Iterates over every blocklist item, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each record in order.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+
+        return self._iter_records("blocklist", params, page_size, max_concurrency)
@@ -12,6 +12,8 @@ from pyarr.types import JsonArray
 class Calendar(CommonActions):
     """Calendar actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(
         self,
         start_date: datetime | None = None,
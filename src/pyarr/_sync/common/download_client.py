@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class DownloadClient(CommonActions):
     """Download client actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of download clients or a specific client by ID.
 
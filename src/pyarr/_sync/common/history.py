@@ -3,21 +3,28 @@
 # Do not edit this file directly.
 # """
 
+from collections.abc import Iterator
+from datetime import datetime
+
 from pyarr._sync.common.base import CommonActions
 from pyarr.exceptions import PyarrMissingArgument
 from pyarr.literals import PyarrHistorySortKey, PyarrSortDirection
-from pyarr.types import JsonObject
+from pyarr.models import HistoryRecord
+from pyarr.types import JsonArray, JsonObject
 
 
 class History(CommonActions):
     """History actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(
         self,
         page: int | None = None,
         page_size: int | None = None,
         sort_key: PyarrHistorySortKey | None = None,
         sort_dir: PyarrSortDirection | None = None,
+        models: bool | None = None,
     ) -> JsonObject:
         """Gets history (grabs/failures/completed).
 
@@ -26,6 +33,8 @@ class History(CommonActions):
             page_size (int | None, optional): Number of items per page. Defaults to None.
             sort_key (PyarrHistorySortKey | None, optional): Field to sort by. Defaults to None.
             sort_dir (PyarrSortDirection | None, optional): Direction to sort the items. Defaults to None.
+            models (bool | None, optional): Return HistoryRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
            JsonObject: Dictionary with items.
@@ -47,5 +56,70 @@ class History(CommonActions):
         response = self.handler.request("history", params=params)
 
         if isinstance(response, dict):
-            return response
+            return self._to_models(response, HistoryRecord, models)
         raise TypeError("Expected response to be a dictionary")
+
+    def iter_pages(
+        self,
+        page_size: int = 250,
+        sort_key: PyarrHistorySortKey | None = None,
+        sort_dir: PyarrSortDirection | None = None,
+        max_concurrency: int = 4,
+    ) -> Iterator[JsonObject]:
+        """Iterates over every page of history, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (PyarrHistorySortKey | None, optional): Field to sort by. Defaults to None.
+            sort_dir (PyarrSortDirection | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each page in order, with its ``records``.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        return self._iter_pages("history", params, page_size, max_concurrency)
+
+    def iter_records(
+        self,
+        page_size: int = 250,
+        sort_key: PyarrHistorySortKey | None = None,
+        sort_dir: PyarrSortDirection | None = None,
+        max_concurrency: int = 4,
+        models: bool | None = None,
+    ) -> Iterator[JsonObject | HistoryRecord]:
+        """Iterates over every history record, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (PyarrHistorySortKey | None, optional): Field to sort by. Defaults to None.
+            sort_dir (PyarrSortDirection | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            models (bool | None, optional): Return HistoryRecord records rather than dictionaries. Defaults to None, the
+                client setting.
+
+        Returns:
+            AsyncIterator[JsonObject | HistoryRecord]: Each record in order.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        return self._iter_records("history", params, page_size, max_concurrency, HistoryRecord, models)
+
+    def since(self, date: datetime | str, event_type: str | None = None) -> JsonArray:
+        """Gets every history record from a date on, oldest first, without paging.
+
+        Args:
+            date (datetime | str): The earliest date, as a datetime or an ISO8601 string.
+            event_type (str | None, optional): Only records of this event type, such as ``grabbed``.
+                Defaults to None.
+
+        Returns:
+            JsonArray: List of dictionaries with items.
+        """
+        params = {"date": date.isoformat() if isinstance(date, datetime) else date}
+        if event_type:
+            params["eventType"] = event_type
+
+        response = self.handler.request("history/since", params=params)
+        if isinstance(response, list):
+            return response
+        raise ValueError("Expected a list response from the 'history/since' endpoint")
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class ImportList(CommonActions):
     """Import list actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of import lists or a specific list by ID.
 
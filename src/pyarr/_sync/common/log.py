@@ -3,6 +3,8 @@
 # Do not edit this file directly.
 # """
 
+from collections.abc import Iterator
+
 from pyarr._sync.common.base import CommonActions
 from pyarr.exceptions import PyarrMissingArgument
 from pyarr.types import JsonObject
@@ -11,6 +13,8 @@ from pyarr.types import JsonObject
 class Log(CommonActions):
     """Log actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(
         self,
         page: int | None = None,
@@ -55,3 +59,63 @@ class Log(CommonActions):
         if isinstance(response, dict):
             return response
         raise TypeError("Expected response to be a dictionary")
+
+    def iter_pages(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        filter_key: str | None = None,
+        filter_value: str | None = None,
+        max_concurrency: int = 4,
+    ) -> Iterator[JsonObject]:
+        """Iterates over every page of logs, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort. Defaults to None.
+            filter_key (str | None, optional): Key to filter by. Defaults to None.
+            filter_value (str | None, optional): Value of the filter. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each page in order, with its ``records``.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        if filter_key and filter_value:
+            params |= {"filterKey": filter_key, "filterValue": filter_value}
+        elif filter_key or filter_value:
+            raise PyarrMissingArgument("filter_key and filter_value must be used together")
+
+        return self._iter_pages("log", params, page_size, max_concurrency)
+
+    def iter_records(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        filter_key: str | None = None,
+        filter_value: str | None = None,
+        max_concurrency: int = 4,
+    ) -> Iterator[JsonObject]:
+        """Iterates over every log entry, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort. Defaults to None.
+            filter_key (str | None, optional): Key to filter by. Defaults to None.
+            filter_value (str | None, optional): Value of the filter. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each record in order.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        if filter_key and filter_value:
+            params |= {"filterKey": filter_key, "filterValue": filter_value}
+        elif filter_key or filter_value:
+            raise PyarrMissingArgument("filter_key and filter_value must be used together")
+
+        return self._iter_records("log", params, page_size, max_concurrency)
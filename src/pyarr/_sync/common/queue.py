@@ -3,20 +3,26 @@
 # Do not edit this file directly.
 # """
 
+from collections.abc import Iterator
+
 from pyarr._sync.common.base import CommonActions
 from pyarr.exceptions import PyarrMissingArgument
+from pyarr.models import QueueRecord
 from pyarr.types import JsonObject
 
 
 class Queue(CommonActions):
     """Queue actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(
         self,
         page: int | None = None,
         page_size: int | None = None,
         sort_key: str | None = None,
         sort_dir: str | None = None,
+        models: bool | None = None,
         **kwargs,
     ) -> JsonObject:
         """Returns the list of items in the queue.
@@ -26,6 +32,8 @@ class Queue(CommonActions):
             page_size (int | None, optional): Number of items per page. Defaults to None.
             sort_key (str | None, optional): Field to sort by. Defaults to None.
             sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            models (bool | None, optional): Return QueueRecord records rather than dictionaries. Defaults to None, the
+                client setting.
             **kwargs: Additional parameters for specific clients.
 
         Returns:
@@ -48,9 +56,64 @@ class Queue(CommonActions):
 
         response = self.handler.request("queue", params=params)
         if isinstance(response, dict):
-            return response
+            return self._to_models(response, QueueRecord, models)
         raise TypeError("Expected response to be a dictionary")
 
+    def iter_pages(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        max_concurrency: int = 4,
+        **kwargs,
+    ) -> Iterator[JsonObject]:
+        """Iterates over every page of the queue, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            **kwargs: Additional parameters for specific clients.
+
+        Returns:
+            AsyncIterator[JsonObject]: Each page in order, with its ``records``.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        if kwargs:
+            params |= kwargs
+
+        return self._iter_pages("queue", params, page_size, max_concurrency)
+
+    def iter_records(
+        self,
+        page_size: int = 250,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        max_concurrency: int = 4,
+        models: bool | None = None,
+        **kwargs,
+    ) -> Iterator[JsonObject | QueueRecord]:
+        """Iterates over every item in the queue, fetching pages concurrently.
+
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 250.
+            sort_key (str | None, optional): Field to sort by. Defaults to None.
+            sort_dir (str | None, optional): Direction to sort the items. Defaults to None.
+            max_concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            models (bool | None, optional): Return QueueRecord records rather than dictionaries. Defaults to None, the
+                client setting.
+            **kwargs: Additional parameters for specific clients.
+
+        Returns:
+            AsyncIterator[JsonObject | QueueRecord]: Each record in order.
+        """
+        params = self._sort_params(sort_key, sort_dir)
+        if kwargs:
+            params |= kwargs
+
+        return self._iter_records("queue", params, page_size, max_concurrency, QueueRecord, models)
+
     def delete(
         self,
         item_id: int,
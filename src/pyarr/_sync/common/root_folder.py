@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class RootFolder(CommonActions):
     """Root folder actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of root folders or a specific root folder by ID.
 
@@ -12,6 +12,8 @@ from pyarr.types import JsonObject
 class Tag(CommonActions):
     """Tag actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> Any:
         """Returns the list of added tags or a specific tag by ID.
 
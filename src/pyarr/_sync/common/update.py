@@ -10,6 +10,8 @@ from pyarr.types import JsonArray
 class Update(CommonActions):
     """Update actions for Arr clients."""
 
+    __slots__ = ()
+
     def get(self) -> JsonArray:
         """Returns the list of available updates.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Accounts(CommonActions):
     """Account actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get_api_keys(self) -> JsonObject:
         """Retrieve API keys.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Backups(CommonActions):
     """Backup actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get(self) -> JsonArray:
         """List all available backup files.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class ChannelProfiles(CommonActions):
     """Channel profile actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve channel profiles.
 
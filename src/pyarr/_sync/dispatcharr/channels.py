@@ -6,12 +6,15 @@
 from typing import Any
 
 from pyarr._sync.common.base import CommonActions
+from pyarr.models import ChannelRecord
 from pyarr.types import JsonArray, JsonObject
 
 
 class Channels(CommonActions):
     """Channel actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get(
         self,
         item_id: int | None = None,
@@ -22,7 +25,8 @@ class Channels(CommonActions):
         page: int | None = None,
         page_size: int | None = None,
         search: str | None = None,
-    ) -> JsonArray | JsonObject:
+        models: bool | None = None,
+    ) -> JsonArray | JsonObject | list[ChannelRecord] | ChannelRecord:
         """Returns the list of channels or a specific channel by ID.
 
         Args:
@@ -34,9 +38,11 @@ class Channels(CommonActions):
             page (int | None, optional): A page number within the paginated result set. Defaults to None.
             page_size (int | None, optional): Number of results to return per page. Defaults to None.
             search (str | None, optional): A search term. Defaults to None.
+            models (bool | None, optional): Return ChannelRecord records rather than dictionaries. Defaults to None, the
+                client setting.
 
         Returns:
-            JsonArray | JsonObject: The response data.
+            JsonArray | JsonObject | list[ChannelRecord] | ChannelRecord: The response data.
         """
         params: dict[str, Any] = {}
         if channel_group:
@@ -54,7 +60,8 @@ class Channels(CommonActions):
         if search:
             params["search"] = search
 
-        return self._get("channels/channels/", item_id=item_id, params=params)
+        response = self._get("channels/channels/", item_id=item_id, params=params)
+        return self._to_models(response, ChannelRecord, models)
 
     def add(self, data: JsonObject) -> JsonObject:
         """Add a new channel.
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Connect(CommonActions):
     """Connect actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get_integrations(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve integrations.
 
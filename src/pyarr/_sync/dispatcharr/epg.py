@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Epg(CommonActions):
     """EPG actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get_current_programs(self, data: JsonObject) -> JsonArray | JsonObject:
         """Retrieve current programs.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Hdhr(CommonActions):
     """HDHR actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get_device_xml(self) -> JsonObject:
         """Retrieve HDHR device XML.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Plugins(CommonActions):
     """Plugin actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get(self, item_id: str | None = None) -> JsonArray | JsonObject:
         """Retrieve plugins.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Proxy(CommonActions):
     """Proxy actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get_ts_status(self, channel_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve TS proxy status.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class DispatcharrSystem(CommonActions):
     """System actions for Dispatcharr (Core API)."""
 
+    __slots__ = ()
+
     def get_notifications(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Retrieve notifications.
 
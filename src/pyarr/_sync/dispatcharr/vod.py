@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Vod(CommonActions):
     """VOD actions for Dispatcharr."""
 
+    __slots__ = ()
+
     def get_all(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of all VOD content or a specific item by ID.
 
@@ -0,0 +1,252 @@
+# """
+# This file is automatically generated from the async version.
+# Do not edit this file directly.
+# """
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from pyarr._sync.client import MediaArrClient
+from pyarr._sync.common.command import SEARCH_COMMANDS
+from pyarr._sync_synchronization import SyncEvent, SyncGate, SyncLock
+from pyarr.types import JsonObject
+
+#: Statuses of commands still waiting or running on the server.
+_ACTIVE_STATUSES = frozenset({"queued", "started"})
+
+
+class _Submission:
+    """A command waiting for its turn."""
+
+    __slots__ = ("body", "done", "error", "field", "ids", "key", "name", "result", "submitted", "taken")
+
+    def __init__(self, name: str, body: dict[str, Any]):
+        """Initializes the submission.
+
+        Args:
+            name (str): The command name.
+            body (dict[str, Any]): The command parameters.
+        """
+        self.name = name
+        self.body = body
+        self.field = SEARCH_COMMANDS.get(name)
+        self.ids: list[Any] = list(body.get(self.field) or []) if self.field else []
+        rest = {key: value for key, value in body.items() if key != self.field}
+        #: Submissions with the same key are sent as one command.
+        self.key = (name, json.dumps(rest, sort_keys=True, default=str))
+        self.submitted = time.monotonic()
+        self.taken = False
+        self.done = SyncEvent()
+        self.result: JsonObject | None = None
+        self.error: BaseException | None = None
+
+    def finish(self, result: JsonObject | None, error: BaseException | None = None) -> None:
+        """Hands the outcome to the submitter.
+
+        Args:
+            result (JsonObject | None): The command in its final state.
+            error (BaseException | None, optional): The error that stopped it. Defaults to None.
+        """
+        self.result = result
+        self.error = error
+        self.done.set()
+
+
+class CommandDispatcher:
+    """Sends commands to one instance without flooding its task queue.
+
+    At most ``max_active`` commands sent through the dispatcher are queued or running on the
+    server at a time, the others wait their turn. Submissions that are waiting when a place frees
+    up are combined: searches by ID (``EpisodeSearch``, ``MoviesSearch``, ``AlbumSearch`` and
+    ``BookSearch``) with otherwise equal parameters become one search for all their IDs, and other
+    identical commands are sent once. Before sending, IDs that a command already queued or
+    running on the server covers are dropped, and a command the server already has is not sent
+    again but waited for.
+    """
+
+    def __init__(self, client: MediaArrClient, max_active: int = 2, max_batch: int = 250):
+        """Initializes the dispatcher.
+
+        Args:
+            client (MediaArrClient): The instance to send commands to.
+            max_active (int, optional): The most commands queued or running at once. Defaults to 2.
+            max_batch (int, optional): The most IDs combined into one search. Defaults to 250.
+
+        Raises:
+            ValueError: If ``max_active`` or ``max_batch`` is less than 1.
+        """
+        if max_active < 1 or max_batch < 1:
+            raise ValueError("max_active and max_batch must be at least 1")
+        self.client = client
+        self.max_active = max_active
+        self.max_batch = max_batch
+        self._gate = SyncGate(lambda: self.max_active)
+        self._lock = SyncLock()
+        self._pending: list[_Submission] = []
+        #: Commands submitted.
+        self.submitted = 0
+        #: Commands sent to the server.
+        self.dispatched = 0
+        #: Submissions combined into a command sent for another.
+        self.merged = 0
+        #: Submissions answered by a command the server already had.
+        self.deduplicated = 0
+        #: Total and longest seconds submissions waited for their turn.
+        self.wait_total = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of submissions waiting for their turn.
+
+        Returns:
+            int: The submissions.
+        """
+        return len(self._pending)
+
+    @property
+    def active(self) -> int:
+        """The number of commands sent through the dispatcher that have not ended.
+
+        Returns:
+            int: The commands.
+        """
+        return self._gate.holders
+
+    def submit(self, name: str, **body: Any) -> JsonObject:
+        """Runs a command once it is its turn and returns it once it has ended.
+
+        Args:
+            name (str): Command name, such as ``EpisodeSearch``.
+            **body (Any): The command parameters, such as ``episodeIds``.
+
+        Returns:
+            JsonObject: The command that carried out the submission, in its final state. It may include the
+                IDs of other submissions.
+        """
+        submission = _Submission(name, body)
+        with self._lock:
+            self._pending.append(submission)
+            self.submitted += 1
+        try:
+            held = self._gate.acquire(unless=lambda: submission.taken)
+        except BaseException:
+            with self._lock:
+                if not submission.taken:
+                    self._pending.remove(submission)
+            raise
+        if held:
+            try:
+                batch = self._take(submission)
+                if batch:
+                    self._dispatch(batch)
+            finally:
+                self._gate.release()
+        submission.done.wait()
+        if submission.error is not None:
+            raise submission.error
+        return submission.result or {}
+
+    def _take(self, submission: _Submission) -> list[_Submission]:
+        """Takes a submission off the queue, with every waiting one it can be combined with.
+
+        Args:
+            submission (_Submission): The submission whose turn it is.
+
+        Returns:
+            list[_Submission]: The submissions to send as one command, empty if another took this one.
+        """
+        with self._lock:
+            if submission.taken:
+                return []
+            batch = [submission]
+            ids = set(submission.ids)
+            for other in self._pending:
+                if other is submission or other.key != submission.key:
+                    continue
+                if submission.field and len(ids.union(other.ids)) > self.max_batch:
+                    continue
+                batch.append(other)
+                ids.update(other.ids)
+            now = time.monotonic()
+            for taken in batch:
+                taken.taken = True
+                self._pending.remove(taken)
+                waited = now - taken.submitted
+                self.wait_total += waited
+                self.max_wait = max(self.max_wait, waited)
+            self.merged += len(batch) - 1
+        if len(batch) > 1:
+            self._gate.wake()
+        return batch
+
+    def _dispatch(self, batch: list[_Submission]) -> None:
+        """Sends a batch as one command, unless the server has it already, and waits for it to end.
+
+        Args:
+            batch (list[_Submission]): The submissions.
+        """
+        first = batch[0]
+        body = dict(first.body)
+        if first.field:
+            body[first.field] = list(dict.fromkeys(item for submission in batch for item in submission.ids))
+        try:
+            covering, body_to_send = self._on_server(first.name, body, first.field)
+            if body_to_send is None:
+                self.deduplicated += len(batch)
+                result = {}
+                for command in covering:
+                    result = self.client.command.wait(command["id"])
+            else:
+                command = self.client.command.execute(first.name, **body_to_send)
+                self.dispatched += 1
+                result = self.client.command.wait(command["id"])
+        except BaseException as error:
+            for submission in batch:
+                submission.finish(None, error)
+            raise
+        for submission in batch:
+            submission.finish(result)
+
+    def _on_server(
+        self,
+        name: str,
+        body: dict[str, Any],
+        field: str | None,
+    ) -> tuple[list[JsonObject], dict[str, Any] | None]:
+        """Finds the commands already queued or running on the server that cover a command.
+
+        Args:
+            name (str): The command name.
+            body (dict[str, Any]): The command parameters.
+            field (str | None): The field holding the IDs, for searches by ID.
+
+        Returns:
+            tuple[list[JsonObject], dict[str, Any] | None]: The covering commands, and the parameters of what is
+                left to send, None if nothing is.
+        """
+        commands = self.client.command.get()
+        rest = {key: value for key, value in body.items() if key != field}
+        matching = [
+            command
+            for command in commands
+            if isinstance(command, dict)
+            and command.get("status") in _ACTIVE_STATUSES
+            and str(command.get("name", "")).lower() == name.lower()
+            and all((command.get("body") or {}).get(key) == value for key, value in rest.items())
+        ]
+        if field is None:
+            return matching[:1], None if matching else body
+        wanted = set(body[field])
+        covered: set[Any] = set()
+        covering = []
+        for command in matching:
+            ids = set((command.get("body") or {}).get(field) or [])
+            if ids & wanted:
+                covering.append(command)
+                covered |= ids
+        remaining = [item for item in body[field] if item not in covered]
+        return covering, {**body, field: remaining} if remaining else None
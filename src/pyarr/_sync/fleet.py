@@ -0,0 +1,246 @@
+# """
+# This file is automatically generated from the async version.
+# Do not edit this file directly.
+# """
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from pyarr._sync.client import BaseArrClient
+from pyarr._sync_synchronization import SyncPool
+from pyarr.fleet import FleetResult, FleetResults
+
+C = TypeVar("C", bound=BaseArrClient)
+
+
+class ArrFleet:
+    """Runs one call across many Arr instances at once.
+
+    Every instance runs concurrently and has its own timeout, so a slow or unreachable instance
+    only costs its own result. Clients built with :meth:`create` share one connection pool.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = 30.0,
+        session: httpx.Client | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        verify_ssl: bool = True,
+        request_timeout: float | None = None,
+    ):
+        """Initializes an empty fleet.
+
+        Args:
+            timeout (float | None, optional): Seconds each instance gets per call, None for no limit.
+                Defaults to 30.0.
+            session (httpx.Client | None, optional): The session shared by the clients built with
+                :meth:`create`. Defaults to None, a session the fleet creates and closes.
+            limits (httpx.Limits | None, optional): Connection pool limits for the session the fleet creates.
+                Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session the fleet creates. Defaults to False.
+            verify_ssl (bool, optional): Whether the session the fleet creates verifies SSL certificates.
+                Defaults to True.
+            request_timeout (float | None, optional): The httpx timeout of each request on the session the fleet
+                creates, as ``request_timeout`` is for a client of its own. Defaults to None, no timeout.
+        """
+        self.timeout = timeout
+        self.clients: dict[str, BaseArrClient] = {}
+        self._timeouts: dict[str, float | None] = {}
+        self.session = session
+        self._owns_session = session is None
+        self._owns_clients = True
+        self._limits = limits
+        self._http2 = http2
+        self._verify_ssl = verify_ssl
+        self._request_timeout = request_timeout
+
+    def __enter__(self) -> ArrFleet:
+        """Enter the runtime context related to this object.
+
+        Returns:
+            ArrFleet: The fleet.
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Closes the clients and the shared session.
+
+        Args:
+            exc_type (Any): The exception type.
+            exc_value (Any): The exception value.
+            traceback (Any): The traceback.
+        """
+        if not self._owns_clients:
+            return
+        for client in self.clients.values():
+            client.__exit__(exc_type, exc_value, traceback)
+        if self.session is not None and self._owns_session:
+            self.session.close()
+            self.session = None
+
+    def _get_session(self) -> httpx.Client:
+        """Returns the shared session, creating it on first use.
+
+        Returns:
+            httpx.Client: The session.
+        """
+        if self.session is None:
+            options: dict[str, Any] = {"limits": self._limits} if self._limits is not None else {}
+            self.session = httpx.Client(
+                follow_redirects=True,
+                verify=self._verify_ssl,
+                http2=self._http2,
+                timeout=self._request_timeout,
+                **options,
+            )
+        return self.session
+
+    def add(self, name: str, client: BaseArrClient, timeout: float | None = None) -> BaseArrClient:
+        """Adds an existing client to the fleet, which closes it on exit.
+
+        Args:
+            name (str): The instance name, used to key results.
+            client (BaseArrClient): The client.
+            timeout (float | None, optional): Seconds this instance gets per call. Defaults to None, the
+                fleet timeout.
+
+        Raises:
+            ValueError: If the name is already in use.
+
+        Returns:
+            BaseArrClient: The client.
+        """
+        if name in self.clients:
+            raise ValueError(f"An instance named {name!r} is already in the fleet")
+        self.clients[name] = client
+        self._timeouts[name] = self.timeout if timeout is None else timeout
+        return client
+
+    def create(
+        self, name: str, client_class: type[C], host: str, api_key: str, timeout: float | None = None, **kwargs: Any
+    ) -> C:
+        """Builds a client on the fleet's shared session and adds it.
+
+        Args:
+            name (str): The instance name, used to key results.
+            client_class (type[C]): The client class, such as ``Sonarr``.
+            host (str): The host or full URL of the instance.
+            api_key (str): The API key of the instance.
+            timeout (float | None, optional): Seconds this instance gets per call. Defaults to None, the
+                fleet timeout.
+            **kwargs (Any): Further client options, such as ``port`` or ``api_ver``.
+
+        Raises:
+            ValueError: If ``request_timeout`` is given, the shared session sets the request timeout of every
+                client, see the fleet's own ``request_timeout``.
+
+        Returns:
+            C: The client.
+        """
+        if "request_timeout" in kwargs:
+            raise ValueError("Clients built by a fleet share its session, pass request_timeout to the fleet instead")
+        client = client_class(host, api_key, session=self._get_session(), **kwargs)
+        self.add(name, client, timeout)
+        return client
+
+    def select(self, *names: str, kind: type[BaseArrClient] | None = None) -> ArrFleet:
+        """Returns a fleet of some of the instances, sharing their clients.
+
+        The returned fleet does not close anything on exit, the clients stay owned by this one.
+
+        Args:
+            *names (str): The instance names to keep. Defaults to every instance.
+            kind (type[BaseArrClient] | None, optional): Keep only clients of this class, such as
+                ``Radarr``. Defaults to None.
+
+        Raises:
+            KeyError: If a name is not in the fleet.
+
+        Returns:
+            ArrFleet: The smaller fleet.
+        """
+        fleet = ArrFleet(self.timeout, session=self.session)
+        fleet._owns_clients = False
+        for name in names or self.clients:
+            client = self.clients[name]
+            if kind is None or isinstance(client, kind):
+                fleet.clients[name] = client
+                fleet._timeouts[name] = self._timeouts[name]
+        return fleet
+
+    def _timed(self, fn: Callable[[Any], Any], client: BaseArrClient) -> tuple[Any, float]:
+        """Runs a call on one client and measures it.
+
+        Args:
+            fn (Callable[[Any], Any]): The call, given the client.
+            client (BaseArrClient): The client.
+
+        Returns:
+            tuple[Any, float]: The result and the seconds it took.
+        """
+        started = time.perf_counter()
+        value = fn(client)
+        return value, time.perf_counter() - started
+
+    def run(self, fn: Callable[[Any], Any]) -> FleetResults:
+        """Runs a call on every instance concurrently.
+
+        Args:
+            fn (Callable[[Any], Any]): The call, given each client, for example
+                ``lambda client: client.system.get_health()``.
+
+        Returns:
+            FleetResults: The value or exception of every instance.
+        """
+        results: dict[str, FleetResult] = {}
+        if not self.clients:
+            return FleetResults(results)
+        # Instances that run out of time are cancelled, or in the threaded sync fleet left to finish unobserved.
+        with SyncPool(len(self.clients), wait=False) as pool:
+            started = time.perf_counter()
+            futures = {name: pool.submit(self._timed, fn, client) for name, client in self.clients.items()}
+            for name, future in futures.items():
+                timeout = self._timeouts[name]
+                remaining = None if timeout is None else max(timeout - (time.perf_counter() - started), 0.0)
+                try:
+                    value, elapsed = pool.result(future, remaining)
+                    results[name] = FleetResult(name, value, None, elapsed)
+                except Exception as error:
+                    results[name] = FleetResult(name, None, error, time.perf_counter() - started)
+        return FleetResults(results)
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> FleetResults:
+        """Calls a component method on every instance concurrently.
+
+        Args:
+            method (str): The component and method, such as ``"system.get_health"`` or ``"queue.get"``.
+            *args (Any): Positional arguments for the method.
+            **kwargs (Any): Keyword arguments for the method.
+
+        Returns:
+            FleetResults: The value or exception of every instance. Instances without the component
+                fail with ``AttributeError``.
+        """
+        component, _, name = method.rpartition(".")
+
+        def invoke(client: BaseArrClient) -> Any:
+            """Looks the method up on one client and calls it.
+
+            Args:
+                client (BaseArrClient): The client.
+
+            Returns:
+                Any: The result of the method.
+            """
+            target: Any = client
+            for attr in component.split(".") if component else ():
+                target = getattr(target, attr)
+            return getattr(target, name)(*args, **kwargs)
+
+        return self.run(invoke)
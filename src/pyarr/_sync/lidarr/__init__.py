@@ -3,23 +3,46 @@
 # Do not edit this file directly.
 # """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import httpx
 
-from pyarr._sync.client import MediaArrClient
-from pyarr._sync.common.import_list_exclusion import ImportListExclusion
-from pyarr._sync.common.wanted import Wanted
-from pyarr._sync.lidarr.album import Album
-from pyarr._sync.lidarr.artist import Artist
-from pyarr._sync.lidarr.config import Config
-from pyarr._sync.lidarr.manual_import import ManualImport
-from pyarr._sync.lidarr.release import Release
-from pyarr._sync.lidarr.track import Track
-from pyarr._sync.lidarr.track_file import TrackFile
+from pyarr._sync.client import LazyComponent, MediaArrClient
+from pyarr.cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+from pyarr.codec import JsonCodec
+from pyarr.instrumentation import Instrument
+from pyarr.ratelimit import RateLimit
+from pyarr.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyarr._sync.common.import_list_exclusion import ImportListExclusion
+    from pyarr._sync.common.wanted import Wanted
+    from pyarr._sync.lidarr.album import Album
+    from pyarr._sync.lidarr.artist import Artist
+    from pyarr._sync.lidarr.config import Config
+    from pyarr._sync.lidarr.manual_import import ManualImport
+    from pyarr._sync.lidarr.release import Release
+    from pyarr._sync.lidarr.track import Track
+    from pyarr._sync.lidarr.track_file import TrackFile
 
 
 class Lidarr(MediaArrClient):
     """Lidarr API client."""
 
+    config: LazyComponent[Config] = LazyComponent(".lidarr.config", "Config")
+    artist: LazyComponent[Artist] = LazyComponent(".lidarr.artist", "Artist")
+    album: LazyComponent[Album] = LazyComponent(".lidarr.album", "Album")
+    track: LazyComponent[Track] = LazyComponent(".lidarr.track", "Track")
+    track_file: LazyComponent[TrackFile] = LazyComponent(".lidarr.track_file", "TrackFile")
+    release: LazyComponent[Release] = LazyComponent(".lidarr.release", "Release")
+    manual_import: LazyComponent[ManualImport] = LazyComponent(".lidarr.manual_import", "ManualImport")
+    wanted: LazyComponent[Wanted] = LazyComponent(".common.wanted", "Wanted", search_command="AlbumSearch")
+    import_list_exclusion: LazyComponent[ImportListExclusion] = LazyComponent(
+        ".common.import_list_exclusion", "ImportListExclusion"
+    )
+
     def __init__(
         self,
         host: str,
@@ -32,6 +55,22 @@ class Lidarr(MediaArrClient):
         session: httpx.Client | None = None,
         verify_ssl: bool = True,
         headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        version_cache: ApiVersionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: JsonCodec | str | None = None,
+        models: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        warm_up: bool = False,
+        coalesce: bool = False,
+        batch_window: float | None = None,
+        batch_size: int = 100,
+        rate_limit: RateLimit | None = None,
+        instrumentation: Instrument | None = None,
+        transport: httpx.BaseTransport | None = None,
+        lookup_cache: LookupCache | None = None,
     ):
         """Initializes the Lidarr client with the provided host, API key, and optional parameters.
 
@@ -46,6 +85,36 @@ class Lidarr(MediaArrClient):
             session (httpx.Client | None, optional): An existing httpx.Client session. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             headers (dict[str, str] | None, optional): Default headers to include in requests. Defaults to None.
+            retry (RetryPolicy | None, optional): How failed requests are retried. Defaults to None, the default policy.
+            version_cache (ApiVersionCache | None, optional): Where discovered API versions are cached between runs.
+                Defaults to None, always probe.
+            response_cache (ResponseCache | None, optional): Caches answers from rarely changing endpoints. Defaults to
+                None, no caching.
+            conditional_cache (ConditionalCache | None, optional): Revalidates repeated GETs instead of downloading and
+                decoding them again. Defaults to None, always fetch.
+            json_codec (JsonCodec | str | None, optional): The JSON backend, a codec or one of "orjson", "msgspec" and
+                "json". Defaults to None, the standard library.
+            models (bool, optional): Return typed records from pyarr.models instead of dictionaries where a model
+                exists. Defaults to False.
+            limits (httpx.Limits | None, optional): Connection pool limits and keep-alive expiry for the session PyArr
+                creates. Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session PyArr creates, needs the httpx[http2] extra.
+                Defaults to False.
+            warm_up (bool, optional): Open a connection, and discover the API version if needed, when entering the
+                context. Defaults to False.
+            coalesce (bool, optional): Share one in-flight answer among identical concurrent GETs. Defaults to False.
+            batch_window (float | None, optional): Gather single-ID lookups made within this many seconds into one list
+                request, where the endpoint supports it. Defaults to None, no batching.
+            batch_size (int, optional): The most IDs sent in one batched request, keeping URLs short. Defaults to 100.
+            rate_limit (RateLimit | None, optional): Paces and caps the requests sent to the host, pass one instance to
+                several clients to share it. Defaults to None, no limit.
+            instrumentation (Instrument | None, optional): Receives a RequestEvent with the timings, sizes and status of
+                every request. Defaults to None, nothing is measured.
+            transport (httpx.BaseTransport | None, optional): Sends requests through this transport instead of the
+                network, such as a :class:`~pyarr.cassette.ReplayTransport`. Ignored when ``session`` is given. Defaults
+                to None.
+            lookup_cache (LookupCache | None, optional): Caches metadata lookups on disk, shared between processes.
+                Defaults to None.
         """
         super().__init__(
             host,
@@ -58,13 +127,20 @@ class Lidarr(MediaArrClient):
             session=session,
             verify_ssl=verify_ssl,
             headers=headers,
+            retry=retry,
+            version_cache=version_cache,
+            response_cache=response_cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            models=models,
+            limits=limits,
+            http2=http2,
+            warm_up=warm_up,
+            coalesce=coalesce,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            rate_limit=rate_limit,
+            instrumentation=instrumentation,
+            transport=transport,
+            lookup_cache=lookup_cache,
         )
-        self.config = Config(self.http_utils)
-        self.artist = Artist(self.http_utils)
-        self.album = Album(self.http_utils)
-        self.track = Track(self.http_utils)
-        self.track_file = TrackFile(self.http_utils)
-        self.release = Release(self.http_utils)
-        self.manual_import = ManualImport(self.http_utils)
-        self.wanted = Wanted(self.http_utils)
-        self.import_list_exclusion = ImportListExclusion(self.http_utils)
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Artist(CommonActions):
     """Artist actions for Lidarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | str | None = None, mb_id: str | None = None) -> JsonArray | JsonObject:
         """Returns artists by ID or MusicBrainz ID.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray
 class ManualImport(CommonActions):
     """Manual import actions for Lidarr."""
 
+    __slots__ = ()
+
     def get(
         self,
         folder: str,
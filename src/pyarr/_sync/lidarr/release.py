@@ -10,6 +10,8 @@ from pyarr.types import JsonArray
 class Release(CommonActions):
     """Release actions for Lidarr."""
 
+    __slots__ = ()
+
     def get(self, artist_id: int | None = None, album_id: int | None = None) -> JsonArray:
         """Search indexers for specified fields.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Track(CommonActions):
     """Track actions for Lidarr."""
 
+    __slots__ = ()
+
     def get(
         self,
         artist_id: int | None = None,
@@ -19,11 +21,15 @@ class Track(CommonActions):
     ) -> JsonArray | JsonObject:
         """Returns tracks based on provided IDs.
 
+        When the client has a ``batch_window``, concurrent lookups of a single track, ``track_ids=[id]``,
+        are sent as one request.
+
         Args:
             artist_id (int | None, optional): Artist ID. Defaults to None.
             album_id (int | None, optional): Album ID. Defaults to None.
             album_release_id (int | None, optional): Album Release ID. Defaults to None.
-            track_ids (list[int] | None, optional): Track IDs. Defaults to None.
+            track_ids (list[int] | None, optional): Track IDs, long lists are split over several concurrent
+                requests. Defaults to None.
 
         Returns:
             JsonArray | JsonObject: List of dictionaries with items or a single dictionary.
@@ -44,4 +50,9 @@ class Track(CommonActions):
             item_id = track_ids[0]
             params.pop("trackIds")
 
+        if item_id and not params and self._batching():
+            return self._get_batched("track", item_id, self._get_by_ids, "track", "trackIds")
+        if track_ids and "trackIds" in params:
+            del params["trackIds"]
+            return self._request_chunked("track", "trackIds", track_ids, params)
         return self._get("track", item_id=item_id, params=params)
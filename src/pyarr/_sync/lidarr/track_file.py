@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class TrackFile(CommonActions):
     """Track file actions for Lidarr."""
 
+    __slots__ = ()
+
     def get(
         self,
         artist_id: int | None = None,
@@ -19,10 +21,14 @@ class TrackFile(CommonActions):
     ) -> JsonArray | JsonObject:
         """Returns track files based on IDs, or all unmapped files.
 
+        When the client has a ``batch_window``, concurrent lookups of a single file, ``track_file_ids=[id]``,
+        are sent as one request.
+
         Args:
             artist_id (int | None, optional): Artist database ID. Defaults to None.
             album_id (int | None, optional): Album database ID. Defaults to None.
-            track_file_ids (list[int] | None, optional): Specific file IDs. Defaults to None.
+            track_file_ids (list[int] | None, optional): Specific file IDs, long lists are split over several
+                concurrent requests. Defaults to None.
             unmapped (bool | None, optional): Get all unmapped files. Defaults to None.
 
         Returns:
@@ -43,6 +49,11 @@ class TrackFile(CommonActions):
             item_id = track_file_ids[0]
             params.pop("trackFileIds")
 
+        if item_id and not params and self._batching():
+            return self._get_batched("trackfile", item_id, self._get_by_ids, "trackfile", "trackFileIds")
+        if track_file_ids and "trackFileIds" in params:
+            del params["trackFileIds"]
+            return self._request_chunked("trackfile", "trackFileIds", track_file_ids, params)
         return self._get("trackfile", item_id=item_id, params=params)
 
     def update(self, data: JsonObject) -> JsonObject:
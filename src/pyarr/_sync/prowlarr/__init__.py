@@ -3,26 +3,50 @@
 # Do not edit this file directly.
 # """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import httpx
 
-from pyarr._sync.client import BaseArrClient
-from pyarr._sync.common.backup import Backup
-from pyarr._sync.common.command import Command
-from pyarr._sync.common.download_client import DownloadClient
-from pyarr._sync.common.history import History
-from pyarr._sync.common.log import Log
-from pyarr._sync.common.notification import Notification
-from pyarr._sync.common.tag import Tag
-from pyarr._sync.common.update import Update
-from pyarr._sync.prowlarr.applications import Applications
-from pyarr._sync.prowlarr.indexer import Indexer
-from pyarr._sync.prowlarr.indexer_proxy import IndexerProxy
-from pyarr._sync.prowlarr.search import Search
+from pyarr._sync.client import BaseArrClient, LazyComponent
+from pyarr.cache import ApiVersionCache, ConditionalCache, LookupCache, ResponseCache
+from pyarr.codec import JsonCodec
+from pyarr.instrumentation import Instrument
+from pyarr.ratelimit import RateLimit
+from pyarr.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyarr._sync.common.backup import Backup
+    from pyarr._sync.common.command import Command
+    from pyarr._sync.common.download_client import DownloadClient
+    from pyarr._sync.common.history import History
+    from pyarr._sync.common.log import Log
+    from pyarr._sync.common.notification import Notification
+    from pyarr._sync.common.tag import Tag
+    from pyarr._sync.common.update import Update
+    from pyarr._sync.prowlarr.applications import Applications
+    from pyarr._sync.prowlarr.indexer import Indexer
+    from pyarr._sync.prowlarr.indexer_proxy import IndexerProxy
+    from pyarr._sync.prowlarr.search import Search
 
 
 class Prowlarr(BaseArrClient):
     """Prowlarr API client."""
 
+    indexer: LazyComponent[Indexer] = LazyComponent(".prowlarr.indexer", "Indexer")
+    command: LazyComponent[Command] = LazyComponent(".common.command", "Command")
+    download_client: LazyComponent[DownloadClient] = LazyComponent(".common.download_client", "DownloadClient")
+    history: LazyComponent[History] = LazyComponent(".common.history", "History")
+    log: LazyComponent[Log] = LazyComponent(".common.log", "Log")
+    notification: LazyComponent[Notification] = LazyComponent(".common.notification", "Notification")
+    backup: LazyComponent[Backup] = LazyComponent(".common.backup", "Backup")
+    tag: LazyComponent[Tag] = LazyComponent(".common.tag", "Tag")
+    update: LazyComponent[Update] = LazyComponent(".common.update", "Update")
+    search: LazyComponent[Search] = LazyComponent(".prowlarr.search", "Search")
+    applications: LazyComponent[Applications] = LazyComponent(".prowlarr.applications", "Applications")
+    indexer_proxy: LazyComponent[IndexerProxy] = LazyComponent(".prowlarr.indexer_proxy", "IndexerProxy")
+
     def __init__(
         self,
         host: str,
@@ -35,6 +59,22 @@ class Prowlarr(BaseArrClient):
         session: httpx.Client | None = None,
         verify_ssl: bool = True,
         headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        version_cache: ApiVersionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: JsonCodec | str | None = None,
+        models: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        warm_up: bool = False,
+        coalesce: bool = False,
+        batch_window: float | None = None,
+        batch_size: int = 100,
+        rate_limit: RateLimit | None = None,
+        instrumentation: Instrument | None = None,
+        transport: httpx.BaseTransport | None = None,
+        lookup_cache: LookupCache | None = None,
     ):
         """Initializes the Prowlarr client.
 
@@ -49,6 +89,36 @@ class Prowlarr(BaseArrClient):
             session (httpx.Client | None, optional): An existing httpx.Client session. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             headers (dict[str, str] | None, optional): Default headers to include in requests. Defaults to None.
+            retry (RetryPolicy | None, optional): How failed requests are retried. Defaults to None, the default policy.
+            version_cache (ApiVersionCache | None, optional): Where discovered API versions are cached between runs.
+                Defaults to None, always probe.
+            response_cache (ResponseCache | None, optional): Caches answers from rarely changing endpoints. Defaults to
+                None, no caching.
+            conditional_cache (ConditionalCache | None, optional): Revalidates repeated GETs instead of downloading and
+                decoding them again. Defaults to None, always fetch.
+            json_codec (JsonCodec | str | None, optional): The JSON backend, a codec or one of "orjson", "msgspec" and
+                "json". Defaults to None, the standard library.
+            models (bool, optional): Return typed records from pyarr.models instead of dictionaries where a model
+                exists. Defaults to False.
+            limits (httpx.Limits | None, optional): Connection pool limits and keep-alive expiry for the session PyArr
+                creates. Defaults to None, the httpx defaults.
+            http2 (bool, optional): Negotiate HTTP/2 on the session PyArr creates, needs the httpx[http2] extra.
+                Defaults to False.
+            warm_up (bool, optional): Open a connection, and discover the API version if needed, when entering the
+                context. Defaults to False.
+            coalesce (bool, optional): Share one in-flight answer among identical concurrent GETs. Defaults to False.
+            batch_window (float | None, optional): Gather single-ID lookups made within this many seconds into one list
+                request, where the endpoint supports it. Defaults to None, no batching.
+            batch_size (int, optional): The most IDs sent in one batched request, keeping URLs short. Defaults to 100.
+            rate_limit (RateLimit | None, optional): Paces and caps the requests sent to the host, pass one instance to
+                several clients to share it. Defaults to None, no limit.
+            instrumentation (Instrument | None, optional): Receives a RequestEvent with the timings, sizes and status of
+                every request. Defaults to None, nothing is measured.
+            transport (httpx.BaseTransport | None, optional): Sends requests through this transport instead of the
+                network, such as a :class:`~pyarr.cassette.ReplayTransport`. Ignored when ``session`` is given. Defaults
+                to None.
+            lookup_cache (LookupCache | None, optional): Caches metadata lookups on disk, shared between processes.
+                Defaults to None.
         """
         super().__init__(
             host,
@@ -61,16 +131,20 @@ class Prowlarr(BaseArrClient):
             session=session,
             verify_ssl=verify_ssl,
             headers=headers,
+            retry=retry,
+            version_cache=version_cache,
+            response_cache=response_cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            models=models,
+            limits=limits,
+            http2=http2,
+            warm_up=warm_up,
+            coalesce=coalesce,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            rate_limit=rate_limit,
+            instrumentation=instrumentation,
+            transport=transport,
+            lookup_cache=lookup_cache,
         )
-        self.indexer = Indexer(self.http_utils)
-        self.command = Command(self.http_utils)
-        self.download_client = DownloadClient(self.http_utils)
-        self.history = History(self.http_utils)
-        self.log = Log(self.http_utils)
-        self.notification = Notification(self.http_utils)
-        self.backup = Backup(self.http_utils)
-        self.tag = Tag(self.http_utils)
-        self.update = Update(self.http_utils)
-        self.search = Search(self.http_utils)
-        self.applications = Applications(self.http_utils)
-        self.indexer_proxy = IndexerProxy(self.http_utils)
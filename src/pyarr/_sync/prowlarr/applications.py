@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Applications(CommonActions):
     """Application management actions for Prowlarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns the list of connected applications or a specific application by ID.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Indexer(CommonIndexer):
     """Indexer actions for Prowlarr."""
 
+    __slots__ = ()
+
     def get_stats(self) -> JsonObject:
         """Gets indexer stats.
 
@@ -12,6 +12,8 @@ from pyarr.types import JsonArray
 class Search(CommonActions):
     """Search actions for Prowlarr."""
 
+    __slots__ = ()
+
     def get(self, query: str, indexer_ids: list[int] | None = None, **kwargs) -> JsonArray:
         """Perform a search across indexers.
 
@@ -24,12 +26,13 @@ class Search(CommonActions):
             JsonArray: List of search results.
         """
         params: dict[str, Any] = {"query": query}
-        if indexer_ids:
-            params["indexerIds"] = indexer_ids
         if kwargs:
             params |= kwargs
 
-        response = self.handler.request("search", params=params)
+        if indexer_ids:
+            response = self._request_chunked("search", "indexerIds", indexer_ids, params)
+        else:
+            response = self.handler.request("search", params=params)
         if isinstance(response, list):
             return response
         raise ValueError("Expected a list response from the 'search' endpoint")
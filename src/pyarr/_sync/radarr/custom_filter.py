@@ -10,6 +10,8 @@ from pyarr.types import JsonArray
 class CustomFilter(CommonActions):
     """Custom filter actions for Radarr."""
 
+    __slots__ = ()
+
     def get(self) -> JsonArray:
         """Query Radarr for custom filters.
 
@@ -10,9 +10,14 @@ from pyarr.types import JsonArray, JsonObject
 class MovieFile(CommonActions):
     """Movie file actions for Radarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None, movie_id: int | None = None) -> JsonArray | JsonObject:
         """Returns movie file information.
 
+        When the client has a ``batch_window``, concurrent lookups of a single file by ID are sent as one
+        request.
+
         Args:
             item_id (int | None, optional): Database id of movie file. Defaults to None.
             movie_id (int | None, optional): Database id of movie. Defaults to None.
@@ -24,6 +29,8 @@ class MovieFile(CommonActions):
         if movie_id:
             params["movieId"] = movie_id
 
+        if item_id and not params and self._batching():
+            return self._get_batched("moviefile", item_id, self._get_by_ids, "moviefile", "movieFileIds")
         return self._get("moviefile", item_id=item_id, params=params)
 
     def delete(self, item_id: int) -> None:
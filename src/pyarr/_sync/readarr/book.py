@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class Book(CommonActions):
     """Book actions for Readarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns books by ID or all books.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class DelayProfile(CommonActions):
     """Delay profile actions for Readarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns delay profiles by ID or all profiles.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray
 class Edition(CommonActions):
     """Edition actions for Readarr."""
 
+    __slots__ = ()
+
     def get(self, book_id: int) -> JsonArray:
         """Get editions for a specific book.
 
@@ -10,6 +10,8 @@ from pyarr.types import JsonArray, JsonObject
 class ReleaseProfile(CommonActions):
     """Release profile actions for Readarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None) -> JsonArray | JsonObject:
         """Returns release profiles by ID or all profiles.
 
@@ -10,9 +10,14 @@ from pyarr.types import JsonArray, JsonObject
 class EpisodeFile(CommonActions):
     """Episode file actions for Sonarr."""
 
+    __slots__ = ()
+
     def get(self, item_id: int | None = None, series_id: int | None = None) -> JsonArray | JsonObject:
         """Returns episode file information.
 
+        When the client has a ``batch_window``, concurrent lookups of a single file by ID are sent as one
+        request.
+
         Args:
             item_id (int | None, optional): Database id of episode file. Defaults to None.
             series_id (int | None, optional): Database id of series. Defaults to None.
@@ -24,6 +29,8 @@ class EpisodeFile(CommonActions):
         if series_id:
             params["seriesId"] = series_id
 
+        if item_id and not params and self._batching():
+            return self._get_batched("episodefile", item_id, self._get_by_ids, "episodefile", "episodeFileIds")
         return self._get("episodefile", item_id=item_id, params=params)
 
     def delete(self, item_id: int) -> None:
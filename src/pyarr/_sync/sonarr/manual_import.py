@@ -10,6 +10,8 @@ from pyarr.types import JsonArray
 class ManualImport(CommonActions):
     """Manual import actions for Sonarr."""
 
+    __slots__ = ()
+
     def get(
         self,
         folder: str,
@@ -0,0 +1,487 @@
+"""Thread based counterparts of the primitives in :mod:`pyarr._async_synchronization`."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+#: Mutual exclusion for threads.
+SyncLock = threading.Lock
+
+#: A flag threads wait on.
+SyncEvent = threading.Event
+
+#: Fetches the items for a list of keys, for :class:`SyncBatcher`.
+SyncBatchFetch = Callable[[list[Any]], list[Any]]
+
+#: Fetches the current state of a list of keys, by key, for :class:`SyncPoller`.
+SyncPollFetch = Callable[[list[Any]], dict[Any, Any]]
+
+
+def sync_sleep(seconds: float) -> None:
+    """Sleeps the calling thread, the counterpart of ``async_sleep``.
+
+    Args:
+        seconds (float): How long to sleep.
+    """
+    time.sleep(seconds)
+
+
+def sync_to_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Runs a blocking function in the calling thread, the counterpart of ``async_to_thread``.
+
+    Args:
+        func (Callable[..., Any]): The function.
+        *args (Any): Its arguments.
+        **kwargs (Any): Its keyword arguments.
+
+    Returns:
+        Any: What the function returned.
+    """
+    return func(*args, **kwargs)
+
+
+class SyncPool:
+    """Runs functions on a thread pool, at most ``max_workers`` at a time.
+
+    The threaded counterpart of ``AsyncPool``. Calls that have not started when the
+    context exits are cancelled, calls already running are waited for unless ``wait`` is off.
+    A running thread cannot be stopped, without waiting it finishes in the background and its
+    result is dropped.
+    """
+
+    def __init__(self, max_workers: int, wait: bool = True):
+        """Initializes the pool.
+
+        Args:
+            max_workers (int): The maximum number of calls in flight at once.
+            wait (bool, optional): Whether exiting waits for calls that are still running. Defaults to True.
+
+        Raises:
+            ValueError: If ``max_workers`` is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyarr")
+        self._wait = wait
+
+    def __enter__(self) -> SyncPool:
+        """Enter the pool context.
+
+        Returns:
+            SyncPool: The pool.
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Cancel queued calls and shut the threads down.
+
+        Args:
+            exc_type (Any): The exception type.
+            exc_value (Any): The exception value.
+            traceback (Any): The traceback.
+        """
+        self._executor.shutdown(wait=self._wait, cancel_futures=True)
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> concurrent.futures.Future[T]:
+        """Schedules a call on the pool.
+
+        Args:
+            fn (Callable[..., T]): The function to call.
+            *args (Any): Positional arguments for ``fn``.
+            **kwargs (Any): Keyword arguments for ``fn``.
+
+        Returns:
+            concurrent.futures.Future[T]: A handle to pass to :meth:`result`.
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def result(self, future: concurrent.futures.Future[T], timeout: float | None = None) -> T:
+        """Waits for a submitted call and returns its result.
+
+        Args:
+            future (concurrent.futures.Future[T]): The handle returned by :meth:`submit`.
+            timeout (float | None, optional): Seconds to wait at most, a call that has not started by
+                then is cancelled. Defaults to None, wait for as long as it takes.
+
+        Raises:
+            TimeoutError: If the call did not complete in time.
+
+        Returns:
+            T: The result of the call, re-raising any exception it raised.
+        """
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+
+class SyncSingleFlight:
+    """Shares one in-flight call among every thread asking for the same key.
+
+    The threaded counterpart of ``AsyncSingleFlight``. The first caller runs the call in its own
+    thread, the others block until it completes. Nothing is kept once it completes.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self._calls: dict[Hashable, concurrent.futures.Future[Any]] = {}
+        self._lock = threading.Lock()
+        #: Calls that went ahead.
+        self.calls = 0
+        #: Callers that joined a call already in flight.
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls currently running.
+
+        Returns:
+            int: The number of keys in flight.
+        """
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs ``fn`` unless a call for ``key`` is already in flight, then waits for that one.
+
+        Args:
+            key (Hashable): Identifies calls that are interchangeable.
+            fn (Callable[..., T]): The function to call.
+            *args (Any): Positional arguments for ``fn``.
+            **kwargs (Any): Keyword arguments for ``fn``.
+
+        Returns:
+            T: The result of the shared call, re-raising any exception it raised.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                self.calls += 1
+                future = self._calls[key] = concurrent.futures.Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as error:
+            self._forget(key)
+            future.set_exception(error)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        """Forgets a completed call, so the next caller starts a new one.
+
+        Args:
+            key (Hashable): The call's key.
+        """
+        with self._lock:
+            del self._calls[key]
+
+
+class _Batch:
+    """A batch of lookups being gathered by :class:`SyncBatcher`."""
+
+    __slots__ = ("futures", "taken")
+
+    def __init__(self) -> None:
+        """Initializes an empty, open batch."""
+        self.futures: dict[Hashable, concurrent.futures.Future[Any]] = {}
+        self.taken = False
+
+
+class SyncBatcher:
+    """Gathers single-key lookups made by several threads into one bulk fetch.
+
+    The threaded counterpart of ``AsyncBatcher``. The thread that opens a batch waits ``window``
+    seconds for others to join, then fetches it, unless a thread filled it to ``max_size`` and
+    fetched it first. A single thread gains nothing and waits ``window`` on every lookup.
+    """
+
+    def __init__(
+        self,
+        fetch: SyncBatchFetch,
+        window: float = 0.005,
+        max_size: int = 100,
+        key: Callable[[Any], Hashable] = lambda item: item.get("id"),
+    ):
+        """Initializes the batcher.
+
+        Args:
+            fetch (SyncBatchFetch): Fetches the items for a list of keys.
+            window (float, optional): Seconds a batch stays open for more lookups. Defaults to 0.005.
+            max_size (int, optional): The most keys sent in one fetch. Defaults to 100.
+            key (Callable[[Any], Hashable], optional): Returns the key of a fetched item. Defaults to its
+                ``id``.
+
+        Raises:
+            ValueError: If ``max_size`` is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._fetch = fetch
+        self._window = window
+        self._max_size = max_size
+        self._key = key
+        self._batch: _Batch | None = None
+        self._lock = threading.Lock()
+        #: Bulk fetches sent.
+        self.batches = 0
+        #: Lookups answered by them.
+        self.lookups = 0
+
+    def load(self, key: Hashable) -> Any:
+        """Looks one key up as part of the next batch.
+
+        Args:
+            key (Hashable): The key to look up.
+
+        Returns:
+            Any: The item, or None if the fetch did not return one for the key.
+        """
+        with self._lock:
+            self.lookups += 1
+            batch = self._batch
+            opened = batch is None
+            if batch is None:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = concurrent.futures.Future()
+            full = len(batch.futures) >= self._max_size and self._take(batch)
+        if opened and not full:
+            time.sleep(self._window)
+            with self._lock:
+                full = self._take(batch)
+        if full:
+            self._run(batch)
+        return future.result()
+
+    def _take(self, batch: _Batch) -> bool:
+        """Closes a batch so exactly one thread fetches it. Call with the lock held.
+
+        Args:
+            batch (_Batch): The batch.
+
+        Returns:
+            bool: True if the calling thread is the one to fetch it.
+        """
+        if batch.taken:
+            return False
+        batch.taken = True
+        if self._batch is batch:
+            self._batch = None
+        self.batches += 1
+        return True
+
+    def _run(self, batch: _Batch) -> None:
+        """Fetches a batch and hands each thread its item.
+
+        Args:
+            batch (_Batch): The batch.
+        """
+        try:
+            items = self._fetch(list(batch.futures))
+        except Exception as error:
+            for future in batch.futures.values():
+                future.set_exception(error)
+            return
+        found = {self._key(item): item for item in items}
+        for key, future in batch.futures.items():
+            future.set_result(found.get(key))
+
+
+class SyncGate:
+    """Admits at most ``limit()`` threads at a time, the counterpart of ``AsyncGate``."""
+
+    def __init__(self, limit: Callable[[], int]):
+        """Initializes an empty gate.
+
+        Args:
+            limit (Callable[[], int]): Returns the current number of holders allowed.
+        """
+        self._limit = limit
+        self._condition = threading.Condition()
+        #: Threads currently admitted.
+        self.holders = 0
+
+    def acquire(self, unless: Callable[[], bool] | None = None) -> bool:
+        """Waits until the gate has room, then holds a place in it.
+
+        Args:
+            unless (Callable[[], bool] | None, optional): Stop waiting, without a place, once this returns
+                True. It is checked when the gate has room and after every :meth:`wake`. Defaults to None.
+
+        Returns:
+            bool: True if a place is held, False if ``unless`` ended the wait.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.holders < self._limit() or (unless is not None and unless()))
+            if unless is not None and unless():
+                return False
+            self.holders += 1
+            return True
+
+    def wake(self) -> None:
+        """Makes the waiters check their ``unless`` again."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def release(self) -> None:
+        """Gives a place back and wakes the waiters, the limit may have grown meanwhile."""
+        with self._condition:
+            self.holders -= 1
+            self._condition.notify_all()
+
+
+class SyncPoller:
+    """Waits for many keys to be done with one polling thread, the counterpart of ``AsyncPoller``."""
+
+    def __init__(
+        self,
+        fetch: SyncPollFetch,
+        done: Callable[[Any], bool],
+        min_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        max_failures: int = 5,
+    ):
+        """Initializes the poller.
+
+        Args:
+            fetch (SyncPollFetch): Fetches the current state of a list of keys, by key.
+            done (Callable[[Any], bool]): Whether a state is final.
+            min_interval (float, optional): Shortest time between polls, in seconds. Defaults to 0.5.
+            max_interval (float, optional): Longest time between polls, in seconds. Defaults to 10.0.
+            backoff (float, optional): Multiplies the interval after a poll that found no change. Defaults to 1.5.
+            max_failures (int, optional): Polls in a row that may fail before the waiters get the error.
+                Defaults to 5.
+
+        Raises:
+            ValueError: If ``max_failures`` is less than 1.
+        """
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        self._fetch = fetch
+        self._done = done
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._max_failures = max_failures
+        self._failures = 0
+        self._interval = min_interval
+        self._next_poll = 0.0
+        self._waiters: dict[Hashable, list[concurrent.futures.Future[Any]]] = {}
+        self._states: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        #: Polls sent.
+        self.polls = 0
+        #: Polls that failed.
+        self.errors = 0
+
+    def wait(self, key: Hashable, timeout: float | None = None) -> Any:
+        """Waits until the state of a key is final.
+
+        Args:
+            key (Hashable): The key.
+            timeout (float | None, optional): Seconds to wait at most. Defaults to None, as long as it takes.
+
+        Raises:
+            TimeoutError: If the key was not done in time.
+
+        Returns:
+            Any: The final state.
+        """
+        future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+        with self._lock:
+            self._waiters.setdefault(key, []).append(future)
+            first_poll = time.monotonic() + self._min_interval
+            if first_poll < self._next_poll or self._thread is None:
+                self._interval = self._min_interval
+                self._next_poll = first_poll
+                self._wake.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pyarr-poller", daemon=True)
+                self._thread.start()
+        try:
+            return future.result(timeout)
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(key)
+                if waiters is not None and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiters[key]
+                        self._states.pop(key, None)
+
+    def _run(self) -> None:
+        """Polls until nobody waits any more."""
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+                delay = self._next_poll - time.monotonic()
+                if delay > 0:
+                    self._wake.clear()
+            if delay > 0:
+                self._wake.wait(delay)
+                continue
+            self._poll()
+            with self._lock:
+                self._next_poll = time.monotonic() + self._interval
+
+    def _poll(self) -> None:
+        """Fetches the state of every key waited for and resolves the waiters of those that are done."""
+        with self._lock:
+            keys = list(self._waiters)
+            self.polls += 1
+        try:
+            states = self._fetch(keys)
+        except Exception as error:
+            with self._lock:
+                self.errors += 1
+                self._failures += 1
+                self._interval = min(self._interval * self._backoff, self._max_interval)
+                if self._failures < self._max_failures:
+                    return
+                self._failures = 0
+                failed = []
+                for key in keys:
+                    self._states.pop(key, None)
+                    failed.extend(self._waiters.pop(key, []))
+            for future in failed:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        changed = False
+        resolved: list[tuple[concurrent.futures.Future[Any], Any]] = []
+        with self._lock:
+            self._failures = 0
+            for key in keys:
+                state = states.get(key)
+                if state != self._states.get(key):
+                    changed = True
+                    self._states[key] = state
+                if state is not None and self._done(state):
+                    self._states.pop(key, None)
+                    resolved.extend((future, state) for future in self._waiters.pop(key, []))
+            if changed:
+                self._interval = self._min_interval
+            else:
+                self._interval = min(self._interval * self._backoff, self._max_interval)
+        for future, state in resolved:
+            future.set_result(state)
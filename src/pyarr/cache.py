@@ -0,0 +1,705 @@
+"""Caches that let the request handlers skip work they have already done."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _default_cache_dir() -> Path:
+    """Returns the per user cache directory, honouring ``XDG_CACHE_HOME``.
+
+    Returns:
+        Path: The directory PyArr keeps its on-disk caches in.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pyarr"
+
+
+class ApiVersionCache:
+    """On-disk cache of discovered API versions, keyed by base URL.
+
+    Short lived scripts otherwise probe ``/api`` on every start. Entries expire after ``ttl``
+    seconds so an upgraded instance is picked up again. The file is replaced atomically, so
+    several processes can share it, the last writer wins.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, ttl: float = 86400.0):
+        """Initializes the cache.
+
+        Args:
+            path (str | os.PathLike[str] | None, optional): The JSON file to keep versions in.
+                Defaults to None, ``api_versions.json`` in the user cache directory.
+            ttl (float, optional): How long a discovered version is trusted, in seconds. Defaults to 86400.0.
+        """
+        self.path = Path(path) if path is not None else _default_cache_dir() / "api_versions.json"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, dict[str, str | float]]:
+        """Reads the cache file, treating a missing or corrupt file as empty.
+
+        Returns:
+            dict[str, dict[str, str | float]]: The entries keyed by base URL.
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, base_url: str) -> str | None:
+        """Returns the cached API version for an instance.
+
+        Args:
+            base_url (str): The base URL of the instance.
+
+        Returns:
+            str | None: The version, or None if there is no entry or it has expired.
+        """
+        entry = self._read().get(base_url)
+        if not isinstance(entry, dict) or float(entry.get("expires", 0)) < time.time():
+            return None
+        version = entry.get("version")
+        return version if isinstance(version, str) else None
+
+    def set(self, base_url: str, version: str) -> None:
+        """Stores the API version for an instance, dropping any expired entries.
+
+        Failing to write the cache is not an error, the version is simply probed again next time.
+
+        Args:
+            base_url (str): The base URL of the instance.
+            version (str): The discovered API version.
+        """
+        with self._lock:
+            now = time.time()
+            entries = {key: value for key, value in self._read().items() if float(value.get("expires", 0)) >= now}
+            entries[base_url] = {"version": version, "expires": now + self.ttl}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".api_versions")
+                with os.fdopen(fd, "w", encoding="utf8") as handle:
+                    json.dump(entries, handle)
+                os.replace(tmp, self.path)
+            except OSError:
+                return
+
+
+#: Cache lifetimes, in seconds, for endpoints whose answers rarely change. Keys are endpoint
+#: paths without any trailing item id, so ``qualityprofile`` also covers ``qualityprofile/3``.
+DEFAULT_RESPONSE_TTLS: dict[str, float] = {
+    "qualityprofile": 300.0,
+    "qualityprofile/schema": 3600.0,
+    "qualitydefinition": 300.0,
+    "tag": 300.0,
+    "rootfolder": 60.0,
+    "metadata": 300.0,
+    "system/status": 60.0,
+    "indexer/schema": 3600.0,
+    "notification/schema": 3600.0,
+    "downloadclient/schema": 3600.0,
+    "importlist/schema": 3600.0,
+}
+
+
+def _endpoint_path(endpoint: str) -> str:
+    """Strips a trailing item id from an endpoint.
+
+    Args:
+        endpoint (str): The endpoint, for example ``qualityprofile/3``.
+
+    Returns:
+        str: The endpoint without the id, for example ``qualityprofile``.
+    """
+    path, _, last = endpoint.strip("/").rpartition("/")
+    return path if path and last.isdigit() else endpoint.strip("/")
+
+
+def _resource(endpoint: str) -> str:
+    """Returns the resource an endpoint belongs to, its first path segment.
+
+    Args:
+        endpoint (str): The endpoint, for example ``indexer/schema``.
+
+    Returns:
+        str: The resource, for example ``indexer``.
+    """
+    return endpoint.strip("/").split("/", 1)[0]
+
+
+class CacheStats:
+    """Counters for one response cache."""
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+
+class ResponseCache:
+    """In-memory cache of GET responses for endpoints that rarely change.
+
+    Only endpoints with a TTL are cached. Entries hold the raw response body, so every hit decodes
+    a fresh object that callers are free to modify. The least recently used entries are evicted
+    once either limit is reached, and a PUT, POST or DELETE to a resource drops every cached
+    answer for that resource. One cache can be shared by several clients, entries are keyed by
+    the full URL.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        max_entries: int = 512,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        """Initializes the cache.
+
+        Args:
+            ttls (Mapping[str, float] | None, optional): Cache lifetime in seconds per endpoint, without any
+                trailing item id. Defaults to None, :data:`DEFAULT_RESPONSE_TTLS`.
+            max_entries (int, optional): The most responses held at once. Defaults to 512.
+            max_bytes (int, optional): The most response bytes held at once. Defaults to 8 MiB.
+        """
+        self.ttls = dict(DEFAULT_RESPONSE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, str, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached responses.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The number of response bytes currently held.
+
+        Returns:
+            int: The total size of the cached bodies.
+        """
+        return self._size
+
+    def ttl(self, endpoint: str) -> float | None:
+        """Returns how long answers from an endpoint are cached.
+
+        Args:
+            endpoint (str): The endpoint, relative to the API URL.
+
+        Returns:
+            float | None: The lifetime in seconds, or None if the endpoint is not cached.
+        """
+        return self.ttls.get(_endpoint_path(endpoint))
+
+    def get(self, key: str) -> bytes | None:
+        """Returns a cached body and marks it as recently used.
+
+        Args:
+            key (str): The request URL, including the query string.
+
+        Returns:
+            bytes | None: The body, or None if there is no live entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[2]
+
+    def set(self, key: str, endpoint: str, body: bytes) -> None:
+        """Stores a response body if its endpoint is cached.
+
+        Args:
+            key (str): The request URL, including the query string.
+            endpoint (str): The endpoint, relative to the API URL.
+            body (bytes): The raw response body.
+        """
+        ttl = self.ttl(endpoint)
+        if ttl is None or ttl <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, _resource(endpoint), body)
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drops every cached answer for the resource an endpoint belongs to.
+
+        Args:
+            endpoint (str): The endpoint a request changed, for example ``tag/4``.
+        """
+        resource = _resource(endpoint)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[1] == resource]
+            for key in stale:
+                self._drop(key)
+            self.stats.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drops every cached answer."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _drop(self, key: str) -> None:
+        """Removes one entry, the caller holds the lock.
+
+        Args:
+            key (str): The entry to remove.
+        """
+        self._size -= len(self._entries.pop(key)[2])
+
+
+class ConditionalStats:
+    """Counters for one conditional GET cache."""
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self.not_modified = 0
+        self.unchanged = 0
+        self.changed = 0
+        self.evictions = 0
+
+
+class ConditionalCache:
+    """Remembers the last answer per URL so repeated GETs can skip downloading and decoding it.
+
+    Requests for a URL seen before carry ``If-None-Match`` and ``If-Modified-Since`` when the
+    server sent an ``ETag`` or ``Last-Modified``. A ``304 Not Modified`` then returns the
+    previously decoded body. Servers that send no validators still transfer the body, but a
+    body whose digest matches the last one is not decoded again.
+
+    Either way an unchanged answer is the very object returned last time, so a caller can test
+    ``result is previous`` to learn cheaply that nothing changed. Because that object is
+    shared, callers must copy it before modifying it.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024):
+        """Initializes the cache.
+
+        Args:
+            max_entries (int, optional): The most URLs remembered at once. Defaults to 64.
+            max_bytes (int, optional): The most response bytes, as transferred, remembered at once.
+                Defaults to 256 MiB.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = ConditionalStats()
+        self._entries: OrderedDict[str, _ConditionalEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of URLs remembered.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    def headers(self, key: str) -> dict[str, str]:
+        """Returns the conditional request headers for a URL.
+
+        Args:
+            key (str): The request URL, including the query string.
+
+        Returns:
+            dict[str, str]: ``If-None-Match`` and ``If-Modified-Since`` where known, otherwise empty.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, key: str) -> tuple[bool, Any]:
+        """Returns the remembered body after the server answered ``304 Not Modified``.
+
+        Args:
+            key (str): The request URL, including the query string.
+
+        Returns:
+            tuple[bool, Any]: Whether the URL was known, and its last decoded body.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.not_modified += 1
+            return True, entry.value
+
+    def store(self, key: str, response: httpx.Response, loads: Callable[[bytes], Any] = json.loads) -> Any:
+        """Decodes a JSON response, unless its body is the same as last time, and remembers it.
+
+        Args:
+            key (str): The request URL, including the query string.
+            response (httpx.Response): A ``200`` response with a JSON body.
+            loads (Callable[[bytes], Any], optional): The JSON decoder. Defaults to json.loads.
+
+        Returns:
+            Any: The decoded body, the remembered object when the body has not changed.
+        """
+        body = response.content
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.digest == digest:
+                entry.etag, entry.last_modified = etag, last_modified
+                self._entries.move_to_end(key)
+                self.stats.unchanged += 1
+                return entry.value
+        value = loads(body)
+        if len(body) > self.max_bytes:
+            return value
+        with self._lock:
+            self.stats.changed += 1
+            if key in self._entries:
+                self._size -= self._entries.pop(key).size
+            self._entries[key] = _ConditionalEntry(etag, last_modified, digest, value, len(body))
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._size -= self._entries.popitem(last=False)[1].size
+                self.stats.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Forgets every remembered answer."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class _ConditionalEntry:
+    """The validators, digest and decoded body remembered for one URL."""
+
+    __slots__ = ("etag", "last_modified", "digest", "value", "size")
+
+    def __init__(self, etag: str | None, last_modified: str | None, digest: bytes, value: Any, size: int):
+        """Initializes the entry.
+
+        Args:
+            etag (str | None): The ``ETag`` the server sent.
+            last_modified (str | None): The ``Last-Modified`` the server sent.
+            digest (bytes): The digest of the body.
+            value (Any): The decoded body.
+            size (int): The size of the body in bytes.
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.value = value
+        self.size = size
+
+
+#: Endpoints that proxy to external metadata services, which a :class:`LookupCache` covers by default.
+LOOKUP_ENDPOINTS: tuple[str, ...] = (
+    "series/lookup",
+    "movie/lookup",
+    "artist/lookup",
+    "album/lookup",
+    "author/lookup",
+    "book/lookup",
+)
+
+_LOOKUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lookup (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    empty INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lookup_used ON lookup (used);
+CREATE TABLE IF NOT EXISTS lookup_claim (key TEXT PRIMARY KEY, expires REAL NOT NULL);
+"""
+
+
+class LookupStats:
+    """Counters for one lookup cache, in this process."""
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+
+
+class LookupCache:
+    """On-disk cache of metadata lookups, shared between threads and processes.
+
+    ``series/lookup``, ``movie/lookup`` and the other lookup endpoints ask TheTVDB, TMDb and the
+    like, and routinely take seconds. Their answers are kept in an SQLite database keyed by
+    instance, endpoint and term, compared without case and extra whitespace, for ``ttl`` seconds,
+    and answers that found nothing for ``negative_ttl``. The least recently used entries are
+    evicted once either limit is exceeded. Processes sharing the file share the work too: while
+    one of them looks a term up, the others wait for its answer rather than asking the server as
+    well, for at most ``lease`` seconds.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        ttl: float = 7 * 86400.0,
+        negative_ttl: float = 3600.0,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        lease: float = 30.0,
+        endpoints: tuple[str, ...] = LOOKUP_ENDPOINTS,
+    ):
+        """Initializes the cache, the database is opened on first use.
+
+        Args:
+            path (str | os.PathLike[str] | None, optional): The SQLite database file. Defaults to None,
+                ``lookups.sqlite`` in the user cache directory.
+            ttl (float, optional): How long an answer is kept, in seconds. Defaults to a week.
+            negative_ttl (float, optional): How long an answer that found nothing is kept, in seconds. Defaults to
+                3600.0.
+            max_entries (int, optional): The most answers kept. Defaults to 10000.
+            max_bytes (int, optional): The most answer bytes kept. Defaults to 64 MiB.
+            lease (float, optional): How long others wait for a lookup in progress before asking the server
+                themselves, in seconds. Defaults to 30.0.
+            endpoints (tuple[str, ...], optional): The endpoints cached, each also covering the endpoints below
+                it. Defaults to :data:`LOOKUP_ENDPOINTS`.
+        """
+        self.path = Path(path) if path is not None else _default_cache_dir() / "lookups.sqlite"
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lease = lease
+        self.endpoints = tuple(endpoint.strip("/") for endpoint in endpoints)
+        #: Seconds between checks for the answer of a lookup another process is making.
+        self.poll_interval = 0.1
+        self.stats = LookupStats()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached answers, including expired ones not evicted yet.
+
+        Returns:
+            int: The number of entries.
+        """
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM lookup").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the connection of this process, opening it on first use. The caller holds the lock.
+
+        A connection must not be used across ``fork``, so a worker process opens its own.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_LOOKUP_SCHEMA)
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    def covers(self, endpoint: str) -> bool:
+        """Returns whether answers from an endpoint are cached.
+
+        Args:
+            endpoint (str): The endpoint, relative to the API URL.
+
+        Returns:
+            bool: True for the lookup endpoints.
+        """
+        endpoint = endpoint.strip("/")
+        return any(endpoint == covered or endpoint.startswith(covered + "/") for covered in self.endpoints)
+
+    @staticmethod
+    def key(instance: str, endpoint: str, params: Mapping[str, Any] | None) -> str:
+        """Builds the key of a lookup.
+
+        Args:
+            instance (str): The base URL of the instance.
+            endpoint (str): The endpoint, relative to the API URL.
+            params (Mapping[str, Any] | None): The query parameters, such as ``term``.
+
+        Returns:
+            str: The key, the same for terms that only differ in case or whitespace.
+        """
+        terms = sorted(
+            (name, " ".join(str(value).split()).casefold())
+            for name, value in (params or {}).items()
+            if name.lower() not in ("apikey", "api_key")
+        )
+        return json.dumps([instance.rstrip("/"), endpoint.strip("/"), terms], separators=(",", ":"))
+
+    def get(self, key: str) -> bytes | None:
+        """Returns a cached answer and marks it as recently used.
+
+        Args:
+            key (str): The lookup key, see :meth:`key`.
+
+        Returns:
+            bytes | None: The answer as JSON, or None if there is no live entry.
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT body, empty, expires FROM lookup WHERE key = ?", (key,)).fetchone()
+            if row is None or row[2] < now:
+                self.stats.misses += 1
+                return None
+            connection.execute("UPDATE lookup SET used = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+            if row[1]:
+                self.stats.negative_hits += 1
+        return row[0]
+
+    def claim(self, key: str) -> bool:
+        """Claims a lookup for this caller, unless another is making it or has just answered it.
+
+        The check for an answer and the claim happen in one transaction, so an answer stored after
+        this caller's :meth:`get` missed is not looked up again.
+
+        Args:
+            key (str): The lookup key.
+
+        Returns:
+            bool: True if the caller should ask the server and then :meth:`set` or :meth:`release` the key,
+                False if it should :meth:`get` the answer again, waiting if another caller is still making it.
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                answered = connection.execute(
+                    "SELECT 1 FROM lookup WHERE key = ? AND expires >= ?", (key, now)
+                ).fetchone()
+                claimed = False
+                if answered is None:
+                    connection.execute("DELETE FROM lookup_claim WHERE key = ? AND expires < ?", (key, now))
+                    cursor = connection.execute(
+                        "INSERT OR IGNORE INTO lookup_claim (key, expires) VALUES (?, ?)", (key, now + self.lease)
+                    )
+                    claimed = cursor.rowcount == 1
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            if answered is None and not claimed:
+                self.stats.waits += 1
+        return claimed
+
+    def release(self, key: str) -> None:
+        """Gives up a claimed lookup without an answer, so another caller can make it.
+
+        Args:
+            key (str): The lookup key.
+        """
+        with self._lock:
+            self._connect().execute("DELETE FROM lookup_claim WHERE key = ?", (key,))
+
+    def set(self, key: str, body: bytes, empty: bool = False) -> None:
+        """Stores an answer, ends the claim on its key and evicts entries beyond the limits.
+
+        Args:
+            key (str): The lookup key.
+            body (bytes): The answer as JSON.
+            empty (bool, optional): Whether the lookup found nothing. Defaults to False.
+        """
+        ttl = self.negative_ttl if empty else self.ttl
+        if ttl <= 0 or len(body) > self.max_bytes:
+            self.release(key)
+            return
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO lookup (key, body, size, empty, expires, used) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, body, len(body), int(empty), now + ttl, now),
+                )
+                connection.execute("DELETE FROM lookup_claim WHERE key = ?", (key,))
+                self._evict(connection, now)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Drops expired entries and then the least recently used ones until both limits hold.
+
+        The caller holds the lock, inside a transaction.
+
+        Args:
+            connection (sqlite3.Connection): The connection.
+            now (float): The current time.
+        """
+        count, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM lookup").fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        self.stats.evictions += connection.execute("DELETE FROM lookup WHERE expires < ?", (now,)).rowcount
+        count, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM lookup").fetchone()
+        victims = []
+        for key, entry_size in connection.execute("SELECT key, size FROM lookup ORDER BY used"):
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            size -= entry_size
+        connection.executemany("DELETE FROM lookup WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def clear(self) -> None:
+        """Drops every cached answer and claim."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM lookup")
+            connection.execute("DELETE FROM lookup_claim")
+
+    def close(self) -> None:
+        """Closes the database, it is opened again when next used."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
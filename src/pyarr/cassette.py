@@ -0,0 +1,378 @@
+"""Record real traffic once and replay it without the servers.
+
+A :class:`RecordingTransport` sits under the HTTP session of any client, passes every request on
+to the real server and stores the exchange in a :class:`Cassette`. A :class:`ReplayTransport`
+later answers the same requests from the cassette at full speed, or with injected latency, so
+automation and PyArr itself can be benchmarked against production shaped data in CI.
+
+A cassette is a single ZIP file: ``index.json`` lists the exchanges and each distinct body is
+stored once, deflate compressed, under ``bodies/<sha1>`` and only read when replayed. Requests
+are matched by method, path and query parameters, ignoring the host so a cassette recorded
+against one instance replays for any, and the API key. Repeated requests are answered in the
+order they were recorded, the last answer repeating once they run out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlencode
+
+import httpx
+
+#: Query parameters that are never part of a key, they hold credentials.
+_SECRET_PARAMS = frozenset({"apikey", "api_key"})
+#: Response headers that describe the encoding on the wire, which is not what is stored.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"})
+
+
+class CassetteMiss(LookupError):
+    """A request the cassette holds no answer for."""
+
+
+class Interaction(NamedTuple):
+    """One recorded exchange."""
+
+    method: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    #: The SHA-1 of the body, None for an empty body.
+    body: str | None
+    #: Seconds the server took to answer.
+    elapsed: float
+
+
+def request_key(method: str, url: httpx.URL) -> str:
+    """Returns the key a request is recorded and looked up by.
+
+    Args:
+        method (str): The HTTP method.
+        url (httpx.URL): The full URL.
+
+    Returns:
+        str: The method, path and sorted query parameters, without the API key.
+    """
+    params = sorted((name, value) for name, value in url.params.multi_items() if name.lower() not in _SECRET_PARAMS)
+    query = urlencode(params)
+    return f"{method.upper()} {url.path}{'?' + query if query else ''}"
+
+
+class Cassette:
+    """The exchanges recorded in one cassette file."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Opens a cassette, loading its index if the file exists.
+
+        Args:
+            path (str | os.PathLike[str]): The cassette file.
+        """
+        self.path = Path(path)
+        self._interactions: dict[str, list[Interaction]] = {}
+        self._cursors: dict[str, int] = {}
+        self._bodies: dict[str, bytes] = {}
+        self._archive: zipfile.ZipFile | None = None
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._archive = zipfile.ZipFile(self.path)
+            index = json.loads(self._archive.read("index.json"))
+            for entry in index["interactions"]:
+                interaction = Interaction(
+                    entry["method"],
+                    entry["url"],
+                    entry["status"],
+                    [(name, value) for name, value in entry["headers"]],
+                    entry["body"],
+                    entry["elapsed"],
+                )
+                self._interactions.setdefault(request_key(interaction.method, httpx.URL(interaction.url)), []).append(
+                    interaction
+                )
+
+    def __len__(self) -> int:
+        """Returns the number of recorded exchanges.
+
+        Returns:
+            int: The exchanges.
+        """
+        return sum(len(interactions) for interactions in self._interactions.values())
+
+    def __repr__(self) -> str:
+        """Shows the file and its size.
+
+        Returns:
+            str: The representation.
+        """
+        return f"Cassette({str(self.path)!r}, interactions={len(self)})"
+
+    def record(self, request: httpx.Request, status: int, headers: httpx.Headers, body: bytes, elapsed: float) -> None:
+        """Adds an exchange, kept in memory until :meth:`save`.
+
+        Args:
+            request (httpx.Request): The request sent.
+            status (int): The status answered.
+            headers (httpx.Headers): The headers answered.
+            body (bytes): The decoded body answered.
+            elapsed (float): Seconds the server took.
+        """
+        digest = hashlib.sha1(body).hexdigest() if body else None
+        kept = [(name, value) for name, value in headers.multi_items() if name.lower() not in _WIRE_HEADERS]
+        url = request.url.copy_with(
+            params=[(k, v) for k, v in request.url.params.multi_items() if k.lower() not in _SECRET_PARAMS]
+        )
+        interaction = Interaction(request.method, str(url), status, kept, digest, elapsed)
+        with self._lock:
+            if digest is not None:
+                self._bodies.setdefault(digest, body)
+            self._interactions.setdefault(request_key(request.method, request.url), []).append(interaction)
+
+    def play(self, request: httpx.Request) -> tuple[Interaction, bytes] | None:
+        """Returns the next recorded answer to a request.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            tuple[Interaction, bytes] | None: The exchange and its body, or None if the request was never recorded.
+        """
+        key = request_key(request.method, request.url)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                return None
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            interaction = interactions[min(position, len(interactions) - 1)]
+            return interaction, self._body(interaction.body)
+
+    def rewind(self) -> None:
+        """Starts replaying every request from its first recorded answer again."""
+        with self._lock:
+            self._cursors.clear()
+
+    def _body(self, digest: str | None) -> bytes:
+        """Returns a body, reading it from the file on first use.
+
+        Args:
+            digest (str | None): The SHA-1 of the body.
+
+        Returns:
+            bytes: The body, empty for None.
+        """
+        if digest is None:
+            return b""
+        body = self._bodies.get(digest)
+        if body is None and self._archive is not None:
+            body = self._bodies[digest] = self._archive.read(f"bodies/{digest}")
+        return body or b""
+
+    def save(self) -> None:
+        """Writes the cassette, replacing the file atomically."""
+        with self._lock:
+            interactions = [interaction for group in self._interactions.values() for interaction in group]
+            digests = {interaction.body for interaction in interactions if interaction.body is not None}
+            index = {"version": 1, "interactions": [interaction._asdict() for interaction in interactions]}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}")
+            with os.fdopen(fd, "wb") as handle, zipfile.ZipFile(handle, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("index.json", json.dumps(index, separators=(",", ":")))
+                for digest in sorted(digests):
+                    archive.writestr(f"bodies/{digest}", self._body(digest))
+            if self._archive is not None:
+                self._archive.close()
+            os.replace(tmp, self.path)
+            self._archive = zipfile.ZipFile(self.path)
+
+
+def _cassette(cassette: Cassette | str | os.PathLike[str]) -> Cassette:
+    """Opens a cassette given as a path.
+
+    Args:
+        cassette (Cassette | str | os.PathLike[str]): The cassette or its file.
+
+    Returns:
+        Cassette: The cassette.
+    """
+    return cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends requests to the real server and records every exchange.
+
+    Works under both sync and async sessions. The cassette is saved when the session closes.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | os.PathLike[str],
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initializes the transport.
+
+        Args:
+            cassette (Cassette | str | os.PathLike[str]): Where to record, new exchanges are added to any already
+                in it.
+            transport (httpx.BaseTransport | httpx.AsyncBaseTransport | None, optional): The transport that reaches
+                the server, such as ``httpx.HTTPTransport(verify=False)``. Defaults to None, the httpx default of
+                the session type in use.
+        """
+        self.cassette = _cassette(cassette)
+        self._transport = transport
+
+    def _answer(self, request: httpx.Request, response: httpx.Response, started: float) -> httpx.Response:
+        """Records an exchange and returns a response the caller can read again.
+
+        Args:
+            request (httpx.Request): The request.
+            response (httpx.Response): The server's response, already read.
+            started (float): When the request was sent.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        elapsed = time.perf_counter() - started
+        self.cassette.record(request, response.status_code, response.headers, response.content, elapsed)
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _WIRE_HEADERS]
+        return httpx.Response(response.status_code, headers=headers, content=response.content, request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends a request and records it.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The server's response.
+        """
+        if not isinstance(self._transport, httpx.BaseTransport):
+            self._transport = httpx.HTTPTransport()
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._answer(request, response, started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends a request and records it.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The server's response.
+        """
+        if not isinstance(self._transport, httpx.AsyncBaseTransport):
+            self._transport = httpx.AsyncHTTPTransport()
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._answer(request, response, started)
+
+    def close(self) -> None:
+        """Closes the real transport and saves the cassette."""
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+        self.cassette.save()
+
+    async def aclose(self) -> None:
+        """Closes the real transport and saves the cassette."""
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
+        self.cassette.save()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answers requests from a cassette, without any server.
+
+    Works under both sync and async sessions.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | os.PathLike[str],
+        latency: float = 0.0,
+        real_time: bool = False,
+        strict: bool = True,
+    ):
+        """Initializes the transport.
+
+        Args:
+            cassette (Cassette | str | os.PathLike[str]): The recording to answer from.
+            latency (float, optional): Seconds added to every answer. Defaults to 0.0.
+            real_time (bool, optional): Also wait as long as the server took when the answer was recorded.
+                Defaults to False, answer at full speed.
+            strict (bool, optional): Raise :class:`CassetteMiss` for a request that was never recorded, rather
+                than answer ``404``. Defaults to True.
+        """
+        self.cassette = _cassette(cassette)
+        self.latency = latency
+        self.real_time = real_time
+        self.strict = strict
+        #: Requests answered from the cassette.
+        self.hits = 0
+        #: Requests it held no answer for.
+        self.misses = 0
+
+    def _answer(self, request: httpx.Request) -> tuple[httpx.Response, float]:
+        """Looks a request up.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Raises:
+            CassetteMiss: If the request was never recorded and the transport is strict.
+
+        Returns:
+            tuple[httpx.Response, float]: The response and the seconds to wait before returning it.
+        """
+        found = self.cassette.play(request)
+        if found is None:
+            self.misses += 1
+            if self.strict:
+                raise CassetteMiss(f"No recorded answer for {request_key(request.method, request.url)}")
+            return httpx.Response(404, json={"message": "Not recorded"}, request=request), self.latency
+        self.hits += 1
+        interaction, body = found
+        response = httpx.Response(interaction.status, headers=interaction.headers, content=body, request=request)
+        return response, self.latency + (interaction.elapsed if self.real_time else 0.0)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answers a request.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The recorded response.
+        """
+        response, delay = self._answer(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answers a request.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The recorded response.
+        """
+        response, delay = self._answer(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
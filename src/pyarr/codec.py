@@ -0,0 +1,298 @@
+"""JSON backends for encoding request bodies and decoding responses.
+
+Library endpoints such as ``movie`` or ``series`` answer with tens of megabytes of JSON, where
+the standard library decoder is a noticeable share of each call. ``orjson`` and ``msgspec`` can be
+chosen instead. Neither is a dependency of PyArr, they come with the ``pyarr[orjson]`` and
+``pyarr[msgspec]`` extras.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+
+
+class JsonCodec:
+    """Encodes and decodes JSON with the standard library."""
+
+    __slots__ = ()
+
+    #: The name the codec is selected by.
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document.
+
+        Args:
+            data (bytes): The UTF-8 encoded document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes a value as compact JSON, the same way httpx does.
+
+        Args:
+            obj (Any): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded document.
+        """
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with ``orjson``."""
+
+    __slots__ = ("_orjson",)
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initializes the codec.
+
+        Raises:
+            ImportError: If ``orjson`` is not installed.
+        """
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document.
+
+        Args:
+            data (bytes): The UTF-8 encoded document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes a value as compact JSON.
+
+        Args:
+            obj (Any): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded document.
+        """
+        return self._orjson.dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    """Encodes and decodes JSON with ``msgspec``."""
+
+    __slots__ = ("_decoder", "_encoder")
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initializes the codec.
+
+        Raises:
+            ImportError: If ``msgspec`` is not installed.
+        """
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document.
+
+        Args:
+            data (bytes): The UTF-8 encoded document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes a value as compact JSON.
+
+        Args:
+            obj (Any): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded document.
+        """
+        return self._encoder.encode(obj)
+
+
+#: The codecs by name, fastest first.
+CODECS: dict[str, type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+
+def get_codec(codec: JsonCodec | str | None = None) -> JsonCodec:
+    """Resolves the JSON codec setting of a client.
+
+    Args:
+        codec (JsonCodec | str | None, optional): A codec, or the name of one. Defaults to None,
+            the standard library.
+
+    Raises:
+        ValueError: If the name is not a known codec.
+        ImportError: If the named codec's library is not installed.
+
+    Returns:
+        JsonCodec: The codec.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is not None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown JSON codec {codec!r}, expected one of {', '.join(CODECS)}")
+        return CODECS[codec]()
+    return JsonCodec()
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+#: The next character that can end a string, a backslash escapes the one after it.
+_STRING_SPECIAL = re.compile(r'["\\]')
+#: The next character that opens or closes a string or container inside an element.
+_NESTED_SPECIAL = re.compile(r'["\[\]{}]')
+#: The same at the top of an element, where a comma, ``]`` or whitespace also ends a scalar.
+_TOP_SPECIAL = re.compile(r'["\[\]{}, \t\n\r]')
+
+
+class JsonArrayDecoder:
+    """Decodes the elements of a JSON array while its bytes are still arriving.
+
+    Only the element being received is held in memory, so the peak stays flat however long the
+    array is. The decoder keeps its place inside that element between chunks, its nesting depth
+    and whether it is in a string, so every character is scanned once; a complete element is then
+    decoded by the standard library's C scanner, the configured codec is not involved.
+    """
+
+    __slots__ = (
+        "_utf8",
+        "_scanner",
+        "_pending",
+        "_in_element",
+        "_depth",
+        "_in_string",
+        "_escaped",
+        "_started",
+        "_done",
+    )
+
+    def __init__(self) -> None:
+        """Initializes the decoder."""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = json.JSONDecoder()
+        #: The text received so far of the element being received.
+        self._pending: list[str] = []
+        self._in_element = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+        self._done = False
+
+    def feed(self, data: bytes, final: bool = False) -> list[Any]:
+        """Adds the next chunk of the body and returns the elements it completed.
+
+        Args:
+            data (bytes): The next chunk of the body.
+            final (bool, optional): Whether this is the end of the body. Defaults to False.
+
+        Raises:
+            ValueError: If the body is not a JSON array, or ends before the array does.
+
+        Returns:
+            list[Any]: The decoded elements, in order.
+        """
+        text = self._utf8.decode(data, final)
+        items = []
+        pos = 0
+        while True:
+            if not self._in_element:
+                pos = _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+                if pos == len(text):
+                    break
+                if self._done:
+                    raise ValueError("Unexpected data after the JSON array")
+                char = text[pos]
+                if not self._started:
+                    if char != "[":
+                        raise ValueError("Expected a JSON array")
+                    self._started = True
+                    pos += 1
+                    continue
+                if char == "]":
+                    self._done = True
+                    pos += 1
+                    continue
+                if char == ",":
+                    pos += 1
+                    continue
+                self._in_element = True
+            start = pos
+            end = self._scan(text, pos)
+            if end is None:
+                self._pending.append(text[start:])
+                break
+            self._pending.append(text[start:end])
+            items.append(self._scanner.decode("".join(self._pending)))
+            self._pending.clear()
+            self._in_element = False
+            pos = end
+        if final and not self._done:
+            raise ValueError("The JSON array ended early")
+        return items
+
+    def _scan(self, text: str, pos: int) -> int | None:
+        """Scans the element being received for its end, keeping the state reached.
+
+        Args:
+            text (str): The chunk being fed.
+            pos (int): Where the element, or the part of it in this chunk, starts.
+
+        Returns:
+            int | None: The offset just past the element, or None if it goes on past the chunk.
+        """
+        while pos < len(text):
+            if self._escaped:
+                self._escaped = False
+                pos += 1
+                continue
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+                if match.group() == "\\":
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                    if not self._depth:
+                        return pos
+                continue
+            match = (_NESTED_SPECIAL if self._depth else _TOP_SPECIAL).search(text, pos)
+            if match is None:
+                return None
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    return pos
+            else:
+                # A comma, whitespace or the array's own "]" ends a scalar, and is left for feed.
+                return match.start()
+        return None
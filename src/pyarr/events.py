@@ -0,0 +1,74 @@
+"""Change events pushed by the Servarr SignalR hub.
+
+Sonarr, Radarr and the other Servarr applications announce every change to their web UI through
+the SignalR hub at ``/signalr/messages``. The clients subscribe to it over the server-sent events
+transport, which needs nothing beyond HTTP, and speak the JSON hub protocol: every message is a
+JSON object terminated by the ``0x1E`` record separator. The changes arrive as invocations of
+``receiveMessage`` whose argument names the resource and carries its action and new state.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, NamedTuple
+
+#: The hub the Servarr applications broadcast on, relative to the instance root.
+HUB_PATH = "/signalr/messages"
+#: Terminates every hub protocol message.
+RECORD_SEPARATOR = "\x1e"
+#: Selects the JSON hub protocol, sent once the connection is open.
+HANDSHAKE = '{"protocol":"json","version":1}' + RECORD_SEPARATOR
+
+#: Hub protocol message types.
+INVOCATION = 1
+PING = 6
+CLOSE = 7
+
+
+class ChangeEvent(NamedTuple):
+    """A change announced by the server."""
+
+    #: The resource, such as ``queue``, ``episode``, ``movie``, ``health`` or ``command``.
+    name: str
+    #: ``updated``, ``deleted`` or ``sync``, the last meaning anything of this resource may have changed.
+    action: str
+    #: The new state, as a dictionary or a record from :mod:`pyarr.models`, None when not sent.
+    resource: Any
+
+    @property
+    def resync(self) -> bool:
+        """Whether the resource should be fetched again as a whole.
+
+        Returns:
+            bool: True for ``sync`` events, sent by the server and after a reconnect.
+        """
+        return self.action == "sync"
+
+
+def parse_messages(data: str) -> list[dict[str, Any]]:
+    """Splits the data of one server-sent event into hub messages.
+
+    Args:
+        data (str): The event data.
+
+    Returns:
+        list[dict[str, Any]]: The messages, in order.
+    """
+    return [json.loads(part) for part in data.split(RECORD_SEPARATOR) if part.strip()]
+
+
+def change_event(message: dict[str, Any]) -> ChangeEvent | None:
+    """Reads the change an invocation announces.
+
+    Args:
+        message (dict[str, Any]): A hub message.
+
+    Returns:
+        ChangeEvent | None: The change, or None if the message is not a ``receiveMessage`` invocation.
+    """
+    if message.get("type") != INVOCATION or str(message.get("target", "")).lower() != "receivemessage":
+        return None
+    arguments = message.get("arguments") or [{}]
+    argument = arguments[0] if isinstance(arguments[0], dict) else {}
+    body = argument.get("body") or {}
+    return ChangeEvent(str(argument.get("name", "")), str(body.get("action", "updated")), body.get("resource"))
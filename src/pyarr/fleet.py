@@ -0,0 +1,120 @@
+"""Results of a call fanned out across a fleet of instances.
+
+:class:`~pyarr.ArrFleet` and :class:`~pyarr.AsyncArrFleet` run one call on every instance they
+hold and never let one instance's failure or slowness fail the whole call. Each instance gets a
+:class:`FleetResult`, holding either its value or the exception it raised, ``TimeoutError``
+included.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any, NamedTuple
+
+
+class FleetResult(NamedTuple):
+    """The outcome of a call on one instance."""
+
+    name: str
+    value: Any
+    error: BaseException | None
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded.
+
+        Returns:
+            bool: True if the call returned a value.
+        """
+        return self.error is None
+
+
+class FleetResults(Mapping[str, FleetResult]):
+    """The outcome of a call on every instance, keyed by instance name."""
+
+    __slots__ = ("_results",)
+
+    def __init__(self, results: Mapping[str, FleetResult]):
+        """Initializes the results.
+
+        Args:
+            results (Mapping[str, FleetResult]): The result of each instance, in fleet order.
+        """
+        self._results = dict(results)
+
+    def __getitem__(self, name: str) -> FleetResult:
+        """Returns the result of one instance.
+
+        Args:
+            name (str): The instance name.
+
+        Returns:
+            FleetResult: Its result.
+        """
+        return self._results[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the instance names.
+
+        Returns:
+            Iterator[str]: The names, in fleet order.
+        """
+        return iter(self._results)
+
+    def __len__(self) -> int:
+        """Returns the number of instances.
+
+        Returns:
+            int: The number of results.
+        """
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        """Shows which instances succeeded and which failed.
+
+        Returns:
+            str: The representation.
+        """
+        return f"FleetResults(ok={list(self.succeeded)}, failed={list(self.errors)})"
+
+    @property
+    def succeeded(self) -> dict[str, Any]:
+        """The values of the instances whose call succeeded.
+
+        Returns:
+            dict[str, Any]: Instance name to value.
+        """
+        return {name: result.value for name, result in self._results.items() if result.ok}
+
+    @property
+    def errors(self) -> dict[str, BaseException]:
+        """The exceptions of the instances whose call failed.
+
+        Returns:
+            dict[str, BaseException]: Instance name to exception.
+        """
+        return {name: result.error for name, result in self._results.items() if result.error is not None}
+
+    def merged(self, tag: str = "instance") -> list[Any]:
+        """Merges the list results of the successful instances into one list.
+
+        Paged answers, such as ``queue.get()``, contribute their ``records`` (``results`` for
+        Dispatcharr). Each dictionary or typed record is copied into a dictionary with the instance
+        name under ``tag``, any other item is wrapped as ``{tag: name, "value": item}``.
+
+        Args:
+            tag (str, optional): The key the instance name is stored under. Defaults to "instance".
+
+        Returns:
+            list[Any]: The tagged items, in fleet order.
+        """
+        merged: list[Any] = []
+        for name, value in self.succeeded.items():
+            if isinstance(value, dict):
+                value = value.get("records", value.get("results", [value]))
+            if not isinstance(value, list):
+                value = [value]
+            for item in value:
+                merged.append({**item, tag: name} if isinstance(item, Mapping) else {tag: name, "value": item})
+        return merged
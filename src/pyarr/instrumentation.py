@@ -0,0 +1,387 @@
+"""Per-request measurements for the request handlers.
+
+Pass an :class:`Instrument` as ``instrumentation`` and every request reports one
+:class:`RequestEvent` once it completes, successful or not: the endpoint as a template such as
+``series/{id}``, the method and status, the bytes sent and received, and where the time went:
+waiting for and opening a connection, waiting for the first byte of the answer, and decoding
+the JSON. Without an instrument nothing is measured.
+
+:class:`LatencyHistograms` aggregates the events in process, :class:`OpenTelemetryInstrument`
+forwards them to OpenTelemetry metrics and needs the ``opentelemetry-api`` package, which is not
+a dependency of PyArr.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple, Protocol
+
+#: Path segments that identify a resource rather than name an endpoint: numbers, UUIDs and long hex digests.
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{32,})$", re.IGNORECASE
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replaces the IDs in an endpoint with ``{id}``, so requests for different items group together.
+
+    Args:
+        endpoint (str): The endpoint, such as ``series/12``.
+
+    Returns:
+        str: The template, such as ``series/{id}``.
+    """
+    if not any(char.isdigit() for char in endpoint):
+        return endpoint
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in endpoint.split("/"))
+
+
+class RequestEvent(NamedTuple):
+    """One completed request, retries included. Durations are in seconds."""
+
+    #: The HTTP method.
+    method: str
+    #: The endpoint with its IDs replaced by ``{id}``.
+    endpoint: str
+    #: The status of the last answer, None if no answer came back.
+    status: int | None
+    #: Attempts made, 1 unless the request was retried.
+    attempts: int
+    #: From the call to its return or exception, including retry waits.
+    duration: float
+    #: Waiting for a pooled connection, or opening one (DNS, TCP and TLS), on the last attempt.
+    connect: float | None
+    #: From sending the request to receiving the answer's headers, on the last attempt.
+    ttfb: float | None
+    #: Decoding the JSON answer.
+    decode: float
+    #: Size of the request body.
+    request_bytes: int
+    #: Size of the answer's body.
+    response_bytes: int
+    #: Whether the answer came from the response cache without a request.
+    cached: bool
+    #: The exception class name if the request failed, None otherwise.
+    error: str | None
+
+
+class Instrument(Protocol):
+    """Receives the events of the requests a handler makes."""
+
+    def record(self, event: RequestEvent) -> None:
+        """Records one request.
+
+        Called on the thread or task that made the request, so keep it quick.
+
+        Args:
+            event (RequestEvent): The request.
+        """
+
+
+class RequestTimer:
+    """Collects the measurements of one request while it runs, see :class:`RequestEvent`."""
+
+    __slots__ = (
+        "started",
+        "status",
+        "attempts",
+        "connect",
+        "ttfb",
+        "decode",
+        "request_bytes",
+        "response_bytes",
+        "cached",
+        "_attempt_started",
+        "_sent",
+    )
+
+    def __init__(self) -> None:
+        """Starts timing the request."""
+        self.started = time.perf_counter()
+        self.status: int | None = None
+        self.attempts = 0
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+        self.decode = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.cached = False
+        self._attempt_started = self.started
+        self._sent: float | None = None
+
+    def attempt(self) -> None:
+        """Starts timing a new attempt."""
+        self.attempts += 1
+        self._attempt_started = time.perf_counter()
+        self.connect = self.ttfb = self._sent = None
+
+    def trace(self, name: str) -> None:
+        """Takes the connection and first byte times from httpcore trace events.
+
+        Args:
+            name (str): The trace event name.
+        """
+        if self._sent is None and name.endswith("send_request_headers.started"):
+            self._sent = time.perf_counter()
+            self.connect = self._sent - self._attempt_started
+        elif self._sent is not None and name.endswith("receive_response_headers.complete"):
+            self.ttfb = time.perf_counter() - self._sent
+
+    def timed(self, loads: Callable[[bytes], Any]) -> Callable[[bytes], Any]:
+        """Wraps a JSON decoder so the time it takes is added to ``decode``.
+
+        Args:
+            loads (Callable[[bytes], Any]): The decoder.
+
+        Returns:
+            Callable[[bytes], Any]: The timed decoder.
+        """
+
+        def timed_loads(data: bytes) -> Any:
+            """Decodes and times a document.
+
+            Args:
+                data (bytes): The document.
+
+            Returns:
+                Any: The decoded value.
+            """
+            started = time.perf_counter()
+            try:
+                return loads(data)
+            finally:
+                self.decode += time.perf_counter() - started
+
+        return timed_loads
+
+    def event(self, method: str, endpoint: str, error: BaseException | None) -> RequestEvent:
+        """Builds the event once the request is over.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint.
+            error (BaseException | None): The exception the request raised, if any.
+
+        Returns:
+            RequestEvent: The event.
+        """
+        return RequestEvent(
+            method,
+            endpoint_template(endpoint),
+            self.status,
+            self.attempts,
+            time.perf_counter() - self.started,
+            self.connect,
+            self.ttfb,
+            self.decode,
+            self.request_bytes,
+            self.response_bytes,
+            self.cached,
+            None if error is None else type(error).__name__,
+        )
+
+
+class LatencyHistogram:
+    """Counts durations in logarithmic buckets with a bounded relative error, like an HDR histogram.
+
+    Durations are counted in microseconds. Values below ``2 ** precision`` are exact, larger ones
+    share a bucket with values within ``2 ** (1 - precision)`` of them, about 1.6% at the default
+    precision. Only buckets in use take memory.
+    """
+
+    __slots__ = ("_bits", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, precision: int = 7):
+        """Initializes an empty histogram.
+
+        Args:
+            precision (int, optional): Bits kept of each value. Defaults to 7.
+        """
+        self._bits = precision
+        self._counts: dict[int, int] = {}
+        #: Values recorded.
+        self.count = 0
+        #: Their sum, in seconds.
+        self.total = 0.0
+        #: The smallest, in seconds.
+        self.min = math.inf
+        #: The largest, in seconds.
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Counts one duration.
+
+        Args:
+            seconds (float): The duration.
+        """
+        micros = max(int(seconds * 1_000_000), 0)
+        shift = max(micros.bit_length() - self._bits, 0)
+        index = shift << self._bits | micros >> shift
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Adds the counts of another histogram of the same precision.
+
+        Args:
+            other (LatencyHistogram): The histogram to add.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other._bits != self._bits:
+            raise ValueError("Only histograms of the same precision can be merged")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """The mean duration.
+
+        Returns:
+            float: The mean in seconds, 0.0 when empty.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Returns the duration below which ``percent`` of the values fall.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The duration in seconds, the middle of its bucket clamped to the values seen, 0.0 when
+                empty.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                shift, top = index >> self._bits, index & ((1 << self._bits) - 1)
+                middle = ((top << shift) + ((top + 1) << shift) - 1) / 2
+                return min(max(middle / 1_000_000, self.min), self.max)
+        return self.max
+
+
+class LatencyHistograms:
+    """Aggregates request events in process, one histogram per method, endpoint and status."""
+
+    def __init__(self, precision: int = 7):
+        """Initializes with no requests seen.
+
+        Args:
+            precision (int, optional): Bits kept of each duration, see :class:`LatencyHistogram`. Defaults to 7.
+        """
+        self.precision = precision
+        #: The histogram of each ``(method, endpoint, status)``.
+        self.histograms: dict[tuple[str, str, int | None], LatencyHistogram] = {}
+        #: Bytes received per ``(method, endpoint, status)``.
+        self.response_bytes: dict[tuple[str, str, int | None], int] = {}
+        #: Time spent decoding JSON, for every request.
+        self.decode = LatencyHistogram(precision)
+        #: Time to the first byte, for every request that got an answer.
+        self.ttfb = LatencyHistogram(precision)
+        #: Failed requests per exception class name.
+        self.errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: RequestEvent) -> None:
+        """Adds one request.
+
+        Args:
+            event (RequestEvent): The request.
+        """
+        key = (event.method, event.endpoint, event.status)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self.precision)
+            histogram.record(event.duration)
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + event.response_bytes
+            self.decode.record(event.decode)
+            if event.ttfb is not None:
+                self.ttfb.record(event.ttfb)
+            if event.error is not None:
+                self.errors[event.error] = self.errors.get(event.error, 0) + 1
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99)) -> list[dict[str, Any]]:
+        """Summarises the histograms, slowest endpoints first.
+
+        Args:
+            percentiles (Iterable[float], optional): The percentiles to report. Defaults to (50, 90, 99).
+
+        Returns:
+            list[dict[str, Any]]: One row per method, endpoint and status, with its ``count``, ``mean``,
+                ``max``, ``bytes`` and a ``p<percentile>`` entry per percentile, durations in seconds.
+        """
+        percentiles = tuple(percentiles)
+        rows = []
+        with self._lock:
+            for (method, endpoint, status), histogram in self.histograms.items():
+                row: dict[str, Any] = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status": status,
+                    "count": histogram.count,
+                    "mean": histogram.mean,
+                    "max": histogram.max,
+                    "bytes": self.response_bytes[method, endpoint, status],
+                }
+                for percent in percentiles:
+                    row[f"p{percent:g}"] = histogram.percentile(percent)
+                rows.append(row)
+        return sorted(rows, key=lambda row: row["mean"] * row["count"], reverse=True)
+
+
+class OpenTelemetryInstrument:
+    """Records request events as OpenTelemetry metrics, following the HTTP client conventions.
+
+    Durations go to the ``http.client.request.duration`` histogram and answer sizes to
+    ``http.client.response.body.size``, with the method, endpoint template, status and error
+    type as attributes. JSON decode time goes to ``pyarr.client.decode.duration``.
+    """
+
+    def __init__(self, meter_provider: Any = None):
+        """Creates the instruments.
+
+        Args:
+            meter_provider (Any, optional): The OpenTelemetry ``MeterProvider``. Defaults to None, the global one.
+
+        Raises:
+            ImportError: If ``opentelemetry-api`` is not installed.
+        """
+        from opentelemetry import metrics  # type: ignore[import-not-found]
+
+        meter = metrics.get_meter("pyarr", meter_provider=meter_provider)
+        self._duration = meter.create_histogram("http.client.request.duration", unit="s")
+        self._size = meter.create_histogram("http.client.response.body.size", unit="By")
+        self._decode = meter.create_histogram("pyarr.client.decode.duration", unit="s")
+
+    def record(self, event: RequestEvent) -> None:
+        """Records one request.
+
+        Args:
+            event (RequestEvent): The request.
+        """
+        attributes: dict[str, Any] = {"http.request.method": event.method, "url.template": event.endpoint}
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.error is not None:
+            attributes["error.type"] = event.error
+        self._duration.record(event.duration, attributes)
+        self._size.record(event.response_bytes, attributes)
+        self._decode.record(event.decode, attributes)
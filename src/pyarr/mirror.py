@@ -0,0 +1,247 @@
+"""The SQLite store behind :class:`~pyarr.LibraryMirror` and :class:`~pyarr.AsyncLibraryMirror`.
+
+Every mirrored record is one row keyed by its kind (``series``, ``episode``, ``movie``...) and
+ID, holding the record as the server sent it in JSON. Records that belong to another, such as the
+episodes of a series, also carry its ID, which is indexed, so reading one record or the children
+of one record is a single index lookup. A ``state`` table keeps the sync watermarks, so a mirror
+stored in a file resumes incrementally after a restart.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from pyarr.types import JsonArray, JsonObject
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS item (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    parent INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS item_parent ON item (kind, parent);
+CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def _instant(date: str) -> datetime:
+    """Parses an ISO 8601 date, taking one without a time zone as UTC.
+
+    Args:
+        date (str): The date.
+
+    Returns:
+        datetime: The date, time zone aware.
+    """
+    parsed = datetime.fromisoformat(date)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def newest_date(*dates: str) -> str:
+    """Returns the latest of ISO 8601 dates, compared as points in time rather than as text.
+
+    The servers send fractional seconds on some dates and not on others, and ``00:00:00.5Z`` sorts
+    before ``00:00:00Z`` as text.
+
+    Args:
+        *dates (str): The dates, at least one.
+
+    Returns:
+        str: The latest date, as it was given.
+    """
+    return max(dates, key=_instant)
+
+
+class MirrorStore:
+    """Mirrored records in an SQLite database, safe to share between threads."""
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:"):
+        """Opens the database, creating its tables if needed.
+
+        Args:
+            path (str | os.PathLike[str], optional): The database file. Defaults to ":memory:", a database that
+                lives as long as the store.
+        """
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _write(self, statements: Iterable[tuple[str, Iterable[Any]]]) -> None:
+        """Runs statements in one transaction.
+
+        Args:
+            statements (Iterable[tuple[str, Iterable[Any]]]): Each SQL statement and the rows it is run for.
+        """
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                for sql, rows in statements:
+                    self._connection.executemany(sql, rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    @staticmethod
+    def _rows(kind: str, items: JsonArray, parent_key: str | None) -> list[tuple[str, int, Any, str]]:
+        """Builds the rows for records.
+
+        Args:
+            kind (str): The record kind.
+            items (JsonArray): The records.
+            parent_key (str | None): The field holding the parent ID, if the kind has one.
+
+        Returns:
+            list[tuple[str, int, Any, str]]: The rows.
+        """
+        dumps = json.dumps
+        return [
+            (kind, item["id"], item.get(parent_key) if parent_key else None, dumps(item, separators=(",", ":")))
+            for item in items
+        ]
+
+    def replace(self, kind: str, items: JsonArray, parent_key: str | None = None, parent: int | None = None) -> None:
+        """Replaces every record of a kind, or every child of one parent, with new ones.
+
+        Args:
+            kind (str): The record kind.
+            items (JsonArray): The records, each with an ``id``.
+            parent_key (str | None, optional): The field holding the parent ID. Defaults to None.
+            parent (int | None, optional): Only replace the children of this parent. Defaults to None, all of the
+                kind.
+        """
+        insert = "INSERT OR REPLACE INTO item (kind, id, parent, data) VALUES (?, ?, ?, ?)"
+        delete: tuple[str, list[tuple[Any, ...]]]
+        if parent is None:
+            delete = ("DELETE FROM item WHERE kind = ?", [(kind,)])
+        else:
+            delete = ("DELETE FROM item WHERE kind = ? AND parent = ?", [(kind, parent)])
+        self._write([delete, (insert, self._rows(kind, items, parent_key))])
+
+    def upsert(self, kind: str, items: JsonArray, parent_key: str | None = None) -> None:
+        """Adds records or replaces those with the same ID.
+
+        Args:
+            kind (str): The record kind.
+            items (JsonArray): The records, each with an ``id``.
+            parent_key (str | None, optional): The field holding the parent ID. Defaults to None.
+        """
+        insert = "INSERT OR REPLACE INTO item (kind, id, parent, data) VALUES (?, ?, ?, ?)"
+        self._write([(insert, self._rows(kind, items, parent_key))])
+
+    def delete(self, kind: str, item_id: int, children: Iterable[str] = ()) -> None:
+        """Removes a record and its children.
+
+        Args:
+            kind (str): The record kind.
+            item_id (int): The record ID.
+            children (Iterable[str], optional): The kinds whose records belong to it. Defaults to ().
+        """
+        self._write(
+            [
+                ("DELETE FROM item WHERE kind = ? AND id = ?", [(kind, item_id)]),
+                ("DELETE FROM item WHERE kind = ? AND parent = ?", [(child, item_id) for child in children]),
+            ]
+        )
+
+    def get(self, kind: str, item_id: int) -> JsonObject | None:
+        """Returns one record.
+
+        Args:
+            kind (str): The record kind.
+            item_id (int): The record ID.
+
+        Returns:
+            JsonObject | None: The record, or None if it is not mirrored.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM item WHERE kind = ? AND id = ?", (kind, item_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def all(self, kind: str, parent: int | None = None) -> JsonArray:
+        """Returns every record of a kind, or every child of one parent, by ID.
+
+        Args:
+            kind (str): The record kind.
+            parent (int | None, optional): Only the children of this parent. Defaults to None.
+
+        Returns:
+            JsonArray: The records.
+        """
+        with self._lock:
+            if parent is None:
+                rows = self._connection.execute("SELECT data FROM item WHERE kind = ? ORDER BY id", (kind,)).fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT data FROM item WHERE kind = ? AND parent = ? ORDER BY id", (kind, parent)
+                ).fetchall()
+        loads = json.loads
+        return [loads(row[0]) for row in rows]
+
+    def count(self, kind: str) -> int:
+        """Returns the number of records of a kind.
+
+        Args:
+            kind (str): The record kind.
+
+        Returns:
+            int: The records.
+        """
+        with self._lock:
+            return int(self._connection.execute("SELECT count(*) FROM item WHERE kind = ?", (kind,)).fetchone()[0])
+
+    def query(self, sql: str, parameters: Iterable[Any] = ()) -> list[tuple[Any, ...]]:
+        """Runs a read-only query, for lookups the other methods do not cover.
+
+        Fields are reached with ``json_extract``, for example
+        ``SELECT data FROM item WHERE kind = 'movie' AND json_extract(data, '$.tmdbId') = ?``.
+
+        Args:
+            sql (str): The query.
+            parameters (Iterable[Any], optional): Its parameters. Defaults to ().
+
+        Returns:
+            list[tuple[Any, ...]]: The rows.
+        """
+        with self._lock:
+            return self._connection.execute(sql, tuple(parameters)).fetchall()
+
+    def state(self, name: str) -> str | None:
+        """Returns a saved sync value.
+
+        Args:
+            name (str): The value name.
+
+        Returns:
+            str | None: The value, or None if it was never saved.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, **values: str) -> None:
+        """Saves sync values.
+
+        Args:
+            **values (str): The values by name.
+        """
+        self._write([("INSERT OR REPLACE INTO state (name, value) VALUES (?, ?)", list(values.items()))])
@@ -0,0 +1,702 @@
+"""Typed, slotted records for the resources clients hold many of.
+
+Large libraries held as plain dictionaries cost a lot of memory, most of it in nested blobs such
+as ``images``, ``ratings`` or ``statistics`` that are rarely read. A record keeps its scalar
+fields in slots and each nested blob as encoded JSON, decoding a blob the first time it is
+read. Fields a model does not declare are kept encoded together, so nothing is lost.
+
+Records are read-only mappings keyed by the JSON field names, so code written against the
+dictionaries, ``movie["title"]`` or ``movie.get("tmdbId")``, keeps working. Use the attributes
+for typed access and :meth:`Record.to_dict` to get a dictionary to send back to the server.
+Clients return dictionaries unless asked for records, see the ``models`` option.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any, ClassVar, Generic, Self, TypeVar, overload
+
+from pyarr.codec import JsonCodec, get_codec
+from pyarr.types import JsonObject
+
+T = TypeVar("T")
+
+_codec = get_codec()
+# Blobs are encoded by the standard library whatever the codec: orjson hands back buffers sized
+# for a kilobyte or more however short the document, which would cost more than the dictionary.
+_encoder = JsonCodec()
+# Records of one kind usually lack the same fields, so they share one set of absent field names.
+_ABSENT_SETS: dict[tuple[str, ...], frozenset[str]] = {}
+_MISSING: Any = type("_Missing", (), {"__repr__": lambda self: "<missing>", "__slots__": ()})()
+
+
+def _encode(value: Any) -> Any:
+    """Encodes containers, leaving scalars as they are.
+
+    Args:
+        value (Any): A decoded JSON value.
+
+    Returns:
+        Any: ``bytes`` for a list or dictionary, otherwise the value itself.
+    """
+    return _encoder.dumps(value) if isinstance(value, list | dict) else value
+
+
+class LazyField(Generic[T]):  # noqa: UP046 - mypy checks against Python 3.10
+    """A record field held as encoded JSON until it is first read."""
+
+    __slots__ = ("key", "slot")
+
+    def __init__(self, key: str):
+        """Initializes the field.
+
+        Args:
+            key (str): The JSON field name.
+        """
+        self.key = key
+        self.slot = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Records the slot the field is stored in, the attribute name with a leading underscore.
+
+        Args:
+            owner (type): The record class.
+            name (str): The attribute name.
+        """
+        self.slot = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> LazyField[T]:
+        """Accessed on the class, returns the field itself."""
+
+    @overload
+    def __get__(self, instance: Record, owner: type) -> T | None:
+        """Accessed on a record, returns the decoded value."""
+
+    def __get__(self, instance: Record | None, owner: type) -> LazyField[T] | T | None:
+        """Decodes the field on first access.
+
+        Args:
+            instance (Record | None): The record, or None when accessed on the class.
+            owner (type): The record class.
+
+        Returns:
+            LazyField[T] | T | None: The decoded value, None if the record has no such field, or
+                the field itself when accessed on the class.
+        """
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if type(value) is bytes:
+            value = _codec.loads(value)
+            setattr(instance, self.slot, value)
+        return None if value is _MISSING else value
+
+    def __set__(self, instance: Record, value: T | None) -> None:
+        """Replaces the field's value.
+
+        Args:
+            instance (Record): The record.
+            value (T | None): The new value.
+        """
+        setattr(instance, self.slot, value)
+
+
+class Record(Mapping[str, Any]):
+    """Base class of the typed records.
+
+    Subclasses declare their scalar fields in ``__slots__`` and ``_fields``, mapping each JSON
+    field name to its attribute, and their nested blobs as :class:`LazyField` attributes with a
+    matching underscored slot.
+    """
+
+    __slots__ = ("_extra", "_absent")
+
+    _extra: bytes | dict[str, Any] | None
+    #: The declared scalar fields the server did not send, None when it sent them all.
+    _absent: frozenset[str] | None
+    #: JSON field name to attribute, for the fields decoded up front.
+    _fields: ClassVar[dict[str, str]] = {}
+    #: JSON field name to lazy field, filled in for each subclass.
+    _lazy: ClassVar[dict[str, LazyField[Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collects the lazy fields of a record class, including inherited ones.
+
+        Args:
+            **kwargs (Any): Passed on to ``object.__init_subclass__``.
+        """
+        super().__init_subclass__(**kwargs)
+        lazy = dict(cls._lazy)
+        lazy.update({field.key: field for field in vars(cls).values() if isinstance(field, LazyField)})
+        cls._lazy = lazy
+
+    @classmethod
+    def from_dict(cls, data: JsonObject) -> Self:
+        """Builds a record from a decoded JSON object.
+
+        Args:
+            data (JsonObject): The object, as returned by the API.
+
+        Returns:
+            Self: The record.
+        """
+        record = cls.__new__(cls)
+        rest = dict(data)
+        absent = []
+        for key, attr in cls._fields.items():
+            value = rest.pop(key, _MISSING)
+            if value is _MISSING:
+                absent.append(key)
+                value = None
+            setattr(record, attr, value)
+        if absent:
+            names = tuple(absent)
+            record._absent = _ABSENT_SETS.get(names) or _ABSENT_SETS.setdefault(names, frozenset(names))
+        else:
+            record._absent = None
+        for key, field in cls._lazy.items():
+            setattr(record, field.slot, _encode(rest.pop(key, _MISSING)))
+        record._extra = _encoder.dumps(rest) if rest else None
+        return record
+
+    def _extra_fields(self) -> dict[str, Any]:
+        """Returns the fields the model does not declare, decoding them on first use.
+
+        Returns:
+            dict[str, Any]: The undeclared fields.
+        """
+        extra = self._extra
+        if isinstance(extra, bytes):
+            extra = self._extra = _codec.loads(extra)
+        return extra if isinstance(extra, dict) else {}
+
+    def _has(self, key: str, attr: str) -> bool:
+        """Whether a declared scalar field is part of the record.
+
+        A field the server did not send is left out until a value is assigned to its attribute.
+
+        Args:
+            key (str): The JSON field name.
+            attr (str): The attribute holding it.
+
+        Returns:
+            bool: True if the field was sent or has been set since.
+        """
+        absent = self._absent
+        return absent is None or key not in absent or getattr(self, attr) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        """Returns a field by its JSON name.
+
+        Args:
+            key (str): The JSON field name.
+
+        Raises:
+            KeyError: If the record has no such field.
+
+        Returns:
+            Any: The value.
+        """
+        attr = self._fields.get(key)
+        if attr is not None:
+            if not self._has(key, attr):
+                raise KeyError(key)
+            return getattr(self, attr)
+        field = self._lazy.get(key)
+        if field is not None and getattr(self, field.slot) is not _MISSING:
+            return field.__get__(self, type(self))
+        return self._extra_fields()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the JSON field names the record has.
+
+        Returns:
+            Iterator[str]: The field names.
+        """
+        yield from (key for key, attr in self._fields.items() if self._has(key, attr))
+        yield from (key for key, field in self._lazy.items() if getattr(self, field.slot) is not _MISSING)
+        yield from self._extra_fields()
+
+    def __len__(self) -> int:
+        """Returns the number of fields the record has.
+
+        Returns:
+            int: The number of fields.
+        """
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Shows the record's id and title or name.
+
+        Returns:
+            str: The representation.
+        """
+        label = self.get("title", self.get("name"))
+        return f"{type(self).__name__}(id={self.get('id')!r}, {label!r})"
+
+    def to_dict(self) -> JsonObject:
+        """Returns the record as a plain dictionary, for example to send it back in an update.
+
+        Returns:
+            JsonObject: Every field the server sent or that has been set since, decoded.
+        """
+        return dict(self.items())
+
+
+class MovieRecord(Record):
+    """A Radarr or Whisparr movie."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "original_title",
+        "sort_title",
+        "year",
+        "status",
+        "overview",
+        "in_cinemas",
+        "has_file",
+        "monitored",
+        "is_available",
+        "size_on_disk",
+        "path",
+        "root_folder_path",
+        "quality_profile_id",
+        "minimum_availability",
+        "runtime",
+        "tmdb_id",
+        "imdb_id",
+        "title_slug",
+        "added",
+        "_images",
+        "_ratings",
+        "_statistics",
+        "_movie_file",
+        "_genres",
+        "_tags",
+        "_alternate_titles",
+        "_collection",
+        "_original_language",
+    )
+
+    _fields = {
+        "id": "id",
+        "title": "title",
+        "originalTitle": "original_title",
+        "sortTitle": "sort_title",
+        "year": "year",
+        "status": "status",
+        "overview": "overview",
+        "inCinemas": "in_cinemas",
+        "hasFile": "has_file",
+        "monitored": "monitored",
+        "isAvailable": "is_available",
+        "sizeOnDisk": "size_on_disk",
+        "path": "path",
+        "rootFolderPath": "root_folder_path",
+        "qualityProfileId": "quality_profile_id",
+        "minimumAvailability": "minimum_availability",
+        "runtime": "runtime",
+        "tmdbId": "tmdb_id",
+        "imdbId": "imdb_id",
+        "titleSlug": "title_slug",
+        "added": "added",
+    }
+
+    id: int
+    title: str
+    original_title: str | None
+    sort_title: str | None
+    year: int | None
+    status: str | None
+    overview: str | None
+    in_cinemas: str | None
+    has_file: bool | None
+    monitored: bool | None
+    is_available: bool | None
+    size_on_disk: int | None
+    path: str | None
+    root_folder_path: str | None
+    quality_profile_id: int | None
+    minimum_availability: str | None
+    runtime: int | None
+    tmdb_id: int | None
+    imdb_id: str | None
+    title_slug: str | None
+    added: str | None
+
+    images: LazyField[list[JsonObject]] = LazyField("images")
+    ratings: LazyField[JsonObject] = LazyField("ratings")
+    statistics: LazyField[JsonObject] = LazyField("statistics")
+    movie_file: LazyField[JsonObject] = LazyField("movieFile")
+    genres: LazyField[list[str]] = LazyField("genres")
+    tags: LazyField[list[int]] = LazyField("tags")
+    alternate_titles: LazyField[list[JsonObject]] = LazyField("alternateTitles")
+    collection: LazyField[JsonObject] = LazyField("collection")
+    original_language: LazyField[JsonObject] = LazyField("originalLanguage")
+
+
+class SeriesRecord(Record):
+    """A Sonarr series."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "sort_title",
+        "status",
+        "overview",
+        "network",
+        "year",
+        "path",
+        "root_folder_path",
+        "quality_profile_id",
+        "season_folder",
+        "monitored",
+        "runtime",
+        "tvdb_id",
+        "tmdb_id",
+        "imdb_id",
+        "title_slug",
+        "series_type",
+        "added",
+        "ended",
+        "first_aired",
+        "certification",
+        "_images",
+        "_ratings",
+        "_statistics",
+        "_seasons",
+        "_genres",
+        "_tags",
+        "_alternate_titles",
+        "_original_language",
+    )
+
+    _fields = {
+        "id": "id",
+        "title": "title",
+        "sortTitle": "sort_title",
+        "status": "status",
+        "overview": "overview",
+        "network": "network",
+        "year": "year",
+        "path": "path",
+        "rootFolderPath": "root_folder_path",
+        "qualityProfileId": "quality_profile_id",
+        "seasonFolder": "season_folder",
+        "monitored": "monitored",
+        "runtime": "runtime",
+        "tvdbId": "tvdb_id",
+        "tmdbId": "tmdb_id",
+        "imdbId": "imdb_id",
+        "titleSlug": "title_slug",
+        "seriesType": "series_type",
+        "added": "added",
+        "ended": "ended",
+        "firstAired": "first_aired",
+        "certification": "certification",
+    }
+
+    id: int
+    title: str
+    sort_title: str | None
+    status: str | None
+    overview: str | None
+    network: str | None
+    year: int | None
+    path: str | None
+    root_folder_path: str | None
+    quality_profile_id: int | None
+    season_folder: bool | None
+    monitored: bool | None
+    runtime: int | None
+    tvdb_id: int | None
+    tmdb_id: int | None
+    imdb_id: str | None
+    title_slug: str | None
+    series_type: str | None
+    added: str | None
+    ended: bool | None
+    first_aired: str | None
+    certification: str | None
+
+    images: LazyField[list[JsonObject]] = LazyField("images")
+    ratings: LazyField[JsonObject] = LazyField("ratings")
+    statistics: LazyField[JsonObject] = LazyField("statistics")
+    seasons: LazyField[list[JsonObject]] = LazyField("seasons")
+    genres: LazyField[list[str]] = LazyField("genres")
+    tags: LazyField[list[int]] = LazyField("tags")
+    alternate_titles: LazyField[list[JsonObject]] = LazyField("alternateTitles")
+    original_language: LazyField[JsonObject] = LazyField("originalLanguage")
+
+
+class EpisodeRecord(Record):
+    """A Sonarr episode."""
+
+    __slots__ = (
+        "id",
+        "series_id",
+        "episode_file_id",
+        "season_number",
+        "episode_number",
+        "absolute_episode_number",
+        "title",
+        "air_date",
+        "air_date_utc",
+        "overview",
+        "has_file",
+        "monitored",
+        "runtime",
+        "tvdb_id",
+        "_images",
+        "_episode_file",
+        "_series",
+    )
+
+    _fields = {
+        "id": "id",
+        "seriesId": "series_id",
+        "episodeFileId": "episode_file_id",
+        "seasonNumber": "season_number",
+        "episodeNumber": "episode_number",
+        "absoluteEpisodeNumber": "absolute_episode_number",
+        "title": "title",
+        "airDate": "air_date",
+        "airDateUtc": "air_date_utc",
+        "overview": "overview",
+        "hasFile": "has_file",
+        "monitored": "monitored",
+        "runtime": "runtime",
+        "tvdbId": "tvdb_id",
+    }
+
+    id: int
+    series_id: int | None
+    episode_file_id: int | None
+    season_number: int | None
+    episode_number: int | None
+    absolute_episode_number: int | None
+    title: str | None
+    air_date: str | None
+    air_date_utc: str | None
+    overview: str | None
+    has_file: bool | None
+    monitored: bool | None
+    runtime: int | None
+    tvdb_id: int | None
+
+    images: LazyField[list[JsonObject]] = LazyField("images")
+    episode_file: LazyField[JsonObject] = LazyField("episodeFile")
+    series: LazyField[JsonObject] = LazyField("series")
+
+
+class QueueRecord(Record):
+    """A download queue item."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "status",
+        "tracked_download_status",
+        "tracked_download_state",
+        "download_id",
+        "protocol",
+        "download_client",
+        "indexer",
+        "output_path",
+        "size",
+        "sizeleft",
+        "timeleft",
+        "estimated_completion_time",
+        "series_id",
+        "episode_id",
+        "movie_id",
+        "_quality",
+        "_languages",
+        "_custom_formats",
+        "_status_messages",
+        "_series",
+        "_episode",
+        "_movie",
+    )
+
+    _fields = {
+        "id": "id",
+        "title": "title",
+        "status": "status",
+        "trackedDownloadStatus": "tracked_download_status",
+        "trackedDownloadState": "tracked_download_state",
+        "downloadId": "download_id",
+        "protocol": "protocol",
+        "downloadClient": "download_client",
+        "indexer": "indexer",
+        "outputPath": "output_path",
+        "size": "size",
+        "sizeleft": "sizeleft",
+        "timeleft": "timeleft",
+        "estimatedCompletionTime": "estimated_completion_time",
+        "seriesId": "series_id",
+        "episodeId": "episode_id",
+        "movieId": "movie_id",
+    }
+
+    id: int
+    title: str | None
+    status: str | None
+    tracked_download_status: str | None
+    tracked_download_state: str | None
+    download_id: str | None
+    protocol: str | None
+    download_client: str | None
+    indexer: str | None
+    output_path: str | None
+    size: float | None
+    sizeleft: float | None
+    timeleft: str | None
+    estimated_completion_time: str | None
+    series_id: int | None
+    episode_id: int | None
+    movie_id: int | None
+
+    quality: LazyField[JsonObject] = LazyField("quality")
+    languages: LazyField[list[JsonObject]] = LazyField("languages")
+    custom_formats: LazyField[list[JsonObject]] = LazyField("customFormats")
+    status_messages: LazyField[list[JsonObject]] = LazyField("statusMessages")
+    series: LazyField[JsonObject] = LazyField("series")
+    episode: LazyField[JsonObject] = LazyField("episode")
+    movie: LazyField[JsonObject] = LazyField("movie")
+
+
+class HistoryRecord(Record):
+    """A history event, such as a grab or an import."""
+
+    __slots__ = (
+        "id",
+        "event_type",
+        "date",
+        "source_title",
+        "download_id",
+        "series_id",
+        "episode_id",
+        "movie_id",
+        "quality_cutoff_not_met",
+        "_quality",
+        "_languages",
+        "_custom_formats",
+        "_data",
+        "_series",
+        "_episode",
+        "_movie",
+    )
+
+    _fields = {
+        "id": "id",
+        "eventType": "event_type",
+        "date": "date",
+        "sourceTitle": "source_title",
+        "downloadId": "download_id",
+        "seriesId": "series_id",
+        "episodeId": "episode_id",
+        "movieId": "movie_id",
+        "qualityCutoffNotMet": "quality_cutoff_not_met",
+    }
+
+    id: int
+    event_type: str | None
+    date: str | None
+    source_title: str | None
+    download_id: str | None
+    series_id: int | None
+    episode_id: int | None
+    movie_id: int | None
+    quality_cutoff_not_met: bool | None
+
+    quality: LazyField[JsonObject] = LazyField("quality")
+    languages: LazyField[list[JsonObject]] = LazyField("languages")
+    custom_formats: LazyField[list[JsonObject]] = LazyField("customFormats")
+    data: LazyField[JsonObject] = LazyField("data")
+    series: LazyField[JsonObject] = LazyField("series")
+    episode: LazyField[JsonObject] = LazyField("episode")
+    movie: LazyField[JsonObject] = LazyField("movie")
+
+
+class ChannelRecord(Record):
+    """A Dispatcharr channel."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "channel_number",
+        "channel_group_id",
+        "tvg_id",
+        "epg_data_id",
+        "logo_id",
+        "uuid",
+        "_streams",
+    )
+
+    _fields = {
+        "id": "id",
+        "name": "name",
+        "channel_number": "channel_number",
+        "channel_group_id": "channel_group_id",
+        "tvg_id": "tvg_id",
+        "epg_data_id": "epg_data_id",
+        "logo_id": "logo_id",
+        "uuid": "uuid",
+    }
+
+    id: int
+    name: str | None
+    channel_number: float | None
+    channel_group_id: int | None
+    tvg_id: str | None
+    epg_data_id: int | None
+    logo_id: int | None
+    uuid: str | None
+
+    streams: LazyField[list[int]] = LazyField("streams")
+
+
+class StreamRecord(Record):
+    """A Dispatcharr stream."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "url",
+        "m3u_account",
+        "logo_url",
+        "tvg_id",
+        "channel_group",
+        "is_custom",
+        "updated_at",
+        "_stream_stats",
+        "_custom_properties",
+    )
+
+    _fields = {
+        "id": "id",
+        "name": "name",
+        "url": "url",
+        "m3u_account": "m3u_account",
+        "logo_url": "logo_url",
+        "tvg_id": "tvg_id",
+        "channel_group": "channel_group",
+        "is_custom": "is_custom",
+        "updated_at": "updated_at",
+    }
+
+    id: int
+    name: str | None
+    url: str | None
+    m3u_account: int | None
+    logo_url: str | None
+    tvg_id: str | None
+    channel_group: int | None
+    is_custom: bool | None
+    updated_at: str | None
+
+    stream_stats: LazyField[JsonObject] = LazyField("stream_stats")
+    custom_properties: LazyField[JsonObject] = LazyField("custom_properties")
@@ -0,0 +1,84 @@
+"""Connection pool measurements.
+
+httpx queues a request inside its pool when every connection is busy and ``max_connections`` is
+reached. That wait is invisible from the outside, so each request carries httpcore's ``trace``
+extension and the time until it was handed a connection is recorded here. Use it to size
+``httpx.Limits`` from real traffic: a growing mean wait with few new connections means the pool
+is too small.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+#: An httpcore ``trace`` extension callback, a coroutine function for async clients.
+TraceCallback = Callable[[str, dict[str, Any]], Any]
+
+#: Trace events that mark the end of the wait for a connection, a new one being opened or a
+#: pooled one starting to send.
+_OPENED_PREFIX = "connection.connect_"
+_SENDING_SUFFIX = "send_request_headers.started"
+
+
+def is_connection_event(name: str) -> tuple[bool, bool]:
+    """Classifies an httpcore trace event.
+
+    Args:
+        name (str): The event name, such as ``connection.connect_tcp.started``.
+
+    Returns:
+        tuple[bool, bool]: Whether the request holds a connection from this event on, and whether
+            that connection is a new one.
+    """
+    if name.startswith(_OPENED_PREFIX):
+        return True, True
+    return name.endswith(_SENDING_SUFFIX), False
+
+
+class PoolStats:
+    """Connection pool counters for one request handler."""
+
+    __slots__ = ("requests", "connections_opened", "wait_total", "wait_max", "_lock")
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self.requests = 0
+        self.connections_opened = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def wait_mean(self) -> float:
+        """The mean time, in seconds, a request waited for a connection.
+
+        Returns:
+            float: The mean wait, 0.0 before any request.
+        """
+        return self.wait_total / self.requests if self.requests else 0.0
+
+    def record(self, wait: float, opened: bool) -> None:
+        """Records the wait of one request.
+
+        Args:
+            wait (float): Seconds from sending the request to holding a connection.
+            opened (bool): Whether a new connection was opened for it.
+        """
+        with self._lock:
+            self.requests += 1
+            self.connections_opened += opened
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def __repr__(self) -> str:
+        """Shows the counters.
+
+        Returns:
+            str: The representation.
+        """
+        return (
+            f"PoolStats(requests={self.requests}, connections_opened={self.connections_opened}, "
+            f"wait_mean={self.wait_mean:.6f}, wait_max={self.wait_max:.6f})"
+        )
@@ -0,0 +1,223 @@
+"""Client-side rate limiting for the request handlers.
+
+A :class:`RateLimit` protects one server from its clients: a token bucket paces how fast requests
+start and a concurrency limit caps how many run at once. Unlike :class:`~pyarr.RetryPolicy` it
+holds state, so passing the same instance to several clients that point at the same host makes
+them share one budget. An async limit must only be shared within one event loop.
+
+Endpoints can cost more than one token, ``series/lookup`` and ``release`` search the indexers and
+are far heavier for the server than ``tag``. In adaptive mode the limit backs off when the
+server's latency or error rate climbs and recovers slowly once it is healthy again.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import TypeVar
+
+G = TypeVar("G")
+
+#: Answers that mean the server is overloaded or failing.
+_OVERLOAD_STATUSES = frozenset({429})
+
+
+class RateLimitTicket:
+    """Tracks one request admitted by a :class:`RateLimit`, so its outcome can be recorded."""
+
+    __slots__ = ("started", "elapsed", "failed")
+
+    def __init__(self) -> None:
+        """Starts timing the request."""
+        self.started = time.perf_counter()
+        self.elapsed: float | None = None
+        self.failed = False
+
+    def respond(self, status: int) -> None:
+        """Records the status the server answered with.
+
+        Args:
+            status (int): The HTTP status code.
+        """
+        self.elapsed = time.perf_counter() - self.started
+        self.failed = status >= 500 or status in _OVERLOAD_STATUSES
+
+
+class RateLimit:
+    """Paces and caps the requests sent to one host."""
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        max_concurrency: int | None = None,
+        weights: Mapping[str, float] | None = None,
+        adaptive: bool = False,
+        latency_target: float = 2.0,
+        error_threshold: float = 0.1,
+        min_scale: float = 0.1,
+        recovery: float = 0.02,
+        cooldown: float = 1.0,
+    ):
+        """Initializes the limit with a full bucket.
+
+        Args:
+            rate (float | None, optional): Tokens added per second, one request costs one token unless weighted.
+                Defaults to None, no pacing.
+            burst (float | None, optional): Tokens the bucket holds, the requests that may start at once after a
+                quiet spell. Defaults to None, one second's worth of ``rate`` and at least one.
+            max_concurrency (int | None, optional): Requests in flight at once. Defaults to None, no cap.
+            weights (Mapping[str, float] | None, optional): Tokens per request by endpoint, such as
+                ``{"series/lookup": 5, "release": 10}``. A key matches the endpoint and anything below it, the
+                longest match wins. Defaults to None, every request costs one token.
+            adaptive (bool, optional): Scale the rate and concurrency down when the server slows or fails, and
+                back up once it recovers. Defaults to False.
+            latency_target (float, optional): Seconds a request may take on average before adaptive mode backs
+                off. Defaults to 2.0.
+            error_threshold (float, optional): Share of requests that may fail, with a 5xx, 429 or transport
+                error, before adaptive mode backs off. Defaults to 0.1.
+            min_scale (float, optional): The lowest share of ``rate`` and ``max_concurrency`` adaptive mode backs
+                off to. Defaults to 0.1.
+            recovery (float, optional): Share of the limit regained per healthy request. Defaults to 0.02.
+            cooldown (float, optional): Seconds between two back-offs, so the requests already in flight when
+                the server struggles count once. Defaults to 1.0.
+
+        Raises:
+            ValueError: If a limit is not positive, or adaptive mode has neither a rate nor a concurrency to scale.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if adaptive and rate is None and max_concurrency is None:
+            raise ValueError("adaptive mode needs a rate or max_concurrency to scale")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate or 1.0, 1.0)
+        self.max_concurrency = max_concurrency
+        self.weights = dict(weights or {})
+        self.adaptive = adaptive
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.min_scale = min_scale
+        self.recovery = recovery
+        self.cooldown = cooldown
+        #: The share of ``rate`` and ``max_concurrency`` in use, lowered by adaptive mode.
+        self.scale = 1.0
+        #: Requests that had to wait for a token.
+        self.waits = 0
+        #: Seconds spent waiting for tokens.
+        self.wait_total = 0.0
+        #: Times adaptive mode backed off.
+        self.backoffs = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._latency: float | None = None
+        self._errors = 0.0
+        self._backed_off = float("-inf")
+        self._gates: dict[Callable[..., object], object] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Shows the limits in use.
+
+        Returns:
+            str: The representation.
+        """
+        return f"RateLimit(rate={self.rate}, max_concurrency={self.max_concurrency}, scale={self.scale:.2f})"
+
+    @property
+    def concurrency(self) -> int | None:
+        """The requests allowed in flight at once, after adaptive scaling.
+
+        Returns:
+            int | None: The cap, or None if concurrency is not limited.
+        """
+        if self.max_concurrency is None:
+            return None
+        return max(1, int(self.max_concurrency * self.scale))
+
+    def cost(self, endpoint: str) -> float:
+        """Returns the tokens a request to an endpoint costs.
+
+        Args:
+            endpoint (str): The endpoint, such as ``series/lookup``.
+
+        Returns:
+            float: The weight of the longest matching key, 1.0 if none matches.
+        """
+        if not self.weights:
+            return 1.0
+        endpoint = endpoint.strip("/")
+        best, weight = -1, 1.0
+        for key, value in self.weights.items():
+            key = key.strip("/")
+            if len(key) > best and (endpoint == key or endpoint.startswith(key + "/")):
+                best, weight = len(key), value
+        return weight
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Takes tokens from the bucket, going into debt if there are not enough.
+
+        Requests reserve in the order they arrive, so a heavy request is not starved by light ones.
+
+        Args:
+            cost (float, optional): The tokens the request costs. Defaults to 1.0.
+
+        Returns:
+            float: Seconds to wait before sending, 0.0 if the request may go now.
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate * self.scale
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= cost
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / rate
+            self.waits += 1
+            self.wait_total += wait
+            return wait
+
+    def gate(self, kind: Callable[[Callable[[], int]], G]) -> G | None:
+        """Returns the gate that enforces the concurrency cap, creating it on first use.
+
+        Args:
+            kind (Callable[[Callable[[], int]], G]): The gate class, ``AsyncGate`` or ``SyncGate``, given a
+                function returning the current cap.
+
+        Returns:
+            G | None: The gate, or None if concurrency is not limited.
+        """
+        if self.max_concurrency is None:
+            return None
+        with self._lock:
+            gate = self._gates.get(kind)
+            if gate is None:
+                gate = self._gates[kind] = kind(lambda: self.concurrency or 1)
+        return gate  # type: ignore[return-value]
+
+    def record(self, ticket: RateLimitTicket) -> None:
+        """Records the outcome of a request, adjusting the limit in adaptive mode.
+
+        Args:
+            ticket (RateLimitTicket): The request's ticket.
+        """
+        if not self.adaptive:
+            return
+        elapsed = ticket.elapsed if ticket.elapsed is not None else time.perf_counter() - ticket.started
+        with self._lock:
+            # Moving averages over roughly the last five requests.
+            self._latency = elapsed if self._latency is None else self._latency + 0.2 * (elapsed - self._latency)
+            self._errors += 0.2 * (ticket.failed - self._errors)
+            if self._latency > self.latency_target or self._errors > self.error_threshold:
+                now = time.monotonic()
+                if now - self._backed_off >= self.cooldown and self.scale > self.min_scale:
+                    self.scale = max(self.min_scale, self.scale / 2)
+                    self._backed_off = now
+                    self.backoffs += 1
+            elif self.scale < 1.0:
+                self.scale = min(1.0, self.scale + self.recovery)
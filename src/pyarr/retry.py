@@ -0,0 +1,201 @@
+"""Retry policy for the request handlers.
+
+A :class:`RetryPolicy` only describes *when* and *how long* to wait before trying a request
+again, it holds no per handler state. Each :class:`~pyarr.RequestHandler` keeps its own retry
+budget and :class:`RetryStats`, so one policy can safely be shared by many clients.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Callable, Collection
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+
+import httpx
+
+#: Errors raised before the request reached the server, so replaying them is safe for any method.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryEvent(NamedTuple):
+    """Describes one retry, passed to :attr:`RetryPolicy.on_retry`."""
+
+    method: str
+    url: str
+    attempt: int
+    delay: float
+    reason: str
+
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait first.
+
+    Connection failures that happened before the request was sent, and ``429 Too Many Requests``
+    answers, are retried for every method because the server never acted on them. Anything else,
+    read timeouts and ``502``/``503``/``504`` answers included, is only retried for
+    ``idempotent_methods``, so a ``POST`` or ``DELETE`` that may already have run is not replayed.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = (429, 502, 503, 504),
+        idempotent_methods: Collection[str] = ("GET", "HEAD", "OPTIONS", "PUT"),
+        respect_retry_after: bool = True,
+        budget_ratio: float = 0.2,
+        budget_reserve: int = 10,
+        on_retry: Callable[[RetryEvent], None] | None = None,
+    ):
+        """Initializes the policy.
+
+        Args:
+            max_attempts (int, optional): Total attempts per request, including the first. 1 disables retries.
+                Defaults to 3.
+            backoff_factor (float, optional): Base delay in seconds, doubled on each retry. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound in seconds for any single wait, ``Retry-After`` included.
+                Defaults to 30.0.
+            jitter (bool, optional): Wait a random time up to the backoff delay rather than the full delay, so
+                many clients do not retry in lockstep. Defaults to True.
+            retry_statuses (Collection[int], optional): Response status codes that are retried.
+                Defaults to (429, 502, 503, 504).
+            idempotent_methods (Collection[str], optional): Methods that may be replayed after the server could
+                have acted on them. Defaults to ("GET", "HEAD", "OPTIONS", "PUT").
+            respect_retry_after (bool, optional): Wait for the ``Retry-After`` header when the server sends one.
+                Defaults to True.
+            budget_ratio (float, optional): Retry tokens each request earns for its handler. 0.2 allows one retry
+                per five requests once the reserve is spent. Defaults to 0.2.
+            budget_reserve (int, optional): Retry tokens a handler starts with, and the most it can hold.
+                Defaults to 10.
+            on_retry (Callable[[RetryEvent], None] | None, optional): Called before each retry wait, for metrics.
+                Defaults to None.
+
+        Raises:
+            ValueError: If ``max_attempts`` is less than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.respect_retry_after = respect_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self.on_retry = on_retry
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the exponential backoff delay after the given attempt.
+
+        Args:
+            attempt (int): The attempt that just failed, starting at 1.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def should_retry_exception(self, method: str, exception: Exception) -> bool:
+        """Whether a transport error is worth retrying.
+
+        Args:
+            method (str): The HTTP method of the request.
+            exception (Exception): The error raised by httpx.
+
+        Returns:
+            bool: True if the request may be sent again.
+        """
+        if isinstance(exception, _NOT_SENT_ERRORS):
+            return True
+        return isinstance(exception, httpx.TransportError) and method.upper() in self.idempotent_methods
+
+    def should_retry_response(self, method: str, response: httpx.Response) -> bool:
+        """Whether an error response is worth retrying.
+
+        Args:
+            method (str): The HTTP method of the request.
+            response (httpx.Response): The response received.
+
+        Returns:
+            bool: True if the request may be sent again.
+        """
+        if response.status_code not in self.retry_statuses:
+            return False
+        return response.status_code == 429 or method.upper() in self.idempotent_methods
+
+    def retry_after(self, response: httpx.Response) -> float | None:
+        """Reads the ``Retry-After`` header, in either its seconds or HTTP date form.
+
+        Args:
+            response (httpx.Response): The response received.
+
+        Returns:
+            float | None: Seconds to wait, capped at ``max_backoff``, or None if there is no usable header.
+        """
+        value = response.headers.get("Retry-After")
+        if not self.respect_retry_after or not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            seconds = (when - datetime.now(UTC)).total_seconds()
+        return min(max(seconds, 0.0), self.max_backoff)
+
+
+class RetryStats:
+    """Retry counters for one request handler."""
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self.retries = 0
+        self.retry_delay = 0.0
+        self.budget_exhausted = 0
+
+
+class RetryBudget:
+    """Limits retries to a share of the requests a handler makes.
+
+    Each request earns ``ratio`` tokens and each retry spends one, so a failing server sees a
+    bounded amount of extra load rather than ``max_attempts`` times its normal traffic.
+    """
+
+    def __init__(self, ratio: float, reserve: int):
+        """Initializes the budget with a full reserve.
+
+        Args:
+            ratio (float): Tokens earned per request.
+            reserve (int): Tokens held at the start, and the most that can be held.
+        """
+        self._ratio = ratio
+        self._reserve = float(reserve)
+        self._tokens = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Records a request, earning its share of a retry."""
+        with self._lock:
+            self._tokens = min(self._reserve, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Spends a token for a retry.
+
+        Returns:
+            bool: True if a retry is allowed, False if the budget is spent.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
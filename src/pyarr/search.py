@@ -0,0 +1,128 @@
+"""Progress and checkpoints for bulk searches of wanted items.
+
+``wanted.search()`` pages through ``wanted/missing`` or ``wanted/cutoff`` and sends the IDs it
+finds as batched search commands, yielding a :class:`SearchProgress` after each one. Given a
+:class:`SearchCheckpoint`, every batch is recorded once the server has accepted it, so a run that
+was interrupted skips the items it already searched when started again. The checkpoint file is
+removed once a run completes.
+
+The file is JSON Lines: a header naming the wanted endpoint, then the IDs of one batch per line.
+Recording a batch appends its line, so the cost of a record does not grow with the run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+
+class SearchProgress(NamedTuple):
+    """How far a bulk search has come."""
+
+    #: Pages of wanted items fetched so far.
+    pages: int
+    #: Wanted items the server reported, 0 until the first page has arrived.
+    total: int
+    #: Distinct items seen so far.
+    found: int
+    #: Items passed over because the checkpoint records them as searched.
+    skipped: int
+    #: Items sent in search commands.
+    searched: int
+    #: Search commands sent.
+    commands: int
+    #: Seconds since the search started.
+    elapsed: float
+    #: Whether every page has been searched.
+    done: bool
+
+    @property
+    def fraction(self) -> float:
+        """The share of the wanted items searched or skipped.
+
+        Returns:
+            float: Between 0.0 and 1.0.
+        """
+        if not self.total:
+            return 1.0 if self.done else 0.0
+        return min(1.0, (self.searched + self.skipped) / self.total)
+
+    @property
+    def rate(self) -> float:
+        """Items searched per second.
+
+        Returns:
+            float: The rate, 0.0 before any time has passed.
+        """
+        return self.searched / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class SearchCheckpoint:
+    """Remembers which wanted items a bulk search has sent, in a JSON Lines file."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Loads the checkpoint, starting empty if the file does not exist.
+
+        A last line cut short by a crash while it was appended is dropped, from the file as well, so
+        the next batch starts on a line of its own.
+
+        Args:
+            path (str | os.PathLike[str]): The checkpoint file.
+        """
+        self.path = Path(path)
+        #: The endpoint the checkpoint belongs to, None until the first batch is recorded.
+        self.source: str | None = None
+        #: IDs sent in search commands.
+        self.searched: set[int] = set()
+        if not self.path.exists():
+            return
+        content = self.path.read_bytes()
+        complete = content[: content.rfind(b"\n") + 1]
+        if len(complete) < len(content):
+            with self.path.open("r+b") as handle:
+                handle.truncate(len(complete))
+        lines = complete.splitlines()
+        if not lines:
+            return
+        self.source = json.loads(lines[0]).get("source")
+        for line in lines[1:]:
+            self.searched.update(json.loads(line))
+
+    def check(self, source: str) -> None:
+        """Makes sure the checkpoint belongs to a search of an endpoint.
+
+        Args:
+            source (str): The wanted endpoint, such as ``wanted/missing``.
+
+        Raises:
+            ValueError: If the checkpoint was written by a search of another endpoint.
+        """
+        if self.source is not None and self.source != source:
+            raise ValueError(f"Checkpoint {self.path} belongs to a search of {self.source}, not {source}")
+
+    def record(self, source: str, ids: list[int]) -> None:
+        """Adds IDs that were sent and appends them to the file as one line.
+
+        The first record starts the file with its header.
+
+        Args:
+            source (str): The wanted endpoint the IDs came from.
+            ids (list[int]): The IDs.
+        """
+        lines = []
+        if self.source is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            lines.append(json.dumps({"version": 2, "source": source}, separators=(",", ":")))
+        lines.append(json.dumps(ids, separators=(",", ":")))
+        with self.path.open("w" if self.source is None else "a") as handle:
+            handle.write("\n".join(lines) + "\n")
+        self.source = source
+        self.searched.update(ids)
+
+    def clear(self) -> None:
+        """Forgets every ID and removes the file."""
+        self.source = None
+        self.searched.clear()
+        self.path.unlink(missing_ok=True)
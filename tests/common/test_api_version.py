@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyarr._async.utils.http import RequestHandler as AsyncRequestHandler
+from pyarr._sync.utils.http import RequestHandler
+from pyarr.cache import ApiVersionCache
+
+
+def _transport(probes):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api":
+            probes.append(request.url.path)
+            time.sleep(0.01)
+            return httpx.Response(200, json={"current": "v3"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    return handler
+
+
+def test_concurrent_threads_probe_the_api_version_once():
+    probes: list[str] = []
+    session = httpx.Client(transport=httpx.MockTransport(_transport(probes)))
+    handler = RequestHandler(host="localhost", api_key="key", port=8989, tls=False, session=session)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(handler.request("series"))) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert probes == ["/api"]
+    assert results == [{"path": "/api/v3/series"}] * 20
+
+
+@pytest.mark.asyncio
+async def test_concurrent_coroutines_probe_the_api_version_once():
+    probes: list[str] = []
+
+    async def slow_probe(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api":
+            probes.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"current": "v3"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    session = httpx.AsyncClient(transport=httpx.MockTransport(slow_probe))
+    handler = AsyncRequestHandler(host="localhost", api_key="key", port=8989, tls=False, session=session)
+
+    results = await asyncio.gather(*(handler.request("series") for _ in range(50)))
+
+    assert probes == ["/api"]
+    assert results == [{"path": "/api/v3/series"}] * 50
+
+
+def test_version_cache_skips_the_probe_for_later_clients(tmp_path):
+    probes: list[str] = []
+    cache = ApiVersionCache(tmp_path / "versions.json")
+
+    for _ in range(3):
+        session = httpx.Client(transport=httpx.MockTransport(_transport(probes)))
+        handler = RequestHandler(host="localhost", api_key="key", port=8989, tls=False, session=session, version_cache=cache)
+        assert handler.request("series") == {"path": "/api/v3/series"}
+
+    assert probes == ["/api"]
+    assert cache.get("http://localhost:8989") == "v3"
+
+
+def test_version_cache_entries_expire(tmp_path):
+    cache = ApiVersionCache(tmp_path / "versions.json", ttl=-1)
+    cache.set("http://localhost:8989", "v3")
+
+    assert cache.get("http://localhost:8989") is None
+
+
+def test_version_cache_tolerates_a_corrupt_file(tmp_path):
+    path = tmp_path / "versions.json"
+    path.write_text("not json")
+
+    assert ApiVersionCache(path).get("http://localhost:8989") is None
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from pyarr._async.common.base import CommonActions
+from pyarr._async.dispatcharr.streams import Streams as AsyncStreams
+from pyarr._async.sonarr.episode import Episode as AsyncEpisode
+from pyarr._sync.lidarr.track import Track
+from pyarr._sync.radarr.movie_file import MovieFile
+from pyarr._sync_synchronization import SyncBatcher
+from pyarr.exceptions import PyarrResourceNotFound, PyarrServerError
+from pyarr.retry import RetryPolicy
+
+
+def _by_ids(seen, param, missing=()):
+    def respond(request):
+        seen.append(request)
+        ids = [int(value) for value in request.url.params.get_list(param)]
+        return httpx.Response(200, json=[{"id": i, "title": f"Item {i}"} for i in ids if i not in missing])
+
+    return respond
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_become_capped_list_requests(async_mock_handler):
+    seen = []
+    episode = AsyncEpisode(async_mock_handler(_by_ids(seen, "episodeIds"), batch_window=0.01, batch_size=100))
+
+    results = await asyncio.gather(*(episode.get(item_id=i) for i in range(1, 251)))
+
+    assert [result["id"] for result in results] == list(range(1, 251))
+    assert len(seen) == 3
+    assert all(request.url.path == "/api/v3/episode" for request in seen)
+    assert [len(request.url.params.get_list("episodeIds")) for request in seen] == [100, 100, 50]
+    [batcher] = episode.handler.batchers.values()
+    assert batcher.batches == 3
+
+
+@pytest.mark.asyncio
+async def test_each_fetch_of_a_path_gets_its_own_batcher(async_mock_handler):
+    seen = []
+    handler = async_mock_handler(_by_ids(seen, "episodeIds"), batch_window=0.01)
+    episode = AsyncEpisode(handler)
+    other = CommonActions(handler)
+
+    async def fetch(ids):
+        return [{"id": i, "title": "Other"} for i in ids]
+
+    first, second = await asyncio.gather(episode.get(item_id=1), other._get_batched("episode", 1, fetch))
+
+    assert first == {"id": 1, "title": "Item 1"}
+    assert second == {"id": 1, "title": "Other"}
+    assert len(seen) == 1
+    assert len(handler.batchers) == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicate_ids_share_one_slot_and_missing_ids_raise(async_mock_handler):
+    seen = []
+    episode = AsyncEpisode(async_mock_handler(_by_ids(seen, "episodeIds", missing={3}), batch_window=0.01))
+
+    results = await asyncio.gather(
+        episode.get(item_id=1), episode.get(item_id=1), episode.get(item_id=3), return_exceptions=True
+    )
+
+    assert results[0] == results[1] == {"id": 1, "title": "Item 1"}
+    assert isinstance(results[2], PyarrResourceNotFound)
+    assert seen[0].url.params.get_list("episodeIds") == ["1", "3"]
+
+
+@pytest.mark.asyncio
+async def test_batching_is_off_by_default(async_mock_handler):
+    seen = []
+
+    def respond(request):
+        seen.append(request)
+        return httpx.Response(200, json={"id": 1})
+
+    episode = AsyncEpisode(async_mock_handler(respond))
+    await asyncio.gather(episode.get(item_id=1), episode.get(item_id=2))
+    assert [request.url.path for request in seen] == ["/api/v3/episode/1", "/api/v3/episode/2"]
+
+
+@pytest.mark.asyncio
+async def test_a_failed_batch_fails_every_caller(async_mock_handler):
+    def respond(request):
+        return httpx.Response(500, json={"message": "boom"})
+
+    episode = AsyncEpisode(async_mock_handler(respond, batch_window=0.01, retry=RetryPolicy(max_attempts=1)))
+
+    results = await asyncio.gather(*(episode.get(item_id=i) for i in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, PyarrServerError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_dispatcharr_streams_batch_through_get_by_ids(async_mock_handler):
+    seen = []
+
+    def respond(request):
+        seen.append(request)
+        ids = json.loads(request.content)["ids"]
+        return httpx.Response(200, json=[{"id": i, "name": f"Stream {i}"} for i in ids])
+
+    streams = AsyncStreams(async_mock_handler(respond, batch_window=0.01))
+
+    results = await asyncio.gather(*(streams.get(i) for i in (4, 5, 6)))
+
+    assert [result["name"] for result in results] == ["Stream 4", "Stream 5", "Stream 6"]
+    assert len(seen) == 1
+    assert seen[0].method == "POST"
+    assert seen[0].url.path == "/api/v3/channels/streams/by-ids/"
+
+
+def test_threads_share_a_batch(mock_handler):
+    seen = []
+    movie_file = MovieFile(mock_handler(_by_ids(seen, "movieFileIds"), batch_window=0.05))
+    results = {}
+
+    def lookup(i):
+        results[i] = movie_file.get(item_id=i)
+
+    threads = [threading.Thread(target=lookup, args=(i,)) for i in range(1, 9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {i: result["id"] for i, result in results.items()} == {i: i for i in range(1, 9)}
+    assert len(seen) == 1
+
+
+def test_lidarr_single_track_lookups_are_batched(mock_handler):
+    seen = []
+    track = Track(mock_handler(_by_ids(seen, "trackIds"), batch_window=0.0))
+
+    assert track.get(track_ids=[7]) == {"id": 7, "title": "Item 7"}
+    assert seen[0].url.path == "/api/v3/track"
+
+
+def test_a_full_batch_is_sent_without_waiting():
+    batches = []
+    batcher = SyncBatcher(lambda ids: batches.append(ids) or [{"id": i} for i in ids], window=10, max_size=1)
+
+    assert batcher.load(1) == {"id": 1}
+    assert batches == [[1]]
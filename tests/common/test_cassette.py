@@ -0,0 +1,106 @@
+import gzip
+import json
+import time
+import zipfile
+
+import httpx
+import pytest
+
+from pyarr import Cassette, RecordingTransport, ReplayTransport
+from pyarr.cassette import CassetteMiss, request_key
+
+_GZIP_JSON = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+
+
+@pytest.fixture()
+def record(mock_handler):
+    def start(path, respond):
+        return mock_handler(transport=RecordingTransport(path, httpx.MockTransport(respond)))
+
+    return start
+
+
+def test_keys_ignore_the_host_the_api_key_and_parameter_order():
+    first = request_key("get", httpx.URL("http://a:8989/api/v3/history?page=2&pageSize=10&apikey=secret"))
+    second = request_key("GET", httpx.URL("https://b/api/v3/history?pageSize=10&page=2"))
+
+    assert first == second == "GET /api/v3/history?page=2&pageSize=10"
+
+
+def test_recorded_traffic_replays_without_the_server(tmp_path, mock_handler, record):
+    path = tmp_path / "sonarr.cassette"
+    with record(path, lambda request: httpx.Response(200, json=[{"id": 1, "title": "Series"}])) as handler:
+        assert handler.request("series") == [{"id": 1, "title": "Series"}]
+
+    replay = ReplayTransport(path)
+    assert mock_handler(transport=replay).request("series") == [{"id": 1, "title": "Series"}]
+    assert replay.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_clients_replay_a_cassette(tmp_path, record, async_mock_handler):
+    path = tmp_path / "radarr.cassette"
+    with record(path, lambda request: httpx.Response(200, json={"a": 1})) as handler:
+        handler.request("system/status")
+
+    async with async_mock_handler(transport=ReplayTransport(path)) as replayed:
+        assert await replayed.request("system/status") == {"a": 1}
+
+
+def test_repeated_requests_replay_in_order(tmp_path, mock_handler, record):
+    path = tmp_path / "queue.cassette"
+    answers = iter([[1, 2], [2], []])
+    with record(path, lambda request: httpx.Response(200, json=next(answers))) as handler:
+        for _ in range(3):
+            handler.request("queue")
+
+    replayed = mock_handler(transport=ReplayTransport(path))
+    assert [replayed.request("queue") for _ in range(4)] == [[1, 2], [2], [], []]
+
+
+def test_unrecorded_requests_are_reported(tmp_path, mock_handler):
+    cassette = Cassette(tmp_path / "empty.cassette")
+
+    with pytest.raises(CassetteMiss, match="GET /api/v3/tag"):
+        mock_handler(transport=ReplayTransport(cassette)).request("tag")
+
+    lenient = ReplayTransport(cassette, strict=False)
+    response = httpx.Client(transport=lenient).get("http://localhost/api/v3/tag")
+    assert response.status_code == 404
+    assert lenient.misses == 1
+
+
+def test_bodies_are_compressed_and_stored_once(tmp_path, record):
+    path = tmp_path / "movies.cassette"
+    movies = [{"id": i, "title": "Synthetic Movie", "overview": "An overview. " * 10} for i in range(200)]
+    with record(path, lambda request: httpx.Response(200, json=movies)) as handler:
+        handler.request("movie")
+        handler.request("movie")
+
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        index = json.loads(archive.read("index.json"))
+    assert len(index["interactions"]) == 2
+    assert len([name for name in names if name.startswith("bodies/")]) == 1
+    assert path.stat().st_size < len(json.dumps(movies)) / 5
+    assert "key" not in index["interactions"][0]["url"]
+
+
+def test_wire_encodings_are_not_replayed(tmp_path, mock_handler, record):
+    path = tmp_path / "gzip.cassette"
+    body = gzip.compress(b'{"ok":true}')
+    with record(path, lambda request: httpx.Response(200, content=body, headers=_GZIP_JSON)) as handler:
+        handler.request("health")
+
+    assert mock_handler(transport=ReplayTransport(path)).request("health") == {"ok": True}
+
+
+def test_latency_is_injected(tmp_path, mock_handler):
+    cassette = Cassette(tmp_path / "slow.cassette")
+    cassette.record(httpx.Request("GET", "http://localhost:8989/api/v3/tag"), 200, httpx.Headers(), b"[]", elapsed=0.05)
+
+    handler = mock_handler(transport=ReplayTransport(cassette, latency=0.02, real_time=True))
+    started = time.perf_counter()
+    handler.request("tag")
+
+    assert time.perf_counter() - started >= 0.07
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from pyarr._async.bazarr.episodes import Episodes as AsyncEpisodes
+from pyarr._sync.bazarr.series import Series
+from pyarr._sync.common.base import MAX_IDS_LENGTH, _chunk_ids, _merge_chunks
+from pyarr._sync.dispatcharr.streams import Streams
+from pyarr._sync.lidarr.album import Album
+from pyarr._sync.prowlarr.search import Search
+
+
+def test_chunks_fit_the_limit_and_keep_order():
+    ids = list(range(100_000, 103_000))
+    chunks = _chunk_ids("albumIds", ids)
+
+    assert len(chunks) > 1
+    assert [i for chunk in chunks for i in chunk] == ids
+    assert all(len(str(httpx.QueryParams({"albumIds": chunk}))) <= MAX_IDS_LENGTH for chunk in chunks)
+
+
+def test_short_lists_are_one_chunk():
+    assert _chunk_ids("ids", [1, 2, 3]) == [[1, 2, 3]]
+    assert _chunk_ids("ids", []) == [[]]
+
+
+def test_merge_combines_wrapped_items():
+    merged = _merge_chunks([{"data": [1, 2], "total": 2}, {"data": [3], "total": 1}])
+    assert merged == {"data": [1, 2, 3], "total": 3}
+    assert _merge_chunks([[1], [2, 3]]) == [1, 2, 3]
+
+
+def test_long_query_lists_are_split_and_merged_in_order(mock_handler):
+    seen = []
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def respond(request):
+        with lock:
+            seen.append(request)
+            active[0] += 1
+            active[1] = max(active)
+        threading.Event().wait(0.02)
+        with lock:
+            active[0] -= 1
+        ids = [int(i) for i in request.url.params.get_list("albumIds")]
+        return httpx.Response(200, json=[{"id": i} for i in ids])
+
+    ids = list(range(100_000, 104_000))
+    albums = Album(mock_handler(respond)).get(album_ids=ids)
+
+    assert [album["id"] for album in albums] == ids
+    assert len(seen) > 1
+    assert all(len(str(request.url)) < 8192 for request in seen)
+    assert all(request.url.params["includeAllArtistAlbums"] == "false" for request in seen)
+    assert active[1] > 1
+
+
+def test_short_lists_send_one_request(mock_handler):
+    seen = []
+
+    def respond(request):
+        seen.append(request)
+        return httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+
+    assert Album(mock_handler(respond)).get(album_ids=[1, 2]) == [{"id": 1}, {"id": 2}]
+    assert len(seen) == 1
+    assert seen[0].url.params.get_list("albumIds") == ["1", "2"]
+
+
+def test_body_id_lists_are_sent_whole(mock_handler):
+    seen = []
+
+    def respond(request):
+        seen.append(request)
+        ids = json.loads(request.content)["ids"]
+        return httpx.Response(200, json=[{"id": i} for i in ids])
+
+    ids = list(range(1, 3001))
+    streams = Streams(mock_handler(respond)).get_by_ids(ids)
+
+    assert [stream["id"] for stream in streams] == ids
+    assert len(seen) == 1
+
+
+def test_every_query_id_list_is_chunked(mock_handler):
+    seen = []
+
+    def respond(request):
+        seen.append(request)
+        if request.url.path.endswith("/search"):
+            return httpx.Response(200, json=[{"indexerId": int(i)} for i in request.url.params.get_list("indexerIds")])
+        ids = [int(i) for i in request.url.params.get_list("seriesid[]")]
+        return httpx.Response(200, json={"data": [{"sonarrSeriesId": i} for i in ids], "total": len(ids)})
+
+    ids = list(range(100_000, 104_000))
+    series = Series(mock_handler(respond, api_ver="")).get(series_id=ids)
+    results = Search(mock_handler(respond, api_ver="v1")).get("query", indexer_ids=ids)
+
+    assert [item["sonarrSeriesId"] for item in series["data"]] == ids
+    assert [result["indexerId"] for result in results] == ids
+    assert all(len(str(request.url)) < 8192 for request in seen)
+    assert all(request.url.params["query"] == "query" for request in seen if request.url.path.endswith("/search"))
+
+
+@pytest.mark.asyncio
+async def test_bazarr_episode_data_is_merged(async_mock_handler):
+    seen = []
+
+    async def respond(request):
+        seen.append(request)
+        await asyncio.sleep(0.01)
+        ids = [int(i) for i in request.url.params.get_list("episodeid[]")]
+        return httpx.Response(200, json={"data": [{"sonarrEpisodeId": i} for i in ids], "total": len(ids)})
+
+    handler = async_mock_handler(respond, port=6767, api_ver="")
+    ids = list(range(1, 2001))
+
+    episodes = await AsyncEpisodes(handler).get(episode_id=ids)
+
+    assert [episode["sonarrEpisodeId"] for episode in episodes["data"]] == ids
+    assert episodes["total"] == len(ids)
+    assert len(seen) > 1
@@ -0,0 +1,123 @@
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pyarr import AsyncCommandDispatcher, AsyncSonarr, CommandDispatcher, Sonarr
+
+
+class FakeQueue:
+    """Queues commands, completing each once the command list has been fetched after it was queued."""
+
+    def __init__(self, *existing, fail=False):
+        self.ids = itertools.count(100)
+        self.commands = {command["id"]: dict(command, listed=-1) for command in existing}
+        self.fail = fail
+        self.posted = []
+        self.most_active = 0
+
+    def __call__(self, request):
+        if request.method == "POST":
+            if self.fail:
+                return httpx.Response(500, json={"message": "Busy"})
+            body = json.loads(request.content)
+            self.posted.append(body)
+            command = {"id": next(self.ids), "name": body["name"], "body": body, "status": "queued", "listed": 0}
+            self.commands[command["id"]] = command
+            active = [c for c in self.commands.values() if c["status"] == "queued" and c["listed"] >= 0]
+            self.most_active = max(self.most_active, len(active))
+            return httpx.Response(201, json=command)
+        path = request.url.path.removeprefix("/api/v3/")
+        if path != "command":
+            return httpx.Response(200, json=self.commands[int(path.split("/")[1])])
+        for command in self.commands.values():
+            command["listed"] += 1
+            if command["listed"] >= 1:
+                command["status"] = "completed"
+        return httpx.Response(200, json=list(self.commands.values()))
+
+
+def _sonarr(server):
+    return Sonarr("localhost", "key", api_ver="v3", session=httpx.Client(transport=httpx.MockTransport(server)))
+
+
+def _async_sonarr(server):
+    return AsyncSonarr(
+        "localhost", "key", api_ver="v3", session=httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+
+
+@pytest.mark.asyncio
+async def test_waiting_searches_are_merged_under_the_cap():
+    server = FakeQueue()
+    dispatcher = AsyncCommandDispatcher(_async_sonarr(server), max_active=1)
+
+    commands = await asyncio.gather(*(dispatcher.submit("EpisodeSearch", episodeIds=[i, 1]) for i in range(1, 6)))
+
+    assert [body["episodeIds"] for body in server.posted] == [[1], [2, 1, 3, 4, 5]]
+    assert server.most_active == 1
+    assert {command["status"] for command in commands} == {"completed"}
+    assert commands[4]["body"]["episodeIds"] == [2, 1, 3, 4, 5]
+    assert (dispatcher.submitted, dispatcher.dispatched, dispatcher.merged) == (5, 2, 3)
+    assert dispatcher.queue_depth == dispatcher.active == 0
+    assert dispatcher.max_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_merged_searches_respect_the_batch_size():
+    server = FakeQueue()
+    dispatcher = AsyncCommandDispatcher(_async_sonarr(server), max_active=1, max_batch=2)
+
+    await asyncio.gather(*(dispatcher.submit("EpisodeSearch", episodeIds=[i]) for i in range(5)))
+
+    assert [body["episodeIds"] for body in server.posted] == [[0], [1, 2], [3, 4]]
+
+
+def test_commands_already_on_the_server_are_not_sent_again():
+    server = FakeQueue({"id": 1, "name": "EpisodeSearch", "status": "started", "body": {"episodeIds": [1, 2]}})
+    dispatcher = CommandDispatcher(_sonarr(server))
+
+    assert dispatcher.submit("EpisodeSearch", episodeIds=[2, 1])["id"] == 1
+    assert not server.posted
+    assert dispatcher.deduplicated == 1
+
+
+def test_only_ids_not_already_searched_are_sent():
+    server = FakeQueue(
+        {"id": 1, "name": "EpisodeSearch", "status": "queued", "body": {"episodeIds": [1, 2]}},
+        {"id": 2, "name": "MoviesSearch", "status": "queued", "body": {"movieIds": [3]}},
+    )
+    dispatcher = CommandDispatcher(_sonarr(server))
+
+    assert dispatcher.submit("EpisodeSearch", episodeIds=[2, 3])["id"] == 100
+
+    assert server.posted == [{"name": "EpisodeSearch", "episodeIds": [3]}]
+    assert dispatcher.deduplicated == 0
+
+
+def test_identical_commands_from_threads_are_sent_once_at_a_time():
+    server = FakeQueue()
+    dispatcher = CommandDispatcher(_sonarr(server), max_active=1)
+
+    with ThreadPoolExecutor(6) as pool:
+        commands = list(pool.map(lambda _: dispatcher.submit("RefreshMonitoredDownloads"), range(6)))
+
+    assert 1 <= len(server.posted) <= 2
+    assert server.most_active == 1
+    assert {command["status"] for command in commands} == {"completed"}
+    assert dispatcher.merged == 6 - len(server.posted)
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_merged_submitter():
+    dispatcher = AsyncCommandDispatcher(_async_sonarr(FakeQueue(fail=True)), max_active=1)
+
+    results = await asyncio.gather(
+        *(dispatcher.submit("MoviesSearch", movieIds=[i]) for i in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, Exception) for result in results)
+    assert dispatcher.queue_depth == dispatcher.active == 0
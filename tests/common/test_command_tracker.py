@@ -0,0 +1,143 @@
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pyarr import AsyncSonarr, Sonarr
+from pyarr._async_synchronization import AsyncPoller
+from pyarr._sync_synchronization import SyncPoller
+
+
+class FakeCommands:
+    """Queues commands and completes each after it has been listed ``polls`` times."""
+
+    def __init__(self, polls=1):
+        self.polls = polls
+        self.ids = itertools.count(1)
+        self.commands = {}
+        self.listed = {}
+        self.requests = []
+
+    def __call__(self, request):
+        path = request.url.path.removeprefix("/api/v3/")
+        self.requests.append((request.method, path))
+        if request.method == "POST":
+            command = {"id": next(self.ids), "name": json.loads(request.content)["name"], "status": "queued"}
+            self.commands[command["id"]] = command
+            return httpx.Response(201, json=command)
+        if request.method == "DELETE":
+            self.commands[int(path.split("/")[1])]["status"] = "cancelled"
+            return httpx.Response(200)
+        if path == "command":
+            for command in self.commands.values():
+                self.listed[command["id"]] = self.listed.get(command["id"], 0) + 1
+                if self.polls is not None and self.listed[command["id"]] >= self.polls:
+                    command["status"] = "completed"
+            return httpx.Response(200, json=[c for c in self.commands.values() if c["id"] % 10])
+        command = self.commands.get(int(path.split("/")[1]))
+        return httpx.Response(200, json=command) if command else httpx.Response(404, json={"message": "NotFound"})
+
+    def list_polls(self):
+        return self.requests.count(("GET", "command"))
+
+
+def _sonarr(server):
+    return Sonarr("localhost", "key", api_ver="v3", session=httpx.Client(transport=httpx.MockTransport(server)))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waits_share_one_poll():
+    server = FakeCommands(polls=2)
+    sonarr = AsyncSonarr(
+        "localhost", "key", api_ver="v3", session=httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+
+    commands = await asyncio.gather(*(sonarr.command.execute("RescanSeries", wait=True, seriesId=i) for i in range(30)))
+
+    assert {command["status"] for command in commands} == {"completed"}
+    assert server.list_polls() == 2
+    # Every tenth command is missing from the list and fetched on its own.
+    assert server.requests.count(("GET", "command/10")) == 2
+
+
+def test_sync_waits_share_one_polling_thread():
+    server = FakeCommands()
+    sonarr = _sonarr(server)
+
+    with ThreadPoolExecutor(8) as pool:
+        commands = list(
+            pool.map(lambda i: sonarr.command.execute("EpisodeSearch", wait=True, episodeIds=[i]), range(8))
+        )
+
+    assert [command["status"] for command in commands] == ["completed"] * 8
+    assert server.list_polls() <= 2
+
+
+def test_waits_time_out_and_stop_being_polled():
+    server = FakeCommands(polls=None)
+    sonarr = _sonarr(server)
+    command = sonarr.command.execute("RssSync")
+
+    with pytest.raises(TimeoutError):
+        sonarr.command.wait(command["id"], timeout=0.6)
+
+    assert server.list_polls() == 1
+
+    sonarr.command.cancel(command["id"])
+    assert sonarr.command.wait(command["id"])["status"] == "cancelled"
+
+
+def test_forgotten_commands_are_orphaned():
+    server = FakeCommands()
+
+    assert _sonarr(server).command.wait(99)["status"] == "orphaned"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waits_are_dropped():
+    server = FakeCommands(polls=None)
+    sonarr = AsyncSonarr(
+        "localhost", "key", api_ver="v3", session=httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+    command = await sonarr.command.execute("RssSync")
+
+    waiter = asyncio.ensure_future(sonarr.command.wait(command["id"]))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    await asyncio.sleep(0.6)
+    assert server.list_polls() == 0
+
+
+def test_failed_polls_are_tried_again():
+    answers = iter([OSError("connection reset"), {1: "started"}, OSError("connection reset"), {1: "completed"}])
+
+    def fetch(keys):
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    poller = SyncPoller(fetch, lambda state: state == "completed", min_interval=0.01, max_failures=2)
+
+    assert poller.wait(1) == "completed"
+    assert (poller.polls, poller.errors) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_waiters_fail_once_polls_keep_failing():
+    async def fetch(keys):
+        raise OSError("connection refused")
+
+    poller = AsyncPoller(fetch, lambda state: True, min_interval=0.01, max_failures=3)
+
+    with pytest.raises(OSError, match="refused"):
+        await poller.wait(1)
+    assert poller.polls == 3
+    with pytest.raises(ValueError):
+        AsyncPoller(fetch, lambda state: True, max_failures=0)
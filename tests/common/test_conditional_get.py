@@ -0,0 +1,107 @@
+import httpx
+import pytest
+
+from pyarr.cache import ConditionalCache
+
+
+def _etag_transport(requests, bodies):
+    """Serves ``bodies`` in turn, honouring ``If-None-Match`` against the current body's ETag."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = bodies[min(len(requests) - 1, len(bodies) - 1)]
+        etag = f'"{bodies.index(body)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return handler
+
+
+def test_304_returns_the_previous_object(mock_handler):
+    requests: list[httpx.Request] = []
+    cache = ConditionalCache()
+    handler = mock_handler(_etag_transport(requests, [[{"id": 1}], [{"id": 1}], [{"id": 2}]]), conditional_cache=cache)
+
+    first = handler.request("movie")
+    second = handler.request("movie")
+    third = handler.request("movie")
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"0"'
+    assert second is first
+    assert third == [{"id": 2}]
+    assert (cache.stats.not_modified, cache.stats.changed) == (1, 2)
+
+
+def test_304_for_a_forgotten_answer_asks_again_for_the_body(mock_handler):
+    requests: list[httpx.Request] = []
+    cache = ConditionalCache()
+    etag_transport = _etag_transport(requests, [[{"id": 1}]])
+
+    def forgetting(request: httpx.Request) -> httpx.Response:
+        # The answer is evicted while the revalidation is in flight.
+        cache.clear()
+        return etag_transport(request)
+
+    handler = mock_handler(forgetting, conditional_cache=cache)
+    handler.request("movie")
+
+    assert handler.request("movie") == [{"id": 1}]
+    assert [request.headers.get("If-None-Match") for request in requests] == [None, '"0"', None]
+
+
+def test_unchanged_body_without_validators_is_not_decoded_again(mock_handler):
+    calls: list[str] = []
+
+    def no_validators(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("If-None-Match", ""))
+        return httpx.Response(200, json={"movies": list(range(50))})
+
+    cache = ConditionalCache()
+    handler = mock_handler(no_validators, conditional_cache=cache)
+
+    first = handler.request("movie", params={"tmdbId": 1})
+    assert handler.request("movie", params={"tmdbId": 1}) is first
+    assert handler.request("movie", params={"tmdbId": 2}) is not first
+
+    assert calls == ["", "", ""]
+    assert cache.stats.unchanged == 1
+
+
+def test_last_modified_is_sent_back(mock_handler):
+    requests: list[httpx.Request] = []
+
+    def last_modified(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[], headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+    handler = mock_handler(last_modified, conditional_cache=ConditionalCache())
+    handler.request("series")
+    handler.request("series")
+
+    assert requests[1].headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+def test_least_recently_used_urls_are_forgotten(mock_handler):
+    requests: list[httpx.Request] = []
+    cache = ConditionalCache(max_entries=1)
+    handler = mock_handler(_etag_transport(requests, [{"id": 1}]), conditional_cache=cache)
+
+    handler.request("movie/1")
+    handler.request("movie/2")
+    handler.request("movie/1")
+
+    assert len(cache) == 1
+    assert cache.stats.evictions == 2
+    assert "If-None-Match" not in requests[2].headers
+
+
+@pytest.mark.asyncio
+async def test_async_handler_revalidates(async_mock_handler):
+    requests: list[httpx.Request] = []
+    handler = async_mock_handler(_etag_transport(requests, [{"id": 1}]), conditional_cache=ConditionalCache())
+
+    first = await handler.request("artist")
+    assert await handler.request("artist") is first
+    assert requests[1].headers["If-None-Match"] == '"0"'
@@ -0,0 +1,175 @@
+import asyncio
+import importlib.util
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from pyarr._async.utils.http import RequestHandler as AsyncRequestHandler
+from pyarr._sync.utils.http import RequestHandler
+from pyarr.pool import PoolStats, is_connection_event
+
+
+class _SlowApi(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.1)
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowApi)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _traced(events):
+    def transport(request):
+        for name in events:
+            request.extensions["trace"](name, {})
+        return httpx.Response(200, json=[])
+
+    return transport
+
+
+def test_connection_events_are_classified():
+    assert is_connection_event("connection.connect_tcp.started") == (True, True)
+    assert is_connection_event("http11.send_request_headers.started") == (True, False)
+    assert is_connection_event("http2.send_request_headers.started") == (True, False)
+    assert is_connection_event("http11.receive_response_headers.started") == (False, False)
+
+
+def test_pool_stats_count_waits_and_new_connections():
+    stats = PoolStats()
+    stats.record(0.5, True)
+    stats.record(0.1, False)
+
+    assert stats.requests == 2
+    assert stats.connections_opened == 1
+    assert stats.wait_max == 0.5
+    assert stats.wait_mean == pytest.approx(0.3)
+
+
+def test_requests_record_the_first_connection_event_only():
+    events = ["connection.connect_tcp.started", "connection.start_tls.started", "http11.send_request_headers.started"]
+    session = httpx.Client(transport=httpx.MockTransport(_traced(events)))
+    handler = RequestHandler(host="localhost", api_key="key", port=8989, tls=False, api_ver="v3", session=session)
+
+    handler.request("movie")
+    handler.request("movie")
+
+    assert handler.pool_stats.requests == 2
+    assert handler.pool_stats.connections_opened == 2
+
+
+def test_limits_and_http2_configure_our_own_session():
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=2, keepalive_expiry=30)
+    handler = RequestHandler(host="localhost", api_key="key", port=8989, tls=False, limits=limits)
+
+    pool = handler._get_session()._transport._pool
+
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 2
+    assert pool._keepalive_expiry == 30
+
+
+def test_http2_is_negotiated_when_asked():
+    pytest.importorskip("h2")
+    handler = RequestHandler(host="localhost", api_key="key", port=8989, tls=False, http2=True)
+
+    assert handler._get_session()._transport._pool._http2
+
+
+def test_http2_without_h2_fails_when_the_client_is_built(monkeypatch):
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None if name == "h2" else real_find_spec(name))
+
+    with pytest.raises(ImportError, match=r"pyarr\[http2\]"):
+        RequestHandler(host="localhost", api_key="key", port=8989, tls=False, http2=True)
+    RequestHandler(host="localhost", api_key="key", port=8989, tls=False, http2=True, session=httpx.Client())
+
+
+def test_pool_wait_is_measured_against_a_real_server(server):
+    handler = RequestHandler(
+        host="127.0.0.1", api_key="key", port=server, tls=False, api_ver="v3", limits=httpx.Limits(max_connections=1)
+    )
+    with handler:
+        threads = [threading.Thread(target=handler.request, args=("movie",)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    stats = handler.pool_stats
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.wait_max >= 0.15
+
+
+def test_warm_up_discovers_the_api_version():
+    requests = []
+    session = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: requests.append(request) or httpx.Response(200, json={"current": "v3"})
+        )
+    )
+    with RequestHandler(
+        host="localhost", api_key="key", port=8989, tls=False, session=session, warm_up=True
+    ) as handler:
+        assert [request.url.path for request in requests] == ["/api"]
+        assert str(handler.api_url).endswith("/api/v3")
+
+
+def test_warm_up_opens_a_connection_when_the_version_is_known(server):
+    with RequestHandler(host="127.0.0.1", api_key="key", port=server, tls=False, api_ver="v3", warm_up=True) as handler:
+        assert handler.session is not None
+        assert handler.pool_stats.requests == 0
+        handler.request("movie")
+
+    # The request found the warmed up connection in the pool.
+    assert handler.pool_stats.connections_opened == 0
+
+
+def test_warm_up_failures_are_left_for_the_first_request():
+    def refuse(request):
+        raise httpx.ConnectError("refused")
+
+    session = httpx.Client(transport=httpx.MockTransport(refuse))
+    with RequestHandler(
+        host="localhost", api_key="key", port=8989, tls=False, api_ver="v3", session=session, warm_up=True
+    ) as handler:
+        assert handler.api_url is not None
+
+
+@pytest.mark.asyncio
+async def test_async_pool_wait_is_measured(server):
+    handler = AsyncRequestHandler(
+        host="127.0.0.1", api_key="key", port=server, tls=False, api_ver="v3", limits=httpx.Limits(max_connections=1)
+    )
+    async with handler:
+        await asyncio.gather(*(handler.request("movie") for _ in range(3)))
+
+    assert handler.pool_stats.requests == 3
+    assert handler.pool_stats.connections_opened == 1
+    assert handler.pool_stats.wait_max >= 0.15
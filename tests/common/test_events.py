@@ -0,0 +1,98 @@
+import itertools
+import json
+
+import httpx
+import pytest
+
+from pyarr import AsyncRadarr, ChangeEvent, Sonarr
+from pyarr.events import HANDSHAKE, RECORD_SEPARATOR
+from pyarr.models import EpisodeRecord
+
+
+def _message(value):
+    return json.dumps(value) + RECORD_SEPARATOR
+
+
+def _change(name, action, resource=None):
+    body = {"action": action, **({"resource": resource} if resource is not None else {})}
+    return _message({"type": 1, "target": "receiveMessage", "arguments": [{"name": name, "body": body}]})
+
+
+class FakeHub:
+    """Stands in for the Servarr SignalR hub, playing one list of messages per connection."""
+
+    def __init__(self, *connections, fail_negotiations=0):
+        self.connections = list(connections)
+        self.fail_negotiations = fail_negotiations
+        self.negotiations = 0
+        self.handshakes = []
+
+    def __call__(self, request):
+        if request.url.path == "/signalr/messages/negotiate":
+            self.negotiations += 1
+            if self.negotiations <= self.fail_negotiations:
+                return httpx.Response(500, json={"message": "Starting up"})
+            token = f"token-{self.negotiations}"
+            return httpx.Response(200, json={"connectionId": "id", "connectionToken": token, "negotiateVersion": 1})
+        if request.url.path == "/signalr/messages" and request.method == "POST":
+            self.handshakes.append((request.url.params["id"], request.content))
+            return httpx.Response(200)
+        messages = [_message({}), *self.connections.pop(0)] if self.connections else [_message({"type": 7})]
+        body = "".join(f"data: {message}\n\n" for message in messages)
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=body.encode())
+
+
+def _sonarr(hub):
+    return Sonarr("localhost", "key", api_ver="v3", tls=False, session=httpx.Client(transport=httpx.MockTransport(hub)))
+
+
+def test_changes_are_yielded_and_resynced_after_a_reconnect():
+    hub = FakeHub(
+        [_message({"type": 6}), _change("queue", "updated", {"id": 1}), _change("health", "sync")],
+        [_change("episode", "deleted", {"id": 7})],
+    )
+    feed = _sonarr(hub).events.subscribe(reconnect_delay=0)
+
+    events = list(itertools.islice(feed, 4))
+    feed.close()
+
+    assert events == [
+        ChangeEvent("queue", "updated", {"id": 1}),
+        ChangeEvent("health", "sync", None),
+        ChangeEvent("*", "sync", None),
+        ChangeEvent("episode", "deleted", {"id": 7}),
+    ]
+    assert events[1].resync and not events[0].resync
+    assert hub.handshakes == [("token-1", HANDSHAKE.encode()), ("token-2", HANDSHAKE.encode())]
+
+
+def test_subscriptions_filter_by_name_and_return_records():
+    hub = FakeHub(
+        [_change("queue", "updated", {"id": 1}), _change("episode", "updated", {"id": 7, "title": "Pilot"})],
+        [_change("episode", "updated", {"id": 8})],
+        fail_negotiations=1,
+    )
+    feed = _sonarr(hub).events.subscribe(names=["episode"], reconnect_delay=0, models=True)
+
+    first, resync, second = itertools.islice(feed, 3)
+    feed.close()
+
+    assert isinstance(first.resource, EpisodeRecord)
+    assert first.resource["title"] == "Pilot"
+    assert resync == ChangeEvent("episode", "sync", None)
+    assert second.resource["id"] == 8
+    assert hub.negotiations == 3
+
+
+@pytest.mark.asyncio
+async def test_async_clients_subscribe():
+    hub = FakeHub([_change("movie", "updated", {"id": 3})])
+    client = AsyncRadarr(
+        "localhost", "key", api_ver="v3", tls=False, session=httpx.AsyncClient(transport=httpx.MockTransport(hub))
+    )
+
+    feed = client.events.subscribe(reconnect_delay=0)
+    event = await anext(feed)
+    await feed.aclose()
+
+    assert event == ChangeEvent("movie", "updated", {"id": 3})
@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from pyarr import ArrFleet, AsyncArrFleet, AsyncSonarr, FleetResults, Radarr, RetryPolicy, Sonarr
+from pyarr.exceptions import PyarrServerError
+
+HEALTH = [{"source": "IndexerStatusCheck", "type": "warning"}]
+
+
+def _client(client_class, handler, **kwargs):
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    return client_class("localhost", "key", port=8989, tls=False, api_ver="v3", session=session, **kwargs)
+
+
+def _answer(body, status=200, delay=0.0):
+    def handler(request):
+        time.sleep(delay)
+        return httpx.Response(status, json=body)
+
+    return handler
+
+
+def test_call_fans_out_and_keeps_partial_failures():
+    with ArrFleet(timeout=5) as fleet:
+        fleet.add("tv-1", _client(Sonarr, _answer(HEALTH)))
+        fleet.add("tv-2", _client(Sonarr, _answer({"message": "boom"}, status=500)))
+        fleet.add("movies", _client(Radarr, _answer([])))
+
+        results = fleet.call("system.get_health")
+
+    assert list(results) == ["tv-1", "tv-2", "movies"]
+    assert results["tv-1"].ok and results["tv-1"].value == HEALTH
+    assert isinstance(results.errors["tv-2"], PyarrServerError)
+    assert results.succeeded == {"tv-1": HEALTH, "movies": []}
+
+
+def test_slow_instances_time_out_without_blocking_the_rest():
+    fleet = ArrFleet(timeout=5)
+    fleet.add("fast", _client(Sonarr, _answer(HEALTH)))
+    fleet.add("slow", _client(Sonarr, _answer(HEALTH, delay=1.0)), timeout=0.2)
+
+    started = time.perf_counter()
+    results = fleet.call("system.get_health")
+
+    assert time.perf_counter() - started < 0.8
+    assert results["fast"].ok
+    assert isinstance(results["slow"].error, TimeoutError)
+
+
+def test_merged_tags_items_and_unwraps_pages():
+    page = {"page": 1, "totalRecords": 1, "records": [{"id": 1, "title": "Queued"}]}
+    fleet = ArrFleet()
+    fleet.add("a", _client(Sonarr, _answer(page)))
+    fleet.add("b", _client(Sonarr, _answer(page)))
+    fleet.add("down", _client(Sonarr, _answer({}, status=503), retry=RetryPolicy(max_attempts=1)))
+
+    merged = fleet.call("queue.get", page_size=50).merged()
+
+    assert merged == [
+        {"id": 1, "title": "Queued", "instance": "a"},
+        {"id": 1, "title": "Queued", "instance": "b"},
+    ]
+
+
+def test_merged_wraps_scalars():
+    results = FleetResults({})
+    assert results.merged() == []
+
+    fleet = ArrFleet()
+    fleet.add("a", _client(Sonarr, _answer(True)))
+    assert fleet.run(lambda client: client.system.get_status()).merged(tag="host") == [{"host": "a", "value": True}]
+
+
+def test_missing_components_fail_that_instance_only():
+    fleet = ArrFleet()
+    fleet.add("tv", _client(Sonarr, _answer([])))
+    fleet.add("movies", _client(Radarr, _answer([{"id": 1}])))
+
+    results = fleet.call("movie.get")
+
+    assert isinstance(results.errors["tv"], AttributeError)
+    assert results.succeeded == {"movies": [{"id": 1}]}
+
+
+def test_select_filters_by_name_and_kind():
+    fleet = ArrFleet()
+    fleet.add("tv", _client(Sonarr, _answer([])))
+    fleet.add("movies", _client(Radarr, _answer([])))
+
+    assert list(fleet.select(kind=Radarr).clients) == ["movies"]
+    assert list(fleet.select("tv").clients) == ["tv"]
+    with pytest.raises(KeyError):
+        fleet.select("unknown")
+
+
+def test_names_are_unique():
+    fleet = ArrFleet()
+    fleet.add("tv", _client(Sonarr, _answer([])))
+    with pytest.raises(ValueError):
+        fleet.add("tv", _client(Sonarr, _answer([])))
+
+
+def test_created_clients_share_one_session():
+    with ArrFleet(limits=httpx.Limits(max_connections=50)) as fleet:
+        first = fleet.create("tv-1", Sonarr, "http://tv-1:8989", "key")
+        second = fleet.create("tv-2", Sonarr, "http://tv-2:8989", "key")
+
+        assert first.http_utils.session is second.http_utils.session is fleet.session
+        assert fleet.session._transport._pool._max_connections == 50
+
+    assert fleet.session is None
+
+
+def test_the_shared_session_uses_the_fleet_request_timeout():
+    with ArrFleet() as fleet:
+        fleet.create("tv", Sonarr, "http://tv:8989", "key")
+        assert fleet.session.timeout == httpx.Timeout(None)
+
+        with pytest.raises(ValueError, match="pass request_timeout to the fleet"):
+            fleet.create("movies", Radarr, "http://movies:7878", "key", request_timeout=60)
+
+    with ArrFleet(request_timeout=120) as fleet:
+        fleet.create("tv", Sonarr, "http://tv:8989", "key")
+        assert fleet.session.timeout == httpx.Timeout(120)
+
+
+@pytest.mark.asyncio
+async def test_async_fleet_runs_instances_concurrently():
+    def handler(delay, body):
+        async def respond(request):
+            await asyncio.sleep(delay)
+            return httpx.Response(200, json=body)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(respond))
+
+    async with AsyncArrFleet(timeout=5) as fleet:
+        for i in range(5):
+            fleet.add(f"tv-{i}", AsyncSonarr("localhost", "key", api_ver="v3", session=handler(0.2, HEALTH)))
+        fleet.add("slow", AsyncSonarr("localhost", "key", api_ver="v3", session=handler(5, HEALTH)), timeout=0.3)
+
+        started = time.perf_counter()
+        results = await fleet.call("system.get_health")
+
+    assert time.perf_counter() - started < 0.6
+    assert len(results.succeeded) == 5
+    assert isinstance(results.errors["slow"], TimeoutError)
@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyarr import LatencyHistograms, RequestEvent
+from pyarr.cache import ResponseCache
+from pyarr.exceptions import PyarrResourceNotFound
+from pyarr.instrumentation import LatencyHistogram, endpoint_template
+from pyarr.retry import RetryPolicy
+
+
+class _Events(list):
+    def record(self, event):
+        self.append(event)
+
+
+def test_ids_become_placeholders():
+    assert endpoint_template("series/12") == "series/{id}"
+    assert endpoint_template("series/lookup") == "series/lookup"
+    assert endpoint_template("episode/3/file") == "episode/{id}/file"
+    assert endpoint_template("channels/550e8400-e29b-41d4-a716-446655440000/") == "channels/{id}/"
+    assert endpoint_template("v3") == "v3"
+
+
+def test_histogram_percentiles_stay_within_the_precision():
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.min == 0.001 and histogram.max == 1.0
+    assert histogram.mean == pytest.approx(0.5005)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+    assert histogram.percentile(100) == pytest.approx(1.0, rel=0.02)
+    assert LatencyHistogram().percentile(50) == 0.0
+
+
+def test_histograms_merge():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.01)
+    second.record(0.02)
+    first.merge(second)
+
+    assert first.count == 2
+    assert first.max == 0.02
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(precision=5))
+
+
+def test_events_carry_status_sizes_and_timings(mock_handler):
+    def respond(request):
+        for name in ("connection.connect_tcp.started", "http11.send_request_headers.started"):
+            request.extensions["trace"](name, {})
+        request.extensions["trace"]("http11.receive_response_headers.complete", {})
+        return httpx.Response(200, json=[{"id": 12, "title": "Series"}])
+
+    events = _Events()
+    handler = mock_handler(respond, instrumentation=events)
+
+    handler.request("series/12", method="PUT", json_data={"id": 12})
+
+    (event,) = events
+    assert isinstance(event, RequestEvent)
+    assert (event.method, event.endpoint, event.status, event.attempts) == ("PUT", "series/{id}", 200, 1)
+    assert event.request_bytes == len(b'{"id":12}')
+    assert event.response_bytes == len(b'[{"id":12,"title":"Series"}]')
+    assert event.connect is not None and event.ttfb is not None
+    assert event.duration >= event.decode > 0
+    assert event.error is None and not event.cached
+
+
+def test_failures_and_retries_are_reported(mock_handler):
+    statuses = iter([503, 404])
+    events = _Events()
+    handler = mock_handler(
+        lambda request: httpx.Response(next(statuses), json={"message": "nope"}),
+        instrumentation=events,
+        retry=RetryPolicy(backoff_factor=0),
+    )
+
+    with pytest.raises(PyarrResourceNotFound):
+        handler.request("tag/1")
+
+    assert events[0].attempts == 2
+    assert events[0].status == 404
+    assert events[0].error == "PyarrResourceNotFound"
+
+
+def test_cached_answers_are_marked(mock_handler):
+    events = _Events()
+    handler = mock_handler(
+        lambda request: httpx.Response(200, json=[]),
+        instrumentation=events,
+        response_cache=ResponseCache(ttls={"tag": 60}),
+    )
+
+    handler.request("tag")
+    handler.request("tag")
+
+    assert [event.cached for event in events] == [False, True]
+    assert events[1].attempts == 0
+
+
+def test_histograms_aggregate_by_endpoint(mock_handler):
+    histograms = LatencyHistograms()
+    handler = mock_handler(lambda request: httpx.Response(200, json={}), instrumentation=histograms)
+
+    for i in range(5):
+        handler.request(f"series/{i}")
+    handler.request("system/status")
+
+    rows = {row["endpoint"]: row for row in histograms.summary()}
+    assert rows["series/{id}"]["count"] == 5
+    assert rows["series/{id}"]["bytes"] == 10
+    assert set(rows["system/status"]) >= {"p50", "p90", "p99", "mean", "max"}
+    assert histograms.decode.count == 6
+
+
+@pytest.mark.asyncio
+async def test_streams_report_once_they_end(async_mock_handler):
+    events = _Events()
+    handler = async_mock_handler(lambda request: httpx.Response(200, json=[1, 2, 3]), instrumentation=events)
+
+    assert [item async for item in handler.stream("movie")] == [1, 2, 3]
+    await asyncio.sleep(0)
+
+    assert [(event.endpoint, event.status, event.response_bytes) for event in events] == [("movie", 200, 7)]
+
+
+def test_opentelemetry_adapter_records_metrics(mock_handler):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    from pyarr import OpenTelemetryInstrument
+
+    reader = InMemoryMetricReader()
+    instrument = OpenTelemetryInstrument(MeterProvider(metric_readers=[reader]))
+    mock_handler(lambda request: httpx.Response(200, json={}), instrumentation=instrument).request("series/1")
+
+    names = {
+        metric.name
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert "http.client.request.duration" in names
@@ -0,0 +1,74 @@
+import json
+
+import httpx
+import pytest
+
+from pyarr.codec import CODECS, JsonCodec, get_codec
+
+
+class CountingCodec(JsonCodec):
+    """Standard library codec that counts its calls."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+
+def _available_codecs():
+    available = []
+    for name in CODECS:
+        try:
+            available.append(get_codec(name))
+        except ImportError:
+            continue
+    return available
+
+
+def test_codec_names_resolve():
+    assert type(get_codec("json")) is JsonCodec
+    assert type(get_codec(None)) is JsonCodec
+    codec = CountingCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(ValueError, match="simplejson"):
+        get_codec("simplejson")
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_agree_with_the_standard_library(codec):
+    document = {"title": "Amélie", "year": 2001, "ratings": [7.5, None], "monitored": True}
+
+    assert codec.loads(json.dumps(document).encode()) == document
+    assert json.loads(codec.dumps(document)) == document
+
+
+def test_handler_encodes_and_decodes_with_its_codec(mock_handler):
+    seen: list[httpx.Request] = []
+
+    def echo(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(201, content=request.content, headers={"Content-Type": "application/json"})
+
+    codec = CountingCodec()
+    handler = mock_handler(echo, json_codec=codec)
+
+    assert handler.request("tag", method="POST", json_data={"label": "4k"}) == {"label": "4k"}
+    assert codec.calls == ["dumps", "loads"]
+    assert seen[0].headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_async_handler_decodes_with_its_codec(async_mock_handler):
+    codec = CountingCodec()
+    handler = async_mock_handler(lambda request: httpx.Response(200, json=[1, 2]), json_codec=codec)
+
+    assert await handler.request("series") == [1, 2]
+    assert codec.calls == ["loads"]
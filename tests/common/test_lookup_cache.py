@@ -0,0 +1,134 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyarr import AsyncRadarr, Sonarr
+from pyarr.cache import LookupCache
+
+
+class FakeLookups:
+    """Answers lookups with one result per term, and none for terms starting with "nothing"."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request):
+        term = request.url.params["term"]
+        self.calls.append((request.url.host, request.url.path, term))
+        return httpx.Response(200, json=[] if term.startswith("nothing") else [{"title": term}])
+
+
+def _sonarr(server, cache, host="localhost"):
+    session = httpx.Client(transport=httpx.MockTransport(server))
+    return Sonarr(host, "key", api_ver="v3", session=session, lookup_cache=cache)
+
+
+def test_lookups_are_cached_by_instance_and_term(tmp_path):
+    server = FakeLookups()
+    cache = LookupCache(tmp_path / "lookups.sqlite")
+    sonarr = _sonarr(server, cache)
+
+    assert sonarr.series.lookup("The  Expanse") == [{"title": "The  Expanse"}]
+    assert sonarr.series.lookup("the expanse") == [{"title": "The  Expanse"}]
+    sonarr.series.lookup(item_id=280619)
+    _sonarr(server, cache, host="other").series.lookup("The Expanse")
+
+    assert [call[0] for call in server.calls] == ["localhost", "localhost", "other"]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+def test_empty_answers_are_cached_for_the_negative_ttl(tmp_path):
+    server = FakeLookups()
+    sonarr = _sonarr(server, LookupCache(tmp_path / "lookups.sqlite", negative_ttl=0))
+
+    sonarr.series.lookup("nothing here")
+    sonarr.series.lookup("nothing here")
+    assert len(server.calls) == 2
+
+    cache = LookupCache(tmp_path / "negative.sqlite")
+    sonarr = _sonarr(server, cache)
+    assert sonarr.series.lookup("nothing here") == sonarr.series.lookup("nothing here") == []
+    assert cache.stats.negative_hits == 1
+
+
+def test_least_recently_used_answers_are_evicted(tmp_path):
+    server = FakeLookups()
+    cache = LookupCache(tmp_path / "lookups.sqlite", max_entries=2)
+    sonarr = _sonarr(server, cache)
+
+    for term in ["a", "b", "a", "c", "a", "b"]:
+        sonarr.series.lookup(term)
+
+    assert [call[2] for call in server.calls] == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+    assert cache.stats.evictions == 2
+
+
+def test_callers_sharing_the_file_wait_for_a_lookup_in_progress(tmp_path):
+    path = tmp_path / "lookups.sqlite"
+    caches = [LookupCache(path) for _ in range(4)]
+    lookups = FakeLookups()
+
+    def server(request):
+        # Answer only once every other caller has found the lookup claimed and is waiting for it.
+        deadline = time.monotonic() + 5
+        while sum(cache.stats.waits for cache in caches) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return lookups(request)
+
+    workers = [_sonarr(server, cache) for cache in caches]
+    results = []
+    threads = [
+        threading.Thread(target=lambda worker=worker: results.append(worker.series.lookup("Dark")))
+        for worker in workers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [[{"title": "Dark"}]] * 4
+    assert len(lookups.calls) == 1
+
+
+def test_answers_stored_after_a_miss_are_not_looked_up_again(tmp_path):
+    first, second = LookupCache(tmp_path / "lookups.sqlite"), LookupCache(tmp_path / "lookups.sqlite")
+    key = first.key("http://localhost:8989", "series/lookup", {"term": "Dark"})
+
+    assert first.get(key) is None
+    assert second.claim(key)
+    second.set(key, b'[{"title": "Dark"}]')
+
+    assert not first.claim(key)
+    assert first.get(key) == b'[{"title": "Dark"}]'
+    assert first.stats.waits == 0
+
+
+def test_failed_lookups_are_released(tmp_path):
+    cache = LookupCache(tmp_path / "lookups.sqlite")
+    key = cache.key("http://localhost:8989", "series/lookup", {"term": "Dark"})
+
+    assert cache.claim(key)
+    assert not cache.claim(key)
+    cache.release(key)
+    assert cache.claim(key)
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_the_cache(tmp_path):
+    server = FakeLookups()
+    cache = LookupCache(tmp_path / "lookups.sqlite")
+    radarr = AsyncRadarr(
+        "localhost",
+        "key",
+        api_ver="v3",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+        lookup_cache=cache,
+    )
+
+    await radarr.movie.lookup("Heat")
+    assert await radarr.movie.lookup("heat") == [{"title": "Heat"}]
+
+    assert server.calls == [("localhost", "/api/v3/movie/lookup", "Heat")]
@@ -0,0 +1,162 @@
+import threading
+
+import httpx
+import pytest
+
+from pyarr import AsyncLibraryMirror, AsyncRadarr, AsyncSonarr, LibraryMirror, Sonarr
+from pyarr._sync.bazarr import Bazarr
+from pyarr.mirror import newest_date
+
+
+class FakeSonarr:
+    def __init__(self):
+        self.series = {1: {"id": 1, "title": "One"}, 2: {"id": 2, "title": "Two"}}
+        self.episodes = {
+            1: [{"id": 10, "seriesId": 1, "hasFile": False}],
+            2: [{"id": 20, "seriesId": 2, "hasFile": False}, {"id": 21, "seriesId": 2, "hasFile": False}],
+        }
+        self.history = [{"id": 1, "seriesId": 1, "episodeId": 10, "date": "2024-01-01T00:00:00Z"}]
+        self.paths = []
+
+    def __call__(self, request):
+        path = request.url.path.removeprefix("/api/v3/")
+        params = request.url.params
+        self.paths.append(path)
+        if path == "history":
+            return httpx.Response(200, json={"page": 1, "totalRecords": 1, "records": self.history[-1:]})
+        if path == "history/since":
+            return httpx.Response(200, json=[event for event in self.history if event["date"] >= params["date"]])
+        if path == "series":
+            return httpx.Response(200, json=list(self.series.values()))
+        if path.startswith("series/"):
+            series = self.series.get(int(path.split("/")[1]))
+            return httpx.Response(200, json=series) if series else httpx.Response(404, json={"message": "NotFound"})
+        if path == "episode":
+            return httpx.Response(200, json=self.episodes.get(int(params["seriesId"]), []))
+        if path == "episodefile":
+            return httpx.Response(200, json=[])
+        if path == "tag":
+            return httpx.Response(200, json=[{"id": 1, "label": "hd"}])
+        if path == "qualityprofile":
+            return httpx.Response(200, json=[{"id": 1, "name": "Any"}])
+        return httpx.Response(404, json={"message": "NotFound"})
+
+
+def _mirror(server, **kwargs):
+    client = Sonarr("localhost", "key", api_ver="v3", session=httpx.Client(transport=httpx.MockTransport(server)))
+    return LibraryMirror(client, **kwargs)
+
+
+def test_first_read_copies_the_library():
+    server = FakeSonarr()
+    mirror = _mirror(server)
+
+    assert [series["title"] for series in mirror.get("series")] == ["One", "Two"]
+    assert [episode["id"] for episode in mirror.get("episode", parent_id=2)] == [20, 21]
+    assert mirror.get("series", 1) == {"id": 1, "title": "One"}
+    assert mirror.get("series", 3) is None
+    assert mirror.get("tag") == [{"id": 1, "label": "hd"}]
+    assert mirror.store.state("watermark") == "2024-01-01T00:00:00Z"
+
+    requests = len(server.paths)
+    mirror.get("episode")
+    assert len(server.paths) == requests
+
+
+def test_incremental_sync_refetches_only_what_history_mentions():
+    server = FakeSonarr()
+    mirror = _mirror(server, max_staleness=None)
+    mirror.sync()
+
+    server.series[2]["title"] = "Two, renamed without history"
+    server.episodes[1][0]["hasFile"] = True
+    server.history.append({"id": 2, "seriesId": 1, "episodeId": 10, "date": "2024-01-02T00:00:00Z"})
+    server.paths.clear()
+
+    assert mirror.sync() == 1
+    assert "series" not in server.paths
+    assert mirror.get("episode", 10)["hasFile"] is True
+    assert mirror.get("series", 2)["title"] == "Two"
+    assert mirror.store.state("watermark") == "2024-01-02T00:00:00Z"
+
+    assert mirror.sync(full=True) == 2
+    assert mirror.get("series", 2)["title"] == "Two, renamed without history"
+
+
+def test_deleted_series_are_removed_with_their_episodes():
+    server = FakeSonarr()
+    mirror = _mirror(server, max_staleness=None)
+    mirror.sync()
+
+    del server.series[2]
+    server.history.append({"id": 2, "seriesId": 2, "date": "2024-01-02T00:00:00Z"})
+    mirror.sync()
+
+    assert mirror.get("series", 2) is None
+    assert mirror.get("episode", parent_id=2) == []
+
+
+def test_mirror_resumes_from_its_file(tmp_path):
+    server = FakeSonarr()
+    with _mirror(server, path=tmp_path / "sonarr.db") as mirror:
+        mirror.sync()
+
+    server.paths.clear()
+    with _mirror(server, path=tmp_path / "sonarr.db", max_staleness=None) as mirror:
+        assert mirror.store.count("episode") == 3
+        mirror.sync()
+
+    assert "history/since" in server.paths
+    assert "series" not in server.paths
+
+
+def test_unsupported_clients_and_kinds_are_rejected():
+    with pytest.raises(TypeError):
+        LibraryMirror(Bazarr("localhost", "key"))
+    with pytest.raises(ValueError, match="movie"):
+        _mirror(FakeSonarr()).get("movie")
+
+
+@pytest.mark.asyncio
+async def test_radarr_movie_files_come_with_the_movies():
+    movies = [{"id": 1, "title": "Film", "movieFile": {"id": 5, "movieId": 1}}, {"id": 2, "title": "Unreleased"}]
+
+    def server(request):
+        path = request.url.path.removeprefix("/api/v3/")
+        if path == "movie":
+            return httpx.Response(200, json=movies)
+        if path == "history":
+            return httpx.Response(200, json={"page": 1, "totalRecords": 0, "records": []})
+        return httpx.Response(200, json=[])
+
+    client = AsyncRadarr(
+        "localhost", "key", api_ver="v3", session=httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+    async with AsyncLibraryMirror(client) as mirror:
+        assert await mirror.get("moviefile") == [{"id": 5, "movieId": 1}]
+        assert await mirror.get("moviefile", parent_id=2) == []
+
+
+def test_watermarks_compare_as_points_in_time():
+    assert newest_date("2024-01-01T00:00:00Z", "2024-01-01T00:00:00.123Z") == "2024-01-01T00:00:00.123Z"
+    assert newest_date("2024-01-01T00:00:00.9999999Z", "2024-01-01T01:00:00+01:00") == "2024-01-01T00:00:00.9999999Z"
+    assert newest_date("2024-01-02T00:00:00", "2024-01-01T23:59:59Z") == "2024-01-02T00:00:00"
+
+
+@pytest.mark.asyncio
+async def test_async_mirrors_write_outside_the_event_loop():
+    client = AsyncSonarr(
+        "localhost", "key", api_ver="v3", session=httpx.AsyncClient(transport=httpx.MockTransport(FakeSonarr()))
+    )
+    async with AsyncLibraryMirror(client) as mirror:
+        writers = set()
+        write = mirror.store._write
+
+        def recording_write(statements):
+            writers.add(threading.get_ident())
+            write(statements)
+
+        mirror.store._write = recording_write
+        assert await mirror.sync() == 2
+
+    assert writers and threading.get_ident() not in writers
@@ -0,0 +1,159 @@
+import json
+import tracemalloc
+
+import httpx
+import pytest
+
+from pyarr._async.radarr.movie import Movie as AsyncMovie
+from pyarr._sync.common.queue import Queue
+from pyarr._sync.radarr.movie import Movie
+from pyarr.models import MovieRecord, QueueRecord, Record
+
+MOVIE = {
+    "id": 7,
+    "title": "Amélie",
+    "tmdbId": 194,
+    "hasFile": True,
+    "images": [{"coverType": "poster", "remoteUrl": "https://image.tmdb.org/t/p/original/194.jpg"}],
+    "ratings": {"imdb": {"votes": 1000, "value": 8.3}},
+    "tags": [],
+    "addOptions": {"searchForMovie": False},
+}
+
+
+def _movies(count):
+    return [
+        {
+            "id": i,
+            "title": f"Movie {i}",
+            "originalTitle": f"Película {i}",
+            "sortTitle": f"movie {i}",
+            "sizeOnDisk": 4_500_000_000 + i,
+            "status": "released",
+            "overview": "A synthetic movie used to measure memory. " * 4,
+            "images": [{"coverType": "poster", "remoteUrl": f"https://image.tmdb.org/t/p/original/{i}.jpg"}],
+            "year": 2019,
+            "hasFile": i % 3 != 0,
+            "tmdbId": 100_000 + i,
+            "genres": ["Action", "Adventure"],
+            "tags": [1, 2],
+            "ratings": {"imdb": {"votes": 1000 + i, "value": 7.4, "type": "user"}},
+        }
+        for i in range(count)
+    ]
+
+
+def test_sparse_records_round_trip_exactly():
+    sparse = {"id": 7, "title": None, "images": [], "addOptions": {"searchForMovie": False}}
+    record = MovieRecord.from_dict(sparse)
+
+    assert record.to_dict() == sparse
+    assert "title" in record and "year" not in record
+    assert record.get("year", 1999) == 1999
+    with pytest.raises(KeyError):
+        record["year"]
+    assert record.year is None
+
+    record.year = 2001
+    assert record.to_dict() == {**sparse, "year": 2001}
+
+
+def test_record_decodes_blobs_on_first_access():
+    record = MovieRecord.from_dict(MOVIE)
+
+    assert isinstance(record._images, bytes)
+    assert record.images == MOVIE["images"]
+    assert record.images is record.images
+    assert record.title == "Amélie"
+    assert record.tmdb_id == 194
+    assert record.statistics is None
+
+
+def test_record_is_a_mapping_of_the_json_fields():
+    record = MovieRecord.from_dict(MOVIE)
+
+    assert record["title"] == "Amélie"
+    assert record["ratings"]["imdb"]["value"] == 8.3
+    assert record["addOptions"] == {"searchForMovie": False}
+    assert record.get("statistics") is None
+    assert "statistics" not in record
+    with pytest.raises(KeyError):
+        record["statistics"]
+    assert repr(record) == "MovieRecord(id=7, 'Amélie')"
+
+
+def test_to_dict_round_trips_the_declared_and_unknown_fields():
+    record = MovieRecord.from_dict(MOVIE)
+
+    assert {key: value for key, value in record.to_dict().items() if value is not None} == MOVIE
+    assert json.loads(json.dumps(record.to_dict()))["addOptions"] == {"searchForMovie": False}
+
+
+def test_records_have_no_instance_dict():
+    assert not hasattr(MovieRecord.from_dict(MOVIE), "__dict__")
+
+
+def test_dictionaries_remain_the_default(mock_handler):
+    movie = Movie(mock_handler(lambda request: httpx.Response(200, json=[MOVIE])))
+
+    assert movie.get() == [MOVIE]
+
+
+def test_models_can_be_chosen_per_call_or_per_client(mock_handler):
+    handler = mock_handler(lambda request: httpx.Response(200, json=[MOVIE]))
+
+    records = Movie(handler).get(models=True)
+    assert isinstance(records[0], MovieRecord)
+
+    handler.models = True
+    assert isinstance(Movie(handler).get()[0], MovieRecord)
+    assert Movie(handler).get(models=False) == [MOVIE]
+    assert all(isinstance(movie, MovieRecord) for movie in Movie(handler).iter_records())
+
+
+def test_paged_records_are_converted_and_models_is_not_sent(mock_handler):
+    seen = []
+
+    def transport(request):
+        seen.append(request.url.params)
+        return httpx.Response(200, json={"page": 1, "pageSize": 10, "totalRecords": 1, "records": [{"id": 3}]})
+
+    page = Queue(mock_handler(transport)).get(models=True)
+
+    assert isinstance(page["records"][0], QueueRecord)
+    assert page["totalRecords"] == 1
+    assert "models" not in seen[0]
+
+
+@pytest.mark.asyncio
+async def test_async_client_returns_records(async_mock_handler):
+    handler = async_mock_handler(lambda request: httpx.Response(200, json=MOVIE), models=True)
+
+    movie = await AsyncMovie(handler).get(7)
+
+    assert isinstance(movie, MovieRecord)
+    assert movie.ratings == MOVIE["ratings"]
+
+
+def test_records_hold_a_library_in_less_memory():
+    body = json.dumps(_movies(1_000)).encode()
+
+    def retained(build):
+        tracemalloc.start()
+        result = build()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del result
+        return current
+
+    dicts = retained(lambda: json.loads(body))
+    records = retained(lambda: [MovieRecord.from_dict(item) for item in json.loads(body)])
+
+    assert records < dicts * 0.75
+
+
+def test_every_record_field_has_a_slot():
+    for model in Record.__subclasses__():
+        slots = set(model.__slots__)
+        assert set(model._fields.values()) <= slots
+        assert {field.slot for field in model._lazy.values()} <= slots
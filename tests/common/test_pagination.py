@@ -0,0 +1,89 @@
+import httpx
+import pytest
+
+from pyarr._async.common.history import History as AsyncHistory
+from pyarr._async.common.wanted import Wanted as AsyncWanted
+from pyarr._sync.common.history import History
+from pyarr._sync.common.log import Log
+from pyarr.exceptions import PyarrMissingArgument
+
+
+def _paged_transport(total_records, captured):
+    """Serves ``total_records`` numbered records, honouring page and pageSize."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        page_size = int(request.url.params["pageSize"])
+        captured.append({**request.url.params, "path": request.url.path})
+        start = (page - 1) * page_size
+        records = [{"id": i} for i in range(start, min(start + page_size, total_records))]
+        body = {"page": page, "pageSize": page_size, "totalRecords": total_records, "records": records}
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+def test_iter_records_yields_every_record_in_order(mock_handler):
+    captured: list[dict] = []
+    history = History(mock_handler(_paged_transport(95, captured)))
+
+    records = list(history.iter_records(page_size=10, sort_key="date", sort_dir="descending", max_concurrency=3))
+
+    assert [r["id"] for r in records] == list(range(95))
+    assert sorted(int(p["page"]) for p in captured) == list(range(1, 11))
+    assert all(p["sortKey"] == "date" and p["sortDirection"] == "descending" for p in captured)
+
+
+def test_iter_pages_single_page_makes_one_request(mock_handler):
+    captured: list[dict] = []
+    history = History(mock_handler(_paged_transport(3, captured)))
+
+    pages = list(history.iter_pages(page_size=10))
+
+    assert len(pages) == 1
+    assert len(captured) == 1
+
+
+def test_iter_pages_stops_early_when_consumer_breaks(mock_handler):
+    """Breaking out must not fetch the whole table, only the window already in flight."""
+    captured: list[dict] = []
+    history = History(mock_handler(_paged_transport(1000, captured)))
+
+    for page in history.iter_pages(page_size=10, max_concurrency=2):
+        if page["page"] == 2:
+            break
+
+    assert len(captured) <= 4
+
+
+def test_iter_pages_validates_arguments(mock_handler):
+    log = Log(mock_handler(_paged_transport(0, [])))
+
+    with pytest.raises(PyarrMissingArgument):
+        log.iter_pages(sort_key="time")
+    with pytest.raises(PyarrMissingArgument):
+        log.iter_records(filter_key="level")
+    with pytest.raises(ValueError):
+        next(log.iter_pages(page_size=0))
+
+
+@pytest.mark.asyncio
+async def test_async_iter_records_yields_every_record_in_order(async_mock_handler):
+    captured: list[dict] = []
+    history = AsyncHistory(async_mock_handler(_paged_transport(95, captured)))
+
+    records = [r async for r in history.iter_records(page_size=10, max_concurrency=3)]
+
+    assert [r["id"] for r in records] == list(range(95))
+    assert len(captured) == 10
+
+
+@pytest.mark.asyncio
+async def test_async_iter_pages_uses_component_path_and_kwargs(async_mock_handler):
+    captured: list[dict] = []
+    wanted = AsyncWanted(async_mock_handler(_paged_transport(25, captured)), path="wanted/cutoff")
+
+    pages = [p async for p in wanted.iter_pages(page_size=10, includeSeries=True)]
+
+    assert [p["page"] for p in pages] == [1, 2, 3]
+    assert all(p["path"] == "/api/v3/wanted/cutoff" and p["includeSeries"] == "true" for p in captured)
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyarr import RateLimit
+from pyarr._sync_synchronization import SyncGate
+from pyarr.exceptions import PyarrServerError
+from pyarr.ratelimit import RateLimitTicket
+from pyarr.retry import RetryPolicy
+
+
+def _ticket(elapsed, status=200):
+    ticket = RateLimitTicket()
+    ticket.respond(status)
+    ticket.elapsed = elapsed
+    return ticket
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped(async_mock_handler):
+    active = [0, 0]
+
+    async def respond(request):
+        active[0] += 1
+        active[1] = max(active)
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        return httpx.Response(200, json=[])
+
+    handler = async_mock_handler(respond, rate_limit=RateLimit(max_concurrency=3))
+    await asyncio.gather(*(handler.request("tag") for _ in range(20)))
+
+    assert active[1] == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_paces_requests_after_the_burst(async_mock_handler):
+    handler = async_mock_handler(lambda request: httpx.Response(200, json=[]), rate_limit=RateLimit(rate=50, burst=5))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handler.request("tag") for _ in range(15)))
+
+    # Five go at once, the other ten at 50 a second.
+    assert time.perf_counter() - started >= 0.18
+    assert handler.rate_limit.waits == 10
+
+
+def test_weights_match_the_longest_endpoint_prefix():
+    limit = RateLimit(rate=10, weights={"series": 2, "series/lookup": 5, "release": 10})
+
+    assert limit.cost("tag") == 1.0
+    assert limit.cost("series/3") == 2
+    assert limit.cost("series/lookup") == 5
+    assert limit.cost("releaseprofile") == 1.0
+    assert limit.reserve(limit.cost("release")) == 0.0
+    assert limit.reserve(limit.cost("release")) == pytest.approx(1.0, abs=0.05)
+
+
+def test_clients_sharing_a_limit_share_the_cap(mock_handler):
+    limit = RateLimit(max_concurrency=2)
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def respond(request):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return httpx.Response(200, json={})
+
+    handlers = [mock_handler(respond, rate_limit=limit) for _ in range(3)]
+    threads = [threading.Thread(target=handler.request, args=("system/status",)) for handler in handlers * 3]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert active[1] == 2
+
+
+def test_adaptive_mode_backs_off_and_recovers():
+    limit = RateLimit(rate=100, max_concurrency=10, adaptive=True, latency_target=0.5, cooldown=0.0, recovery=0.1)
+
+    limit.record(_ticket(0.01, status=503))
+    limit.record(_ticket(0.01, status=503))
+    assert limit.scale == 0.25
+    assert limit.concurrency == 2
+    assert limit.backoffs == 2
+
+    for _ in range(40):
+        limit.record(_ticket(0.01))
+    assert limit.scale == 1.0
+
+    limit.record(_ticket(5.0))
+    assert limit.scale == 0.5
+
+
+def test_adaptive_backoff_waits_out_the_cooldown():
+    limit = RateLimit(max_concurrency=8, adaptive=True, cooldown=60)
+
+    for _ in range(5):
+        limit.record(_ticket(0.01, status=500))
+
+    assert limit.backoffs == 1
+    assert limit.concurrency == 4
+
+
+def test_server_errors_count_against_an_adaptive_limit(mock_handler):
+    limit = RateLimit(max_concurrency=4, adaptive=True, error_threshold=0.1)
+    handler = mock_handler(
+        lambda request: httpx.Response(500, json={}), rate_limit=limit, retry=RetryPolicy(max_attempts=1)
+    )
+
+    with pytest.raises(PyarrServerError):
+        handler.request("tag")
+
+    assert limit.backoffs == 1
+    assert limit.gate(SyncGate).holders == 0
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError):
+        RateLimit(max_concurrency=0)
+    with pytest.raises(ValueError):
+        RateLimit(adaptive=True)
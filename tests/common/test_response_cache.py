@@ -0,0 +1,98 @@
+import httpx
+import pytest
+
+from pyarr.cache import ResponseCache
+
+
+def _counting_transport(calls):
+    """Answers every request with a JSON body that includes how many requests came before it."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url.path}")
+        return httpx.Response(200, json={"id": 1, "call": len(calls)})
+
+    return handler
+
+
+def test_get_is_served_from_cache_until_a_mutation(mock_handler):
+    calls: list[str] = []
+    cache = ResponseCache()
+    handler = mock_handler(_counting_transport(calls), response_cache=cache)
+
+    first = handler.request("qualityprofile/1")
+    first["name"] = "changed by the caller"
+    assert handler.request("qualityprofile/1") == {"id": 1, "call": 1}
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    handler.request("qualityprofile/1", method="PUT", json_data={"id": 1})
+    assert handler.request("qualityprofile/1") == {"id": 1, "call": 3}
+    assert calls == ["GET /api/v3/qualityprofile/1", "PUT /api/v3/qualityprofile/1", "GET /api/v3/qualityprofile/1"]
+
+
+def test_endpoints_without_ttl_are_not_cached(mock_handler):
+    calls: list[str] = []
+    cache = ResponseCache()
+    handler = mock_handler(_counting_transport(calls), response_cache=cache)
+
+    handler.request("series")
+    handler.request("series")
+    handler.request("tag/detail")
+    handler.request("tag/detail")
+
+    assert len(calls) == 4
+    assert len(cache) == 0
+
+
+def test_entries_expire(monkeypatch, mock_handler):
+    now = [1000.0]
+    monkeypatch.setattr("pyarr.cache.time.monotonic", lambda: now[0])
+    calls: list[str] = []
+    handler = mock_handler(_counting_transport(calls), response_cache=ResponseCache(ttls={"tag": 10}))
+
+    handler.request("tag")
+    now[0] += 5
+    handler.request("tag")
+    now[0] += 6
+    handler.request("tag")
+
+    assert len(calls) == 2
+
+
+def test_query_parameters_are_part_of_the_key(mock_handler):
+    calls: list[str] = []
+    handler = mock_handler(_counting_transport(calls), response_cache=ResponseCache(ttls={"indexer/schema": 60}))
+
+    handler.request("indexer/schema", params={"a": 1})
+    handler.request("indexer/schema", params={"a": 2})
+    handler.request("indexer/schema", params={"a": 1})
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("limits", [{"max_entries": 2}, {"max_bytes": 60}])
+def test_least_recently_used_entries_are_evicted(limits):
+    cache = ResponseCache(ttls={"tag": 60}, **limits)
+
+    for key in ("a", "b"):
+        cache.set(key, "tag", b'{"padding": "xxxxxxxxxx"}')
+    cache.get("a")
+    cache.set("c", "tag", b'{"padding": "xxxxxxxxxx"}')
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats.evictions == 1
+    assert cache.size <= 60
+
+
+@pytest.mark.asyncio
+async def test_async_handler_uses_the_cache(async_mock_handler):
+    calls: list[str] = []
+    cache = ResponseCache()
+    handler = async_mock_handler(_counting_transport(calls), response_cache=cache)
+
+    assert await handler.request("system/status") == await handler.request("system/status")
+    await handler.request("system/restart", method="POST")
+    await handler.request("system/status")
+
+    assert calls == ["GET /api/v3/system/status", "POST /api/v3/system/restart", "GET /api/v3/system/status"]
+    assert cache.stats.invalidations == 1
@@ -0,0 +1,109 @@
+import httpx
+import pytest
+
+from pyarr.exceptions import PyarrBadGateway, PyarrConnectionError
+from pyarr.retry import RetryPolicy
+
+
+def _scripted_transport(script, calls):
+    """Answers each request with the next entry of ``script``, an exception or a response."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        step = script[min(len(calls) - 1, len(script) - 1)]
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+    return handler
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays: list[float] = []
+    monkeypatch.setattr("pyarr._sync.utils.http.sync_sleep", delays.append)
+
+    async def _async_sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr("pyarr._async.utils.http.async_sleep", _async_sleep)
+    return delays
+
+
+def test_get_is_retried_on_503_and_honours_retry_after(no_sleep, mock_handler):
+    calls: list[str] = []
+    events = []
+    script = [httpx.Response(503, headers={"Retry-After": "7"}), httpx.Response(200, json={"ok": True})]
+    handler = mock_handler(_scripted_transport(script, calls), retry=RetryPolicy(on_retry=events.append))
+
+    assert handler.request("system/status") == {"ok": True}
+
+    assert calls == ["GET", "GET"]
+    assert no_sleep == [7.0]
+    assert handler.retry_stats.retries == 1
+    assert events[0].reason == "503" and events[0].attempt == 1
+
+
+def test_post_is_not_replayed_after_server_error(mock_handler):
+    """The server may already have run the command, so a 503 on POST must surface."""
+    calls: list[str] = []
+    handler = mock_handler(_scripted_transport([httpx.Response(503, text="busy")], calls))
+
+    with pytest.raises(Exception, match="503"):
+        handler.request("command", method="POST", json_data={"name": "RescanSeries"})
+
+    assert calls == ["POST"]
+
+
+def test_post_is_retried_when_it_never_reached_the_server(mock_handler):
+    calls: list[str] = []
+    script = [httpx.ConnectError("refused"), httpx.Response(429), httpx.Response(201, json={"id": 1})]
+    handler = mock_handler(_scripted_transport(script, calls))
+
+    assert handler.request("command", method="POST", json_data={"name": "RescanSeries"}) == {"id": 1}
+
+    assert calls == ["POST", "POST", "POST"]
+
+
+def test_gives_up_after_max_attempts_with_connection_error(no_sleep, mock_handler):
+    calls: list[str] = []
+    handler = mock_handler(
+        _scripted_transport([httpx.ReadTimeout("slow")], calls), retry=RetryPolicy(max_attempts=4, jitter=False)
+    )
+
+    with pytest.raises(PyarrConnectionError):
+        handler.request("series")
+
+    assert len(calls) == 4
+    assert no_sleep == [0.5, 1.0, 2.0]
+
+
+def test_retry_budget_stops_retry_storms(mock_handler):
+    calls: list[str] = []
+    handler = mock_handler(
+        _scripted_transport([httpx.Response(502)], calls),
+        retry=RetryPolicy(max_attempts=5, budget_reserve=2, budget_ratio=0),
+    )
+
+    with pytest.raises(PyarrBadGateway):
+        handler.request("series")
+
+    assert len(calls) == 3
+    assert handler.retry_stats.budget_exhausted == 1
+
+
+def test_max_attempts_must_be_positive():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.mark.asyncio
+async def test_async_get_is_retried_on_connection_error(no_sleep, async_mock_handler):
+    calls: list[str] = []
+    script = [httpx.ConnectError("refused"), httpx.Response(200, json=[])]
+    handler = async_mock_handler(_scripted_transport(script, calls))
+
+    assert await handler.request("series") == []
+
+    assert calls == ["GET", "GET"]
+    assert len(no_sleep) == 1
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyarr._async_synchronization import AsyncSingleFlight
+from pyarr._sync_synchronization import SyncSingleFlight
+from pyarr.exceptions import PyarrServerError
+from pyarr.retry import RetryPolicy
+
+
+def _respond(seen, status=200, delay=0.05):
+    async def respond(request):
+        seen.append(request)
+        await asyncio.sleep(delay)
+        return httpx.Response(status, json=[{"id": 1, "name": "HD-1080p"}])
+
+    return respond
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_request(async_mock_handler):
+    seen = []
+    handler = async_mock_handler(_respond(seen), coalesce=True)
+
+    results = await asyncio.gather(*(handler.request("qualityprofile") for _ in range(5)))
+
+    assert len(seen) == 1
+    assert all(result is results[0] for result in results)
+    assert handler.singleflight.calls == 1
+    assert handler.singleflight.coalesced == 4
+    assert handler.singleflight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_kept_after_the_request_completes(async_mock_handler):
+    seen = []
+    handler = async_mock_handler(_respond(seen), coalesce=True)
+
+    await handler.request("system/status")
+    await handler.request("system/status")
+
+    assert len(seen) == 2
+    assert handler.singleflight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_different_params_methods_and_headers_are_not_shared(async_mock_handler):
+    seen = []
+    handler = async_mock_handler(_respond(seen), coalesce=True)
+
+    await asyncio.gather(
+        handler.request("series", params={"id": 1}),
+        handler.request("series", params={"id": 2}),
+        handler.request("series", params={"id": 1}, headers={"X-Trace": "1"}),
+        handler.request("series", method="POST", json_data={"id": 1}),
+    )
+
+    assert len(seen) == 4
+    assert handler.singleflight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_coalescing_is_off_by_default(async_mock_handler):
+    seen = []
+    handler = async_mock_handler(_respond(seen))
+
+    await asyncio.gather(handler.request("tag"), handler.request("tag"))
+
+    assert len(seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter(async_mock_handler):
+    seen = []
+    handler = async_mock_handler(_respond(seen, status=500), coalesce=True, retry=RetryPolicy(max_attempts=1))
+
+    results = await asyncio.gather(*(handler.request("tag") for _ in range(3)), return_exceptions=True)
+
+    assert len(seen) == 1
+    assert all(isinstance(result, PyarrServerError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_caller_does_not_cancel_the_others():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", slow))
+    second = asyncio.ensure_future(flight.do("key", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    assert calls == [1]
+
+
+def test_threads_share_one_request(mock_handler):
+    seen = []
+
+    def respond(request):
+        seen.append(request)
+        time.sleep(0.1)
+        return httpx.Response(200, json={"version": "4.0"})
+
+    handler = mock_handler(respond, coalesce=True)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(handler.request("system/status"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(seen) == 1
+    assert results == [{"version": "4.0"}] * 4
+    assert handler.singleflight.coalesced == 3
+
+
+def test_sync_errors_reach_every_waiter():
+    flight = SyncSingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except ValueError as error:
+            errors.append(error)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2
+    assert flight.in_flight == 0
@@ -0,0 +1,146 @@
+import json
+import tracemalloc
+
+import httpx
+import pytest
+
+from pyarr._async.radarr.movie import Movie as AsyncMovie
+from pyarr._sync.dispatcharr.streams import Streams
+from pyarr._sync.sonarr.episode import Episode
+from pyarr.codec import JsonArrayDecoder
+from pyarr.exceptions import PyarrResourceNotFound
+from pyarr.retry import RetryPolicy
+
+
+def _chunked(document: bytes, size: int):
+    return [document[i : i + size] for i in range(0, len(document), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 64])
+def test_decoder_handles_any_chunk_boundary(size):
+    items = [{"title": 'Amélie "]\\', "nested": [1, {"a": None}]}, -12.5e3, "x,y", True, [], {}, 0]
+    decoder = JsonArrayDecoder()
+    decoded = []
+
+    for chunk in _chunked(json.dumps(items, ensure_ascii=False).encode(), size):
+        decoded.extend(decoder.feed(chunk))
+    decoded.extend(decoder.feed(b"", final=True))
+
+    assert decoded == items
+
+
+def test_decoder_decodes_each_element_once_however_it_is_split():
+    items = [{"title": "a" * 2000, "ids": list(range(500))}, "b" * 2000, 12345]
+    decoder = JsonArrayDecoder()
+    calls = []
+
+    class Recording(json.JSONDecoder):
+        def decode(self, text):
+            calls.append(text)
+            return super().decode(text)
+
+    decoder._scanner = Recording()
+    decoded = []
+
+    for chunk in _chunked(json.dumps(items).encode(), 7):
+        decoded.extend(decoder.feed(chunk))
+    decoded.extend(decoder.feed(b"", final=True))
+
+    assert decoded == items
+    assert [json.loads(text) for text in calls] == items
+
+
+@pytest.mark.parametrize("body", [b'{"message": "error"}', b"[1, 2", b"<html></html>", b"[1] 2"])
+def test_decoder_rejects_anything_but_a_whole_array(body):
+    decoder = JsonArrayDecoder()
+
+    with pytest.raises(ValueError):
+        decoder.feed(body)
+        decoder.feed(b"", final=True)
+
+
+def test_stream_yields_elements_while_downloading(mock_handler):
+    chunks_sent: list[int] = []
+
+    def chunks():
+        yield b'[{"id": 1},'
+        chunks_sent.append(1)
+        yield b' {"id": 2}]'
+        chunks_sent.append(2)
+
+    def transport(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["seriesId"] == "7"
+        return httpx.Response(200, content=chunks(), headers={"Content-Type": "application/json"})
+
+    records = Episode(mock_handler(transport)).iter_records(series_id=7)
+
+    assert next(records) == {"id": 1}
+    assert chunks_sent == []
+    assert list(records) == [{"id": 2}]
+
+
+def test_stream_memory_stays_flat(mock_handler):
+    count = 20_000
+    record = json.dumps({"id": 0, "title": "x" * 200, "tags": list(range(20))}).encode()
+
+    def chunks():
+        yield b"[" + record
+        for _ in range(count // 100):
+            yield (b"," + record) * 100
+        yield b"]"
+
+    handler = mock_handler(lambda request: httpx.Response(200, content=chunks()))
+
+    tracemalloc.start()
+    seen = sum(1 for _ in handler.stream("movie"))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert seen == count + 1
+    assert peak < count * len(record) / 20
+
+
+def test_stream_retries_before_the_first_element_and_raises_errors(mock_handler):
+    responses = [httpx.Response(503), httpx.Response(200, json=[1, 2])]
+    calls: list[int] = []
+
+    def transport(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return responses[len(calls) - 1]
+
+    handler = mock_handler(transport, retry=RetryPolicy(backoff_factor=0))
+
+    assert list(handler.stream("series")) == [1, 2]
+    assert len(calls) == 2
+
+    missing = mock_handler(lambda request: httpx.Response(404, json={"message": "NotFound"}))
+    with pytest.raises(PyarrResourceNotFound):
+        list(missing.stream("series"))
+
+
+@pytest.mark.asyncio
+async def test_async_movie_stream(async_mock_handler):
+    def transport(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+
+    handler = async_mock_handler(transport, port=7878)
+
+    assert [movie["id"] async for movie in AsyncMovie(handler).iter_records()] == [1, 2]
+
+
+def test_dispatcharr_streams_follow_every_page(mock_handler):
+    streams = [{"id": i, "name": f"Stream {i}"} for i in range(1, 8)]
+    seen = []
+
+    def transport(request):
+        page, size = int(request.url.params["page"]), int(request.url.params["page_size"])
+        seen.append(page)
+        results = streams[(page - 1) * size : page * size]
+        more = page * size < len(streams)
+        next_url = f"http://localhost/api/channels/streams/?page={page + 1}" if more else None
+        return httpx.Response(200, json={"count": len(streams), "next": next_url, "previous": None, "results": results})
+
+    records = Streams(mock_handler(transport)).iter_records(page_size=3, models=True)
+
+    assert [record["id"] for record in records] == list(range(1, 8))
+    assert seen == [1, 2, 3]
@@ -0,0 +1,118 @@
+import json
+
+import httpx
+import pytest
+
+from pyarr import AsyncRadarr, Bazarr, SearchCheckpoint, Sonarr
+
+
+class FakeWanted:
+    """Serves wanted items in pages and accepts search commands, which complete at once."""
+
+    def __init__(self, count):
+        self.ids = list(range(1, count + 1))
+        self.paths = []
+        self.searches = []
+
+    def __call__(self, request):
+        path = request.url.path.split("/api/v3/")[-1]
+        if request.method == "POST":
+            body = json.loads(request.content)
+            self.searches.append(body)
+            return httpx.Response(201, json={"id": len(self.searches), "name": body["name"], "status": "queued"})
+        if path.startswith("command"):
+            return httpx.Response(200, json=[{"id": i + 1, "status": "completed"} for i in range(len(self.searches))])
+        self.paths.append(path)
+        page, size = int(request.url.params["page"]), int(request.url.params["pageSize"])
+        records = [{"id": item_id} for item_id in self.ids[(page - 1) * size : page * size]]
+        return httpx.Response(
+            200, json={"page": page, "pageSize": size, "totalRecords": len(self.ids), "records": records}
+        )
+
+
+def _sonarr(server):
+    return Sonarr("localhost", "key", api_ver="v3", session=httpx.Client(transport=httpx.MockTransport(server)))
+
+
+def test_wanted_items_are_searched_in_batches():
+    server = FakeWanted(7)
+
+    progress = list(_sonarr(server).wanted.search(chunk_size=3, page_size=3))
+
+    assert server.searches == [
+        {"name": "EpisodeSearch", "episodeIds": [1, 2, 3]},
+        {"name": "EpisodeSearch", "episodeIds": [4, 5, 6]},
+        {"name": "EpisodeSearch", "episodeIds": [7]},
+    ]
+    assert [(p.searched, p.commands, p.done) for p in progress] == [(3, 1, False), (6, 2, False), (7, 3, True)]
+    assert progress[-1].pages == 3
+    assert progress[-1].fraction == 1.0
+    assert set(server.paths) == {"wanted/missing"}
+
+
+def test_interrupted_searches_resume_from_the_checkpoint(tmp_path):
+    server = FakeWanted(5)
+    path = tmp_path / "search.json"
+    sonarr = _sonarr(server)
+
+    search = sonarr.wanted.search(chunk_size=2, checkpoint=path)
+    next(search)
+    search.close()
+    assert SearchCheckpoint(path).searched == {1, 2}
+
+    last = list(sonarr.wanted.search(chunk_size=2, checkpoint=path))[-1]
+
+    assert [search["episodeIds"] for search in server.searches] == [[1, 2], [3, 4], [5]]
+    assert (last.skipped, last.searched, last.found) == (2, 3, 5)
+    assert not path.exists()
+
+
+def test_checkpoints_append_each_batch_and_drop_a_torn_line(tmp_path):
+    path = tmp_path / "search.jsonl"
+    checkpoint = SearchCheckpoint(path)
+    checkpoint.record("wanted/missing", [3, 1])
+    checkpoint.record("wanted/missing", [2])
+
+    assert path.read_text().splitlines() == ['{"version":2,"source":"wanted/missing"}', "[3,1]", "[2]"]
+
+    with path.open("a") as handle:
+        handle.write("[4,")
+    resumed = SearchCheckpoint(path)
+    resumed.record("wanted/missing", [5])
+
+    assert (resumed.source, resumed.searched) == ("wanted/missing", {1, 2, 3, 5})
+    assert SearchCheckpoint(path).searched == {1, 2, 3, 5}
+
+
+def test_commands_are_paced_and_waited_for():
+    server = FakeWanted(3)
+
+    last = list(_sonarr(server).wanted.search(chunk_size=1, commands_per_minute=600, wait=True))[-1]
+
+    assert last.commands == 3
+    assert last.elapsed >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_async_clients_search_items_below_the_cutoff():
+    server = FakeWanted(4)
+    radarr = AsyncRadarr(
+        "localhost", "key", api_ver="v3", session=httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+
+    progress = [p async for p in radarr.wanted.search(cutoff=True)]
+
+    assert server.searches == [{"name": "MoviesSearch", "movieIds": [1, 2, 3, 4]}]
+    assert progress[-1].done
+    assert set(server.paths) == {"wanted/cutoff"}
+
+
+def test_searches_are_refused_when_they_cannot_run(tmp_path):
+    server = FakeWanted(1)
+    path = tmp_path / "search.json"
+    SearchCheckpoint(path).record("wanted/cutoff", [1])
+
+    with pytest.raises(ValueError, match="belongs to a search of wanted/cutoff"):
+        _sonarr(server).wanted.search(checkpoint=path)
+    with pytest.raises(ValueError, match="cannot search"):
+        Bazarr("localhost", "key", session=httpx.Client(transport=httpx.MockTransport(server))).wanted_movies.search()
@@ -1,6 +1,9 @@
+import httpx
 import pytest
 
 from pyarr import Lidarr, Radarr, Readarr, Sonarr
+from pyarr._async.utils.http import RequestHandler as AsyncRequestHandler
+from pyarr._sync.utils.http import RequestHandler
 
 from . import (
     LIDARR_API_KEY,
@@ -48,3 +51,25 @@ def lidarr_client():
 def readarr_client():
     with Readarr(host="localhost", api_key=READARR_API_KEY, tls=False) as client:
         yield client
+
+
+def _handler_factory(handler_class, session_class):
+    def make(respond=None, **kwargs):
+        if respond is not None:
+            kwargs.setdefault("session", session_class(transport=httpx.MockTransport(respond)))
+        options = {"host": "localhost", "api_key": "key", "port": 8989, "tls": False, "api_ver": "v3"}
+        return handler_class(**{**options, **kwargs})
+
+    return make
+
+
+@pytest.fixture()
+def mock_handler():
+    """Builds request handlers whose requests are answered by ``respond(request)`` instead of a server."""
+    return _handler_factory(RequestHandler, httpx.Client)
+
+
+@pytest.fixture()
+def async_mock_handler():
+    """Builds async request handlers whose requests are answered by ``respond(request)`` instead of a server."""
+    return _handler_factory(AsyncRequestHandler, httpx.AsyncClient)
@@ -0,0 +1,72 @@
+"""``import pyarr`` should only import what the caller goes on to use."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pyarr
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Runs ``code`` in a fresh interpreter and returns the pyarr modules it imported."""
+    script = f"import sys\n{code}\nprint('\\n'.join(m for m in sys.modules if m.startswith('pyarr')))"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_import_pyarr_imports_no_clients():
+    modules = _loaded_modules("import pyarr")
+
+    assert not any(m.startswith(("pyarr._sync", "pyarr._async")) for m in modules)
+
+
+def test_one_client_imports_only_its_own_components():
+    modules = _loaded_modules("import pyarr\npyarr.Sonarr('localhost', 'key', api_ver='v3')")
+
+    assert "pyarr._sync.sonarr" in modules
+    assert not any(m.startswith("pyarr._async") for m in modules)
+    assert "pyarr._sync.radarr" not in modules
+    assert "pyarr._sync.common.history" not in modules
+
+
+def test_sync_client_does_not_import_asyncio():
+    script = "import sys, pyarr\npyarr.Sonarr('localhost', 'key', api_ver='v3')\nprint('asyncio' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "False"
+
+
+def test_components_are_imported_and_built_on_first_access():
+    client = pyarr.Dispatcharr("localhost", "key", tls=False)
+
+    assert "streams" not in vars(client)
+    streams = client.streams
+    assert client.streams is streams
+    assert streams.handler is client.http_utils
+    assert type(client.system).__name__ == "DispatcharrSystem"
+
+
+def test_client_construction_builds_no_components_or_session():
+    client = pyarr.Bazarr("localhost", "key", tls=False, api_ver="v1")
+
+    assert set(vars(client)) == {"http_utils"}
+    assert client.http_utils.session is None
+    assert client.wanted_movies.path == "movies/wanted"
+    assert client.wanted_episodes.path == "episodes/wanted"
+
+
+def test_components_are_slotted():
+    client = pyarr.Sonarr("localhost", "key", api_ver="v3")
+
+    for component in (client.series, client.history, client.wanted, client.config):
+        assert not hasattr(component, "__dict__")
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="NotAClient"):
+        pyarr.NotAClient  # noqa: B018
+
+
+def test_dir_lists_lazy_names():
+    assert {"Sonarr", "AsyncSonarr", "RetryPolicy"} <= set(dir(pyarr))